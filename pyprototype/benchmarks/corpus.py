@@ -0,0 +1,164 @@
+"""
+Synthetic Fin corpora for the compiler benchmarks.
+
+Every generator returns { relative_path: source } with the entry point at
+'main.fin'. Sizes scale linearly with 'scale' so the same shapes can be
+used for quick smoke runs (scale=1) and for profiling sessions.
+"""
+
+
+def deep_nesting(scale=1):
+    """One function with deeply nested if/while/for blocks and long expressions."""
+    depth = 40 * scale
+    lines = ["fun nested(n: <int>) <int> {", "    let acc <int> = 0;"]
+    indent = "    "
+    for level in range(depth):
+        kind = level % 3
+        if kind == 0:
+            lines.append(f"{indent}if (n > {level}) {{")
+        elif kind == 1:
+            lines.append(f"{indent}for (let i{level} <int> = 0; i{level} < 2; i{level}++) {{")
+        else:
+            lines.append(f"{indent}while (acc < {level * 7}) {{")
+        indent += "    "
+        lines.append(f"{indent}acc = acc + ((n * {level}) - (acc / {level + 1})) % 97 + 1;")
+    for _ in range(depth):
+        indent = indent[:-4]
+        lines.append(f"{indent}}}")
+    lines += ["    return acc;", "}", "",
+              "fun main() <int> {", "    return nested(3) % 256;", "}", ""]
+    return {"main.fin": "\n".join(lines)}
+
+
+def many_modules(scale=1):
+    """An entry point importing many small modules, each with a few functions."""
+    count = 25 * scale
+    files = {}
+    imports, calls = [], []
+    for m in range(count):
+        body = []
+        for f in range(4):
+            body.append(
+                f"fun m{m}_f{f}(x: <int>) <int> {{\n"
+                f"    let y <int> = x * {f + 1} + {m};\n"
+                f"    if (y > 1000) {{ return y - 1000; }}\n"
+                f"    return y;\n"
+                f"}}\n"
+            )
+        files[f"mod_{m}.fin"] = "\n".join(body)
+        imports.append(f'import {{ m{m}_f0, m{m}_f3 }} from "./mod_{m}";')
+        calls.append(f"    acc = m{m}_f3(m{m}_f0(acc));")
+    files["main.fin"] = "\n".join(
+        imports + ["", "fun main() <int> {", "    let acc <int> = 1;"] + calls
+        + ["    return acc % 256;", "}", ""]
+    )
+    return files
+
+
+def generics_and_macros(scale=1):
+    """Generic structs/functions instantiated with many types, plus text and AST macros."""
+    count = 30 * scale
+    lines = [
+        "#cdef SQUARE(x) ((x) * (x))",
+        "",
+        "@macro twice(x) {",
+        "    @return x + x;",
+        "}",
+        "",
+        "struct Box<T> {",
+        "    value <T>,",
+        "",
+        "    fun get() <T> {",
+        "        return self.value;",
+        "    }",
+        "}",
+        "",
+        "struct Pair<A, B> {",
+        "    first <A>,",
+        "    second <B>",
+        "}",
+        "",
+        "fun identity<T>(x: <T>) <T> {",
+        "    return x;",
+        "}",
+        "",
+    ]
+    types = ["int", "long"]
+    for i in range(count):
+        t = types[i % len(types)]
+        lines += [
+            f"fun use_{i}(seed: <int>) <int> {{",
+            f"    let b <Box<{t}>> = Box::<{t}>{{value: identity::<{t}>(seed + {i})}};",
+            f"    let p <Pair<int, {t}>> = Pair::<int, {t}>{{first: SQUARE(seed), second: b.get()}};",
+            f"    return $twice(p.first) + {i};",
+            "}",
+            "",
+        ]
+    lines += ["fun main() <int> {", "    let acc <int> = 0;"]
+    lines += [f"    acc = acc + use_{i}(acc % 13);" for i in range(count)]
+    lines += ["    return acc % 256;", "}", ""]
+    return {"main.fin": "\n".join(lines)}
+
+
+def large_array_literals(scale=1):
+    """Large constant array literals (exercises literal lowering and IR size)."""
+    size = 2000 * scale
+    values = ", ".join(str((i * 7919) % 1000) for i in range(size))
+    source = (
+        f"fun main() <int> {{\n"
+        f"    let table <[int, {size}]> = [{values}];\n"
+        f"    let acc <int> = 0;\n"
+        f"    foreach v <int> in (table) {{\n"
+        f"        acc = acc + v;\n"
+        f"    }}\n"
+        f"    return acc % 256;\n"
+        f"}}\n"
+    )
+    return {"main.fin": source}
+
+
+def struct_heavy(scale=1):
+    """Many structs with constructors, methods, operators and heap allocation."""
+    count = 40 * scale
+    lines = []
+    for i in range(count):
+        lines += [
+            f"struct Shape{i} {{",
+            "    w <int>,",
+            "    h <int>,",
+            "",
+            "    struct(w: <int>, h: <int>) {",
+            "        self.w = w;",
+            "        self.h = h;",
+            "    }",
+            "",
+            "    fun area() <int> {",
+            f"        return self.w * self.h + {i};",
+            "    }",
+            "",
+            f"    operator + (other: <Shape{i}>) <Shape{i}> {{",
+            f"        return Shape{i}{{w: self.w + other.w, h: self.h + other.h}};",
+            "    }",
+            "}",
+            "",
+        ]
+    lines += ["fun main() <int> {", "    let acc <int> = 0;"]
+    for i in range(count):
+        lines += [
+            f"    let s{i} <Shape{i}> = Shape{i}({i}, 2);",
+            f"    let a{i} <&Shape{i}> = new Shape{i}{{w: {i}, h: 2}};",
+            f"    let t{i} <Shape{i}> = s{i} + s{i};",
+            f"    acc = acc + a{i}.area() + t{i}.area();",
+            f"    delete a{i};",
+        ]
+    lines += ["    return acc % 256;", "}", ""]
+    return {"main.fin": "\n".join(lines)}
+
+
+CORPORA = {
+    "deep_nesting": deep_nesting,
+    "many_modules": many_modules,
+    "generics_macros": generics_and_macros,
+    "large_arrays": large_array_literals,
+    "struct_heavy": struct_heavy,
+}
@@ -0,0 +1,14 @@
+/* Fill and repeatedly scan an array with foreach. */
+int kernel(void) {
+    int data[4096];
+    for (int i = 0; i < 4096; i++) {
+        data[i] = (i * 31) % 1024;
+    }
+    int acc = 0;
+    for (int round = 0; round < 1000; round++) {
+        for (int k = 0; k < 4096; k++) {
+            acc = (acc + data[k] * (round % 16)) % 1000003;
+        }
+    }
+    return acc;
+}
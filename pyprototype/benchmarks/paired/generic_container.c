@@ -0,0 +1,21 @@
+/* A generic accumulator instantiated for int and long. */
+#define DEFINE_ACCUMULATOR(T)                                               \
+    typedef struct { T total, count; } Accumulator_##T;                    \
+    __attribute__((noinline)) static void Accumulator_##T##_add(           \
+        Accumulator_##T *self, T x) {                                      \
+        self->total = (self->total + x) % 1000003;                         \
+        self->count = self->count + 1;                                     \
+    }
+
+DEFINE_ACCUMULATOR(int)
+DEFINE_ACCUMULATOR(long)
+
+int kernel(void) {
+    Accumulator_int small = { 0, 0 };
+    Accumulator_long big = { 0, 0 };
+    for (int i = 0; i < 5000000; i++) {
+        Accumulator_int_add(&small, i % 1000);
+        Accumulator_long_add(&big, i);
+    }
+    return (int)((small.total + small.count + big.total + big.count) % 1000003);
+}
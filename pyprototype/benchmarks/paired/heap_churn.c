@@ -0,0 +1,16 @@
+/* new/delete of a small struct in a loop. */
+#include <stdlib.h>
+
+typedef struct { int value, weight; } Node;
+
+int kernel(void) {
+    int acc = 0;
+    for (int i = 0; i < 1000000; i++) {
+        Node *volatile n = malloc(sizeof(Node));
+        n->value = i;
+        n->weight = i * 2;
+        acc = (acc + n->value + n->weight) % 1000003;
+        free(n);
+    }
+    return acc;
+}
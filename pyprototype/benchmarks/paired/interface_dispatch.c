@@ -0,0 +1,29 @@
+/* Calls through an interface (vtable) value. */
+typedef struct { int (*area)(void *self); } ShapeVTable;
+typedef struct { void *data; const ShapeVTable *vtable; } Shape;
+
+typedef struct { int w, h; } Rect;
+typedef struct { int side; } Square;
+
+static int Rect_area(void *self) { Rect *r = self; return r->w * r->h; }
+static int Square_area(void *self) { Square *s = self; return s->side * s->side; }
+
+static const ShapeVTable rect_vtable = { Rect_area };
+static const ShapeVTable square_vtable = { Square_area };
+
+int kernel(void) {
+    Rect r = { 3, 5 };
+    Square s = { 4 };
+    /* volatile keeps the compiler from devirtualizing, as Fin cannot either */
+    Shape volatile a = { &r, &rect_vtable };
+    Shape volatile b = { &s, &square_vtable };
+    int acc = 0;
+    for (int i = 0; i < 5000000; i++) {
+        if (i % 2 == 0) {
+            acc = (acc + a.vtable->area(a.data)) % 1000003;
+        } else {
+            acc = (acc + b.vtable->area(b.data)) % 1000003;
+        }
+    }
+    return acc;
+}
@@ -0,0 +1,19 @@
+/* Byte-wise hashing of a string literal. */
+#include <string.h>
+
+__attribute__((noinline)) static int hash(const char *s) {
+    int h = 5381;
+    int n = (int)strlen(s);
+    for (int i = 0; i < n; i++) {
+        h = (h * 33 + s[i]) % 1000003;
+    }
+    return h;
+}
+
+int kernel(void) {
+    int acc = 0;
+    for (int i = 0; i < 200000; i++) {
+        acc = (acc + hash("the quick brown fox jumps over the lazy dog")) % 1000003;
+    }
+    return acc;
+}
@@ -0,0 +1,21 @@
+/* Struct values passed to and returned from methods. */
+typedef struct { int x, y; } Vec2;
+
+__attribute__((noinline)) static int Vec2_dot(const Vec2 *self, Vec2 other) {
+    return self->x * other.x + self->y * other.y;
+}
+
+__attribute__((noinline)) static Vec2 Vec2_scaled(const Vec2 *self, int k) {
+    Vec2 r = { self->x * k, self->y * k };
+    return r;
+}
+
+int kernel(void) {
+    int acc = 0;
+    Vec2 a = { 3, 4 };
+    for (int i = 0; i < 5000000; i++) {
+        Vec2 b = Vec2_scaled(&a, i % 7);
+        acc = (acc + Vec2_dot(&b, a)) % 1000003;
+    }
+    return acc;
+}
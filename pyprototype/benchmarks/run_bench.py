@@ -0,0 +1,317 @@
+"""
+Fin compiler benchmark suite.
+
+Measures, per corpus (see benchmarks/corpus.py):
+    lexer           tokens/sec
+    parser          AST nodes/sec (parser.parse)
+    codegen         functions/sec (FinCompiler.compile, parsing excluded)
+    parse_assembly  seconds for binding.parse_assembly + verify
+    mcjit           seconds for create_mcjit_compiler + finalize_object
+and, per kernel in benchmarks/kernels/, the runtime of the JIT-compiled main.
+
+    python -m benchmarks.run_bench -o results.json
+    python -m benchmarks.run_bench --baseline benchmarks/baseline.json
+    python -m benchmarks.run_bench --save-baseline benchmarks/baseline.json
+
+Each value is the best of --repeat runs. With --baseline every metric is
+compared against the stored one and changes beyond --threshold are
+reported; the exit code is 1 if anything regressed. A corpus or kernel
+that fails is recorded as {"error": ...} in the results (and also makes
+the exit code 1); the others still run and the JSON is always written.
+"""
+import argparse
+import ctypes
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from copy import deepcopy
+from pathlib import Path
+
+try:
+    from src.lexer import lexer
+    from src.parser import parser
+except ImportError:
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.lexer import lexer
+    from src.parser import parser
+
+from llvmlite import binding, ir
+from src.codegen.fin import FinCompiler
+from src.codegen.prod.exceptions import load_exception_runtime
+from src.ast2.nodes import Node
+from src.preprocessor.macros import preprocess_macros
+from src.utils.helpers import parse_code, parse_file, enable_parse_cache
+from src.utils.module_loader import ModuleLoader
+
+from benchmarks.corpus import CORPORA
+
+ROOT = Path(__file__).resolve().parent.parent
+KERNELS_DIR = Path(__file__).resolve().parent / "kernels"
+BUILTINS_PATH = ROOT / "stdlib" / "builtins.fin"
+
+# Metric name -> True if higher is better
+HIGHER_IS_BETTER = {
+    "tokens_per_sec": True,
+    "nodes_per_sec": True,
+    "functions_per_sec": True,
+    "seconds": False,
+}
+
+
+def best_of(repeat, fn):
+    """Runs fn() 'repeat' times, returns (min seconds, last result)."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def count_nodes(root):
+    """Counts AST nodes reachable from 'root'."""
+    count, stack, seen = 0, [root], set()
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, Node) and id(item) not in seen:
+            seen.add(id(item))
+            count += 1
+            stack.extend(vars(item).values())
+    return count
+
+
+def lex_all(sources):
+    tokens = 0
+    for name, code in sources.items():
+        lexer.filename = name
+        lexer.lineno = 1
+        lexer.input(preprocess_macros(code))
+        while lexer.token() is not None:
+            tokens += 1
+    return tokens
+
+
+def parse_all(sources):
+    asts = []
+    for name, code in sources.items():
+        lexer.filename = name
+        lexer.lineno = 1
+        asts.append(parser.parse(preprocess_macros(code), lexer=lexer))
+    return asts
+
+
+def new_compiler(entry, builtins_ast):
+    compiler = FinCompiler(
+        entry.read_text(encoding="utf-8"), str(entry),
+        is_jit=True,
+        module_loader=ModuleLoader(entrypoint_file=str(entry)),
+        initial_file_path=str(entry),
+    )
+    compiler.compile(deepcopy(builtins_ast.statements))
+    compiler.compile(parse_file(str(entry)))
+    return compiler
+
+
+def jit(compiler, opt=0):
+    """
+    Returns (parse_assembly seconds, mcjit seconds, engine). With opt > 0 the
+    module is run through LLVM's O<opt> pipeline first (not timed).
+    """
+    start = time.perf_counter()
+    llvm_module = binding.parse_assembly(str(compiler.module))
+    llvm_module.verify()
+    parsed = time.perf_counter()
+    parse_seconds = parsed - start
+
+    target_machine = binding.Target.from_default_triple().create_target_machine(
+        cpu=compiler.target_cpu, features=compiler.target_features, opt=opt,
+    )
+    if opt:
+        pass_builder = binding.create_pass_builder(
+            target_machine, binding.create_pipeline_tuning_options(speed_level=opt)
+        )
+        pass_builder.getModulePassManager().run(llvm_module, pass_builder)
+        parsed = time.perf_counter()
+    if compiler.uses_exceptions:
+        load_exception_runtime()
+    engine = binding.create_mcjit_compiler(llvm_module, target_machine)
+    engine.finalize_object()
+    return parse_seconds, time.perf_counter() - parsed, engine
+
+
+def bench_corpus(name, sources, builtins_ast, repeat):
+    results = {}
+    lines = sum(code.count("\n") + 1 for code in sources.values())
+
+    seconds, tokens = best_of(repeat, lambda: lex_all(sources))
+    results["lexer"] = {"tokens": tokens, "seconds": seconds, "tokens_per_sec": tokens / seconds}
+
+    seconds, asts = best_of(repeat, lambda: parse_all(sources))
+    nodes = count_nodes(asts)
+    results["parser"] = {"nodes": nodes, "seconds": seconds, "nodes_per_sec": nodes / seconds}
+
+    with tempfile.TemporaryDirectory(prefix=f"finbench-{name}-") as tmp:
+        for rel, code in sources.items():
+            Path(tmp, rel).write_text(code, encoding="utf-8")
+        entry = Path(tmp, "main.fin")
+        for rel in sources:
+            parse_file(str(Path(tmp, rel)))  # Warm the parse cache
+
+        seconds, compiler = best_of(repeat, lambda: new_compiler(entry, builtins_ast))
+        functions = sum(1 for f in compiler.module.functions if not f.is_declaration)
+        results["codegen"] = {
+            "functions": functions, "seconds": seconds, "functions_per_sec": functions / seconds,
+        }
+
+        asm, mcjit = [], []
+        for _ in range(repeat):
+            a, m, _ = jit(compiler)
+            asm.append(a)
+            mcjit.append(m)
+        results["parse_assembly"] = {"ir_bytes": len(str(compiler.module)), "seconds": min(asm)}
+        results["mcjit"] = {"seconds": min(mcjit)}
+
+    results["lines"] = lines
+    return results
+
+
+def bench_kernel(path, builtins_ast, repeat):
+    compiler = new_compiler(path, builtins_ast)
+    _, _, engine = jit(compiler)
+    engine.run_static_constructors()
+
+    main = compiler.main_function
+    returns_int = isinstance(main.function_type.return_type, ir.IntType)
+    func = ctypes.CFUNCTYPE(ctypes.c_int if returns_int else None)(
+        engine.get_function_address(main.name)
+    )
+
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    engine.run_static_destructors()
+    return {"seconds": min(times), "median": statistics.median(times), "result": result}
+
+
+def describe_error(exc):
+    return f"{type(exc).__name__}: {exc}"
+
+
+def flatten(results):
+    """{'a': {'b': {'seconds': 1}}} -> {'a.b.seconds': 1}, comparable metrics only."""
+    flat = {}
+    for group, entries in results.items():
+        if not isinstance(entries, dict):
+            continue
+        for name, phases in entries.items():
+            if not isinstance(phases, dict):
+                continue
+            for phase, metrics in phases.items():
+                if not isinstance(metrics, dict):
+                    continue
+                for metric, value in metrics.items():
+                    if metric in HIGHER_IS_BETTER:
+                        flat[f"{group}.{name}.{phase}.{metric}"] = value
+    return flat
+
+
+def compare(results, baseline, threshold):
+    """Returns [(key, old, new, change)] for metrics worse than 'threshold'."""
+    regressions = []
+    current, previous = flatten(results), flatten(baseline)
+    for key in sorted(current.keys() & previous.keys()):
+        old, new = previous[key], current[key]
+        if not old:
+            continue
+        change = (new - old) / old
+        higher_is_better = HIGHER_IS_BETTER[key.rsplit(".", 1)[1]]
+        worse = -change if higher_is_better else change
+        marker = "REGRESSION" if worse > threshold else ("improved" if worse < -threshold else "")
+        print(f"  {key:<60} {old:>14.6g} -> {new:>14.6g} ({change:+.1%}) {marker}")
+        if worse > threshold:
+            regressions.append((key, old, new, change))
+    return regressions
+
+
+def main(argv=None):
+    prs = argparse.ArgumentParser(description="Fin compiler benchmarks")
+    prs.add_argument("-o", "--output", type=str, help="Write results JSON to this file")
+    prs.add_argument("--baseline", type=str, help="Compare against a stored results JSON")
+    prs.add_argument("--save-baseline", type=str, metavar="FILE", help="Store these results as the baseline")
+    prs.add_argument("--threshold", type=float, default=0.10, help="Relative change reported as regression (default 0.10)")
+    prs.add_argument("--repeat", type=int, default=5, help="Runs per measurement, best is kept (default 5)")
+    prs.add_argument("--scale", type=int, default=1, help="Synthetic corpus size multiplier")
+    prs.add_argument("--only", type=str, help="Comma-separated corpus/kernel names to run")
+    args = prs.parse_args(argv)
+
+    binding.initialize_native_target()
+    binding.initialize_native_asmprinter()
+    binding.initialize_native_asmparser()
+    lexer.parser_instance = parser
+    enable_parse_cache()
+    builtins_ast = parse_code(BUILTINS_PATH.read_text(encoding="utf-8"), BUILTINS_PATH.name)
+    only = set(args.only.split(",")) if args.only else None
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu": binding.get_host_cpu_name(),
+            "llvm": ".".join(map(str, binding.llvm_version_info)),
+            "scale": args.scale,
+            "repeat": args.repeat,
+        },
+        "corpora": {},
+        "kernels": {},
+    }
+
+    failures = 0
+    for name, generator in CORPORA.items():
+        if only and name not in only:
+            continue
+        print(f"corpus {name}...", flush=True)
+        try:
+            results["corpora"][name] = bench_corpus(name, generator(args.scale), builtins_ast, args.repeat)
+        except Exception as e:  # Recorded, so one broken corpus does not lose the others
+            failures += 1
+            results["corpora"][name] = {"error": describe_error(e)}
+            print(f"corpus {name} FAILED: {describe_error(e)}", flush=True)
+
+    for path in sorted(KERNELS_DIR.glob("*.fin")):
+        if only and path.stem not in only:
+            continue
+        print(f"kernel {path.stem}...", flush=True)
+        try:
+            results["kernels"][path.stem] = {"runtime": bench_kernel(path, builtins_ast, args.repeat)}
+        except Exception as e:
+            failures += 1
+            results["kernels"][path.stem] = {"error": describe_error(e)}
+            print(f"kernel {path.stem} FAILED: {describe_error(e)}", flush=True)
+
+    text = json.dumps(results, indent=2, sort_keys=True)
+    for target in (args.output, args.save_baseline):
+        if target:
+            Path(target).write_text(text + "\n")
+    if not args.output and not args.save_baseline:
+        print(text)
+
+    if args.baseline:
+        print(f"--- Compared to {args.baseline} (threshold {args.threshold:.0%}) ---")
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.threshold)
+        print(f"{len(regressions)} regression(s)")
+        return 1 if regressions or failures else 0
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Generated-code quality: Fin kernels against equivalent C.
+
+Every kernel in benchmarks/paired/ exists twice: 'name.fin' (entry 'main')
+and 'name.c' (entry 'int kernel(void)'). The C side is built as a shared
+object with the local C compiler, the Fin side is compiled with FinCompiler
+and JIT-ed; both are called in-process through ctypes and timed the same
+way. Both must return the same value. A kernel that fails to build or run
+is recorded with its error and the remaining kernels still run.
+
+    python -m benchmarks.run_vs_c [-O 2] [--cc clang] [-o results.json]
+
+The reported ratio is fin_seconds / c_seconds (1.0 = parity, lower is better).
+"""
+import argparse
+import ctypes
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from llvmlite import binding, ir
+
+from benchmarks.run_bench import BUILTINS_PATH, new_compiler, jit
+from src.utils.helpers import parse_code, enable_parse_cache
+
+PAIRED_DIR = Path(__file__).resolve().parent / "paired"
+
+
+def find_cc(preferred=None):
+    for candidate in ([preferred] if preferred else []) + [os.environ.get("CC"), "clang", "gcc", "cc"]:
+        if candidate and shutil.which(candidate):
+            return candidate
+    raise RuntimeError("No C compiler found (tried $CC, clang, gcc, cc)")
+
+
+def time_calls(func, repeat):
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def build_c(cc, source, out_dir, opt):
+    lib = Path(out_dir, source.stem + ".so")
+    subprocess.run(
+        [cc, f"-O{opt}", "-march=native", "-shared", "-fPIC", "-o", str(lib), str(source)],
+        check=True,
+    )
+    kernel = ctypes.CDLL(str(lib)).kernel
+    kernel.restype = ctypes.c_int
+    return kernel
+
+
+def build_fin(source, builtins_ast, opt):
+    compiler = new_compiler(source, builtins_ast)
+    _, _, engine = jit(compiler, opt)
+    engine.run_static_constructors()
+    main = compiler.main_function
+    if not isinstance(main.function_type.return_type, ir.IntType):
+        raise RuntimeError(f"{source.name}: 'main' must return <int>")
+    # Keep the engine alive as long as the function pointer
+    func = ctypes.CFUNCTYPE(ctypes.c_int)(engine.get_function_address(main.name))
+    return func, engine
+
+
+def main(argv=None):
+    prs = argparse.ArgumentParser(description="Fin vs C generated-code benchmarks")
+    prs.add_argument("-O", "--opt", type=int, default=2, help="Optimization level for both sides (default 2)")
+    prs.add_argument("--cc", type=str, help="C compiler (default: $CC, clang, gcc, cc)")
+    prs.add_argument("--repeat", type=int, default=5, help="Runs per kernel, best is kept (default 5)")
+    prs.add_argument("--only", type=str, help="Comma-separated kernel names to run")
+    prs.add_argument("-o", "--output", type=str, help="Write results JSON to this file")
+    args = prs.parse_args(argv)
+
+    binding.initialize_native_target()
+    binding.initialize_native_asmprinter()
+    binding.initialize_native_asmparser()
+    enable_parse_cache()
+    builtins_ast = parse_code(BUILTINS_PATH.read_text(encoding="utf-8"), BUILTINS_PATH.name)
+    cc = find_cc(args.cc)
+    only = set(args.only.split(",")) if args.only else None
+
+    results = {"meta": {"cc": cc, "opt": args.opt, "cpu": binding.get_host_cpu_name()}, "kernels": {}}
+    mismatches = failures = 0
+
+    print(f"{'kernel':<22} {'C (s)':>10} {'Fin (s)':>10} {'ratio':>8}")
+    with tempfile.TemporaryDirectory(prefix="finbench-c-") as tmp:
+        for fin_source in sorted(PAIRED_DIR.glob("*.fin")):
+            name = fin_source.stem
+            c_source = fin_source.with_suffix(".c")
+            if (only and name not in only) or not c_source.exists():
+                continue
+
+            try:
+                c_seconds, c_result = time_calls(build_c(cc, c_source, tmp, args.opt), args.repeat)
+                fin_func, engine = build_fin(fin_source, builtins_ast, args.opt)
+                fin_seconds, fin_result = time_calls(fin_func, args.repeat)
+                engine.run_static_destructors()
+            except Exception as e:  # One broken kernel must not hide the others
+                failures += 1
+                results["kernels"][name] = {"error": f"{type(e).__name__}: {e}"}
+                print(f"{name:<22} FAILED ({type(e).__name__}: {e})")
+                continue
+
+            ratio = fin_seconds / c_seconds if c_seconds else float("inf")
+            results["kernels"][name] = {
+                "c_seconds": c_seconds, "fin_seconds": fin_seconds, "ratio": ratio,
+                "c_result": c_result, "fin_result": fin_result,
+            }
+            note = ""
+            if c_result != fin_result:
+                mismatches += 1
+                note = f"  MISMATCH (C={c_result}, Fin={fin_result})"
+            print(f"{name:<22} {c_seconds:>10.4f} {fin_seconds:>10.4f} {ratio:>7.2f}x{note}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+    return 1 if mismatches or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -46,10 +46,10 @@ from .essentials import *
 
 # <Method name=_create_collection_from_array_literal args=[<Compiler>, <ir.Value>, <ir.Type>]>
 # <Description>
-# Converts a Static Array Value ([N x T]) into a Collection ({T*, N}).
+# Converts a Static Array Value ([N x T]) into a Collection ({T*, N, N}).
 # 1. Calculates exact element size using LLVM GEP arithmetic (handles padding correctly).
 # 2. Allocates Heap Memory.
-# 3. Copies elements from the static array to the heap.
+# 3. Copies elements from the static array to the heap (memcpy for constants).
 # 4. Returns the Collection struct.
 # </Description>
 def create_collection_from_array_literal(compiler: Compiler, array_val: ir.Value, element_type: ir.Type) -> ir.Value:
@@ -67,7 +67,7 @@ def create_collection_from_array_literal(compiler: Compiler, array_val: ir.Value
     
     if compiler.data_layout_obj:
         # Preferred: Use DataLayout if available (Compile-time constant)
-        elem_size_int = llvm_elem_type.get_abi_size(compiler.data_layout_obj)
+        elem_size_int = compiler.abi_size(llvm_elem_type)
         elem_size = ir.Constant(ir.IntType(64), elem_size_int)
     else:
         # Fallback: Generate IR to calculate size (Runtime/Linktime constant)
@@ -94,32 +94,15 @@ def create_collection_from_array_literal(compiler: Compiler, array_val: ir.Value
     # 4. Cast to Element Pointer (T*)
     data_ptr = compiler.builder.bitcast(raw_ptr, llvm_elem_type.as_pointer(), name="coll_data_ptr")
     
-    # 5. Store Data (Copy Loop)
-    # We extract from the array value and store into the heap pointer.
-    # Note: For very large arrays, memcpy is better, but extract/store is safer for 
-    # handling SSA values without needing an intermediate stack slot.
-    
-    for i in range(count):
-        # Extract value from the [N x T] array
-        val = compiler.builder.extract_value(array_val, i)
-        
-        # Calculate address in heap: data_ptr + i
-        idx = ir.Constant(ir.IntType(32), i)
-        dest_gep = compiler.builder.gep(data_ptr, [idx])
-        
-        # Store
-        compiler.builder.store(val, dest_gep)
+    # 5. Store Data
+    # Constant elements are one memcpy from a private constant global; only
+    # runtime elements are stored one by one (see prod/arrays.py store_array_value).
+    compiler.store_array_value(array_val, data_ptr)
 
-    # 6. Create Collection Struct { T*, i32 }
-    # We use the specific struct type for this collection
-    coll_type = ir.LiteralStructType([
-        llvm_elem_type.as_pointer(), 
-        ir.IntType(32)
-    ])
-    
-    coll_val = ir.Constant(coll_type, ir.Undefined)
-    coll_val = compiler.builder.insert_value(coll_val, data_ptr, 0)
-    coll_val = compiler.builder.insert_value(coll_val, ir.Constant(ir.IntType(32), count), 1)
+    # 6. Create Collection Struct { T*, len, cap }
+    # The buffer is exactly full: the first push grows it (see prod/collections.py)
+    coll_type = compiler.collection_type(llvm_elem_type)
+    coll_val = compiler.build_collection(coll_type, data_ptr, count)
     
     return coll_val
 
@@ -67,13 +67,43 @@ from .prod.funcs import compile_function_declaration, compile_return, compile_la
 # Pointer
 from .prod.memory import compile_address_of, compile_dereference, compile_as_ptr, compile_sizeof, compile_new, compile_delete
 # Array
-from .prod.arrays import compile_array_index, compile_array_literal
+from .prod.arrays import compile_array_index, compile_array_literal, store_array_value
 # Error Handling
 from .prod.flow import compile_try_catch, compile_blame, compile_foreach
 # Metaprogramming
 from .prod.metaprogramming import compile_special_call, compile_special_declaration
 # Macros
 from .prod.macros import compile_macro_declaration, compile_macro_call
+# Targets
+from .prod.targets import resolve_host_target
+# Profile-Guided Optimization
+from .prod.pgo import setup_pgo, emit_profiled_cbranch, emit_profiled_entry
+# Runtime Profiler
+from .prod.instrument import (setup_instrumentation, emit_instrument_prologue,
+emit_instrument_epilogue, attach_instrumentation, collect_instrumentation)
+# Perf Map
+from .prod.perfmap import capture_jit_object, write_perf_map, demangle_name
+# SSA Builder
+from .prod.ssa import setup_ssa, create_block_params, branch_with_args, define_ssa_value
+# Compile Statistics
+from .prod.stats import setup_stats, count_stat, count_mono_instance, stats_mark, count_macro_expansion
+# Bounds-Check Elimination
+from .prod.bounds import setup_bounds, record_counter_range, bounds_check_guard
+# Panic Stubs
+from .prod.panics import setup_panics, get_panic_function, emit_panic_check
+# Exceptions
+from .prod.exceptions import (setup_exceptions, load_exception_runtime, emit_throw, emit_landing_pad,
+emit_cleanup_pad, emit_call, emit_invokes, emit_rethrow, load_caught_value, finish_catch, type_tag)
+# Collections
+from .prod.collections import (setup_collections, collection_type, is_collection_type, build_collection,
+to_index, compile_collection_method)
+from .prod.abi import (passes_indirectly, lower_function_type, apply_abi_attributes, return_slot,
+source_arguments, source_signature, emit_abi_call, call_site_attributes, store_value, aggregate_address,
+copy_aggregate)
+from .prod.escape import setup_escape_analysis, analyze_escapes, stack_allocate_new, is_stack_delete
+from .prod.arena import (setup_arenas, emit_arena_prologue, emit_arena_epilogue, emit_allocation, emit_deallocation,
+arena_owns, in_arena)
+from .prod.pools import setup_pools, struct_pool, pool_allocate, pool_free, collect_pool_stats
 # --- Codegen ---
 # Module
 from .modules import compile_module_access, compile_import
@@ -94,7 +124,9 @@ from .compiletime.errors import ErrorHandler
 # Compiler Components Import
 from .helpers import (enter_scope, exit_scope, get_mangled_name, classify_mode, 
 get_mono_mangled_name, box_value, unbox_value, is_any_type,
-merge_scope, _emit_runtime_check_zero, pack_any,)
+merge_scope, _emit_runtime_check_zero, pack_any, register_global_ctor,
+register_global_dtor, get_or_declare_function, create_entry_alloca,
+abi_size, abi_alignment, call_runtime_function,)
 from .variables import create_variable_mut, create_variable_immut, get_variable, set_variable, guess_type, create_global_string
 from .functions import create_function, compile_function_call, instantiate_and_compile_generic
 from .types import (convert_type, ast_to_fin_type, ast_to_fin_type_pattern, 
@@ -105,7 +137,8 @@ from .structs import (compile_struct, compile_member_access,
 compile_struct_method, compile_operator,emit_operator_call,
 compile_struct_instantiation,lookup_field_type_ast,
 get_generic_params_of_struct, compile_struct_field_access,
-allocate_and_init_struct, compile_actual_method_call)
+allocate_and_init_struct, init_struct_fields, struct_init_template, compile_actual_method_call,
+compile_constructor, resolve_constructor, emit_constructor_call, scout_struct_layout)
 from .interfaces import (compile_interface,
 pack_interface, get_interface_type)
 from .arrays import create_collection_from_array_literal
@@ -113,16 +146,6 @@ from .modules import (compile_and_import_file,
 compile_import,compile_module_access)
 # -------------------------------------------
 
-def _debug_getattr(self, name):
-    if name == 'pointee':
-        print(f"\n[FATAL DEBUG] Accessed .pointee on IdentifiedStructType: {self}")
-        print("Stack Trace of the crash:")
-        traceback.print_stack()
-        raise AttributeError(f"'IdentifiedStructType' object {self} has no attribute 'pointee'")
-    raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
-
-ir.IdentifiedStructType.__getattr__ = _debug_getattr
-
 def safe_pointee(obj):
     """Safely get .pointee, raising a clear error if missing."""
     # If it's a Value, get its type first
@@ -204,6 +227,7 @@ class FinCompiler:
 
     # --- Struct Helpers (src/codegen/structs.py) ---
     compile_struct = compile_struct
+    scout_struct_layout = scout_struct_layout
     compile_struct_instantiation = compile_struct_instantiation
     compile_member_access = compile_member_access
     compile_struct_method = compile_struct_method
@@ -212,7 +236,12 @@ class FinCompiler:
     compile_struct_method_call = compile_struct_method_call
     compile_struct_field_access = compile_struct_field_access
     allocate_and_init_struct = allocate_and_init_struct
+    init_struct_fields = init_struct_fields
+    struct_init_template = struct_init_template
     compile_actual_method_call = compile_actual_method_call
+    compile_constructor = compile_constructor
+    resolve_constructor = resolve_constructor
+    emit_constructor_call = emit_constructor_call
     
     # --- Interface Helpers (src/codegen/interfaces.py) ---
     compile_interface = compile_interface
@@ -228,6 +257,8 @@ class FinCompiler:
 
     # --- Array Helpers (src/codegen/arrays.py) ---
     create_collection_from_array_literal = create_collection_from_array_literal
+    store_array_value = store_array_value # src/codegen/prod/arrays.py
+    compile_array_index = compile_array_index # src/codegen/prod/arrays.py
     
     # --- Module Helpers (src/codegen/modules.py) ---
     compile_and_import_file = compile_and_import_file
@@ -239,29 +270,126 @@ class FinCompiler:
     merge_scope = merge_scope
     get_mono_mangled_name = get_mono_mangled_name
     _emit_runtime_check_zero = _emit_runtime_check_zero
+    register_global_ctor = register_global_ctor
+    register_global_dtor = register_global_dtor
+    get_or_declare_function = get_or_declare_function
+    call_runtime_function = call_runtime_function
+    create_entry_alloca = create_entry_alloca
+    abi_size = abi_size
+    abi_alignment = abi_alignment
+
+    # --- Profile-Guided Optimization (src/codegen/prod/pgo.py) ---
+    emit_profiled_cbranch = emit_profiled_cbranch
+    emit_profiled_entry = emit_profiled_entry
+
+    # --- Runtime Profiler (src/codegen/prod/instrument.py) ---
+    emit_instrument_prologue = emit_instrument_prologue
+    emit_instrument_epilogue = emit_instrument_epilogue
+
+    # --- Perf Map (src/codegen/prod/perfmap.py) ---
+    demangle_name = demangle_name
+
+    # --- SSA Builder (src/codegen/prod/ssa.py) ---
+    create_block_params = create_block_params
+    branch_with_args = branch_with_args
+    define_ssa_value = define_ssa_value
+
+    # --- Compile Statistics (src/codegen/prod/stats.py) ---
+    count_stat = count_stat
+    count_mono_instance = count_mono_instance
+    stats_mark = stats_mark
+    count_macro_expansion = count_macro_expansion
+
+    # --- Bounds-Check Elimination (src/codegen/prod/bounds.py) ---
+    record_counter_range = record_counter_range
+    bounds_check_guard = bounds_check_guard
+
+    # --- Panic Stubs (src/codegen/prod/panics.py) ---
+    get_panic_function = get_panic_function
+    emit_panic_check = emit_panic_check
+
+    # --- Exceptions (src/codegen/prod/exceptions.py) ---
+    emit_throw = emit_throw
+    emit_landing_pad = emit_landing_pad
+    emit_cleanup_pad = emit_cleanup_pad
+    emit_call = emit_call
+    emit_invokes = emit_invokes
+    emit_rethrow = emit_rethrow
+    load_caught_value = load_caught_value
+    finish_catch = finish_catch
+    type_tag = type_tag
+
+    # --- Collections (src/codegen/prod/collections.py) ---
+    collection_type = collection_type
+    is_collection_type = is_collection_type
+    build_collection = build_collection
+    to_index = to_index
+    compile_collection_method = compile_collection_method
+
+    # --- Aggregate ABI (src/codegen/prod/abi.py) ---
+    passes_indirectly = passes_indirectly
+    lower_function_type = lower_function_type
+    apply_abi_attributes = apply_abi_attributes
+    return_slot = return_slot
+    source_arguments = source_arguments
+    source_signature = source_signature
+    emit_abi_call = emit_abi_call
+    call_site_attributes = call_site_attributes
+    store_value = store_value
+    aggregate_address = aggregate_address
+    copy_aggregate = copy_aggregate
+
+    # --- Escape Analysis (src/codegen/prod/escape.py) ---
+    analyze_escapes = analyze_escapes
+    stack_allocate_new = stack_allocate_new
+    is_stack_delete = is_stack_delete
+
+    # --- Arena Regions (src/codegen/prod/arena.py) ---
+    emit_arena_prologue = emit_arena_prologue
+    emit_arena_epilogue = emit_arena_epilogue
+    emit_allocation = emit_allocation
+    emit_deallocation = emit_deallocation
+    arena_owns = arena_owns
+    in_arena = in_arena
+
+    # --- Pooled Structs (src/codegen/prod/pools.py) ---
+    struct_pool = struct_pool
+    pool_allocate = pool_allocate
+    pool_free = pool_free
 
     def fin_type_to_ast(self, fin_type):
         return fin_type_to_ast(fin_type)
     
-    def __init__(self, source_code:str,file_name:str,opt=None, codemodel=None, is_jit=False, module_loader=None, initial_file_path=None):
+    def __init__(self, source_code:str,file_name:str,opt=None, codemodel=None, is_jit=False, module_loader=None, initial_file_path=None, cpu=None, features=None, profile_generate=None, profile_use=None, instrument=False, perf_map=False, stats=False, build_profile="debug"):
         # Initialize ErrorHandler
         self.errors = ErrorHandler(source_code, file_name)
         # Initialize binding
         binding.initialize_native_target()
         binding.initialize_native_asmprinter()
+        binding.initialize_native_asmparser() # Inline asm (CPUID dispatch)
 
         # ------------------ Declare module ---------------------
-        self.module = ir.Module(name="fin_module")
+        # Each compiler owns its type context, so identified struct names
+        # never collide between compilations sharing a process.
+        self.context = ir.Context()
+        self.module = ir.Module(name="fin_module", context=self.context)
         
         #--------- Runner check -------
         try:
             # Get target triple
             self.target_triple = binding.get_default_triple()
             self.target = binding.Target.from_triple(self.target_triple)
+            # CPU / Features: host by default, 'generic' for portable builds
+            self.target_cpu, self.target_features = resolve_host_target(cpu, features)
             if is_jit:
-                self.target_machine = self.target.create_target_machine()
+                self.target_machine = self.target.create_target_machine(
+                    cpu=self.target_cpu,
+                    features=self.target_features,
+                )
             else:
                 self.target_machine = self.target.create_target_machine(
+                    cpu=self.target_cpu,
+                    features=self.target_features,
                     reloc="static",
                     codemodel="default" if not codemodel else codemodel,
                     opt=0 if not opt else opt,
@@ -300,6 +428,7 @@ class FinCompiler:
         self.struct_types: Dict[str, ir.Type] = {}
         self.struct_field_indices: Dict[str, Dict[str, int]] = {}
         self.struct_field_defaults: Dict[str, Dict[str, Node]] = {} # Maps 'MangledStructName' -> { 'field_name': DefaultValueAST }
+        self.struct_init_templates: Dict[str, Tuple[ir.Constant, Set[str], Optional[ir.GlobalVariable]]] = {} # Maps 'MangledStructName' -> constant initializer
         self.struct_field_visibility: Dict[str, Dict[str, Visibility]] = {} # Stores { 'StructName': { 'field_name': 'public' } }
         self.struct_field_types_registry: Dict[str, Dict[str, str]] = {} # { 'Box': {'val': 'T'} }
         self.struct_generic_params_registry: Dict[str, List[str]] = {} # { 'Box': ['T'] }
@@ -311,7 +440,7 @@ class FinCompiler:
         self.current_struct_name: str = None # For 'Self' resolution
         self.current_struct_type: ir.Type = None # For 'Self' resolution
         self.inheritance_map: Dict[str, List[str]] = {} # Child -> [Parents]
-        self.interfaces: Set[str] = {}
+        self.interfaces: Set[str] = set()
         # ---------------------------------
         # --------------- Enums ------------
         self.enum_types: Dict[str, ir.Type] = {}
@@ -335,6 +464,7 @@ class FinCompiler:
         self.function_registry: Dict[str, FunctionDeclaration] = {}
         self.function_visibility: Dict[str, str] = {}
         self.function_origins: Dict[str, str] = {}
+        self.mangled_modules: Dict[str, str] = {} # Sanitized path prefix -> 'dir.module'
         self.main_function: Optional[ir.Function] = None
         self.current_function: Optional[ir.FunctionType] = None
         # ---------- Strings -------------
@@ -364,6 +494,32 @@ class FinCompiler:
         
         # ------------- Macros ------------
         self.macros = {}
+        # ------------- @embed ------------
+        self.embedded_files = {} # (path, element size) -> private constant global
+        # --------------------------------
+
+        # ------------- PGO ---------------
+        setup_pgo(self, profile_generate, profile_use)
+        # ------------- Runtime Profiler ---------------
+        setup_instrumentation(self, instrument)
+        # ------------- Perf Map ---------------
+        self.perf_map = perf_map # Write /tmp/perf-<pid>.map from runwithjit
+        self.jit_objects: List[bytes] = []
+        # ------------- SSA Builder ---------------
+        setup_ssa(self)
+        # ------------- Compile Statistics ---------------
+        setup_stats(self, stats)
+        # ------------- Bounds Checks ---------------
+        setup_bounds(self, build_profile)
+        # ------------- Panic Stubs ---------------
+        setup_panics(self)
+        # ------------- Exceptions ---------------
+        setup_exceptions(self)
+        # ------------- Collections ---------------
+        setup_collections(self)
+        setup_escape_analysis(self)
+        setup_arenas(self)
+        setup_pools(self)
         # --------------------------------
 
 
@@ -468,6 +624,8 @@ class FinCompiler:
         # Structs
         elif isinstance(ast, StructDeclaration):
             return compile_struct(self, ast)
+        elif isinstance(ast, InterfaceDeclaration):
+            return compile_interface(self, ast)
         elif isinstance(ast, StructInstantiation):
             return compile_struct_instantiation(self, ast)
         elif isinstance(ast, MemberAccess):
@@ -505,8 +663,9 @@ class FinCompiler:
                     mangled_name = self.get_mangled_name(node.name)
                     if mangled_name not in self.struct_types:
                         # Create Opaque Type
-                        struct_ty = ir.global_context.get_identified_type(mangled_name)
+                        struct_ty = self.context.get_identified_type(mangled_name)
                         self.struct_types[mangled_name] = struct_ty
+                        scout_struct_layout(self, node) # Sized for the prototypes below
                 
                 elif isinstance(node, InterfaceDeclaration):
                     mangled_name = self.get_mangled_name(node.name)
@@ -539,20 +698,40 @@ class FinCompiler:
             self.errors.error(ast,f"Unsupported AST node type: {type(ast)}")
         return self.module
     def shutdown(self):
-        binding.shutdown()
+        # LLVM itself (binding) is process-wide and may be shared with other
+        # FinCompiler instances, so only release what this compiler owns.
+        self.builder = None
+        self.function = None
+        self.jit_objects = []
     def runwithjit(self, entry_function_name="main"):
         llvm_module = binding.parse_assembly(str(self.module))
         llvm_module.verify()
 
-        target_machine = binding.Target.from_default_triple().create_target_machine()
+        target_machine = binding.Target.from_default_triple().create_target_machine(
+            cpu=self.target_cpu,
+            features=self.target_features,
+        )
+        if self.uses_exceptions:
+            load_exception_runtime() # __cxa_throw, personality, unwinder
         engine = binding.create_mcjit_compiler(llvm_module, target_machine)
+        capture_jit_object(self, engine)
 
         engine.finalize_object()
+        write_perf_map(self, engine)
         engine.run_static_constructors()
+        attach_instrumentation(self, engine)
 
         if self.main_function is None:
             raise Exception("No 'main' function found to JIT.")
 
         func_ptr = engine.get_function_address(self.main_function.name)
-        func = ctypes.CFUNCTYPE(None)(func_ptr)
-        func()
\ No newline at end of file
+        # 'main <int>' reports its status, 'main <void>' always succeeds
+        returns_int = isinstance(self.main_function.function_type.return_type, ir.IntType)
+        func = ctypes.CFUNCTYPE(ctypes.c_int if returns_int else None)(func_ptr)
+        result = func()
+
+        # Flushes PGO profiles and other 'llvm.global_dtors' work
+        engine.run_static_destructors()
+        collect_instrumentation(self, engine)
+        collect_pool_stats(self, engine)
+        return result if returns_int else 0
\ No newline at end of file
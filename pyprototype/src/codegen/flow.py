@@ -43,6 +43,7 @@
 # “Code fades. Love leaves a signature.”
 # =============================================================================
 from .essentials import *
+from .prod.ssa import is_ssa_safe
 
 # ---------------------------------------------------------------------------
 # <Method name=create_block args=[<Compiler>, <str>]>
@@ -198,7 +199,7 @@ def compile_if(compiler: Compiler, ast: IfStatement):
     if ast.elifs or ast.else_body:
         current_false_target_bb = func.append_basic_block(f"if_cond_false{if_id_suffix}")
 
-    compiler.builder.cbranch(cond_val, then_bb, current_false_target_bb)
+    compiler.emit_profiled_cbranch("if", cond_val, then_bb, current_false_target_bb)
 
     # 3. Compile THEN Block
     compiler.builder.position_at_end(then_bb)
@@ -220,7 +221,7 @@ def compile_if(compiler: Compiler, ast: IfStatement):
 
             # Compile Elif Condition
             elif_cond_val = compiler.compile(elif_cond_ast)
-            compiler.builder.cbranch(elif_cond_val, elif_then_bb, next_false_target_for_elif)
+            compiler.emit_profiled_cbranch("elif", elif_cond_val, elif_then_bb, next_false_target_for_elif)
 
             # Compile Elif Body
             compiler.builder.position_at_end(elif_then_bb)
@@ -270,7 +271,7 @@ def compile_while(compiler: Compiler, ast: WhileLoop):
     if not (isinstance(cond_val.type, ir.IntType) and cond_val.type.width == 1):
         compiler.errors.error(ast.condition, f"While condition must be boolean, got {cond_val.type}")
         
-    compiler.builder.cbranch(cond_val, body_block, end_block)
+    compiler.emit_profiled_cbranch("while", cond_val, body_block, end_block)
 
     # 3. Compile Body
     compiler.builder.position_at_end(body_block)
@@ -298,22 +299,28 @@ def compile_while(compiler: Compiler, ast: WhileLoop):
 # <Description>
 # Compiles C-style 'for' loops.
 # Structure: Init -> Cond -> Body -> Increment -> Cond
+# An integer counter that only the increment writes ('i++', 'i += n',
+# 'i = expr'; see is_ssa_safe) is kept in SSA form: a block parameter
+# (phi) of the Cond block instead of a stack slot.
 # </Description>
 def compile_for(compiler: Compiler, ast: ForLoop):
     # 1. Enter Scope (for the Init variable)
     compiler.enter_scope()
 
-    # 2. Compile Init (e.g. let i = 0)
-    if ast.init is not None:
-        compiler.compile(ast.init)
-
-    # 3. Create Blocks
+    # 2. Create Blocks
     cond_block = compiler.function.append_basic_block("for_cond")
     body_block = compiler.function.append_basic_block("for_body")
     inc_block = compiler.function.append_basic_block("for_inc")
     end_block = compiler.function.append_basic_block("for_end")
 
-    compiler.builder.branch(cond_block)
+    # 3. Compile Init (e.g. let i = 0), as an SSA counter when possible
+    counter = _compile_ssa_counter_init(compiler, ast, cond_block)
+    if counter is not None:
+        compiler.record_counter_range(ast, counter)
+    else:
+        if ast.init is not None:
+            compiler.compile(ast.init)
+        compiler.builder.branch(cond_block)
 
     # 4. Compile Condition
     compiler.builder.position_at_end(cond_block)
@@ -322,7 +329,7 @@ def compile_for(compiler: Compiler, ast: ForLoop):
     if not (isinstance(cond_val.type, ir.IntType) and cond_val.type.width == 1):
         compiler.errors.error(ast.condition, f"For loop condition must be boolean.")
         
-    compiler.builder.cbranch(cond_val, body_block, end_block)
+    compiler.emit_profiled_cbranch("for", cond_val, body_block, end_block)
 
     # 5. Compile Body
     compiler.builder.position_at_end(body_block)
@@ -344,16 +351,74 @@ def compile_for(compiler: Compiler, ast: ForLoop):
 
     # 6. Compile Increment
     compiler.builder.position_at_end(inc_block)
-    if ast.increment is not None:
-        compiler.compile(ast.increment)
+    if counter is not None:
+        compiler.branch_with_args(cond_block, [_compile_ssa_counter_step(compiler, ast.increment, counter)])
+    else:
+        if ast.increment is not None:
+            compiler.compile(ast.increment)
 
-    if not compiler.builder.block.is_terminated:
-        compiler.builder.branch(cond_block)
+        if not compiler.builder.block.is_terminated:
+            compiler.builder.branch(cond_block)
 
     # 7. Resume
     compiler.builder.position_at_end(end_block)
     compiler.exit_scope() # Exit init scope
 
+# ---------------------------------------------------------------------------
+# <Method name=_compile_ssa_counter_init args=[<Compiler>, <ForLoop>, <ir.Block>]>
+# <Description>
+# If the loop variable can be an SSA counter, compiles the init value,
+# binds the name to a phi of 'cond_block' and branches there.
+# Returns the phi, or None (nothing emitted) if the loop does not qualify.
+# </Description>
+def _compile_ssa_counter_init(compiler: Compiler, ast: ForLoop, cond_block: ir.Block) -> Optional[ir.PhiInstr]:
+    init = ast.init
+    if not isinstance(init, VariableDeclaration) or init.value is None or init.type == "auto":
+        return None
+    name = init.identifier
+    step = ast.increment
+    if isinstance(step, PostfixOperator):
+        simple_step = step.operand == name and step.operator in ("++", "--")
+    elif isinstance(step, Assignment):
+        simple_step = step.identifier == name and step.operator in ("=", "+=", "-=") \
+            and is_ssa_safe(name, step.value)
+    else:
+        simple_step = False
+    if not simple_step or not is_ssa_safe(name, ast.condition, ast.body):
+        return None
+
+    counter_type = compiler.convert_type(init.type)
+    if not isinstance(counter_type, ir.IntType):
+        return None
+
+    init_val = _coerce_counter(compiler, compiler.compile(init.value), counter_type)
+    [counter] = compiler.create_block_params(cond_block, [counter_type], [name])
+    compiler.branch_with_args(cond_block, [init_val])
+    compiler.define_ssa_value(name, counter, compiler.ast_to_fin_type(init.type))
+    return counter
+
+def _compile_ssa_counter_step(compiler: Compiler, step: Node, counter: ir.PhiInstr) -> ir.Value:
+    if isinstance(step, PostfixOperator):
+        one = ir.Constant(counter.type, 1)
+        if step.operator == "++":
+            return compiler.builder.add(counter, one, name="inc")
+        return compiler.builder.sub(counter, one, name="dec")
+
+    value = _coerce_counter(compiler, compiler.compile(step.value), counter.type)
+    if step.operator == "+=":
+        return compiler.builder.add(counter, value, name="inc")
+    if step.operator == "-=":
+        return compiler.builder.sub(counter, value, name="dec")
+    return value
+
+def _coerce_counter(compiler: Compiler, value: ir.Value, counter_type: ir.IntType) -> ir.Value:
+    if isinstance(value.type, ir.IntType):
+        if value.type.width != counter_type.width:
+            return compiler.builder.sext(value, counter_type) if value.type.width < counter_type.width \
+                else compiler.builder.trunc(value, counter_type)
+        return value
+    return compiler.builder.fptosi(value, counter_type)
+
 # ---------------------------------------------------------------------------
 # <Method name=compile_control_statement args=[<Compiler>, <ControlStatement>]>
 # <Description>
@@ -60,8 +60,10 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
 
     func_to_call_llvm = None
     
-    # --- Case 1: Super Constructor Call ---
-    if isinstance(ast.call_name, SuperNode):
+    # --- Case 1: Super Constructor Call (super(...) / super.__init(...)) ---
+    if isinstance(ast.call_name, SuperNode) or (
+            isinstance(ast.call_name, MemberAccess) and isinstance(ast.call_name.struct_name, SuperNode)
+            and ast.call_name.member_name == "__init"):
         if not compiler.current_struct_name:
             compiler.errors.error(ast, "'super' call used outside of a struct.")
             return ir.Constant(ir.IntType(32), 0)
@@ -79,29 +81,27 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
             return ir.Constant(ir.IntType(32), 0)
 
         mangled_parent = compiler.get_mangled_name(parent_name)
-        ctor_name = f"{mangled_parent}__init"
-        try:
-            func_to_call_llvm = compiler.module.get_global(ctor_name)
-        except KeyError:
+        func_to_call_llvm = compiler.resolve_constructor(parent_name)
+        if func_to_call_llvm is None:
             compiler.errors.error(ast, f"Parent struct '{parent_name}' has no constructor.")
             return ir.Constant(ir.IntType(32), 0)
 
-        arg_llvm_values = [compiler.compile(arg) for arg in ast.params]
-        temp_parent_ptr = compiler.builder.call(func_to_call_llvm, arg_llvm_values, name="super_temp_obj")
-
         self_ptr_addr = compiler.current_scope.resolve("self")
         if not self_ptr_addr:
             compiler.errors.error(ast, "'self' not found in scope for super call.")
             return ir.Constant(ir.IntType(32), 0)
         
-        # In constructor, self is Struct* (no load needed)
+        # In constructor, self is Struct* (no load needed); in methods it is Struct**
+        if isinstance(self_ptr_addr.type.pointee, ir.PointerType):
+            self_ptr_addr = compiler.builder.load(self_ptr_addr, name="super_self_load")
+        
+        # The parent fields come first in the child layout: the parent
+        # constructor initializes them in place (no temporary, no copy)
         parent_ty = compiler.struct_types[mangled_parent]
         self_as_parent_ptr = compiler.builder.bitcast(self_ptr_addr, parent_ty.as_pointer(), name="super_self_cast")
         
-        temp_val = compiler.builder.load(temp_parent_ptr, name="super_temp_val")
-        compiler.builder.store(temp_val, self_as_parent_ptr)
-        
-        return self_as_parent_ptr
+        arg_llvm_values = [compiler.compile(arg) for arg in ast.params]
+        return compiler.emit_constructor_call(func_to_call_llvm, arg_llvm_values, self_as_parent_ptr)
 
     # --- Case 2: String Name ---
     elif isinstance(ast.call_name, str):
@@ -113,18 +113,14 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
                         (call_name_str in compiler.struct_types)
 
         if struct_exists:
-            ctor_name = f"{mangled_struct_name}__init"
-            try:
-                func_to_call_llvm = compiler.module.get_global(ctor_name)
-            except KeyError:
-                try:
-                    func_to_call_llvm = compiler.module.get_global(f"{call_name_str}__init")
-                except KeyError:
-                    compiler.errors.error(ast, f"Struct '{call_name_str}' does not have a constructor defined.")
-                    return ir.Constant(ir.IntType(32), 0)
+            func_to_call_llvm = compiler.resolve_constructor(call_name_str)
+            if func_to_call_llvm is None:
+                compiler.errors.error(ast, f"Struct '{call_name_str}' does not have a constructor defined.")
+                return ir.Constant(ir.IntType(32), 0)
             
+            # Constructed in place into a stack slot of the caller
             arg_llvm_values = [compiler.compile(arg) for arg in ast.params]
-            return compiler.builder.call(func_to_call_llvm, arg_llvm_values, name=f"new_{call_name_str}")
+            return compiler.emit_constructor_call(func_to_call_llvm, arg_llvm_values)
 
         # B. Check for Monomorphization Template
         if call_name_str in compiler.function_templates:
@@ -174,8 +170,11 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
                 compiler._substitute_ast_types(concrete_func_ast, bindings)
                 func_to_call_llvm = compiler.compile(concrete_func_ast)
                 compiler.mono_function_cache[inst_name] = func_to_call_llvm
+                compiler.count_mono_instance(call_name_str, inst_name)
             
-            return compiler.builder.call(func_to_call_llvm, arg_llvm_values)
+            _, param_types = compiler.source_signature(func_to_call_llvm)
+            arg_llvm_values = [_coerce_call_arg(compiler, v, t) for v, t in zip(arg_llvm_values, param_types)]
+            return compiler.emit_abi_call(func_to_call_llvm, arg_llvm_values)
 
         # C. Standard Function Resolution
         resolved_symbol = compiler.current_scope.resolve(call_name_str)
@@ -244,7 +243,8 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
         has_rest_param = True
     
     # Determine fixed arg count
-    num_fixed = len(expected_params)
+    # (@define externs are not in function_registry: their LLVM signature counts)
+    num_fixed = len(expected_params) if func_def_ast else len(compiler.source_signature(func_to_call_llvm)[1])
     if has_rest_param:
         num_fixed -= 1 # The last one is dynamic
     
@@ -277,7 +277,7 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
         # Determine Element Type
         rest_llvm_type = compiler.convert_type(rest_type_ast)
         element_llvm_type = None
-        if isinstance(rest_llvm_type, ir.LiteralStructType) and len(rest_llvm_type.elements) == 2:
+        if compiler.is_collection_type(rest_llvm_type):
              element_llvm_type = rest_llvm_type.elements[0].pointee
         elif isinstance(rest_llvm_type, ir.ArrayType):
              element_llvm_type = rest_llvm_type.element
@@ -290,7 +290,7 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
         
         # Calculate Size
         if compiler.data_layout_obj:
-            elem_size_int = element_llvm_type.get_abi_size(compiler.data_layout_obj)
+            elem_size_int = compiler.abi_size(element_llvm_type)
             elem_size = ir.Constant(ir.IntType(64), elem_size_int)
         else:
             null_ptr = ir.Constant(element_llvm_type.as_pointer(), None)
@@ -324,9 +324,7 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
             compiler.builder.store(val, dest)
             
         # Create Collection Struct
-        coll_val = ir.Constant(rest_llvm_type, ir.Undefined)
-        coll_val = compiler.builder.insert_value(coll_val, data_ptr, 0)
-        coll_val = compiler.builder.insert_value(coll_val, ir.Constant(ir.IntType(32), count), 1)
+        coll_val = compiler.build_collection(rest_llvm_type, data_ptr, count)
         
         arg_llvm_values.append(coll_val)
 
@@ -342,9 +340,10 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
                  arg_llvm_values.append(compiler.compile(ast.params[i]))
 
     # --- Coercion & Interface Packing ---
+    _, param_types = compiler.source_signature(func_to_call_llvm) # Fin-level types (before byval/sret lowering)
     final_args = []
     for i, arg_val in enumerate(arg_llvm_values):
-        if i >= len(fn_ty.args):
+        if i >= len(param_types):
             if fn_ty.var_arg:
                 if isinstance(arg_val.type, ir.FloatType):
                     arg_val = compiler.builder.fpext(arg_val, ir.DoubleType())
@@ -354,7 +353,7 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
                     compiler.errors.error(ast, f"Too many arguments for '{ast.call_name}'")
                     return ir.Constant(ir.IntType(32), 0)
         
-        expected_type = fn_ty.args[i]
+        expected_type = param_types[i]
         
         # 'any' Packing (Concrete -> {i8*, i64})
         is_any_expected = (isinstance(expected_type, ir.LiteralStructType) and 
@@ -381,20 +380,29 @@ def compile_function_call(compiler: Compiler, ast: FunctionCall) -> ir.Value:
                 arg_val = compiler.pack_interface(arg_val, arg_val.type, expected_type)
 
         # Standard Coercion
-        if arg_val.type != expected_type:
-            if isinstance(expected_type, ir.FloatType) and isinstance(arg_val.type, ir.IntType):
-                arg_val = compiler.builder.sitofp(arg_val, expected_type)
-            elif isinstance(expected_type, ir.PointerType) and isinstance(arg_val.type, ir.PointerType):
-                arg_val = compiler.builder.bitcast(arg_val, expected_type)
-            elif isinstance(expected_type, ir.IntType) and isinstance(arg_val.type, ir.IntType):
-                if arg_val.type.width < expected_type.width:
-                    arg_val = compiler.builder.sext(arg_val, expected_type)
-                elif arg_val.type.width > expected_type.width:
-                    arg_val = compiler.builder.trunc(arg_val, expected_type)
-        
-        final_args.append(arg_val)
+        final_args.append(_coerce_call_arg(compiler, arg_val, expected_type))
+
+    return compiler.emit_abi_call(func_to_call_llvm, final_args)
+
+# ---------------------------------------------------------------------------
+# <Method name=_coerce_call_arg args=[<Compiler>, <ir.Value>, <ir.Type>]>
+# <Description>
+# Standard argument coercion: Int->Float, Ptr->Ptr and Int width
+# (sext/trunc). Anything else is left for the call to reject.
+# </Description>
+def _coerce_call_arg(compiler: Compiler, arg_val: ir.Value, expected_type: ir.Type) -> ir.Value:
+    if arg_val.type != expected_type:
+        if isinstance(expected_type, ir.FloatType) and isinstance(arg_val.type, ir.IntType):
+            arg_val = compiler.builder.sitofp(arg_val, expected_type)
+        elif isinstance(expected_type, ir.PointerType) and isinstance(arg_val.type, ir.PointerType):
+            arg_val = compiler.builder.bitcast(arg_val, expected_type)
+        elif isinstance(expected_type, ir.IntType) and isinstance(arg_val.type, ir.IntType):
+            if arg_val.type.width < expected_type.width:
+                arg_val = compiler.builder.sext(arg_val, expected_type)
+            elif arg_val.type.width > expected_type.width:
+                arg_val = compiler.builder.trunc(arg_val, expected_type)
+    return arg_val
 
-    return compiler.builder.call(func_to_call_llvm, final_args)
 # ---------------------------------------------------------------------------
 # <Method name=_instantiate_and_compile_generic args=[...]>
 # <Description>
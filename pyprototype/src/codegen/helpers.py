@@ -232,6 +232,9 @@ def get_mangled_name(compiler: Compiler, name: str) -> str:
     if safe_path.endswith('_'):
         safe_path = safe_path[:-1]
 
+    # Remember the readable module path for demangling (perf maps, reports)
+    compiler.mangled_modules[safe_path] = rel_path.replace(os.sep, ".")
+
     return f"{safe_path}__{name}"
 
 # ---------------------------------------------------------------------------
@@ -320,7 +323,7 @@ def box_value(compiler: Compiler, llvm_val: ir.Value, fin_type: FinType) -> ir.V
             value_type = llvm_val.type.pointee
         
         if compiler.data_layout_obj:
-            size_int = value_type.get_abi_size(compiler.data_layout_obj)
+            size_int = abi_size(compiler, value_type)
             size_arg = ir.Constant(ir.IntType(64), size_int)
         else:
             null_ptr = ir.Constant(value_type.as_pointer(), None)
@@ -328,14 +331,9 @@ def box_value(compiler: Compiler, llvm_val: ir.Value, fin_type: FinType) -> ir.V
             gep_ptr = compiler.builder.gep(null_ptr, [one], name="box_sizeof_gep")
             size_arg = compiler.builder.ptrtoint(gep_ptr, ir.IntType(64), name="box_sizeof_int")
 
-        # 2. Malloc
-        try:
-            malloc_fn = compiler.module.get_global("malloc")
-        except KeyError:
-            malloc_ty = ir.FunctionType(ir.IntType(8).as_pointer(), [ir.IntType(64)])
-            malloc_fn = ir.Function(compiler.module, malloc_ty, name="malloc")
-
-        raw_ptr = compiler.builder.call(malloc_fn, [size_arg], name="box_malloc")
+        # 2. Malloc (or the open #[arena] region)
+        compiler.count_stat("boxes")
+        raw_ptr = compiler.emit_allocation(size_arg)
         
         # 3. Store Value
         # Cast i8* -> T*
@@ -414,7 +412,7 @@ def unbox_value(compiler: Compiler, void_ptr: ir.Value, target_fin_type: FinType
 # 2. Compile-Time: If value is zero Constant, raise Compile Error.
 # 3. Runtime: If value is dynamic, emit check with "Unlikely" branch weights.
 # </Description>
-def _emit_runtime_check_zero(self, compiler: Compiler, value_llvm: ir.Value, error_msg: str, node: Node = None):
+def _emit_runtime_check_zero(compiler: Compiler, value_llvm: ir.Value, error_msg: str, node: Node = None):
     # Only check integers
     if not isinstance(value_llvm.type, ir.IntType):
         return
@@ -437,37 +435,14 @@ def _emit_runtime_check_zero(self, compiler: Compiler, value_llvm: ir.Value, err
     # --- OPTIMIZATION 2: Runtime Check with Branch Prediction ---
     # If we are here, the value is dynamic (variable). We must check it.
     
-    # Create blocks
-    panic_block = compiler.function.append_basic_block("panic_check")
-    safe_block = compiler.function.append_basic_block("safe_cont")
-    
+    compiler.count_stat("zero_checks")
+
     # Compare with 0
     zero = ir.Constant(value_llvm.type, 0)
     is_zero = compiler.builder.icmp_signed("==", value_llvm, zero, name="is_zero")
     
-    # Branch with Weights
-    # We tell LLVM: "It is 10,000 times more likely to go to safe_block than panic_block"
-    # This allows the CPU to speculatively execute the safe path without stalling.
-    compiler.builder.cbranch(is_zero, panic_block, safe_block, weights=[1, 10000])
-    
-    # Get panic function
-    try:
-        panic_fn = compiler.module.get_global("__panic")
-    except KeyError:
-        # If builtins.fin wasn't loaded, we can't panic safely.
-        # Fallback: Just trap/abort
-        # compiler.builder.asm(ir.FunctionType(ir.VoidType(), []), "ud2", "", [], True)
-        # Better: Raise compiler error that builtins are missing
-        raise CompilerException("Runtime Error: '__panic' function not found. Ensure builtins are loaded.")
-    
-    # -- Panic Block --
-    compiler.builder.position_at_end(panic_block)
-    msg_ptr = compiler.create_global_string(error_msg)
-    compiler.builder.call(panic_fn, [msg_ptr])
-    compiler.builder.unreachable()
-    
-    # -- Safe Block --
-    compiler.builder.position_at_end(safe_block)
+    # Unlikely branch to a shared cold panic stub; continues in the safe block
+    compiler.emit_panic_check(is_zero, error_msg, node)
 
 # -------------------------------------------------------------------------
 
@@ -499,6 +474,7 @@ def exit_scope(self):
             self.current_scope = self.global_scope
         return
 
+    _end_scope_lifetimes(self)
     self.current_scope = self.current_scope.parent
 
 def _get_scope_depth(self) -> int:
@@ -539,4 +515,150 @@ def pack_any(compiler: Compiler, val: ir.Value, val_fin_type: FinType) -> ir.Val
     any_val = compiler.builder.insert_value(any_val, boxed_ptr, 0)
     any_val = compiler.builder.insert_value(any_val, type_id_val, 1)
     
-    return any_val
\ No newline at end of file
+    return any_val
+# -------------------------------------------------------------------------
+# <Method name=register_global_ctor args=[<Compiler>, <ir.Function>]>
+# <Description>
+# Schedules 'fn' (void()) to run at load time, before 'main'.
+# All registered functions are called in order from a single
+# '__fin_module_init' function listed in 'llvm.global_ctors', so the
+# appending global is only ever created once per module.
+# Both the AOT path (crt init) and runwithjit (run_static_constructors)
+# execute it.
+# </Description>
+def register_global_ctor(compiler: Compiler, fn: ir.Function):
+    _register_global_structor(compiler, fn, "__fin_module_init", "llvm.global_ctors")
+
+# -------------------------------------------------------------------------
+# <Method name=register_global_dtor args=[<Compiler>, <ir.Function>]>
+# <Description>
+# Schedules 'fn' (void()) to run when the program finishes normally
+# ('__fin_module_fini' in 'llvm.global_dtors'). runwithjit runs them
+# through run_static_destructors once 'main' returns.
+# </Description>
+def register_global_dtor(compiler: Compiler, fn: ir.Function):
+    _register_global_structor(compiler, fn, "__fin_module_fini", "llvm.global_dtors")
+
+def _register_global_structor(compiler: Compiler, fn: ir.Function, holder_name: str, table_name: str):
+    void_fn_ty = ir.FunctionType(ir.VoidType(), [])
+    try:
+        holder_fn = compiler.module.get_global(holder_name)
+    except KeyError:
+        holder_fn = ir.Function(compiler.module, void_fn_ty, name=holder_name)
+        holder_fn.linkage = "internal"
+        ir.IRBuilder(holder_fn.append_basic_block("entry")).ret_void()
+
+        # { priority, function, data }
+        entry_ty = ir.LiteralStructType([ir.IntType(32), void_fn_ty.as_pointer(), ir.IntType(8).as_pointer()])
+        table_ty = ir.ArrayType(entry_ty, 1)
+        table = ir.GlobalVariable(compiler.module, table_ty, name=table_name)
+        table.linkage = "appending"
+        table.initializer = ir.Constant(table_ty, [
+            ir.Constant(entry_ty, [
+                ir.Constant(ir.IntType(32), 65535),
+                holder_fn,
+                ir.Constant(ir.IntType(8).as_pointer(), None),
+            ])
+        ])
+
+    # Insert the call right before the 'ret void' of the holder function
+    entry = holder_fn.blocks[0]
+    builder = ir.IRBuilder(entry)
+    builder.position_before(entry.terminator)
+    builder.call(fn, [])
+
+# -------------------------------------------------------------------------
+# <Method name=get_or_declare_function args=[<Compiler>, <str>, <ir.FunctionType>]>
+# <Description>
+# Returns the module function 'name', declaring it (external) with 'fn_ty'
+# if builtins did not define it. Used for libc runtime support calls.
+# </Description>
+def get_or_declare_function(compiler: Compiler, name: str, fn_ty: ir.FunctionType) -> ir.Function:
+    try:
+        return compiler.module.get_global(name)
+    except KeyError:
+        return ir.Function(compiler.module, fn_ty, name=name)
+# -------------------------------------------------------------------------
+# <Method name=call_runtime_function args=[<Compiler>, <str>, <ir.FunctionType>, <List[ir.Value]>, <Optional[ir.IRBuilder]>, <str>]>
+# <Description>
+# Calls libc 'name' as if it were declared with 'fn_ty'. builtins.fin may
+# declare it with other pointer types (malloc returns &int, free takes
+# &int): pointer arguments and the pointer result are bitcast to match.
+# </Description>
+def call_runtime_function(compiler: Compiler, name: str, fn_ty: ir.FunctionType, args: List[ir.Value],
+                          builder: Optional[ir.IRBuilder] = None, result_name: str = "") -> ir.Value:
+    builder = builder or compiler.builder
+    fn = get_or_declare_function(compiler, name, fn_ty)
+    declared = fn.function_type
+    args = [builder.bitcast(arg, param) if isinstance(param, ir.PointerType) and arg.type != param else arg
+            for arg, param in zip(args, declared.args)] + list(args[len(declared.args):])
+    result = builder.call(fn, args, name=result_name)
+    if isinstance(fn_ty.return_type, ir.PointerType) and declared.return_type != fn_ty.return_type:
+        result = builder.bitcast(result, fn_ty.return_type, name=result_name)
+    return result
+# -------------------------------------------------------------------------
+# <Method name=abi_size args=[<Compiler>, <ir.Type>]>
+# <Description>
+# Target ABI size / alignment of 'llvm_type' in bytes. Identified structs
+# live in the compiler's own ir.Context, which llvmlite must be given to
+# resolve them (the global context does not know them).
+# </Description>
+def abi_size(compiler: Compiler, llvm_type: ir.Type) -> int:
+    return llvm_type.get_abi_size(compiler.data_layout_obj, context=compiler.context)
+
+def abi_alignment(compiler: Compiler, llvm_type: ir.Type) -> int:
+    return llvm_type.get_abi_alignment(compiler.data_layout_obj, context=compiler.context)
+# -------------------------------------------------------------------------
+# <Method name=create_entry_alloca args=[<Compiler>, <ir.Type>, <str>, <bool>]>
+# <Description>
+# Allocates a stack slot in the entry block of the current function
+# (before its terminator), whatever block the builder is in.
+# Entry-block allocas are allocated once per call (not once per loop
+# iteration) and are what SROA/mem2reg promote to registers.
+# With 'scoped=True' and the builder outside the entry block (loop and
+# branch bodies), llvm.lifetime.start is emitted here and the matching
+# llvm.lifetime.end when the current scope exits (see exit_scope).
+# </Description>
+def create_entry_alloca(compiler: Compiler, llvm_type: ir.Type, name: str = "", scoped: bool = False) -> ir.AllocaInstr:
+    current_block = compiler.builder.block
+    with compiler.builder.goto_entry_block():
+        slot = compiler.builder.alloca(llvm_type, name=name)
+
+    if scoped and current_block is not current_block.parent.entry_basic_block:
+        size = _lifetime_size(compiler, llvm_type)
+        _emit_lifetime_marker(compiler, "llvm.lifetime.start", slot, size)
+        compiler.current_scope.lifetime_slots.append((slot, size))
+    return slot
+
+def _lifetime_size(compiler: Compiler, llvm_type: ir.Type) -> int:
+    if compiler.data_layout_obj:
+        return abi_size(compiler, llvm_type)
+    return -1 # Unknown size (whole object)
+
+def _emit_lifetime_marker(compiler: Compiler, intrinsic: str, slot: ir.AllocaInstr, size: int):
+    i8_ptr = ir.IntType(8).as_pointer()
+    fn_ty = ir.FunctionType(ir.VoidType(), [ir.IntType(64), i8_ptr])
+    marker = compiler.module.declare_intrinsic(intrinsic, [i8_ptr], fnty=fn_ty)
+    ptr = compiler.builder.bitcast(slot, i8_ptr)
+    compiler.builder.call(marker, [ir.Constant(ir.IntType(64), size), ptr])
+
+# -------------------------------------------------------------------------
+# <Method name=_end_scope_lifetimes args=[<Compiler>]>
+# <Description>
+# Emits llvm.lifetime.end for the scoped slots of the current scope.
+# Loop bodies usually branch back before their scope is exited, so the
+# markers go before the terminator of the current block in that case.
+# </Description>
+def _end_scope_lifetimes(compiler: Compiler):
+    slots = compiler.current_scope.lifetime_slots
+    if not slots or compiler.builder is None or compiler.builder.block is None:
+        return
+
+    block = compiler.builder.block
+    if block.is_terminated:
+        compiler.builder.position_before(block.terminator)
+    for slot, size in reversed(slots):
+        _emit_lifetime_marker(compiler, "llvm.lifetime.end", slot, size)
+    if block.is_terminated:
+        compiler.builder.position_at_end(block)
+    slots.clear()
@@ -131,7 +131,7 @@ def pack_interface(compiler: Compiler, struct_val: ir.Value, struct_type: ir.Typ
     
     # If it's a Value (loaded struct), spill to stack to get a pointer
     if not isinstance(struct_val.type, ir.PointerType):
-        temp = compiler.builder.alloca(struct_val.type, name="pack_spill")
+        temp = compiler.create_entry_alloca(struct_val.type, name="pack_spill")
         compiler.builder.store(struct_val, temp)
         data_ptr = temp
     
@@ -197,7 +197,8 @@ def compile_interface(compiler: Compiler, ast: InterfaceDeclaration):
 
     mangled_name = compiler.get_mangled_name(name)
     
-    if mangled_name in compiler.struct_types:
+    # Check if already defined (the registration pass only creates the type)
+    if mangled_name in compiler.struct_field_indices:
          compiler.exit_scope()
          compiler.errors.error(ast, f"Interface '{name}' (internal: {mangled_name}) already declared.")
          return
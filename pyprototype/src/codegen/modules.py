@@ -58,7 +58,7 @@ def compile_and_import_file(compiler: Compiler, abs_path: str, node: AstNode = N
         # Check if we can recover using Opaque Types (Scouting Pass)
         if abs_path in getattr(compiler, 'active_module_scopes', {}):
             imported_scope = compiler.active_module_scopes[abs_path]
-            compiler.merge_scope(imported_scope, targets, alias)
+            compiler.merge_scope(imported_scope, targets, abs_path)
             if alias:
                 compiler.module_aliases[alias] = abs_path
                 compiler.loaded_modules[abs_path] = imported_scope.symbols
@@ -76,7 +76,7 @@ def compile_and_import_file(compiler: Compiler, abs_path: str, node: AstNode = N
     # 2. Cache Check
     if abs_path in compiler.module_loader.cache:
         imported_scope = compiler.module_loader.cache[abs_path]
-        compiler._merge_scope(imported_scope, targets, alias)
+        compiler.merge_scope(imported_scope, targets, abs_path)
         if alias:
             compiler.module_aliases[alias] = abs_path
             compiler.loaded_modules[abs_path] = imported_scope.symbols
@@ -112,8 +112,9 @@ def compile_and_import_file(compiler: Compiler, abs_path: str, node: AstNode = N
             if isinstance(stmt, StructDeclaration):
                 mangled_name = compiler.get_mangled_name(stmt.name)
                 if mangled_name not in compiler.struct_types:
-                    struct_ty = ir.global_context.get_identified_type(mangled_name)
+                    struct_ty = compiler.context.get_identified_type(mangled_name)
                     compiler.struct_types[mangled_name] = struct_ty
+                    compiler.scout_struct_layout(stmt) # Sized for the prototypes below
             
             elif isinstance(stmt, InterfaceDeclaration):
                 mangled_name = compiler.get_mangled_name(stmt.name)
@@ -151,7 +152,7 @@ def compile_and_import_file(compiler: Compiler, abs_path: str, node: AstNode = N
         compiler.module_aliases[alias] = abs_path
         compiler.loaded_modules[abs_path] = module_scope.symbols
     
-    compiler._merge_scope(module_scope, targets, alias)
+    compiler.merge_scope(module_scope, targets, abs_path)
     
     # 11. Snapshot Registries
     if not hasattr(compiler, 'module_struct_field_types'): compiler.module_struct_field_types = {}
@@ -219,7 +220,7 @@ def compile_import(compiler: Compiler, node: ImportModule):
         
         for fpath, symbols in files_to_load.items():
             # [FIX] Pass 'node' for error reporting
-            compiler.compile_and_import_file(compiler, fpath, node, symbols, None)
+            compiler.compile_and_import_file(fpath, node, symbols, None)
         return
 
     # 2. Standard Resolution
@@ -230,7 +231,7 @@ def compile_import(compiler: Compiler, node: ImportModule):
         return
 
     # [FIX] Pass 'node' for error reporting
-    compiler.compile_and_import_file(compiler, abs_path, node, node.targets, effective_alias)
+    compiler.compile_and_import_file(abs_path, node, node.targets, effective_alias)
 
 # ---------------------------------------------------------------------------
 # <Method name=compile_module_access args=[<Compiler>, <ModuleAccess>]>
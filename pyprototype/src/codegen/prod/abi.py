@@ -0,0 +1,241 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+
+# Aggregates up to this size (two eightbytes) stay first-class values and
+# are passed/returned in registers. Larger ones go through memory: 'byval'
+# parameters and an 'sret' return slot, like the x86-64 C ABI.
+MAX_DIRECT_SIZE = 16
+
+# Instructions that never write memory: a load followed only by these
+# still reads the current value of its source.
+_PURE_INSTRUCTIONS = (ir.LoadInstr, ir.GEPInstr, ir.CastInstr, ir.AllocaInstr,
+                      ir.ExtractValue, ir.InsertValue, ir.CompareInstr, ir.SelectInstr)
+_PURE_OPS = ("add", "sub", "mul", "sdiv", "udiv", "srem", "urem", "fadd", "fsub", "fmul",
+             "fdiv", "frem", "fneg", "shl", "lshr", "ashr", "and", "or", "xor")
+
+# ---------------------------------------------------------------------------
+# <Method name=passes_indirectly args=[<Compiler>, <ir.Type>]>
+# <Description>
+# True for struct types too big for registers (see MAX_DIRECT_SIZE).
+# Without a data layout, structs with more than two fields count as big.
+# </Description>
+def passes_indirectly(compiler: Compiler, llvm_type: ir.Type) -> bool:
+    if not isinstance(llvm_type, ir.IdentifiedStructType) or llvm_type.is_opaque:
+        return False
+    if compiler.data_layout_obj:
+        return compiler.abi_size(llvm_type) > MAX_DIRECT_SIZE
+    return len(llvm_type.elements) > 2
+
+# ---------------------------------------------------------------------------
+# <Method name=lower_function_type args=[<Compiler>, <ir.Type>, <List[ir.Type]>, <bool>]>
+# <Description>
+# LLVM signature of a Fin function returning 'ret_type' and taking
+# 'param_types': big struct results become a leading 'T* sret' parameter
+# (the function returns void), big struct parameters become 'T* byval'.
+# </Description>
+def lower_function_type(compiler: Compiler, ret_type: ir.Type, param_types: List[ir.Type], var_arg: bool = False) -> ir.FunctionType:
+    lowered_params = [p.as_pointer() if passes_indirectly(compiler, p) else p for p in param_types]
+    if passes_indirectly(compiler, ret_type):
+        return ir.FunctionType(ir.VoidType(), [ret_type.as_pointer()] + lowered_params, var_arg=var_arg)
+    return ir.FunctionType(ret_type, lowered_params, var_arg=var_arg)
+
+# ---------------------------------------------------------------------------
+# <Method name=apply_abi_attributes args=[<Compiler>, <ir.Function>, <ir.Type>, <List[ir.Type]>]>
+# <Description>
+# Marks the arguments introduced by lower_function_type: the return slot is
+# 'noalias nonnull sret', big parameters are 'byval' (the callee gets its
+# own copy, the caller's object is never modified).
+# </Description>
+def apply_abi_attributes(compiler: Compiler, fn: ir.Function, ret_type: ir.Type, param_types: List[ir.Type]):
+    args = list(fn.args)
+    if passes_indirectly(compiler, ret_type):
+        slot = args.pop(0)
+        slot.name = "ret_slot"
+        for attr in ("noalias", "nonnull", "sret"):
+            slot.add_attribute(attr)
+        if compiler.data_layout_obj:
+            slot.attributes.dereferenceable = compiler.abi_size(ret_type)
+    for arg, param_type in zip(args, param_types):
+        if passes_indirectly(compiler, param_type):
+            arg.add_attribute("byval")
+            if compiler.data_layout_obj:
+                arg.attributes.align = compiler.abi_alignment(param_type)
+
+# ---------------------------------------------------------------------------
+# <Method name=return_slot args=[<Compiler>, <ir.Function>]>
+# <Description>
+# The 'sret' argument of 'fn', or None if it returns directly.
+# </Description>
+def return_slot(compiler: Compiler, fn: ir.Function) -> Optional[ir.Argument]:
+    if isinstance(fn, ir.Function) and fn.args and "sret" in fn.args[0].attributes:
+        return fn.args[0]
+    return None
+
+# ---------------------------------------------------------------------------
+# <Method name=source_arguments args=[<Compiler>, <ir.Function>]>
+# <Description>
+# The arguments of 'fn' matching its Fin parameters (without the 'sret' slot).
+# </Description>
+def source_arguments(compiler: Compiler, fn: ir.Function) -> List[ir.Argument]:
+    return list(fn.args[1:]) if return_slot(compiler, fn) is not None else list(fn.args)
+
+# ---------------------------------------------------------------------------
+# <Method name=source_signature args=[<Compiler>, <ir.Value>]>
+# <Description>
+# (return type, parameter types) of a callee as seen from Fin: the inverse
+# of lower_function_type. Function pointers are never lowered.
+# </Description>
+def source_signature(compiler: Compiler, callee: ir.Value) -> Tuple[ir.Type, List[ir.Type]]:
+    if not isinstance(callee, ir.Function):
+        fn_ty = callee.type.pointee
+        return fn_ty.return_type, list(fn_ty.args)
+    slot = return_slot(compiler, callee)
+    ret_type = slot.type.pointee if slot is not None else callee.function_type.return_type
+    param_types = [arg.type.pointee if "byval" in arg.attributes else arg.type
+                   for arg in source_arguments(compiler, callee)]
+    return ret_type, param_types
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_abi_call args=[<Compiler>, <ir.Value>, <List[ir.Value]>, <str>]>
+# <Description>
+# Calls 'callee' with Fin-level arguments, applying its ABI:
+# 1. 'byval' parameters receive the address of the value (its source when
+#    it was just loaded, a stack copy otherwise).
+# 2. An 'sret' result is written to a stack slot; the returned load is
+#    turned into a memcpy by store_value when copied further.
+# Other callees are called directly.
+# </Description>
+def emit_abi_call(compiler: Compiler, callee: ir.Value, args: List[ir.Value], name: str = "") -> ir.Value:
+    if not isinstance(callee, ir.Function):
+        return compiler.emit_call(callee, args, name=name)
+    slot_arg = return_slot(compiler, callee)
+    params = source_arguments(compiler, callee)
+    lowered = []
+    for i, value in enumerate(args):
+        if i < len(params) and "byval" in params[i].attributes and value.type == params[i].type.pointee:
+            value = aggregate_address(compiler, value)
+        lowered.append(value)
+    if slot_arg is None:
+        return compiler.emit_call(callee, lowered, name=name, arg_attrs=call_site_attributes(compiler, callee))
+    slot = compiler.create_entry_alloca(slot_arg.type.pointee, name="sret_tmp")
+    compiler.emit_call(callee, [slot] + lowered, arg_attrs=call_site_attributes(compiler, callee))
+    return compiler.builder.load(slot, name=name or "sret_val")
+
+# ---------------------------------------------------------------------------
+# <Method name=call_site_attributes args=[<Compiler>, <ir.Function>]>
+# <Description>
+# The 'sret'/'byval' markers of 'fn' for a call instruction ('arg_attrs'),
+# so indirect calls (e.g. #[multiversion] trampolines) keep the ABI too.
+# </Description>
+def call_site_attributes(compiler: Compiler, fn: ir.Function) -> Optional[Dict[int, Tuple[str, ...]]]:
+    attrs = {}
+    for i, arg in enumerate(fn.args):
+        marks = tuple(attr for attr in ("sret", "byval") if attr in arg.attributes)
+        if marks:
+            attrs[i] = marks
+    return attrs or None
+
+# ---------------------------------------------------------------------------
+# <Method name=store_value args=[<Compiler>, <ir.Value>, <ir.Value>]>
+# <Description>
+# Stores 'value' at 'dest_ptr'. A big struct that was just loaded is
+# copied with llvm.memcpy from where it was loaded instead of moving the
+# whole first-class aggregate through registers.
+# </Description>
+def store_value(compiler: Compiler, value: ir.Value, dest_ptr: ir.Value):
+    if passes_indirectly(compiler, value.type):
+        source = _aggregate_source(compiler, value)
+        if source is not None:
+            copy_aggregate(compiler, dest_ptr, source)
+            return
+    compiler.builder.store(value, dest_ptr)
+
+# ---------------------------------------------------------------------------
+# <Method name=aggregate_address args=[<Compiler>, <ir.Value>]>
+# <Description>
+# Address holding 'value': its source if it was just loaded, otherwise a
+# stack slot it is spilled to.
+# </Description>
+def aggregate_address(compiler: Compiler, value: ir.Value) -> ir.Value:
+    source = _aggregate_source(compiler, value)
+    if source is not None:
+        return source
+    spill = compiler.create_entry_alloca(value.type, name="agg_spill")
+    compiler.builder.store(value, spill)
+    return spill
+
+# ---------------------------------------------------------------------------
+# <Method name=copy_aggregate args=[<Compiler>, <ir.Value>, <ir.Value>]>
+# <Description>
+# memcpy of one '*src_ptr' object to 'dest_ptr' (same type, equal or
+# disjoint).
+# </Description>
+def copy_aggregate(compiler: Compiler, dest_ptr: ir.Value, src_ptr: ir.Value):
+    i8_ptr = ir.IntType(8).as_pointer()
+    llvm_type = src_ptr.type.pointee
+    memcpy = compiler.module.declare_intrinsic("llvm.memcpy", [i8_ptr, i8_ptr, ir.IntType(64)])
+    compiler.builder.call(memcpy, [
+        compiler.builder.bitcast(dest_ptr, i8_ptr),
+        compiler.builder.bitcast(src_ptr, i8_ptr),
+        _type_size(compiler, llvm_type),
+        ir.Constant(ir.IntType(1), 0),
+    ])
+
+def _aggregate_source(compiler: Compiler, value: ir.Value) -> Optional[ir.Value]:
+    # The pointer 'value' was loaded from, if nothing may have written to it since
+    if not isinstance(value, ir.LoadInstr) or value.parent is not compiler.builder.block:
+        return None
+    instructions = compiler.builder.block.instructions
+    for inst in instructions[instructions.index(value) + 1:]:
+        if not (isinstance(inst, _PURE_INSTRUCTIONS) or
+                (type(inst) is ir.Instruction and inst.opname in _PURE_OPS)):
+            return None
+    return value.operands[0]
+
+def _type_size(compiler: Compiler, llvm_type: ir.Type) -> ir.Constant:
+    if compiler.data_layout_obj:
+        return ir.Constant(ir.IntType(64), compiler.abi_size(llvm_type))
+    return ir.Constant(llvm_type.as_pointer(), None).gep([ir.Constant(ir.IntType(32), 1)]).ptrtoint(ir.IntType(64))
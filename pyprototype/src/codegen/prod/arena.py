@@ -0,0 +1,382 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+
+# Arena regions. '#[arena]' on a function makes its body a region: while
+# it runs, 'new', boxing and Collection growth take memory from a bump
+# allocator instead of malloc, and 'delete' of region memory is a no-op.
+# All of it goes back to malloc in one sweep when the function returns or
+# unwinds. The region is dynamic (callees allocate into it too), so a
+# per-request entry point marked #[arena] frees the whole request at once.
+# Nothing allocated in a region may outlive its function.
+#
+# Arena: { i8* chunk, i64 used, i64 size, arena* parent }
+#   chunk   newest chunk; starts with { i8* prev, i64 size } (CHUNK_HEADER)
+#   used    bytes taken in 'chunk', header included
+#   size    bytes in 'chunk' (0 before the first allocation)
+#   parent  region that was active when this one opened
+# '__fin_active_arena' is the innermost open region (null: none).
+
+I8_PTR = ir.IntType(8).as_pointer()
+I64 = ir.IntType(64)
+ARENA_TYPE = ir.LiteralStructType([I8_PTR, I64, I64, I8_PTR])
+CHUNK_FIELD, USED_FIELD, SIZE_FIELD, PARENT_FIELD = range(4)
+CHUNK_HEADER_TYPE = ir.LiteralStructType([I8_PTR, I64])
+CHUNK_HEADER = 16
+ALIGNMENT = 16
+MALLOC_TYPE = ir.FunctionType(I8_PTR, [I64])
+FREE_TYPE = ir.FunctionType(ir.VoidType(), [I8_PTR])
+
+# Chunks double in size, starting here (or at the request, if bigger)
+MIN_CHUNK_SIZE = 64 * 1024
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_arena_prologue args=[<Compiler>, <FunctionDeclaration>]>
+# <Description>
+# At the entry of a function body: opens its region if it is #[arena]
+# (an empty arena on the stack, made the active one). Sets
+# compiler.current_arena (None for other functions).
+# </Description>
+def emit_arena_prologue(compiler: Compiler, ast: FunctionDeclaration):
+    compiler.current_arena = None
+    if not ast.get_attr("arena"):
+        return
+
+    builder = compiler.builder
+    arena = compiler.create_entry_alloca(ARENA_TYPE, name="arena")
+    builder.store(ir.Constant(ARENA_TYPE, None), arena)
+    active = _active_arena_global(compiler)
+    builder.store(builder.bitcast(builder.load(active), I8_PTR), _field(builder, arena, PARENT_FIELD))
+    builder.store(arena, active)
+    compiler.current_arena = arena
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_arena_epilogue args=[<Compiler>, <ir.Function>]>
+# <Description>
+# Closes the region of a finished #[arena] function: before every 'ret'
+# and 'resume', and on a cleanup pad that every call which may unwind
+# now invokes (an exception passing through still frees the region and
+# reactivates the parent).
+# </Description>
+def emit_arena_epilogue(compiler: Compiler, llvm_function: ir.Function):
+    arena = compiler.current_arena
+    if arena is None:
+        return
+
+    close_fn = _close_function(compiler)
+    for block in list(llvm_function.blocks):
+        terminator = block.terminator
+        if isinstance(terminator, ir.Ret) or (terminator is not None and terminator.opname == "resume"):
+            builder = ir.IRBuilder(block)
+            builder.position_before(terminator)
+            builder.call(close_fn, [arena])
+
+    blocks = list(llvm_function.blocks)
+    cleanup_bb = llvm_function.append_basic_block("arena_cleanup")
+    if compiler.emit_invokes(blocks[0], 0, blocks[1:], cleanup_bb) == 0:
+        llvm_function.blocks.remove(cleanup_bb)
+        return
+    compiler.builder.position_at_end(cleanup_bb)
+    landing = compiler.emit_cleanup_pad()
+    compiler.builder.call(close_fn, [arena])
+    compiler.builder.resume(landing)
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_allocation args=[<Compiler>, <ir.Value>, <Optional[ir.IRBuilder]>]>
+# <Description>
+# 'size' bytes from the active region, or from malloc outside regions.
+# Returns i8*. 'builder' defaults to compiler.builder (runtime helpers
+# pass their own).
+# </Description>
+def emit_allocation(compiler: Compiler, size: ir.Value, builder: Optional[ir.IRBuilder] = None) -> ir.Value:
+    builder = builder or compiler.builder
+    active = builder.load(_active_arena_global(compiler), name="active_arena")
+    in_arena = builder.icmp_unsigned("!=", active, ir.Constant(active.type, None), name="in_arena")
+    with builder.if_else(in_arena) as (from_arena, from_heap):
+        with from_arena:
+            arena_ptr = builder.call(_alloc_function(compiler), [active, size], name="arena_alloc")
+            arena_bb = builder.block
+        with from_heap:
+            heap_ptr = compiler.call_runtime_function("malloc", MALLOC_TYPE, [size], builder, "alloc_call")
+            heap_bb = builder.block
+    ptr = builder.phi(I8_PTR, name="alloc_ptr")
+    ptr.add_incoming(arena_ptr, arena_bb)
+    ptr.add_incoming(heap_ptr, heap_bb)
+    return ptr
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_deallocation args=[<Compiler>, <ir.Value>, <Optional[ir.IRBuilder]>]>
+# <Description>
+# free(ptr), unless ptr lies in an open region (freed with it).
+# </Description>
+def emit_deallocation(compiler: Compiler, ptr: ir.Value, builder: Optional[ir.IRBuilder] = None):
+    builder = builder or compiler.builder
+    with builder.if_then(builder.not_(arena_owns(compiler, ptr, builder))):
+        compiler.call_runtime_function("free", FREE_TYPE, [ptr], builder)
+
+# ---------------------------------------------------------------------------
+# <Method name=arena_owns args=[<Compiler>, <ir.Value>, <Optional[ir.IRBuilder]>]>
+# <Description>
+# i1: ptr lies in a chunk of an open region (false outside regions).
+# Walks the chunks, so keep it off hot paths (growth, delete).
+# </Description>
+def arena_owns(compiler: Compiler, ptr: ir.Value, builder: Optional[ir.IRBuilder] = None) -> ir.Value:
+    builder = builder or compiler.builder
+    return builder.call(_owns_function(compiler), [builder.bitcast(ptr, I8_PTR)], name="arena_owned")
+
+# ---------------------------------------------------------------------------
+# <Method name=in_arena args=[<Compiler>, <Optional[ir.IRBuilder]>]>
+# <Description>
+# i1: a region is open.
+# </Description>
+def in_arena(compiler: Compiler, builder: Optional[ir.IRBuilder] = None) -> ir.Value:
+    builder = builder or compiler.builder
+    active = builder.load(_active_arena_global(compiler), name="active_arena")
+    return builder.icmp_unsigned("!=", active, ir.Constant(active.type, None), name="in_arena")
+
+# ---------------------------------------------------------------------------
+# <Method name=_alloc_function args=[<Compiler>]>
+# <Description>
+# 'i8* __fin_arena_alloc(arena*, bytes)': bumps 'used' by 'bytes' rounded
+# up to ALIGNMENT; a new chunk (out of line) when the current one is full.
+# Small enough for LLVM to inline into allocation sites.
+# </Description>
+def _alloc_function(compiler: Compiler) -> ir.Function:
+    fn = compiler.arena_helpers.get("alloc")
+    if fn is not None:
+        return fn
+
+    fn = _helper_function(compiler, "alloc", I8_PTR, [ARENA_TYPE.as_pointer(), I64])
+    arena, size = fn.args
+    builder = ir.IRBuilder(fn.append_basic_block("entry"))
+    rounded = builder.and_(builder.add(size, _i64(ALIGNMENT - 1)), _i64(-ALIGNMENT), name="rounded")
+    rounded = builder.select(builder.icmp_unsigned("==", rounded, _i64(0)), _i64(ALIGNMENT), rounded)
+    used_ptr = _field(builder, arena, USED_FIELD)
+    used = builder.load(used_ptr, name="used")
+    end = builder.add(used, rounded, name="end")
+    fits = builder.icmp_unsigned("<=", end, builder.load(_field(builder, arena, SIZE_FIELD)), name="fits")
+    with builder.if_then(builder.not_(fits), likely=False):
+        builder.ret(builder.call(_refill_function(compiler), [arena, rounded], name="fresh"))
+    builder.store(end, used_ptr)
+    builder.ret(builder.gep(builder.load(_field(builder, arena, CHUNK_FIELD)), [used], name="bumped"))
+
+    compiler.arena_helpers["alloc"] = fn
+    return fn
+
+# ---------------------------------------------------------------------------
+# <Method name=_refill_function args=[<Compiler>]>
+# <Description>
+# 'i8* __fin_arena_refill(arena*, bytes)': mallocs a chunk of
+# max(2 * size, bytes + header, MIN_CHUNK_SIZE), links it in front of
+# the current one and allocates 'bytes' (already rounded) from it.
+# </Description>
+def _refill_function(compiler: Compiler) -> ir.Function:
+    fn = compiler.arena_helpers.get("refill")
+    if fn is not None:
+        return fn
+
+    fn = _helper_function(compiler, "refill", I8_PTR, [ARENA_TYPE.as_pointer(), I64])
+    fn.attributes.add("noinline")
+    fn.attributes.add("cold")
+    arena, rounded = fn.args
+    builder = ir.IRBuilder(fn.append_basic_block("entry"))
+    size_ptr = _field(builder, arena, SIZE_FIELD)
+    chunk_ptr = _field(builder, arena, CHUNK_FIELD)
+    new_size = builder.shl(builder.load(size_ptr), _i64(1), name="doubled")
+    needed = builder.add(rounded, _i64(CHUNK_HEADER), name="needed")
+    new_size = builder.select(builder.icmp_unsigned("<", new_size, needed), needed, new_size)
+    new_size = builder.select(builder.icmp_unsigned("<", new_size, _i64(MIN_CHUNK_SIZE)), _i64(MIN_CHUNK_SIZE), new_size, name="chunk_size")
+
+    chunk = compiler.call_runtime_function("malloc", MALLOC_TYPE, [new_size], builder, "chunk")
+    header = builder.bitcast(chunk, CHUNK_HEADER_TYPE.as_pointer())
+    builder.store(builder.load(chunk_ptr), _field(builder, header, 0))
+    builder.store(new_size, _field(builder, header, 1))
+    builder.store(chunk, chunk_ptr)
+    builder.store(new_size, size_ptr)
+    builder.store(needed, _field(builder, arena, USED_FIELD))
+    builder.ret(builder.gep(chunk, [_i64(CHUNK_HEADER)], name="bumped"))
+
+    compiler.arena_helpers["refill"] = fn
+    return fn
+
+# ---------------------------------------------------------------------------
+# <Method name=_close_function args=[<Compiler>]>
+# <Description>
+# 'void __fin_arena_close(arena*)': frees every chunk of the region and
+# makes its parent the active region again.
+# </Description>
+def _close_function(compiler: Compiler) -> ir.Function:
+    fn = compiler.arena_helpers.get("close")
+    if fn is not None:
+        return fn
+
+    fn = _helper_function(compiler, "close", ir.VoidType(), [ARENA_TYPE.as_pointer()])
+    arena, = fn.args
+    entry = fn.append_basic_block("entry")
+    loop = fn.append_basic_block("chunks")
+    body = fn.append_basic_block("free_chunk")
+    done = fn.append_basic_block("done")
+    builder = ir.IRBuilder(entry)
+    first = builder.load(_field(builder, arena, CHUNK_FIELD), name="first")
+    builder.branch(loop)
+
+    builder.position_at_end(loop)
+    chunk = builder.phi(I8_PTR, name="chunk")
+    chunk.add_incoming(first, entry)
+    builder.cbranch(builder.icmp_unsigned("==", chunk, ir.Constant(I8_PTR, None)), done, body)
+
+    builder.position_at_end(body)
+    header = builder.bitcast(chunk, CHUNK_HEADER_TYPE.as_pointer())
+    prev = builder.load(_field(builder, header, 0), name="prev")
+    compiler.call_runtime_function("free", FREE_TYPE, [chunk], builder)
+    chunk.add_incoming(prev, body)
+    builder.branch(loop)
+
+    builder.position_at_end(done)
+    parent = builder.load(_field(builder, arena, PARENT_FIELD), name="parent")
+    builder.store(builder.bitcast(parent, ARENA_TYPE.as_pointer()), _active_arena_global(compiler))
+    builder.ret_void()
+
+    compiler.arena_helpers["close"] = fn
+    return fn
+
+# ---------------------------------------------------------------------------
+# <Method name=_owns_function args=[<Compiler>]>
+# <Description>
+# 'i1 __fin_arena_owns(i8*)': whether the pointer lies in a chunk of the
+# active region or one of its parents.
+# </Description>
+def _owns_function(compiler: Compiler) -> ir.Function:
+    fn = compiler.arena_helpers.get("owns")
+    if fn is not None:
+        return fn
+
+    fn = _helper_function(compiler, "owns", ir.IntType(1), [I8_PTR])
+    ptr, = fn.args
+    entry = fn.append_basic_block("entry")
+    arenas = fn.append_basic_block("arenas")
+    first_chunk = fn.append_basic_block("first_chunk")
+    chunks = fn.append_basic_block("chunks")
+    check = fn.append_basic_block("check")
+    next_chunk = fn.append_basic_block("next_chunk")
+    next_arena = fn.append_basic_block("next_arena")
+    found = fn.append_basic_block("found")
+    missing = fn.append_basic_block("missing")
+
+    arena_ptr_type = ARENA_TYPE.as_pointer()
+    builder = ir.IRBuilder(entry)
+    address = builder.ptrtoint(ptr, I64, name="address")
+    innermost = builder.load(_active_arena_global(compiler), name="innermost")
+    builder.branch(arenas)
+
+    builder.position_at_end(arenas)
+    arena = builder.phi(arena_ptr_type, name="arena")
+    arena.add_incoming(innermost, entry)
+    builder.cbranch(builder.icmp_unsigned("==", arena, ir.Constant(arena_ptr_type, None)), missing, first_chunk)
+
+    builder.position_at_end(first_chunk)
+    first = builder.load(_field(builder, arena, CHUNK_FIELD), name="first")
+    builder.branch(chunks)
+
+    builder.position_at_end(chunks)
+    chunk = builder.phi(I8_PTR, name="chunk")
+    chunk.add_incoming(first, first_chunk)
+    builder.cbranch(builder.icmp_unsigned("==", chunk, ir.Constant(I8_PTR, None)), next_arena, check)
+
+    builder.position_at_end(check)
+    header = builder.bitcast(chunk, CHUNK_HEADER_TYPE.as_pointer())
+    offset = builder.sub(address, builder.ptrtoint(chunk, I64), name="offset")
+    inside = builder.icmp_unsigned("<", offset, builder.load(_field(builder, header, 1)), name="inside")
+    builder.cbranch(inside, found, next_chunk)
+
+    builder.position_at_end(next_chunk)
+    chunk.add_incoming(builder.load(_field(builder, header, 0), name="prev"), next_chunk)
+    builder.branch(chunks)
+
+    builder.position_at_end(next_arena)
+    parent = builder.load(_field(builder, arena, PARENT_FIELD), name="parent")
+    arena.add_incoming(builder.bitcast(parent, arena_ptr_type), next_arena)
+    builder.branch(arenas)
+
+    builder.position_at_end(found)
+    builder.ret(ir.Constant(ir.IntType(1), 1))
+    builder.position_at_end(missing)
+    builder.ret(ir.Constant(ir.IntType(1), 0))
+
+    compiler.arena_helpers["owns"] = fn
+    return fn
+
+def _active_arena_global(compiler: Compiler) -> ir.GlobalVariable:
+    try:
+        return compiler.module.get_global("__fin_active_arena")
+    except KeyError:
+        gv = ir.GlobalVariable(compiler.module, ARENA_TYPE.as_pointer(), name="__fin_active_arena")
+        gv.linkage = "internal"
+        gv.initializer = ir.Constant(ARENA_TYPE.as_pointer(), None)
+        return gv
+
+def _helper_function(compiler: Compiler, kind: str, ret_type: ir.Type, arg_types: List[ir.Type]) -> ir.Function:
+    fn = ir.Function(compiler.module, ir.FunctionType(ret_type, arg_types), name=f"__fin_arena_{kind}")
+    fn.linkage = "internal"
+    fn.attributes.add("nounwind")
+    return fn
+
+def _field(builder: ir.IRBuilder, struct_ptr: ir.Value, index: int) -> ir.Value:
+    return builder.gep(struct_ptr, [_i32(0), _i32(index)], inbounds=True)
+
+def _i32(value: int) -> ir.Constant:
+    return ir.Constant(ir.IntType(32), value)
+
+def _i64(value: int) -> ir.Constant:
+    return ir.Constant(I64, value)
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_arenas args=[<Compiler>]>
+# <Description>
+# Initializes the arena region state on the compiler.
+# </Description>
+def setup_arenas(compiler: Compiler):
+    compiler.arena_helpers = {} # kind -> generated runtime function
+    compiler.current_arena = None # Arena slot of the #[arena] function being compiled
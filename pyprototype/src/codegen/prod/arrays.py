@@ -50,7 +50,8 @@ from .essentials import *
 # Compiles array indexing `arr[i]`.
 # Handles:
 # 1. Static Arrays ([N x T]): Compile-time bounds check + Runtime check.
-# 2. Dynamic Collections ({T*, len}): Runtime bounds check.
+# 2. Dynamic Collections ({T*, len, cap}): Runtime bounds check.
+#    Runtime checks go through bounds_check_guard (elided / hoisted).
 # 3. Raw Pointers (T*): Unsafe access (no check).
 # 4. L-Value vs R-Value: Returns pointer if `want_pointer=True`, else loads primitives.
 # </Description>
@@ -62,9 +63,8 @@ def compile_array_index(compiler: Compiler, ast: ArrayIndexNode, want_pointer: b
         compiler.errors.error(ast.index_expr, f"Array index must be an integer, got {index_val.type}")
         return ir.Constant(ir.IntType(32), 0) # Dummy return
 
-    # Ensure index is i32 for GEP
-    if index_val.type.width != 32:
-        index_val = compiler.builder.intcast(index_val, ir.IntType(32), name="idx_cast")
+    # Indices are 64-bit (same width as collection lengths)
+    index_val = compiler.to_index(index_val, name="idx_cast")
 
     # 2. Resolve Array Base
     array_ptr = None
@@ -90,7 +90,7 @@ def compile_array_index(compiler: Compiler, ast: ArrayIndexNode, want_pointer: b
     
     # Case A: Static Array ([10 x i32])
     if isinstance(pointee_type, ir.ArrayType):
-        length_val = ir.Constant(ir.IntType(32), pointee_type.count)
+        length_val = ir.Constant(ir.IntType(64), pointee_type.count)
         
         # [OPTIMIZATION] Compile-Time Bounds Check
         if isinstance(ast.index_expr, Literal) and isinstance(ast.index_expr.value, int):
@@ -98,8 +98,8 @@ def compile_array_index(compiler: Compiler, ast: ArrayIndexNode, want_pointer: b
             if idx_const < 0 or idx_const >= pointee_type.count:
                 compiler.errors.error(ast, f"Index {idx_const} out of bounds for array of size {pointee_type.count}")
 
-    # Case B: Collection / Slice ({T*, len})
-    elif isinstance(pointee_type, ir.LiteralStructType) and len(pointee_type.elements) == 2:
+    # Case B: Collection / Slice ({T*, len, cap})
+    elif compiler.is_collection_type(pointee_type):
         is_collection = True
         # Load length from struct (index 1)
         zero = ir.Constant(ir.IntType(32), 0)
@@ -113,22 +113,19 @@ def compile_array_index(compiler: Compiler, ast: ArrayIndexNode, want_pointer: b
         pass
 
     # 4. [RUNTIME CHECK] Bounds Checking
-    if length_val is not None:
+    # Skipped when proven in range (loop counters, constants) or disabled by
+    # #[unchecked] / the build profile; see prod/bounds.py
+    guard = compiler.bounds_check_guard(ast, array_ptr) if length_val is not None else True
+    if guard is not True:
         # Check: if (index < 0 || index >= length) panic
         # 'icmp ult' handles negative check automatically (negative cast to large unsigned)
+        compiler.count_stat("bounds_checks")
         in_bounds = compiler.builder.icmp_unsigned("<", index_val, length_val, name="bounds_check")
+        if guard is not None:
+            # Loop-invariant guard from the preheader: the whole range fits
+            in_bounds = compiler.builder.or_(guard, in_bounds, name="bounds_ok")
         
-        with compiler.builder.if_then(compiler.builder.not_(in_bounds)):
-            msg_ptr = compiler.create_global_string("Runtime Error: Index out of bounds")
-            
-            # Resolve Panic Function (Dynamic or Internal)
-            try:
-                panic_fn = compiler.module.get_global("__panic")
-            except KeyError:
-                panic_fn = compiler.panic_func # Fallback to internal if builtins missing
-
-            compiler.builder.call(panic_fn, [msg_ptr])
-            compiler.builder.unreachable()
+        compiler.emit_panic_check(compiler.builder.not_(in_bounds), "Runtime Error: Index out of bounds", ast)
 
     # 5. Get Element Pointer (GEP)
     zero = ir.Constant(ir.IntType(32), 0)
@@ -169,7 +166,9 @@ def compile_array_index(compiler: Compiler, ast: ArrayIndexNode, want_pointer: b
 # Compiles an array literal `[e1, e2, ...]`.
 # Handles:
 # 1. Global Context: Enforces constants, returns ir.Constant.
-# 2. Local Context: Uses 'insertvalue' to build array from runtime values.
+# 2. Local Context: Constant elements form one constant aggregate; only the
+#    runtime elements are added with 'insertvalue'. Stores of the result
+#    (store_array_value) memcpy the constant part from a private global.
 # 3. Type Coercion: Matches elements to target type (Int->Float, etc.).
 # 4. Type Inference: Infers array type from first element if target is None.
 # </Description>
@@ -192,9 +191,77 @@ def compile_array_literal(compiler: Compiler, ast: ArrayLiteralNode, target_arra
         # Global Constant
         return ir.Constant(target_array_type, compiled_elements)
     else:
-        # Local Value (insertvalue)
-        array_val = ir.Constant(target_array_type, ir.Undefined)
+        # Local Value: constant part + insertvalue for runtime elements only
+        constant_slots = [val if isinstance(val, ir.Constant) else ir.Undefined for val in compiled_elements]
+        if all(slot is ir.Undefined for slot in constant_slots):
+            array_val = ir.Constant(target_array_type, ir.Undefined)
+        else:
+            array_val = ir.Constant(target_array_type, constant_slots)
         for i, val in enumerate(compiled_elements):
             # (Add element coercion logic here if needed)
-            array_val = compiler.builder.insert_value(array_val, val, i)
-        return array_val
\ No newline at end of file
+            if not isinstance(val, ir.Constant):
+                array_val = compiler.builder.insert_value(array_val, val, i)
+        return array_val
+
+# ---------------------------------------------------------------------------
+# <Method name=store_array_value args=[<Compiler>, <ir.Value>, <ir.Value>]>
+# <Description>
+# Stores an array value ([N x T]) at 'dest_ptr' ([N x T]* or T*).
+# For literals (a constant aggregate plus 'insertvalue's, see
+# compile_array_literal) the constant part is one memcpy from a private
+# constant global and only the inserted elements get a store each, so a
+# large lookup table costs a handful of instructions instead of one
+# store per element. Other array values are stored as a whole.
+# </Description>
+def store_array_value(compiler: Compiler, array_val: ir.Value, dest_ptr: ir.Value):
+    array_type = array_val.type
+    elem_ptr_type = array_type.element.as_pointer()
+    dest = dest_ptr if dest_ptr.type == elem_ptr_type else \
+        compiler.builder.bitcast(dest_ptr, elem_ptr_type, name="arr_dest")
+
+    base, inserts = _split_inserts(array_val)
+    if not isinstance(base, ir.Constant):
+        compiler.builder.store(array_val, compiler.builder.bitcast(dest, array_type.as_pointer()))
+        return
+
+    if base.constant is not ir.Undefined and array_type.count > 0:
+        i8_ptr = ir.IntType(8).as_pointer()
+        source = constant_array_global(compiler, base)
+        memcpy = compiler.module.declare_intrinsic("llvm.memcpy", [i8_ptr, i8_ptr, ir.IntType(64)])
+        compiler.builder.call(memcpy, [
+            compiler.builder.bitcast(dest, i8_ptr),
+            compiler.builder.bitcast(source, i8_ptr),
+            _array_size(compiler, array_type),
+            ir.Constant(ir.IntType(1), 0),
+        ])
+
+    for index, value in inserts:
+        slot = compiler.builder.gep(dest, [ir.Constant(ir.IntType(64), index)], inbounds=True)
+        compiler.builder.store(value, slot)
+
+# ---------------------------------------------------------------------------
+# <Method name=constant_array_global args=[<Compiler>, <ir.Constant>]>
+# <Description>
+# Private unnamed_addr constant global holding 'value' (identical tables
+# are merged by LLVM).
+# </Description>
+def constant_array_global(compiler: Compiler, value: ir.Constant) -> ir.GlobalVariable:
+    glob = ir.GlobalVariable(compiler.module, value.type, name=compiler.module.get_unique_name(".arr"))
+    glob.linkage = "private"
+    glob.global_constant = True
+    glob.unnamed_addr = True
+    glob.initializer = value
+    return glob
+
+def _split_inserts(array_val: ir.Value) -> Tuple[ir.Value, List[Tuple[int, ir.Value]]]:
+    # Walks an insertvalue chain back to its base; the last insert per index wins
+    inserts = {}
+    while isinstance(array_val, ir.InsertValue) and len(array_val.indices) == 1:
+        inserts.setdefault(array_val.indices[0], array_val.value)
+        array_val = array_val.aggregate
+    return array_val, sorted(inserts.items())
+
+def _array_size(compiler: Compiler, array_type: ir.ArrayType) -> ir.Constant:
+    if compiler.data_layout_obj:
+        return ir.Constant(ir.IntType(64), compiler.abi_size(array_type))
+    return ir.Constant(array_type.as_pointer(), None).gep([ir.Constant(ir.IntType(32), 1)]).ptrtoint(ir.IntType(64))
\ No newline at end of file
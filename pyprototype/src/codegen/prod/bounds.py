@@ -0,0 +1,323 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+from .ssa import is_ssa_safe
+from .perfmap import longest_prefix
+import os
+
+# Build profiles selectable with FinCompiler(build_profile=...) / --release
+BUILD_PROFILES = ("debug", "release")
+
+class IndexRange:
+    """
+    What a for-loop guarantees about its SSA counter inside the body:
+    0 <= counter < bound, where 'bound' is one of
+        ("const", n)              a literal limit,
+        ("length", name, slot)    'name.length', 'name' not resized in the loop,
+        ("value", name, value)    a variable not written in the loop
+                                  (its stack slot or SSA value).
+    'preheader' is the block entering the loop: loop-invariant guards are
+    computed there, once per array ('guards').
+    """
+    def __init__(self, loop: ForLoop, bound: Tuple, preheader: ir.Block):
+        self.loop = loop
+        self.bound = bound
+        self.preheader = preheader
+        self.guards: Dict[int, Optional[ir.Value]] = {}
+
+# ---------------------------------------------------------------------------
+# <Method name=record_counter_range args=[<Compiler>, <ForLoop>, <ir.PhiInstr>]>
+# <Description>
+# Range analysis for an SSA loop counter (see compile_for). Must be called
+# right after the counter is created, while the builder is still in the
+# preheader. Records an IndexRange when the loop has the shape
+#     for (let i = <lit >= 0>; i < LIMIT; i++ | i += <lit > 0>)
+# (or 'i <= <lit>', 'LIMIT > i'), so indexing with 'i' in the body can
+# drop or hoist its bounds check.
+# </Description>
+def record_counter_range(compiler: Compiler, ast: ForLoop, counter: ir.PhiInstr):
+    name = ast.init.identifier
+    start = ast.init.value
+    if not (isinstance(start, Literal) and isinstance(start.value, int) and start.value >= 0):
+        return
+    if not _is_increasing_step(ast.increment, name):
+        return
+
+    cond = ast.condition
+    if not isinstance(cond, ComparisonOperator):
+        return
+    if cond.left == name and cond.operator in ("<", "<="):
+        limit, inclusive = cond.right, cond.operator == "<="
+    elif cond.right == name and cond.operator in (">", ">="):
+        limit, inclusive = cond.left, cond.operator == ">="
+    else:
+        return
+
+    bound = None
+    if isinstance(limit, Literal) and isinstance(limit.value, int):
+        bound = ("const", limit.value + (1 if inclusive else 0))
+    elif inclusive:
+        return
+    elif isinstance(limit, MemberAccess) and isinstance(limit.struct_name, str) and limit.member_name == "length":
+        slot = compiler.current_scope.resolve(limit.struct_name)
+        if _is_stable_array(compiler, limit.struct_name, slot, ast):
+            bound = ("length", limit.struct_name, slot)
+    elif isinstance(limit, str) and is_ssa_safe(limit, ast.body, ast.increment):
+        value = compiler.current_scope.resolve(limit)
+        if isinstance(value, ir.AllocaInstr) and isinstance(value.type.pointee, ir.IntType) \
+                and not _address_escaped(compiler.function, value):
+            bound = ("value", limit, value)
+        elif isinstance(value, (ir.Instruction, ir.Constant)) and isinstance(value.type, ir.IntType):
+            bound = ("value", limit, value)
+
+    if bound is not None:
+        compiler.index_ranges[counter] = IndexRange(ast, bound, compiler.builder.block)
+
+def _is_increasing_step(step: Node, name: str) -> bool:
+    if isinstance(step, PostfixOperator):
+        return step.operand == name and step.operator == "++"
+    if isinstance(step, Assignment):
+        return step.identifier == name and step.operator == "+=" \
+            and isinstance(step.value, Literal) and isinstance(step.value.value, int) and step.value.value > 0
+    return False
+
+# ---------------------------------------------------------------------------
+# <Method name=bounds_check_guard args=[<Compiler>, <ArrayIndexNode>, <ir.Value>]>
+# <Description>
+# Decides how compile_array_index checks 'ast' (indexing 'array_ptr'):
+#   True      no check (proven in range, #[unchecked] or disabled by profile)
+#   None      full per-access check
+#   ir.Value  i1 computed in the loop preheader; the access only needs
+#             its own check when it is false (see _hoisted_guard)
+# </Description>
+def bounds_check_guard(compiler: Compiler, ast: ArrayIndexNode, array_ptr: ir.Value) -> Union[bool, None, ir.Value]:
+    if not bounds_checks_enabled(compiler):
+        compiler.count_stat("bounds_checks_elided")
+        return True
+
+    pointee = array_ptr.type.pointee
+    static_count = pointee.count if isinstance(pointee, ir.ArrayType) else None
+
+    index = ast.index_expr
+    if isinstance(index, Literal) and isinstance(index.value, int):
+        if static_count is not None and 0 <= index.value < static_count:
+            compiler.count_stat("bounds_checks_elided")
+            return True
+        return None
+
+    fact = compiler.index_ranges.get(compiler.current_scope.resolve(index)) if isinstance(index, str) else None
+    if fact is None:
+        return None
+
+    kind = fact.bound[0]
+    if kind == "const" and static_count is not None and fact.bound[1] <= static_count:
+        compiler.count_stat("bounds_checks_elided")
+        return True
+    if kind == "length" and array_ptr is fact.bound[2]:
+        compiler.count_stat("bounds_checks_elided")
+        return True
+
+    guard = _hoisted_guard(compiler, fact, ast, array_ptr)
+    if guard is not None:
+        compiler.count_stat("bounds_checks_hoisted")
+    return guard
+
+# ---------------------------------------------------------------------------
+# <Method name=_hoisted_guard args=[<Compiler>, <IndexRange>, <ArrayIndexNode>, <ir.Value>]>
+# <Description>
+# Computes 'bound <= length(array)' once in the loop preheader. When it
+# holds, every value the counter takes is in range; when it does not, the
+# access keeps its per-iteration check, so a loop that only goes out of
+# range on a late iteration still panics there and not before it starts.
+# The guard is loop-invariant, so LLVM unswitches the loop on it and the
+# in-range copy is free of checks (and vectorizable).
+# Returns None if the array's length is not known to stay the same.
+# </Description>
+def _hoisted_guard(compiler: Compiler, fact: IndexRange, ast: ArrayIndexNode, array_ptr: ir.Value) -> Optional[ir.Value]:
+    key = id(array_ptr)
+    if key in fact.guards:
+        return fact.guards[key]
+
+    guard = None
+    pointee = array_ptr.type.pointee
+    stable = isinstance(pointee, ir.ArrayType) or (
+        isinstance(ast.array_expr, str)
+        and array_ptr is compiler.current_scope.resolve(ast.array_expr)
+        and _is_stable_array(compiler, ast.array_expr, array_ptr, fact.loop)
+    )
+    if stable:
+        builder = ir.IRBuilder(fact.preheader)
+        builder.position_before(fact.preheader.terminator)
+        i64 = ir.IntType(64)
+        length = _array_length(builder, array_ptr)
+        bound = _bound_value(builder, fact.bound)
+        if bound is not None:
+            bound = builder.sext(bound, i64) if bound.type.width < 64 else bound
+            guard = builder.icmp_signed("<=", bound, length, name="bounds_hoisted")
+    fact.guards[key] = guard
+    return guard
+
+def _array_length(builder: ir.IRBuilder, array_ptr: ir.Value) -> ir.Value:
+    pointee = array_ptr.type.pointee
+    if isinstance(pointee, ir.ArrayType):
+        return ir.Constant(ir.IntType(64), pointee.count)
+    zero = ir.Constant(ir.IntType(32), 0)
+    one = ir.Constant(ir.IntType(32), 1)
+    return builder.load(builder.gep(array_ptr, [zero, one], inbounds=True), name="coll_len")
+
+def _bound_value(builder: ir.IRBuilder, bound: Tuple) -> Optional[ir.Value]:
+    kind = bound[0]
+    if kind == "const":
+        return ir.Constant(ir.IntType(64), bound[1])
+    if kind == "length":
+        return _array_length(builder, bound[2])
+    value = bound[2]
+    if isinstance(value, ir.AllocaInstr):
+        return builder.load(value, name=f"{bound[1]}_bound")
+    return value
+
+# ---------------------------------------------------------------------------
+# <Method name=_is_stable_array args=[<Compiler>, <str>, <ir.Value>, <ForLoop>]>
+# <Description>
+# True if the length of array/collection 'name' (stack slot 'slot') cannot
+# change while 'loop' runs: static arrays always; collections only when
+# the loop never assigns, re-declares or calls a method on them and their
+# slot's address has not been taken earlier in the function.
+# </Description>
+def _is_stable_array(compiler: Compiler, name: str, slot: ir.Value, loop: ForLoop) -> bool:
+    if not isinstance(slot, (ir.AllocaInstr, ir.GlobalVariable)):
+        return False
+    pointee = slot.type.pointee
+    if isinstance(pointee, ir.ArrayType):
+        return True
+    if not compiler.is_collection_type(pointee):
+        return False
+    if not isinstance(slot, ir.AllocaInstr) or _address_escaped(compiler.function, slot):
+        return False
+    trees = (loop.condition, loop.increment, loop.body)
+    return is_ssa_safe(name, *trees) and not any(_calls_method_on(tree, name) for tree in trees)
+
+def _calls_method_on(node, name: str) -> bool:
+    if isinstance(node, (list, tuple)):
+        return any(_calls_method_on(item, name) for item in node)
+    if isinstance(node, dict):
+        return any(_calls_method_on(item, name) for item in node.values())
+    if not isinstance(node, Node):
+        return False
+    if isinstance(node, StructMethodCall) and node.struct_name == name:
+        return True
+    return any(_calls_method_on(value, name) for value in vars(node).values())
+
+def _address_escaped(function: ir.Function, slot: ir.AllocaInstr) -> bool:
+    """True if 'slot' (or a GEP/bitcast of it) has been used as anything but
+    a load/store address or a lifetime marker so far."""
+    derived = {id(slot)}
+    for block in function.blocks:
+        for inst in block.instructions:
+            if (isinstance(inst, ir.GEPInstr) or getattr(inst, "opname", "") == "bitcast") \
+                    and id(inst.operands[0]) in derived:
+                derived.add(id(inst))
+
+    for block in function.blocks:
+        for inst in block.instructions:
+            if id(inst) in derived or not any(id(op) in derived for op in inst.operands):
+                continue
+            if isinstance(inst, ir.LoadInstr):
+                continue
+            if isinstance(inst, ir.StoreInstr) and id(inst.operands[0]) not in derived:
+                continue
+            if isinstance(inst, ir.CallInstr) and getattr(inst.callee, "name", "").startswith("llvm.lifetime."):
+                continue
+            return True
+    return False
+
+# ---------------------------------------------------------------------------
+# <Method name=bounds_checks_enabled args=[<Compiler>]>
+# <Description>
+# Whether residual (unproven) bounds checks are emitted here: off inside
+# #[unchecked] functions/structs, otherwise as configured for the current
+# module by the build profile in finn.toml:
+#     [profile.release]
+#     bounds_checks = true
+#     [profile.release.modules]
+#     "kernels" = { bounds_checks = false }   # kernels and kernels.*
+# Checks are on by default in every profile.
+# </Description>
+def bounds_checks_enabled(compiler: Compiler) -> bool:
+    if compiler.bounds_unchecked:
+        return False
+    module = _module_key(compiler)
+    if module not in compiler.bounds_policy:
+        config = getattr(compiler.module_loader, "finn_config", None) or {}
+        profile = config.get("profile", {}).get(compiler.build_profile, {})
+        enabled = profile.get("bounds_checks", True)
+        modules = profile.get("modules", {})
+        match = module if module in modules else longest_prefix(module, modules.keys(), ".")
+        if match:
+            enabled = modules[match].get("bounds_checks", enabled)
+        compiler.bounds_policy[module] = bool(enabled)
+    return compiler.bounds_policy[module]
+
+def _module_key(compiler: Compiler) -> str:
+    if not compiler.current_file_path or compiler.module_loader is None:
+        return "<main>"
+    try:
+        rel_path = os.path.relpath(compiler.current_file_path, compiler.module_loader.root_dir)
+    except ValueError:
+        rel_path = os.path.basename(compiler.current_file_path)
+    return os.path.splitext(rel_path)[0].replace(os.sep, ".")
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_bounds args=[<Compiler>, <str>]>
+# <Description>
+# Initializes the bounds-check state on the compiler.
+# </Description>
+def setup_bounds(compiler: Compiler, build_profile: str):
+    if build_profile not in BUILD_PROFILES:
+        raise CompilerException(f"Unknown build profile '{build_profile}' (expected one of {', '.join(BUILD_PROFILES)}).")
+    compiler.build_profile = build_profile
+    compiler.bounds_unchecked = False # Inside an #[unchecked] function/struct
+    compiler.bounds_policy = {} # module -> residual checks on?
+    compiler.index_ranges = {} # SSA loop counter -> IndexRange
@@ -0,0 +1,368 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+
+# Collection<T> layout: { T* data, length, capacity } (see stdlib/builtins.fin)
+DATA_FIELD = 0
+LENGTH_FIELD = 1
+CAPACITY_FIELD = 2
+# Lengths, capacities and indices are 64-bit (collections over 2^31 elements)
+LENGTH_TYPE = ir.IntType(64)
+
+# First allocation made by push/extend on an empty collection
+MIN_CAPACITY = 4
+
+COLLECTION_METHODS = ("push", "pop", "reserve", "extend", "shrink_to_fit")
+
+# ---------------------------------------------------------------------------
+# <Method name=collection_type args=[<Compiler>, <ir.Type>]>
+# <Description>
+# LLVM layout of Collection<T> for element type 'elem_type'.
+# Each element type gets its own layout (T* data, not i8*), so element
+# loads/stores and the helpers below are specialised per T.
+# </Description>
+def collection_type(compiler: Compiler, elem_type: ir.Type) -> ir.LiteralStructType:
+    return ir.LiteralStructType([elem_type.as_pointer(), LENGTH_TYPE, LENGTH_TYPE])
+
+# ---------------------------------------------------------------------------
+# <Method name=is_collection_type args=[<Compiler>, <ir.Type>]>
+# <Description>
+# True for a Collection layout ({T*, len, cap}). Interfaces ({i8*, i8*})
+# and 'any' ({i8*, i64}) have two fields, so they never match.
+# </Description>
+def is_collection_type(compiler: Compiler, llvm_type: ir.Type) -> bool:
+    return isinstance(llvm_type, ir.LiteralStructType) and \
+        len(llvm_type.elements) == 3 and \
+        isinstance(llvm_type.elements[DATA_FIELD], ir.PointerType) and \
+        llvm_type.elements[LENGTH_FIELD] == LENGTH_TYPE and \
+        llvm_type.elements[CAPACITY_FIELD] == LENGTH_TYPE
+
+# ---------------------------------------------------------------------------
+# <Method name=build_collection args=[<Compiler>, <ir.LiteralStructType>, <ir.Value>, <Union[int, ir.Value]>, <Union[int, ir.Value, None]>]>
+# <Description>
+# Builds a Collection value from a data pointer, a length and a capacity
+# (defaults to the length: the buffer is exactly full).
+# </Description>
+def build_collection(compiler: Compiler, coll_type: ir.LiteralStructType, data_ptr: ir.Value,
+                     length: Union[int, ir.Value], capacity: Union[int, ir.Value, None] = None) -> ir.Value:
+    if capacity is None:
+        capacity = length
+    if isinstance(length, int):
+        length = ir.Constant(LENGTH_TYPE, length)
+    if isinstance(capacity, int):
+        capacity = ir.Constant(LENGTH_TYPE, capacity)
+
+    coll_val = ir.Constant(coll_type, ir.Undefined)
+    coll_val = compiler.builder.insert_value(coll_val, data_ptr, DATA_FIELD)
+    coll_val = compiler.builder.insert_value(coll_val, length, LENGTH_FIELD)
+    return compiler.builder.insert_value(coll_val, capacity, CAPACITY_FIELD)
+
+# ---------------------------------------------------------------------------
+# <Method name=to_index args=[<Compiler>, <ir.Value>]>
+# <Description>
+# Widens an integer index/length to LENGTH_TYPE (sign-extended, so negative
+# indices stay out of range for the unsigned bounds compare).
+# </Description>
+def to_index(compiler: Compiler, value: ir.Value, name: str = "idx64") -> ir.Value:
+    if value.type == LENGTH_TYPE:
+        return value
+    if isinstance(value, ir.Constant) and isinstance(value.constant, int):
+        return ir.Constant(LENGTH_TYPE, value.constant)
+    if value.type.width == 1: # bool
+        return compiler.builder.zext(value, LENGTH_TYPE, name=name)
+    if value.type.width < LENGTH_TYPE.width:
+        return compiler.builder.sext(value, LENGTH_TYPE, name=name)
+    return compiler.builder.trunc(value, LENGTH_TYPE, name=name)
+
+# ---------------------------------------------------------------------------
+# <Method name=compile_collection_method args=[<Compiler>, <StructMethodCall>, <ir.Value>]>
+# <Description>
+# Built-in methods of Collection<T> ('coll_ptr' is the collection's address):
+# - push(v): appends; grows the buffer geometrically when full (amortized O(1)).
+# - pop(): removes and returns the last element (panics when empty).
+# - reserve(n): makes capacity at least n (no-op when it already is).
+# - extend(other): appends all elements of a collection or array literal.
+# - shrink_to_fit(): releases unused capacity.
+# Only the common path is inline; growing and shrinking call per-T
+# helpers (see _grow_function / _shrink_function).
+# </Description>
+def compile_collection_method(compiler: Compiler, node: StructMethodCall, coll_ptr: ir.Value) -> Optional[ir.Value]:
+    method = node.method_name
+    if method not in COLLECTION_METHODS:
+        compiler.errors.error(
+            node,
+            f"Collection has no method '{method}'.",
+            hint=f"Available methods: {', '.join(COLLECTION_METHODS)}.")
+        return None
+
+    expected = {"push": 1, "pop": 0, "reserve": 1, "extend": 1, "shrink_to_fit": 0}[method]
+    if len(node.params) != expected:
+        compiler.errors.error(node, f"Collection.{method}() expects {expected} argument(s), got {len(node.params)}.")
+        return None
+
+    coll_type = coll_ptr.type.pointee
+    elem_type = coll_type.elements[DATA_FIELD].pointee
+    length_ptr = _field_ptr(compiler, coll_ptr, LENGTH_FIELD)
+    capacity_ptr = _field_ptr(compiler, coll_ptr, CAPACITY_FIELD)
+    one = ir.Constant(LENGTH_TYPE, 1)
+
+    if method == "push":
+        value = _coerce_element(compiler, compiler.compile(node.params[0]), elem_type, node)
+        length = compiler.builder.load(length_ptr, name="coll_len")
+        capacity = compiler.builder.load(capacity_ptr, name="coll_cap")
+        full = compiler.builder.icmp_unsigned(">=", length, capacity, name="coll_full")
+        with compiler.builder.if_then(full, likely=False):
+            new_length = compiler.builder.add(length, one, name="coll_need")
+            compiler.builder.call(_grow_function(compiler, coll_type), [coll_ptr, new_length])
+        data = compiler.builder.load(_field_ptr(compiler, coll_ptr, DATA_FIELD), name="coll_data")
+        compiler.builder.store(value, compiler.builder.gep(data, [length], inbounds=True, name="push_slot"))
+        compiler.builder.store(compiler.builder.add(length, one, name="coll_len_inc"), length_ptr)
+        return None
+
+    if method == "pop":
+        length = compiler.builder.load(length_ptr, name="coll_len")
+        empty = compiler.builder.icmp_unsigned("==", length, ir.Constant(LENGTH_TYPE, 0), name="coll_empty")
+        compiler.emit_panic_check(empty, "Runtime Error: pop from empty Collection", node)
+        new_length = compiler.builder.sub(length, one, name="coll_len_dec")
+        compiler.builder.store(new_length, length_ptr)
+        data = compiler.builder.load(_field_ptr(compiler, coll_ptr, DATA_FIELD), name="coll_data")
+        return compiler.builder.load(compiler.builder.gep(data, [new_length], inbounds=True), name="popped")
+
+    if method == "reserve":
+        wanted = compiler.compile(node.params[0])
+        if not isinstance(wanted.type, ir.IntType):
+            compiler.errors.error(node, f"Collection.reserve() expects an integer, got {wanted.type}.")
+            return None
+        wanted = to_index(compiler, wanted)
+        capacity = compiler.builder.load(capacity_ptr, name="coll_cap")
+        short = compiler.builder.icmp_unsigned(">", wanted, capacity, name="coll_short")
+        with compiler.builder.if_then(short):
+            compiler.builder.call(_grow_function(compiler, coll_type), [coll_ptr, wanted])
+        return None
+
+    if method == "extend":
+        other = compiler.compile(node.params[0])
+        if isinstance(other.type, ir.ArrayType):
+            other = compiler.create_collection_from_array_literal(other, elem_type)
+        elif isinstance(other.type, ir.PointerType) and is_collection_type(compiler, other.type.pointee):
+            other = compiler.builder.load(other, name="extend_src")
+        if other.type != coll_type:
+            compiler.errors.error(node, f"Collection.extend() expects a collection of the same element type ({coll_type}), got {other.type}.")
+            return None
+
+        other_data = compiler.builder.extract_value(other, DATA_FIELD, name="extend_data")
+        other_length = compiler.builder.extract_value(other, LENGTH_FIELD, name="extend_len")
+        data_ptr = _field_ptr(compiler, coll_ptr, DATA_FIELD)
+        old_data = compiler.builder.load(data_ptr, name="coll_data")
+        length = compiler.builder.load(length_ptr, name="coll_len")
+        capacity = compiler.builder.load(capacity_ptr, name="coll_cap")
+        needed = compiler.builder.add(length, other_length, name="coll_need")
+        short = compiler.builder.icmp_unsigned(">", needed, capacity, name="coll_short")
+        with compiler.builder.if_then(short):
+            compiler.builder.call(_grow_function(compiler, coll_type), [coll_ptr, needed])
+        data = compiler.builder.load(data_ptr, name="coll_data")
+        # xs.extend(xs): the source buffer moved with the realloc
+        same = compiler.builder.icmp_unsigned("==", other_data, old_data, name="extend_self")
+        source = compiler.builder.select(same, data, other_data, name="extend_src_data")
+
+        i8_ptr = ir.IntType(8).as_pointer()
+        dest = compiler.builder.bitcast(compiler.builder.gep(data, [length], inbounds=True), i8_ptr)
+        size = compiler.builder.mul(other_length, _element_size(compiler, elem_type), name="extend_bytes")
+        memcpy = compiler.module.declare_intrinsic("llvm.memcpy", [i8_ptr, i8_ptr, ir.IntType(64)])
+        compiler.builder.call(memcpy, [dest, compiler.builder.bitcast(source, i8_ptr), size, ir.Constant(ir.IntType(1), 0)])
+        compiler.builder.store(needed, length_ptr)
+        return None
+
+    # shrink_to_fit
+    compiler.builder.call(_shrink_function(compiler, coll_type), [coll_ptr])
+    return None
+
+# ---------------------------------------------------------------------------
+# <Method name=_grow_function args=[<Compiler>, <ir.LiteralStructType>]>
+# <Description>
+# 'void __fin_coll_grow.N(coll*, needed)' for one collection layout:
+# new capacity = max(2 * capacity, needed, MIN_CAPACITY), buffer realloc'd.
+# Capacity 0 marks a buffer the collection does not own (pointer casts,
+# @embed data): it is copied into a fresh allocation instead. So is every
+# buffer while an #[arena] region is open: the copy comes from the region
+# and the old buffer is freed only if it came from malloc.
+# noinline: it runs O(log n) times, so it stays out of the push path.
+# </Description>
+def _grow_function(compiler: Compiler, coll_type: ir.LiteralStructType) -> ir.Function:
+    key = ("grow", coll_type)
+    fn = compiler.collection_helpers.get(key)
+    if fn is not None:
+        return fn
+
+    fn = _helper_function(compiler, "grow", [coll_type.as_pointer(), LENGTH_TYPE])
+    coll_ptr, needed = fn.args
+    builder = ir.IRBuilder(fn.append_basic_block("entry"))
+    capacity_ptr = builder.gep(coll_ptr, [_i32(0), _i32(CAPACITY_FIELD)], inbounds=True)
+    data_ptr = builder.gep(coll_ptr, [_i32(0), _i32(DATA_FIELD)], inbounds=True)
+
+    capacity = builder.load(capacity_ptr, name="cap")
+    doubled = builder.shl(capacity, ir.Constant(LENGTH_TYPE, 1), name="doubled")
+    new_capacity = builder.select(builder.icmp_unsigned("<", doubled, needed), needed, doubled)
+    minimum = ir.Constant(LENGTH_TYPE, MIN_CAPACITY)
+    new_capacity = builder.select(builder.icmp_unsigned("<", new_capacity, minimum), minimum, new_capacity, name="new_cap")
+
+    elem_type = coll_type.elements[DATA_FIELD].pointee
+    data = builder.load(data_ptr, name="data")
+    owned = builder.icmp_unsigned("!=", capacity, ir.Constant(LENGTH_TYPE, 0), name="owned")
+    resizable = builder.and_(owned, builder.not_(compiler.in_arena(builder)), name="resizable")
+    with builder.if_else(resizable) as (when_owned, otherwise):
+        with when_owned:
+            builder.store(_realloc(compiler, builder, data, new_capacity, elem_type), data_ptr)
+        with otherwise:
+            i8_ptr = ir.IntType(8).as_pointer()
+            size = builder.mul(new_capacity, _element_size(compiler, elem_type), name="bytes")
+            raw = compiler.emit_allocation(size, builder)
+            length = builder.load(builder.gep(coll_ptr, [_i32(0), _i32(LENGTH_FIELD)], inbounds=True), name="len")
+            used = builder.mul(length, _element_size(compiler, elem_type), name="used_bytes")
+            memcpy = compiler.module.declare_intrinsic("llvm.memcpy", [i8_ptr, i8_ptr, ir.IntType(64)])
+            builder.call(memcpy, [raw, builder.bitcast(data, i8_ptr), used, ir.Constant(ir.IntType(1), 0)])
+            with builder.if_then(owned):
+                compiler.emit_deallocation(data, builder) # Region growth: the malloc'd original
+            builder.store(builder.bitcast(raw, data.type), data_ptr)
+    builder.store(new_capacity, capacity_ptr)
+    builder.ret_void()
+
+    compiler.collection_helpers[key] = fn
+    return fn
+
+# ---------------------------------------------------------------------------
+# <Method name=_shrink_function args=[<Compiler>, <ir.LiteralStructType>]>
+# <Description>
+# 'void __fin_coll_shrink.N(coll*)': reallocs the buffer down to the length
+# (frees it when empty). No-op when the collection is already full, or
+# its buffer belongs to an open #[arena] region.
+# </Description>
+def _shrink_function(compiler: Compiler, coll_type: ir.LiteralStructType) -> ir.Function:
+    key = ("shrink", coll_type)
+    fn = compiler.collection_helpers.get(key)
+    if fn is not None:
+        return fn
+
+    fn = _helper_function(compiler, "shrink", [coll_type.as_pointer()])
+    coll_ptr, = fn.args
+    builder = ir.IRBuilder(fn.append_basic_block("entry"))
+    length = builder.load(builder.gep(coll_ptr, [_i32(0), _i32(LENGTH_FIELD)], inbounds=True), name="len")
+    capacity_ptr = builder.gep(coll_ptr, [_i32(0), _i32(CAPACITY_FIELD)], inbounds=True)
+    data_ptr = builder.gep(coll_ptr, [_i32(0), _i32(DATA_FIELD)], inbounds=True)
+    data = builder.load(data_ptr, name="data")
+
+    slack = builder.icmp_unsigned("<", length, builder.load(capacity_ptr, name="cap"))
+    with builder.if_then(builder.and_(slack, builder.not_(compiler.arena_owns(data, builder)))):
+        with builder.if_else(builder.icmp_unsigned("==", length, ir.Constant(LENGTH_TYPE, 0))) as (when_empty, otherwise):
+            with when_empty:
+                free_ty = ir.FunctionType(ir.VoidType(), [ir.IntType(8).as_pointer()])
+                compiler.call_runtime_function("free", free_ty, [data], builder) # (builtins.fin: free takes &int)
+                builder.store(ir.Constant(data.type, None), data_ptr)
+            with otherwise:
+                builder.store(_realloc(compiler, builder, data, length, data.type.pointee), data_ptr)
+        builder.store(length, capacity_ptr)
+    builder.ret_void()
+
+    compiler.collection_helpers[key] = fn
+    return fn
+
+def _helper_function(compiler: Compiler, kind: str, arg_types: List[ir.Type]) -> ir.Function:
+    fn_ty = ir.FunctionType(ir.VoidType(), arg_types)
+    fn = ir.Function(compiler.module, fn_ty, name=f"__fin_coll_{kind}.{len(compiler.collection_helpers)}")
+    fn.linkage = "internal"
+    for attr in ("noinline", "nounwind"):
+        fn.attributes.add(attr)
+    return fn
+
+def _realloc(compiler: Compiler, builder: ir.IRBuilder, data: ir.Value, count: ir.Value, elem_type: ir.Type) -> ir.Value:
+    i8_ptr = ir.IntType(8).as_pointer()
+    realloc_ty = ir.FunctionType(i8_ptr, [i8_ptr, ir.IntType(64)])
+    size = builder.mul(count, _element_size(compiler, elem_type), name="bytes")
+    raw = compiler.call_runtime_function("realloc", realloc_ty, [data, size], builder, "realloc_call")
+    return builder.bitcast(raw, data.type)
+
+def _element_size(compiler: Compiler, elem_type: ir.Type) -> ir.Constant:
+    if compiler.data_layout_obj:
+        return ir.Constant(ir.IntType(64), compiler.abi_size(elem_type))
+    # GEP-null trick as a constant expression (folded by LLVM)
+    return ir.Constant(elem_type.as_pointer(), None).gep([_i32(1)]).ptrtoint(ir.IntType(64))
+
+def _field_ptr(compiler: Compiler, coll_ptr: ir.Value, field: int) -> ir.Value:
+    return compiler.builder.gep(coll_ptr, [_i32(0), _i32(field)], inbounds=True)
+
+def _i32(value: int) -> ir.Constant:
+    return ir.Constant(ir.IntType(32), value)
+
+# ---------------------------------------------------------------------------
+# <Method name=_coerce_element args=[<Compiler>, <ir.Value>, <ir.Type>, <Node>]>
+# <Description>
+# Converts a pushed value to the element type (boxing for erased T,
+# int -> float, int widths, pointer casts, struct pointer -> value).
+# </Description>
+def _coerce_element(compiler: Compiler, value: ir.Value, elem_type: ir.Type, node: Node) -> ir.Value:
+    if value.type == elem_type:
+        return value
+    if elem_type == ir.IntType(8).as_pointer() and not isinstance(value.type, ir.PointerType):
+        return compiler.box_value(value, compiler.infer_fin_type_from_llvm(value.type))
+    if isinstance(elem_type, ir.FloatType) and isinstance(value.type, ir.IntType):
+        return compiler.builder.sitofp(value, elem_type)
+    if isinstance(elem_type, ir.IntType) and isinstance(value.type, ir.IntType):
+        if value.type.width < elem_type.width:
+            return compiler.builder.sext(value, elem_type)
+        return compiler.builder.trunc(value, elem_type)
+    if isinstance(value.type, ir.PointerType) and value.type.pointee == elem_type:
+        return compiler.builder.load(value, name="push_load")
+    if isinstance(elem_type, ir.PointerType) and isinstance(value.type, ir.PointerType):
+        return compiler.builder.bitcast(value, elem_type)
+    compiler.errors.error(node, f"Cannot push a value of type {value.type} into a collection of {elem_type}.")
+    return ir.Constant(elem_type, None)
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_collections args=[<Compiler>]>
+# <Description>
+# Initializes the per-layout helper cache (grow/shrink functions).
+# </Description>
+def setup_collections(compiler: Compiler):
+    compiler.collection_helpers = {} # (kind, collection layout) -> helper function
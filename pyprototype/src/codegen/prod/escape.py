@@ -0,0 +1,172 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+
+# Largest object (bytes) a non-escaping 'new' may place on the stack
+MAX_STACK_OBJECT_SIZE = 1024
+
+# ---------------------------------------------------------------------------
+# <Method name=analyze_escapes args=[<Compiler>, <List[Node]>]>
+# <Description>
+# Escape analysis of a function body. Finds the 'let p = new T...;'
+# declarations whose object provably never leaves the function: every
+# later mention of 'p' is a field access ('p.x', also as an assignment
+# target), a dereference ('*p') or 'delete p'. Anything else (passing 'p'
+# to a call or method, returning or storing it, '&p.x', comparing it,
+# reassigning or shadowing 'p', lambdas and macros) counts as an escape.
+# So does 'new T(args)' with a constructor, which gets the object as
+# 'self' (checked in compile_new, where T's constructor is known).
+# Returns a map from the id of each such 'new' node, and of each 'delete'
+# of its variable, to the id of the 'new' node.
+# </Description>
+def analyze_escapes(compiler: Compiler, body: List[Node]) -> Dict[int, int]:
+    candidates = []
+    _collect_candidates(body, candidates)
+    result = {}
+    for decl in candidates:
+        if _escapes(body, decl.identifier, decl):
+            continue
+        new_id = id(decl.value)
+        result[new_id] = new_id
+        for delete in _deletes_of(body, decl.identifier):
+            result[id(delete)] = new_id
+    return result
+
+# ---------------------------------------------------------------------------
+# <Method name=stack_allocate_new args=[<Compiler>, <NewExpressionNode>, <ir.Type>]>
+# <Description>
+# Entry-block stack slot for a 'new' that analyze_escapes proved local, or
+# None if it must go to the heap (escapes, or larger than
+# MAX_STACK_OBJECT_SIZE). Promoted objects are recorded so their 'delete'
+# is dropped (see is_stack_delete).
+# </Description>
+def stack_allocate_new(compiler: Compiler, ast: NewExpressionNode, llvm_type: ir.Type) -> Optional[ir.AllocaInstr]:
+    if compiler.non_escaping_news.get(id(ast)) != id(ast) or not compiler.data_layout_obj:
+        return None
+    if compiler.abi_size(llvm_type) > MAX_STACK_OBJECT_SIZE:
+        return None
+    compiler.stack_objects.add(id(ast))
+    return compiler.create_entry_alloca(llvm_type, name="new_stack")
+
+# ---------------------------------------------------------------------------
+# <Method name=is_stack_delete args=[<Compiler>, <DeleteStatementNode>]>
+# <Description>
+# True if 'ast' deletes an object that stack_allocate_new put on the stack.
+# </Description>
+def is_stack_delete(compiler: Compiler, ast: DeleteStatementNode) -> bool:
+    owner = compiler.non_escaping_news.get(id(ast))
+    return owner is not None and owner in compiler.stack_objects
+
+def _collect_candidates(node, out: List[VariableDeclaration]):
+    if isinstance(node, (list, tuple)):
+        for item in node:
+            _collect_candidates(item, out)
+        return
+    if isinstance(node, dict):
+        _collect_candidates(list(node.values()), out)
+        return
+    if not isinstance(node, Node) or isinstance(node, LambdaNode): # Lambdas are other functions
+        return
+    if isinstance(node, VariableDeclaration) and isinstance(node.value, NewExpressionNode) and \
+        isinstance(node.identifier, str):
+        out.append(node)
+    for value in vars(node).values():
+        _collect_candidates(value, out)
+
+def _escapes(node, name: str, decl: VariableDeclaration) -> bool:
+    if decl is not None and node is decl: # The declaration itself
+        return _escapes(decl.value, name, None)
+    if isinstance(node, str):
+        return node == name # Any other use of the pointer
+    if isinstance(node, (list, tuple)):
+        return any(_escapes(item, name, decl) for item in node)
+    if isinstance(node, dict):
+        return any(_escapes(item, name, decl) for item in node.values())
+    if not isinstance(node, Node):
+        return False
+
+    if isinstance(node, MemberAccess) and node.struct_name == name: # p.x
+        return False
+    if isinstance(node, DereferenceNode) and node.expression == name: # *p
+        return False
+    if isinstance(node, DeleteStatementNode) and node.pointer_expr_ast == name: # delete p
+        return False
+    if isinstance(node, (AddressOfNode, AsPtrNode, MacroCall, LambdaNode)) and _mentions(node, name):
+        return True # Interior pointers, unknown code
+    if isinstance(node, VariableDeclaration) and node.identifier == name:
+        return True # Shadowing: uses can no longer be told apart
+    return any(_escapes(value, name, decl) for value in vars(node).values())
+
+def _mentions(node, name: str) -> bool:
+    if isinstance(node, str):
+        return node == name
+    if isinstance(node, (list, tuple)):
+        return any(_mentions(item, name) for item in node)
+    if isinstance(node, dict):
+        return any(_mentions(item, name) for item in node.values())
+    if isinstance(node, Node):
+        return any(_mentions(value, name) for value in vars(node).values())
+    return False
+
+def _deletes_of(node, name: str) -> List[DeleteStatementNode]:
+    if isinstance(node, (list, tuple)):
+        return [d for item in node for d in _deletes_of(item, name)]
+    if isinstance(node, dict):
+        return _deletes_of(list(node.values()), name)
+    if not isinstance(node, Node):
+        return []
+    if isinstance(node, DeleteStatementNode) and node.pointer_expr_ast == name:
+        return [node]
+    return [d for value in vars(node).values() for d in _deletes_of(value, name)]
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_escape_analysis args=[<Compiler>]>
+# <Description>
+# Initializes the escape analysis state (per function, see
+# _compile_function_body).
+# </Description>
+def setup_escape_analysis(compiler: Compiler):
+    compiler.non_escaping_news = {} # id(new / delete node) -> id(new node)
+    compiler.stack_objects = set() # ids of 'new' nodes placed on the stack
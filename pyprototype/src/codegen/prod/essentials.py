@@ -42,9 +42,10 @@
 # -----------------------------------------------------------------------------
 # “Code fades. Love leaves a signature.”
 # =============================================================================
-from ...ast2.nodes import *
-from llvmlite import ir
 from typing import *
+from llvmlite import ir
+# After typing: the AST 'Literal' node must shadow typing.Literal
+from ...ast2.nodes import *
 from ...semantics.scope import Scope
 from ...semantics.types import *
 import enum
@@ -60,12 +61,15 @@ class Compiler:
     # =========================================================================
     # 1. LLVM Core State
     # =========================================================================
+    context: ir.Context # Per-compiler type context (identified structs)
     module: ir.Module
     builder: Optional[ir.IRBuilder]
     target_triple: str
     target: Any
     target_machine: Optional[Any]
     data_layout_obj: Optional[Any]
+    target_cpu: str
+    target_features: str
     
     # =========================================================================
     # 2. Scopes & Execution State
@@ -87,6 +91,7 @@ class Compiler:
     
     # Maps Mangled Name -> { FieldName: DefaultValueAST }
     struct_field_defaults: Dict[str, Dict[str, Node]]
+    struct_init_templates: Dict[str, Tuple[ir.Constant, Set[str], Optional[ir.GlobalVariable]]] # (template, non-constant defaults, global for memcpy)
     
     # Maps Mangled Name -> { FieldName: Visibility }
     struct_field_visibility: Dict[str, Dict[str, str]]
@@ -144,6 +149,9 @@ class Compiler:
     
     # Maps Name -> FilePath (For error reporting/visibility checks)
     function_origins: Dict[str, str]
+
+    # Maps sanitized path prefix -> dotted module path (see get_mangled_name)
+    mangled_modules: Dict[str, str]
     
     # The 'main' entry point function
     main_function: Optional[ir.Function]
@@ -192,6 +200,59 @@ class Compiler:
     
     # Macros
     macros: Dict[str, Tuple[List[str], List[AstNode]]]
+
+    # Profile-Guided Optimization (src/codegen/prod/pgo.py)
+    pgo_generate: Optional[str] # Output profile path (instrumented build)
+    pgo_profile: Optional[Dict[str, int]] # Loaded counts (optimizing build)
+    pgo_hot_threshold: int
+    pgo_site_ordinals: Dict[str, Dict[str, int]] # Function -> { kind: next ordinal }
+    pgo_counters: Dict[str, ir.GlobalVariable] # Counter key -> i64 global
+    pgo_writer_anchor: Optional[ir.Instruction] # fclose() in '__fin_pgo_write'
+
+    # Runtime Profiler (src/codegen/prod/instrument.py)
+    instrument: bool
+    instrument_globals: Dict[str, ir.GlobalVariable]
+    instrumented_functions: Dict[str, Dict[str, Any]] # LLVM name -> { id, record, ... }
+    instrument_edges: Optional[Any] # ctypes edge table owned by runwithjit
+    runtime_profile: Optional[Dict[str, Dict[str, Any]]]
+
+    # Perf Map (src/codegen/prod/perfmap.py)
+    perf_map: bool
+    jit_objects: List[bytes] # Objects emitted by MCJIT (perf map sizing)
+
+    # SSA Builder (src/codegen/prod/ssa.py)
+    ssa_block_params: Dict[ir.Block, List[ir.PhiInstr]]
+
+    # Compile Statistics (src/codegen/prod/stats.py)
+    stats_enabled: bool
+    compile_stats: Dict[str, Dict[str, int]] # LLVM function name -> { kind: count }
+    stats_generics: Dict[str, Dict[str, Set[str]]] # Generic -> { instances, symbols }
+    stats_macros: Dict[str, Dict[str, int]] # Macro -> { expansions, instructions }
+
+    # Bounds Checks (src/codegen/prod/bounds.py)
+    build_profile: str # 'debug' | 'release' (selects [profile.<name>] in finn.toml)
+    bounds_unchecked: bool # Inside an #[unchecked] function/struct
+    bounds_policy: Dict[str, bool] # Module -> residual bounds checks on?
+    index_ranges: Dict[ir.PhiInstr, Any] # SSA loop counter -> IndexRange
+
+    # Panic Stubs (src/codegen/prod/panics.py)
+    panic_stubs: Dict[str, ir.Function] # Message -> outlined cold stub
+    panic_blocks: Dict[ir.Function, Dict[str, ir.Block]] # Function -> { message: cold block }
+
+    # Exceptions (src/codegen/prod/exceptions.py)
+    uses_exceptions: bool # Module throws/catches: JIT needs the C++ ABI runtime
+    try_stack: List[Tuple[ir.Function, ir.Block, ir.AllocaInstr, ir.Block]] # Enclosing try: (function, dispatch, exn slot, landing)
+
+    # Collections (src/codegen/prod/collections.py)
+    collection_helpers: Dict[Tuple[str, ir.LiteralStructType], ir.Function] # (kind, layout) -> grow/shrink helper
+    embedded_files: Dict[Tuple[str, int], ir.GlobalVariable] # @embed: (path, element size) -> constant bytes
+    non_escaping_news: Dict[int, int] # Escape analysis: id(new / delete node) -> id(new node)
+    stack_objects: Set[int] # ids of the 'new' nodes placed on the stack
+    arena_helpers: Dict[str, ir.Function] # Arena region runtime, by kind
+    current_arena: Optional[ir.AllocaInstr] # Arena slot of the #[arena] function being compiled
+    pooled_structs: Set[str] # Mangled names of #[pooled] structs
+    struct_pools: Dict[str, Dict[str, Any]] # Mangled name -> pool (state global, slot size, helpers)
+    pool_stats: Optional[Dict[str, Dict[str, int]]] # Runtime pool counters (--stats)
     attributes_lib = Any#(Compiler)
     intrinsics_lib = Any#(Compiler)
 
@@ -314,6 +375,10 @@ class Compiler:
         """Compiles a struct definition."""
         ...
 
+    def scout_struct_layout(self, ast: StructDeclaration) -> None:
+        """Scouting pass: lays out a plain struct early so prototypes see its size."""
+        ...
+
     def compile_struct_instantiation(self, node: StructInstantiation) -> ir.Value:
         """Compiles 'new Struct' or stack instantiation."""
         ...
@@ -338,6 +403,26 @@ class Compiler:
         """Compiles a method call on a struct instance."""
         ...
     
+    def compile_constructor(self, struct_name: str, struct_ty: ir.Type, ctor_ast: Any) -> None:
+        """Defines `void S__init(S* sret self, ...)` so the struct is built in caller storage."""
+        ...
+    
+    def resolve_constructor(self, name: Union[str, Node]) -> Optional[ir.Function]:
+        """Returns the constructor function of struct `name` (or of a generic instance), or None if it has none."""
+        ...
+    
+    def emit_constructor_call(self, ctor: ir.Function, args: List[ir.Value], dest: ir.Value = None) -> ir.Value:
+        """Constructs into `dest` (or a fresh stack slot) and returns the pointer."""
+        ...
+    
+    def init_struct_fields(self, struct_ptr: ir.Value, struct_type: ir.IdentifiedStructType, mangled_name: str, field_indices: dict, defaults_map: dict, provided_assignments: dict, node: Any) -> None:
+        """Stores the constant template, then the assigned and non-constant default fields."""
+        ...
+    
+    def struct_init_template(self, struct_type: ir.IdentifiedStructType, mangled_name: str, field_indices: dict, defaults_map: dict) -> Tuple[ir.Constant, Set[str], Optional[ir.GlobalVariable]]:
+        """Returns the cached constant initializer of a struct type."""
+        ...
+    
     # --- Variables (src/codegen/variables.py) ---
     def create_variable_mut(
         self,
@@ -377,6 +462,10 @@ class Compiler:
     def compile_array_literal(compiler: Compiler, ast: ArrayLiteralNode, target_array_type: Optional[ir.Type] = None) -> ir.Value:
         """Compiles an array literal `[e1, e2, ...]`."""
         ...
+
+    def store_array_value(self, array_val: ir.Value, dest_ptr: ir.Value) -> None:
+        """Stores an array value; literal constants are memcpy'd from a private global."""
+        ...
     
     # --- Interface Helpers (src/codegen/interfaces.py) ---
     def compile_interface(self, ast: InterfaceDeclaration) -> None:
@@ -452,7 +541,7 @@ class Compiler:
         ...
     
     # --- General Helpers --- (src/codegen/helpers.py) ---
-    def merge_scope(self, source_scope: Scope, targets: Optional[List[str]], alias: Optional[str]) -> None:
+    def merge_scope(self, source_scope: Scope, targets: Optional[List[str]], source_path: Optional[str] = None) -> None:
         """Merges symbols from source_scope into current_scope."""
         ...
     
@@ -460,13 +549,264 @@ class Compiler:
         """Generates a unique name for a monomorphized instance (e.g. Box_int)."""
         ...
     
-    def _emit_runtime_check_zero(self, compiler: Compiler, value_llvm: ir.Value, error_msg: str, node: Node = None):
+    def _emit_runtime_check_zero(self, value_llvm: ir.Value, error_msg: str, node: Node = None):
         """
         Emits a runtime check that 'value_llvm' is not zero/null.
         If it is zero, calls the panic function with 'error_msg'.
         """
         ...
     
+    def register_global_ctor(self, fn: ir.Function) -> None:
+        """Schedules 'fn' (void()) to run at load time via '__fin_module_init'."""
+        ...
+
+    def register_global_dtor(self, fn: ir.Function) -> None:
+        """Schedules 'fn' (void()) to run at exit via '__fin_module_fini'."""
+        ...
+
+    def get_or_declare_function(self, name: str, fn_ty: ir.FunctionType) -> ir.Function:
+        """Returns module function 'name', declaring it if missing."""
+        ...
+
+    def call_runtime_function(self, name: str, fn_ty: ir.FunctionType, args: List[ir.Value], builder: Optional[ir.IRBuilder] = None, result_name: str = "") -> ir.Value:
+        """Calls libc 'name' typed as 'fn_ty', bitcasting pointers to its actual declaration."""
+        ...
+
+    def create_entry_alloca(self, llvm_type: ir.Type, name: str = "", scoped: bool = False) -> ir.AllocaInstr:
+        """Allocates in the function entry block; 'scoped' adds lifetime markers."""
+        ...
+
+    def abi_size(self, llvm_type: ir.Type) -> int:
+        """Target ABI size of 'llvm_type' in bytes (resolved in the compiler's context)."""
+        ...
+
+    def abi_alignment(self, llvm_type: ir.Type) -> int:
+        """Target ABI alignment of 'llvm_type' in bytes."""
+        ...
+
+    # --- Profile-Guided Optimization (src/codegen/prod/pgo.py) ---
+    def emit_profiled_cbranch(self, kind: str, cond: ir.Value, true_block: ir.Block, false_block: ir.Block) -> ir.Instruction:
+        """cbranch that is counted (--profile-generate) or weighted (--profile-use)."""
+        ...
+
+    def emit_profiled_entry(self, llvm_function: ir.Function) -> None:
+        """Counts function entries or applies entry counts / hot / cold."""
+        ...
+
+    # --- Runtime Profiler (src/codegen/prod/instrument.py) ---
+    def emit_instrument_prologue(self, llvm_function: ir.Function) -> None:
+        """Counts the call and starts the cycle timer (--instrument)."""
+        ...
+
+    def emit_instrument_epilogue(self, llvm_function: ir.Function) -> None:
+        """Stops the timer before every 'ret' of a finished function."""
+        ...
+
+    # --- Perf Map (src/codegen/prod/perfmap.py) ---
+    def demangle_name(self, llvm_name: str) -> str:
+        """Turns an LLVM symbol back into 'module.Struct.method' form."""
+        ...
+
+    # --- SSA Builder (src/codegen/prod/ssa.py) ---
+    def create_block_params(self, block: ir.Block, types: List[ir.Type], names: List[str]) -> List[ir.PhiInstr]:
+        """Gives 'block' one phi per type (block-argument style SSA)."""
+        ...
+
+    def branch_with_args(self, target: ir.Block, args: List[ir.Value]) -> ir.Instruction:
+        """Branches to 'target', passing 'args' to its block parameters."""
+        ...
+
+    def define_ssa_value(self, name: str, value: ir.Value, fin_type: FinType = None) -> None:
+        """Binds 'name' to an SSA value in the current scope (no stack slot)."""
+        ...
+
+    # --- Compile Statistics (src/codegen/prod/stats.py) ---
+    def count_stat(self, kind: str, amount: int = 1) -> None:
+        """Counts a bloat source against the function being compiled (--stats)."""
+        ...
+
+    def count_mono_instance(self, generic_name: str, inst_name: str) -> None:
+        """Records a monomorphized instance of 'generic_name'."""
+        ...
+
+    def stats_mark(self) -> Optional[int]:
+        """Instruction count of the current function (for count_macro_expansion)."""
+        ...
+
+    def count_macro_expansion(self, name: str, mark: Optional[int]) -> None:
+        """Records one expansion of macro 'name' and the instructions it emitted."""
+        ...
+
+    # --- Bounds Checks (src/codegen/prod/bounds.py) ---
+    def record_counter_range(self, ast: ForLoop, counter: ir.PhiInstr) -> None:
+        """Records the range of a for-loop's SSA counter (call from the preheader)."""
+        ...
+
+    def bounds_check_guard(self, ast: ArrayIndexNode, array_ptr: ir.Value) -> Union[bool, None, ir.Value]:
+        """True: no check needed; None: full check; i1 value: hoisted loop guard."""
+        ...
+
+    # --- Panic Stubs (src/codegen/prod/panics.py) ---
+    def get_panic_function(self) -> Optional[ir.Function]:
+        """'__panic' marked noreturn + cold (None if builtins are missing)."""
+        ...
+
+    def emit_panic_check(self, failed: ir.Value, message: str, node: Node = None) -> None:
+        """Panics with 'message' if 'failed' via a shared cold stub; continues after."""
+        ...
+
+    # --- Exceptions (src/codegen/prod/exceptions.py) ---
+    def emit_throw(self, value: ir.Value, message: ir.Value) -> None:
+        """Throws 'value' (type-tagged) with 'message' for the uncaught case."""
+        ...
+
+    def emit_landing_pad(self, exn_slot: ir.AllocaInstr) -> None:
+        """Landing pad catching Fin exceptions, stored into 'exn_slot'."""
+        ...
+
+    def emit_cleanup_pad(self) -> ir.Value:
+        """Cleanup landing pad at the current block; returns it for 'resume'."""
+        ...
+
+    def emit_call(self, callee: ir.Value, args: List[ir.Value], name: str = "", **kwargs) -> ir.Value:
+        """Call, or invoke to the innermost try's landing pad inside a try body."""
+        ...
+
+    def emit_invokes(self, start_block: ir.Block, start_index: int, blocks: List[ir.Block], landing: ir.Block) -> int:
+        """Turns the emitted calls that may unwind into invokes to 'landing'."""
+        ...
+
+    def emit_rethrow(self, exn: ir.Value) -> None:
+        """Re-raises 'exn' to the callers."""
+        ...
+
+    def load_caught_value(self, exn: ir.Value, value_type: ir.Type) -> Tuple[ir.Value, ir.Value, ir.Value]:
+        """(tag, message ptr, value ptr) of in-flight exception 'exn'."""
+        ...
+
+    def finish_catch(self, exn: ir.Value) -> None:
+        """Marks 'exn' caught and releases it."""
+        ...
+
+    def type_tag(self, llvm_type: ir.Type) -> ir.Value:
+        """Address-comparable tag of a blamed/caught value type."""
+        ...
+
+    # --- Collections (src/codegen/prod/collections.py) ---
+    def collection_type(self, elem_type: ir.Type) -> ir.LiteralStructType:
+        """Collection<T> layout {T*, i64 length, i64 capacity}."""
+        ...
+
+    def is_collection_type(self, llvm_type: ir.Type) -> bool:
+        """True for a Collection layout."""
+        ...
+
+    def build_collection(self, coll_type: ir.LiteralStructType, data_ptr: ir.Value, length: Union[int, ir.Value], capacity: Union[int, ir.Value, None] = None) -> ir.Value:
+        """Collection value from data, length and capacity (default: length)."""
+        ...
+
+    def to_index(self, value: ir.Value, name: str = "idx64") -> ir.Value:
+        """Integer widened to the 64-bit index/length type."""
+        ...
+
+    def compile_collection_method(self, node: StructMethodCall, coll_ptr: ir.Value) -> Optional[ir.Value]:
+        """push/pop/reserve/extend/shrink_to_fit on the collection at 'coll_ptr'."""
+        ...
+
+    def passes_indirectly(self, llvm_type: ir.Type) -> bool:
+        """True for structs passed/returned through memory (byval/sret)."""
+        ...
+
+    def lower_function_type(self, ret_type: ir.Type, param_types: List[ir.Type], var_arg: bool = False) -> ir.FunctionType:
+        """LLVM signature with big struct params as 'T* byval' and big results as 'T* sret'."""
+        ...
+
+    def apply_abi_attributes(self, fn: ir.Function, ret_type: ir.Type, param_types: List[ir.Type]) -> None:
+        """Adds the sret/byval attributes matching lower_function_type."""
+        ...
+
+    def return_slot(self, fn: ir.Function) -> Optional[ir.Argument]:
+        """The 'sret' argument of 'fn', if any."""
+        ...
+
+    def source_arguments(self, fn: ir.Function) -> List[ir.Argument]:
+        """Arguments of 'fn' matching its Fin parameters."""
+        ...
+
+    def source_signature(self, callee: ir.Value) -> Tuple[ir.Type, List[ir.Type]]:
+        """(return type, parameter types) of a callee before ABI lowering."""
+        ...
+
+    def emit_abi_call(self, callee: ir.Value, args: List[ir.Value], name: str = "") -> ir.Value:
+        """Calls 'callee' with Fin-level arguments, passing big structs by reference."""
+        ...
+
+    def call_site_attributes(self, fn: ir.Function) -> Optional[Dict[int, Tuple[str, ...]]]:
+        """'arg_attrs' (sret/byval) for a call to 'fn'."""
+        ...
+
+    def store_value(self, value: ir.Value, dest_ptr: ir.Value) -> None:
+        """Store, lowered to memcpy for big structs that were just loaded."""
+        ...
+
+    def aggregate_address(self, value: ir.Value) -> ir.Value:
+        """Address holding 'value' (its load source or a stack spill)."""
+        ...
+
+    def copy_aggregate(self, dest_ptr: ir.Value, src_ptr: ir.Value) -> None:
+        """memcpy of one object from 'src_ptr' to 'dest_ptr'."""
+        ...
+
+    def analyze_escapes(self, body: List[Node]) -> Dict[int, int]:
+        """ids of the non-escaping 'new' nodes of a function body (and of their 'delete's)."""
+        ...
+
+    def stack_allocate_new(self, ast: NewExpressionNode, llvm_type: ir.Type) -> Optional[ir.AllocaInstr]:
+        """Stack slot for a non-escaping 'new', or None for a heap allocation."""
+        ...
+
+    def is_stack_delete(self, ast: DeleteStatementNode) -> bool:
+        """True if 'ast' deletes a stack-allocated 'new' object."""
+        ...
+
+    # --- Arena Regions (src/codegen/prod/arena.py) ---
+    def emit_arena_prologue(self, ast: FunctionDeclaration) -> None:
+        """Opens the region of an #[arena] function at its entry."""
+        ...
+
+    def emit_arena_epilogue(self, llvm_function: ir.Function) -> None:
+        """Closes the region before every exit (ret, resume, unwind)."""
+        ...
+
+    def emit_allocation(self, size: ir.Value, builder: Optional[ir.IRBuilder] = None) -> ir.Value:
+        """'size' bytes from the open region, else malloc. Returns i8*."""
+        ...
+
+    def emit_deallocation(self, ptr: ir.Value, builder: Optional[ir.IRBuilder] = None) -> None:
+        """free(ptr) unless it is region memory."""
+        ...
+
+    def arena_owns(self, ptr: ir.Value, builder: Optional[ir.IRBuilder] = None) -> ir.Value:
+        """i1: ptr lies in an open region."""
+        ...
+
+    def in_arena(self, builder: Optional[ir.IRBuilder] = None) -> ir.Value:
+        """i1: a region is open."""
+        ...
+
+    # --- Pooled Structs (src/codegen/prod/pools.py) ---
+    def struct_pool(self, llvm_type: ir.Type) -> Optional[Dict[str, Any]]:
+        """The slab pool of a #[pooled] struct type, else None."""
+        ...
+
+    def pool_allocate(self, pool: Dict[str, Any]) -> ir.Value:
+        """One slot from 'pool'. Returns i8*."""
+        ...
+
+    def pool_free(self, pool: Dict[str, Any], ptr: ir.Value) -> None:
+        """Puts the slot at 'ptr' back on the pool's freelist."""
+        ...
+    
     def _is_parent_of(compiler: Compiler, parent_name: str, child_name: str) -> bool:
         """Checks if 'parent_name' is a parent of 'child_name' in the inheritance hierarchy."""
         ...
@@ -0,0 +1,398 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+from llvmlite import binding
+from ctypes.util import find_library
+
+# Fin exceptions use the Itanium C++ ABI (libstdc++ / libgcc unwinder):
+# 'blame' throws with __cxa_throw, calls inside 'try' become 'invoke's
+# whose unwind edge goes to a landing pad, and the unwinder finds it
+# through the .eh_frame tables. Code that does not throw runs exactly
+# as before (no flags, no setjmp, no checks after calls).
+#
+# Thrown object: { i8* tag, i8* message, T value }
+#   tag      '__fin_tag.<type>' global, compared by address in 'catch (e as T)'
+#   message  what an uncaught blame prints (error_msg of a struct, or the string)
+#   value    the blamed value itself (structs are copied, so they outlive
+#            the frame that blamed them)
+
+I8_PTR = ir.IntType(8).as_pointer()
+# What a landing pad produces: { exception pointer, type selector }
+LANDING_PAD_TYPE = ir.LiteralStructType([I8_PTR, ir.IntType(32)])
+
+_EH_RUNTIME = {
+    # name: (return type, args, noreturn, nounwind)
+    "__cxa_allocate_exception": (I8_PTR, [ir.IntType(64)], False, True),
+    "__cxa_throw": (ir.VoidType(), [I8_PTR, I8_PTR, I8_PTR], True, False),
+    "__cxa_rethrow": (ir.VoidType(), [], True, False),
+    "__cxa_get_exception_ptr": (I8_PTR, [I8_PTR], False, True),
+    "__cxa_begin_catch": (I8_PTR, [I8_PTR], False, True),
+    "__cxa_end_catch": (ir.VoidType(), [], False, False),
+    "_ZSt13set_terminatePFvvE": (I8_PTR, [I8_PTR], False, True), # std::set_terminate
+}
+
+_runtime_loaded = False
+
+# ---------------------------------------------------------------------------
+# <Method name=load_exception_runtime args=[]>
+# <Description>
+# Makes the C++ ABI runtime (libstdc++) visible to the JIT. Needed before
+# finalizing a module that throws or catches (compiler.uses_exceptions).
+# </Description>
+def load_exception_runtime():
+    global _runtime_loaded
+    if not _runtime_loaded:
+        binding.load_library_permanently(find_library("stdc++") or "libstdc++.so.6")
+        _runtime_loaded = True
+
+# ---------------------------------------------------------------------------
+# <Method name=get_eh_function args=[<Compiler>, <str>]>
+# <Description>
+# Declares (once) one of the C++ ABI runtime functions in _EH_RUNTIME.
+# </Description>
+def get_eh_function(compiler: Compiler, name: str) -> ir.Function:
+    try:
+        return compiler.module.get_global(name)
+    except KeyError:
+        pass
+    ret, args, noreturn, nounwind = _EH_RUNTIME[name]
+    fn = ir.Function(compiler.module, ir.FunctionType(ret, args), name=name)
+    if noreturn:
+        fn.attributes.add("noreturn")
+    if nounwind:
+        fn.attributes.add("nounwind")
+    compiler.uses_exceptions = True
+    return fn
+
+def _personality(compiler: Compiler) -> ir.Function:
+    try:
+        return compiler.module.get_global("__gxx_personality_v0")
+    except KeyError:
+        return ir.Function(compiler.module, ir.FunctionType(ir.IntType(32), [], var_arg=True),
+                           name="__gxx_personality_v0")
+
+def _linkonce_constant(compiler: Compiler, name: str, initializer: ir.Constant) -> ir.GlobalVariable:
+    try:
+        return compiler.module.get_global(name)
+    except KeyError:
+        gv = ir.GlobalVariable(compiler.module, initializer.type, name=name)
+        gv.linkage = "linkonce_odr"
+        gv.global_constant = True
+        gv.initializer = initializer
+        return gv
+
+def _cstring(text: str) -> ir.Constant:
+    data = bytearray(text.encode("utf8")) + b"\00"
+    return ir.Constant(ir.ArrayType(ir.IntType(8), len(data)), data)
+
+# ---------------------------------------------------------------------------
+# <Method name=_fin_typeinfo args=[<Compiler>]>
+# <Description>
+# The C++ type_info every Fin exception is thrown with (as if it were
+# 'class fin::Error'). Landing pads only catch this type, so foreign C++
+# exceptions pass through Fin frames untouched.
+# </Description>
+def _fin_typeinfo(compiler: Compiler) -> ir.Value:
+    try:
+        vtable = compiler.module.get_global("_ZTVN10__cxxabiv117__class_type_infoE")
+    except KeyError:
+        vtable = ir.GlobalVariable(compiler.module, I8_PTR, name="_ZTVN10__cxxabiv117__class_type_infoE")
+    name = _linkonce_constant(compiler, "_ZTSN3fin5ErrorE", _cstring("N3fin5ErrorE"))
+    zero = ir.Constant(ir.IntType(32), 0)
+    typeinfo = _linkonce_constant(compiler, "_ZTIN3fin5ErrorE", ir.Constant.literal_struct([
+        vtable.gep([ir.Constant(ir.IntType(64), 2)]).bitcast(I8_PTR), # vtable + 2 slots
+        name.gep([zero, zero]),
+    ]))
+    return typeinfo.bitcast(I8_PTR)
+
+# ---------------------------------------------------------------------------
+# <Method name=type_tag args=[<Compiler>, <ir.Type>]>
+# <Description>
+# Address-comparable tag for a blamed/caught value type: the struct name
+# for structs (by value or pointer), 'string' for i8*, the LLVM type
+# otherwise.
+# </Description>
+def type_tag(compiler: Compiler, llvm_type: ir.Type) -> ir.Value:
+    if isinstance(llvm_type, ir.PointerType) and isinstance(llvm_type.pointee, ir.IdentifiedStructType):
+        llvm_type = llvm_type.pointee
+    if isinstance(llvm_type, ir.IdentifiedStructType):
+        name = llvm_type.name
+    elif llvm_type == I8_PTR:
+        name = "string"
+    else:
+        name = str(llvm_type)
+    zero = ir.Constant(ir.IntType(32), 0)
+    return _linkonce_constant(compiler, f"__fin_tag.{name}", _cstring(name)).gep([zero, zero])
+
+def _payload_type(value_type: ir.Type) -> ir.LiteralStructType:
+    return ir.LiteralStructType([I8_PTR, I8_PTR, value_type])
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_throw args=[<Compiler>, <ir.Value>, <ir.Value>]>
+# <Description>
+# Throws 'value' (tagged with its type) with 'message' for the uncaught
+# case. Terminates the current block.
+# </Description>
+def emit_throw(compiler: Compiler, value: ir.Value, message: ir.Value):
+    builder = compiler.builder
+    payload_type = _payload_type(value.type)
+    null_payload = ir.Constant(payload_type.as_pointer(), None)
+    size = builder.ptrtoint(builder.gep(null_payload, [ir.Constant(ir.IntType(32), 1)]), ir.IntType(64), name="exn_size")
+
+    raw = builder.call(get_eh_function(compiler, "__cxa_allocate_exception"), [size], name="exn")
+    payload = builder.bitcast(raw, payload_type.as_pointer())
+    zero = ir.Constant(ir.IntType(32), 0)
+    for index, field in enumerate((type_tag(compiler, value.type), message, value)):
+        builder.store(field, builder.gep(payload, [zero, ir.Constant(ir.IntType(32), index)], inbounds=True))
+
+    builder.store(message, _uncaught_message(compiler))
+    emit_call(compiler, get_eh_function(compiler, "__cxa_throw"), [raw, _fin_typeinfo(compiler), ir.Constant(I8_PTR, None)])
+    compiler.builder.unreachable()
+
+# ---------------------------------------------------------------------------
+# <Method name=_uncaught_message args=[<Compiler>]>
+# <Description>
+# Global holding the message of the last blame. The first time it is
+# needed, a terminate handler is installed (global constructor) that
+# panics with it, so an uncaught blame still reads like a panic instead
+# of 'terminate called after throwing...'.
+# </Description>
+def _uncaught_message(compiler: Compiler) -> ir.GlobalVariable:
+    try:
+        return compiler.module.get_global("__fin_uncaught_msg")
+    except KeyError:
+        pass
+    slot = ir.GlobalVariable(compiler.module, I8_PTR, name="__fin_uncaught_msg")
+    slot.linkage = "internal"
+    slot.initializer = ir.Constant(I8_PTR, None)
+
+    void_fn = ir.FunctionType(ir.VoidType(), [])
+    handler = ir.Function(compiler.module, void_fn, name="__fin_terminate")
+    handler.linkage = "internal"
+    builder = ir.IRBuilder(handler.append_basic_block("entry"))
+    message = builder.load(slot)
+    fallback = compiler.create_global_string("Uncaught exception")
+    message = builder.select(builder.icmp_unsigned("==", message, ir.Constant(I8_PTR, None)), fallback, message)
+    panic_fn = compiler.get_panic_function()
+    if panic_fn is not None:
+        builder.call(panic_fn, [message])
+    builder.unreachable()
+
+    init = ir.Function(compiler.module, void_fn, name="__fin_eh_init")
+    init.linkage = "internal"
+    builder = ir.IRBuilder(init.append_basic_block("entry"))
+    builder.call(get_eh_function(compiler, "_ZSt13set_terminatePFvvE"), [builder.bitcast(handler, I8_PTR)])
+    builder.ret_void()
+    compiler.register_global_ctor(init)
+    return slot
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_landing_pad args=[<Compiler>, <ir.AllocaInstr>]>
+# <Description>
+# At the current (fresh) block: a landing pad catching Fin exceptions,
+# storing { exception, selector } into 'exn_slot'. Gives the function
+# its personality routine (and uwtable).
+# </Description>
+def emit_landing_pad(compiler: Compiler, exn_slot: ir.AllocaInstr):
+    # (llvmlite only prints attributes, personality included, if the set is non-empty)
+    compiler.function.attributes.add("uwtable")
+    compiler.function.attributes.personality = _personality(compiler)
+    landing = compiler.builder.landingpad(LANDING_PAD_TYPE, name="lp")
+    landing.add_clause(ir.CatchClause(_fin_typeinfo(compiler)))
+    compiler.builder.store(landing, exn_slot)
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_cleanup_pad args=[<Compiler>]>
+# <Description>
+# At the current (fresh) block: a cleanup landing pad (runs for every
+# exception passing through, catches none). Returns its value, for the
+# 'resume' that ends the cleanup.
+# </Description>
+def emit_cleanup_pad(compiler: Compiler) -> ir.Value:
+    compiler.function.attributes.add("uwtable")
+    compiler.function.attributes.personality = _personality(compiler)
+    compiler.uses_exceptions = True
+    return compiler.builder.landingpad(LANDING_PAD_TYPE, name="lp_cleanup", cleanup=True)
+
+# ---------------------------------------------------------------------------
+# <Method name=load_caught_value args=[<Compiler>, <ir.Value>, <ir.Type>]>
+# <Description>
+# Pointer to the payload of in-flight exception 'exn', viewed as thrown
+# with a value of 'value_type'. Returns (tag, message pointer, value pointer).
+# Does not begin the catch (see finish_catch).
+# </Description>
+def load_caught_value(compiler: Compiler, exn: ir.Value, value_type: ir.Type) -> Tuple[ir.Value, ir.Value, ir.Value]:
+    builder = compiler.builder
+    raw = builder.call(get_eh_function(compiler, "__cxa_get_exception_ptr"), [exn])
+    payload = builder.bitcast(raw, _payload_type(value_type).as_pointer())
+    zero = ir.Constant(ir.IntType(32), 0)
+    fields = [builder.gep(payload, [zero, ir.Constant(ir.IntType(32), i)], inbounds=True) for i in range(3)]
+    return builder.load(fields[0], name="exn_tag"), fields[1], fields[2]
+
+# ---------------------------------------------------------------------------
+# <Method name=finish_catch args=[<Compiler>, <ir.Value>]>
+# <Description>
+# Marks 'exn' as caught and releases it (call after copying its value out).
+# </Description>
+def finish_catch(compiler: Compiler, exn: ir.Value):
+    compiler.builder.call(get_eh_function(compiler, "__cxa_begin_catch"), [exn])
+    compiler.builder.call(get_eh_function(compiler, "__cxa_end_catch"), [])
+    compiler.builder.store(ir.Constant(I8_PTR, None), _uncaught_message(compiler))
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_rethrow args=[<Compiler>, <ir.Value>]>
+# <Description>
+# Re-raises 'exn' to the callers (a 'catch (e as T)' whose T did not
+# match, with no enclosing 'try' in this function). The rethrow starts a
+# new search, as the unwinder already stopped at this frame's handler;
+# its cleanup pad ends the catch it opened before resuming.
+# </Description>
+def emit_rethrow(compiler: Compiler, exn: ir.Value):
+    builder = compiler.builder
+    builder.call(get_eh_function(compiler, "__cxa_begin_catch"), [exn])
+    dead = compiler.function.append_basic_block("rethrow_dead")
+    cleanup = compiler.function.append_basic_block("rethrow_cleanup")
+    builder.invoke(get_eh_function(compiler, "__cxa_rethrow"), [], dead, cleanup)
+
+    builder.position_at_end(dead)
+    builder.unreachable()
+
+    builder.position_at_end(cleanup)
+    landing = builder.landingpad(LANDING_PAD_TYPE, name="lp_rethrow", cleanup=True)
+    builder.call(get_eh_function(compiler, "__cxa_end_catch"), [])
+    builder.resume(landing)
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_call args=[<Compiler>, <ir.Value>, <List[ir.Value]>, <str>]>
+# <Description>
+# Calls 'callee' at the builder. Inside a 'try' body of the current
+# function, a callee that may unwind is invoked instead: the unwind edge
+# goes to the innermost try's landing pad and the builder continues in a
+# new 'invoke_cont' block. Extra keywords go to call/invoke (arg_attrs...).
+# </Description>
+def emit_call(compiler: Compiler, callee: ir.Value, args: List[ir.Value], name: str = "", **kwargs) -> ir.Value:
+    landing = _unwind_target(compiler)
+    if landing is None or not _may_unwind(callee):
+        return compiler.builder.call(callee, args, name=name, **kwargs)
+    cont = compiler.function.append_basic_block("invoke_cont")
+    result = compiler.builder.invoke(callee, args, cont, landing, name=name, **kwargs)
+    compiler.builder.position_at_end(cont)
+    return result
+
+def _unwind_target(compiler: Compiler) -> Optional[ir.Block]:
+    function = compiler.function
+    for entry in reversed(compiler.try_stack):
+        if entry[0] is function:
+            return entry[3]
+    return None
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_invokes args=[<Compiler>, <ir.Block>, <int>, <List[ir.Block]>, <ir.Block>]>
+# <Description>
+# Turns every call that may unwind in already emitted code into an
+# 'invoke' unwinding to 'landing' (a finished #[arena] function, whose
+# cleanup covers the whole body). The code is 'start_block' from
+# instruction 'start_index' on plus 'blocks'; it must be fully emitted
+# (terminated). The block of each call is split after it, the call
+# becomes the block's terminator and the rest moves to a new
+# 'invoke_cont' block. Intrinsics, inline asm and 'nounwind' callees
+# (panics, EH runtime) stay calls. Calls in 'try' bodies are already
+# invokes (see emit_call).
+# </Description>
+def emit_invokes(compiler: Compiler, start_block: ir.Block, start_index: int, blocks: List[ir.Block], landing: ir.Block) -> int:
+    function = compiler.function
+    count = 0
+    work = [(start_block, start_index)] + [(block, 0) for block in blocks]
+    while work:
+        block, index = work.pop()
+        for i in range(index, len(block.instructions)):
+            inst = block.instructions[i]
+            if type(inst) is ir.CallInstr and _may_unwind(inst.callee):
+                work.append((_split_at_call(function, block, i, landing), 0))
+                count += 1
+                break
+    return count
+
+def _may_unwind(callee: ir.Value) -> bool:
+    if isinstance(callee, ir.InlineAsm):
+        return False
+    if isinstance(callee, ir.Function):
+        return not (callee.name.startswith("llvm.") or "nounwind" in callee.attributes)
+    return True # Indirect call
+
+def _split_at_call(function: ir.Function, block: ir.Block, index: int, landing: ir.Block) -> ir.Block:
+    call = block.instructions[index]
+    cont = function.insert_basic_block(function.blocks.index(block) + 1, name="invoke_cont")
+    tail = block.instructions[index + 1:]
+    del block.instructions[index + 1:]
+    for inst in tail:
+        inst.parent = cont
+    cont.instructions.extend(tail)
+    cont.terminator = block.terminator
+
+    # Successor phis now come from 'cont'
+    for other in function.blocks:
+        for inst in other.instructions:
+            if isinstance(inst, ir.PhiInstr):
+                inst.incomings = [(value, cont if pred is block else pred) for value, pred in inst.incomings]
+
+    # The call keeps its identity (its users stay valid) and becomes the invoke
+    call.__class__ = ir.InvokeInstr
+    call.opname = "invoke"
+    call.tail = ""
+    call.normal_to = cont
+    call.unwind_to = landing
+    call._clear_string_cache()
+    block.terminator = call
+    return cont
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_exceptions args=[<Compiler>]>
+# <Description>
+# Initializes the exception handling state on the compiler.
+# </Description>
+def setup_exceptions(compiler: Compiler):
+    compiler.uses_exceptions = False # Needs the C++ ABI runtime at JIT time
+    compiler.try_stack = [] # (ir.Function, dispatch block, exn slot, landing block) of enclosing 'try' bodies
@@ -43,82 +43,121 @@
 # “Code fades. Love leaves a signature.”
 # =============================================================================
 from .essentials import *
+from .exceptions import LANDING_PAD_TYPE
 
 # ---------------------------------------------------------------------------
 # <Method name=compile_try_catch args=[<Compiler>, <TryCatchNode>]>
 # <Description>
-# Compiles 'try { ... } catch(e) { ... }'.
-# NOTE: Without LLVM 'invoke' and landingpads, this does NOT actually catch runtime exceptions.
-# It compiles the 'try' block normally.
-# It compiles the 'catch' block in a detached block to ensure semantic validity.
+# Compiles 'try { ... } catch(e [as T]) { ... }' with table-based
+# unwinding (see prod/exceptions.py):
+# 1. The try body is compiled with this try on compiler.try_stack, so
+#    every call in it that may unwind is emitted as an 'invoke' whose
+#    unwind edge is this try's landing pad (see emit_call). The
+#    non-throwing path has no extra work.
+# 2. Landing pad -> dispatch: with 'as T', the thrown value's type tag
+#    is compared with T's; a mismatch goes to the enclosing try of this
+#    function, or is rethrown to the callers.
+# 3. Catch: copies the value out of the exception (the message string if
+#    no type is given), releases it and runs the catch body.
 # </Description>
 def compile_try_catch(compiler: Compiler, ast: TryCatchNode):
-    # 1. Compile Try Block
+    function = compiler.function
+    exn_slot = compiler.create_entry_alloca(LANDING_PAD_TYPE, name="exn_slot")
+
+    # 1. Try Body (nested try bodies dispatch mismatches to ours)
+    landing_bb = function.append_basic_block("try_landing")
+    dispatch_bb = function.append_basic_block("try_dispatch")
+    compiler.try_stack.append((function, dispatch_bb, exn_slot, landing_bb))
     compiler.compile(ast.try_body)
-    
-    # If try block terminates (returns), we stop here.
-    if compiler.builder.block.is_terminated:
-        return
+    compiler.try_stack.pop()
 
-    # 2. Compile Catch Block (Placeholder)
-    if ast.catch_body:
-        # Create a block for catch, but DO NOT branch to it.
-        # This prevents it from running, but allows us to compile it for type checking.
-        # In a real implementation, 'invoke' would jump here on exception.
-        catch_bb = compiler.function.append_basic_block("catch_block")
-        
-        # Save current block to resume after (if try didn't terminate)
-        resume_bb = compiler.function.append_basic_block("try_continue")
+    resume_bb = function.append_basic_block("try_continue")
+    if not compiler.builder.block.is_terminated:
         compiler.builder.branch(resume_bb)
-        
-        # Switch to Catch Block to compile it
-        compiler.builder.position_at_end(catch_bb)
-        compiler.enter_scope()
-        
-        if ast.catch_var:
-            # Determine Error Type
-            err_type = ir.IntType(8).as_pointer() # Default: i8*
-            err_fin_type = None
-            
-            if hasattr(ast, 'catch_type') and ast.catch_type:
-                err_type = compiler.convert_type(ast.catch_type)
-                err_fin_type = compiler.ast_to_fin_type(ast.catch_type)
-            
-            # Create 'err' variable
-            # Initialize with null since we don't have a real exception object
-            init_val = ir.Constant(err_type, None)
-            compiler.create_variable_mut(ast.catch_var, err_type, init_val)
-        
-        compiler.compile(ast.catch_body)
-        
-        # If catch doesn't return, branch to resume
-        if not compiler.builder.block.is_terminated:
-            compiler.builder.branch(resume_bb)
-            
-        compiler.exit_scope()
-        
-        # Resume normal flow
-        compiler.builder.position_at_end(resume_bb)
+
+    compiler.builder.position_at_end(landing_bb)
+    compiler.emit_landing_pad(exn_slot)
+    compiler.builder.branch(dispatch_bb)
+
+    # 2. Dispatch on the thrown type
+    compiler.builder.position_at_end(dispatch_bb)
+    landing = compiler.builder.load(exn_slot, name="exn_info")
+    exn = compiler.builder.extract_value(landing, 0, name="exn")
+
+    value_type = ir.IntType(8).as_pointer() # Untyped catch binds the message
+    if ast.catch_type:
+        value_type = compiler.convert_type(ast.catch_type)
+        if isinstance(value_type, ir.PointerType) and isinstance(value_type.pointee, ir.IdentifiedStructType):
+            value_type = value_type.pointee # Structs are thrown by value
+    tag, msg_ptr, value_ptr = compiler.load_caught_value(exn, value_type)
+
+    catch_bb = function.append_basic_block("catch_block")
+    if ast.catch_type:
+        mismatch_bb = function.append_basic_block("catch_mismatch")
+        matches = compiler.builder.icmp_unsigned("==", tag, compiler.type_tag(value_type), name="exn_matches")
+        compiler.builder.cbranch(matches, catch_bb, mismatch_bb)
+
+        compiler.builder.position_at_end(mismatch_bb)
+        outer = next((entry for entry in reversed(compiler.try_stack) if entry[0] is function), None)
+        if outer is not None:
+            compiler.builder.store(landing, outer[2])
+            compiler.builder.branch(outer[1])
+        else:
+            compiler.emit_rethrow(exn)
+    else:
+        compiler.builder.branch(catch_bb)
+
+    # 3. Catch Body
+    compiler.builder.position_at_end(catch_bb)
+    compiler.enter_scope()
+
+    caught = compiler.builder.load(msg_ptr if not ast.catch_type else value_ptr, name="caught")
+    compiler.finish_catch(exn)
+
+    if ast.catch_var:
+        if ast.catch_type is None:
+            compiler.create_variable_mut(ast.catch_var, caught.type, caught)
+        elif isinstance(compiler.convert_type(ast.catch_type), ir.PointerType) and caught.type == value_type \
+                and isinstance(value_type, ir.IdentifiedStructType):
+            # 'as &T' style catch: bind a pointer to a local copy
+            copy = compiler.create_entry_alloca(value_type, name="caught_copy")
+            compiler.builder.store(caught, copy)
+            compiler.create_variable_mut(ast.catch_var, ast.catch_type, copy)
+        else:
+            compiler.create_variable_mut(ast.catch_var, ast.catch_type, caught)
+
+    compiler.compile(ast.catch_body)
+
+    if not compiler.builder.block.is_terminated:
+        compiler.builder.branch(resume_bb)
+
+    compiler.exit_scope()
+
+    # Resume normal flow
+    compiler.builder.position_at_end(resume_bb)
 
 # ---------------------------------------------------------------------------
 # <Method name=compile_blame args=[<Compiler>, <BlameNode>]>
 # <Description>
 # Compiles 'blame expr'.
 # 1. Compiles expression.
-# 2. If Struct, extracts 'error_msg' field.
-# 3. Calls '__panic' (from builtins).
-# 4. Emits 'unreachable'.
+# 2. Works out the message an uncaught blame prints: the string itself,
+#    or the 'error_msg' field of a struct.
+# 3. Throws the value (structs by value) with that message; the nearest
+#    'try' catching its type handles it (see compile_try_catch).
 # </Description>
 def compile_blame(compiler: Compiler, ast: BlameNode):
     # 1. Compile Expression
     err_val = compiler.compile(ast.expression)
     msg_ptr = err_val
+    thrown = err_val
 
     # 2. Handle Structs (Extract error_msg)
     if isinstance(err_val.type, ir.PointerType) and \
        isinstance(err_val.type.pointee, ir.IdentifiedStructType):
         
         struct_name = err_val.type.pointee.name
+        thrown = compiler.builder.load(err_val, name="blamed") # Copied into the exception
         
         # Find 'error_msg' index
         indices = compiler.struct_field_indices.get(struct_name)
@@ -150,19 +189,8 @@ def compile_blame(compiler: Compiler, ast: BlameNode):
         else:
             msg_ptr = compiler.create_global_string("Unknown Error Value")
 
-    # 4. Call Panic
-    try:
-        panic_fn = compiler.module.get_global("__panic")
-    except KeyError:
-        # Fallback if builtins not loaded
-        if hasattr(compiler, 'panic_func'):
-            panic_fn = compiler.panic_func
-        else:
-            compiler.errors.error(ast, "Runtime Error: '__panic' function not found. Ensure builtins are loaded.")
-            return
-
-    compiler.builder.call(panic_fn, [msg_ptr])
-    compiler.builder.unreachable()
+    # 4. Throw
+    compiler.emit_throw(thrown, msg_ptr)
 
 # ---------------------------------------------------------------------------
 # <Method name=compile_foreach args=[<Compiler>, <ForeachLoop>]>
@@ -170,15 +198,23 @@ def compile_blame(compiler: Compiler, ast: BlameNode):
 # Compiles 'foreach var <Type> in collection { ... }'.
 # Currently supports Arrays and Collections.
 # Logic:
-# 1. Compiles the collection expression.
-# 2. Creates a hidden index variable (i = 0).
+# 1. Compiles the collection expression (a named fixed array is iterated in place).
+# 2. Keeps the hidden index (i = 0) in SSA form, a phi in the Cond block.
 # 3. Generates loop blocks (Cond, Body, Inc, End).
 # 4. In Body: Loads element at [i] and assigns to 'var'.
 # 5. Compiles user body.
 # </Description>
 def compile_foreach(compiler: Compiler, ast: ForeachLoop):
     # 1. Compile Collection
-    coll_val = compiler.compile(ast.collection)
+    # A named fixed array is iterated through its own storage; loading it
+    # first would copy the whole array.
+    coll_val = None
+    if isinstance(ast.iterable, str):
+        storage = compiler.current_scope.resolve(ast.iterable)
+        if isinstance(getattr(storage, "type", None), ir.PointerType) and isinstance(storage.type.pointee, ir.ArrayType):
+            coll_val = storage
+    if coll_val is None:
+        coll_val = compiler.compile(ast.iterable)
     
     # Determine Length
     # We reuse the logic from compile_member_access/arrays to get length
@@ -191,8 +227,8 @@ def compile_foreach(compiler: Compiler, ast: ForeachLoop):
     check_type = coll_val.type
     if isinstance(check_type, ir.PointerType): check_type = check_type.pointee
     
-    # Case A: Collection {T*, len}
-    if isinstance(check_type, ir.LiteralStructType) and len(check_type.elements) == 2:
+    # Case A: Collection {T*, len, cap}
+    if compiler.is_collection_type(check_type):
         is_collection = True
         zero = ir.Constant(ir.IntType(32), 0)
         one = ir.Constant(ir.IntType(32), 1)
@@ -205,41 +241,35 @@ def compile_foreach(compiler: Compiler, ast: ForeachLoop):
 
     # Case B: Static Array [N x T]
     elif isinstance(check_type, ir.ArrayType):
-        length_val = ir.Constant(ir.IntType(32), check_type.count)
+        length_val = ir.Constant(ir.IntType(64), check_type.count)
+        # GEP needs a pointer: spill a temporary array once, before the loop
+        if not isinstance(coll_val.type, ir.PointerType):
+            temp = compiler.create_entry_alloca(coll_val.type, name="foreach_spill")
+            compiler.store_array_value(coll_val, temp)
+            coll_val = temp
         
     else:
-        compiler.errors.error(ast.collection, f"Foreach expects an Array or Collection, got {check_type}")
+        compiler.errors.error(ast.iterable, f"Foreach expects an Array or Collection, got {check_type}")
         return
 
     # 2. Enter Scope
     compiler.enter_scope()
 
-    # 3. Create Hidden Index Variable
-    idx_name = f".foreach_idx_{compiler.block_count}"
-    compiler.block_count += 1
-    
-    # i = 0
-    init_val = ir.Constant(ir.IntType(32), 0)
-    idx_ptr = compiler.create_variable_mut(idx_name, "int", init_val)
-
-    # 4. Create Blocks
+    # 3. Create Blocks
     cond_block = compiler.function.append_basic_block("foreach_cond")
     body_block = compiler.function.append_basic_block("foreach_body")
     inc_block = compiler.function.append_basic_block("foreach_inc")
     end_block = compiler.function.append_basic_block("foreach_end")
 
-    compiler.builder.branch(cond_block)
+    # 4. Hidden Index: 64-bit SSA block parameter of the condition block (i = 0)
+    [curr_idx] = compiler.create_block_params(cond_block, [ir.IntType(64)], ["idx_val"])
+    compiler.branch_with_args(cond_block, [ir.Constant(ir.IntType(64), 0)])
 
     # 5. Condition: i < length
     compiler.builder.position_at_end(cond_block)
-    curr_idx = compiler.builder.load(idx_ptr, name="idx_val")
-    
-    # Ensure length is i32
-    if length_val.type != ir.IntType(32):
-        length_val = compiler.builder.intcast(length_val, ir.IntType(32))
         
     cond = compiler.builder.icmp_unsigned("<", curr_idx, length_val, name="loop_cond")
-    compiler.builder.cbranch(cond, body_block, end_block)
+    compiler.emit_profiled_cbranch("foreach", cond, body_block, end_block)
 
     # 6. Body
     compiler.builder.position_at_end(body_block)
@@ -275,13 +305,6 @@ def compile_foreach(compiler: Compiler, ast: ForeachLoop):
     elif isinstance(check_type, ir.ArrayType):
         # Static Array
         zero = ir.Constant(ir.IntType(32), 0)
-        # coll_val must be a pointer for GEP
-        if not isinstance(coll_val.type, ir.PointerType):
-            # Spill to stack if it's a value
-            temp = compiler.builder.alloca(coll_val.type)
-            compiler.builder.store(coll_val, temp)
-            coll_val = temp
-            
         elem_ptr = compiler.builder.gep(coll_val, [zero, curr_idx])
         elem_val = compiler.builder.load(elem_ptr, name="elem_val")
 
@@ -305,12 +328,9 @@ def compile_foreach(compiler: Compiler, ast: ForeachLoop):
 
     # 7. Increment: i++
     compiler.builder.position_at_end(inc_block)
-    curr_idx_2 = compiler.builder.load(idx_ptr)
-    one = ir.Constant(ir.IntType(32), 1)
-    next_idx = compiler.builder.add(curr_idx_2, one, name="idx_inc")
-    compiler.builder.store(next_idx, idx_ptr)
-    
-    compiler.builder.branch(cond_block)
+    one = ir.Constant(ir.IntType(64), 1)
+    next_idx = compiler.builder.add(curr_idx, one, name="idx_inc")
+    compiler.branch_with_args(cond_block, [next_idx])
 
     # 8. End
     compiler.builder.position_at_end(end_block)
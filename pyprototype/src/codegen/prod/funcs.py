@@ -43,6 +43,7 @@
 # “Code fades. Love leaves a signature.”
 # =============================================================================
 from .essentials import *
+from .targets import compile_multiversion_function
 
 # ---------------------------------------------------------------------------
 # <Method name=compile_function_declaration args=[<Compiler>, <FunctionDeclaration>]>
@@ -54,6 +55,7 @@ from .essentials import *
 # 3. Attributes: Applies #[llvm_name], #[linkage], etc.
 # 4. Interfaces: Converts Interface parameters to Fat Pointers.
 # 5. Argument Binding: Allocates stack space for arguments.
+# 6. #[multiversion]: Per-ISA variants with load-time dispatch.
 # </Description>
 def compile_function_declaration(compiler: Compiler, ast: FunctionDeclaration, prototype_only: bool = False) -> Optional[ir.Function]:
     func_name = ast.name
@@ -103,7 +105,8 @@ def compile_function_declaration(compiler: Compiler, ast: FunctionDeclaration, p
         llvm_param_types.append(compiler.convert_type(p_ast.var_type))
 
     # 5. Create or Retrieve LLVM Function
-    llvm_func_type = ir.FunctionType(
+    # Big structs travel by reference (byval params, sret result; see abi.py)
+    llvm_func_type = compiler.lower_function_type(
         llvm_ret_type,
         llvm_param_types,
         var_arg=ast.is_vararg
@@ -113,6 +116,7 @@ def compile_function_declaration(compiler: Compiler, ast: FunctionDeclaration, p
         llvm_function = compiler.module.get_global(llvm_name)
     except KeyError:
         llvm_function = ir.Function(compiler.module, llvm_func_type, name=llvm_name)
+        compiler.apply_abi_attributes(llvm_function, llvm_ret_type, llvm_param_types)
     print(llvm_function)
     compiler.attributes_lib.apply(llvm_function, ast)
     print(llvm_function)
@@ -137,37 +141,13 @@ def compile_function_declaration(compiler: Compiler, ast: FunctionDeclaration, p
 
     # 7. Compile Body
     if ast.body:
-        prev_function = compiler.function
-        prev_builder = compiler.builder
-        
-        compiler.function = llvm_function
-        entry_block = llvm_function.append_basic_block(name="entry")
-        compiler.builder = ir.IRBuilder(entry_block)
-
-        for i, param_ast in enumerate(ast.params):
-            llvm_arg = llvm_function.args[i]
-            llvm_arg.name = param_ast.identifier
-            
-            compiler.create_variable_mut(
-                param_ast.identifier, 
-                param_ast.var_type, 
-                initial_value_llvm=llvm_arg
+        if ast.get_attr("multiversion"):
+            compile_multiversion_function(
+                compiler, ast, llvm_function,
+                lambda fn: _compile_function_body(compiler, ast, fn, llvm_ret_type)
             )
-
-        for stmt_node in ast.body:
-            compiler.compile(stmt_node)
-
-        if not compiler.builder.block.is_terminated:
-            if isinstance(llvm_ret_type, ir.VoidType):
-                compiler.builder.ret_void()
-            elif func_name == "main" and isinstance(llvm_ret_type, ir.IntType):
-                 compiler.builder.ret(ir.Constant(llvm_ret_type, 0))
-            else:
-                compiler.errors.error(ast, f"Function '{func_name}' is missing a return statement.")
-                compiler.builder.unreachable()
-
-        compiler.function = prev_function
-        compiler.builder = prev_builder
+        else:
+            _compile_function_body(compiler, ast, llvm_function, llvm_ret_type)
         
         if func_name == "main":
             compiler.main_function = llvm_function
@@ -175,6 +155,68 @@ def compile_function_declaration(compiler: Compiler, ast: FunctionDeclaration, p
     compiler.exit_scope()
     return llvm_function
 # ---------------------------------------------------------------------------
+# <Method name=_compile_function_body args=[<Compiler>, <FunctionDeclaration>, <ir.Function>, <ir.Type>]>
+# <Description>
+# Emits the body of 'ast' into 'llvm_function' (entry block, parameter
+# binding, statements, implicit return). Parameters are defined in the
+# current scope, so callers compiling the same body several times
+# (e.g. #[multiversion]) must enter a fresh scope for each copy.
+# </Description>
+def _compile_function_body(compiler: Compiler, ast: FunctionDeclaration, llvm_function: ir.Function, llvm_ret_type: ir.Type):
+    func_name = ast.name
+    prev_function = compiler.function
+    prev_builder = compiler.builder
+    prev_unchecked = compiler.bounds_unchecked
+    prev_escapes = (compiler.non_escaping_news, compiler.stack_objects)
+    prev_arena = compiler.current_arena
+    
+    compiler.function = llvm_function
+    compiler.non_escaping_news = compiler.analyze_escapes(ast.body or []) # 'new' objects that may live on the stack
+    compiler.stack_objects = set()
+    compiler.bounds_unchecked = bool(ast.get_attr("unchecked")) # #[unchecked]: no residual bounds checks
+    entry_block = llvm_function.append_basic_block(name="entry")
+    compiler.builder = ir.IRBuilder(entry_block)
+    compiler.emit_profiled_entry(llvm_function)
+    compiler.emit_instrument_prologue(llvm_function)
+    compiler.emit_arena_prologue(ast) # #[arena]: the body is an allocation region
+
+    fin_args = compiler.source_arguments(llvm_function) # Without the sret slot
+    for i, param_ast in enumerate(ast.params):
+        llvm_arg = fin_args[i]
+        llvm_arg.name = param_ast.identifier
+        
+        compiler.create_variable_mut(
+            param_ast.identifier, 
+            param_ast.var_type, 
+            initial_value_llvm=llvm_arg
+        )
+
+    for stmt_node in ast.body:
+        compiler.compile(stmt_node)
+
+    if not compiler.builder.block.is_terminated:
+        if isinstance(llvm_ret_type, ir.VoidType):
+            compiler.builder.ret_void()
+        elif func_name == "main" and isinstance(llvm_ret_type, ir.IntType):
+             compiler.builder.ret(ir.Constant(llvm_ret_type, 0))
+        else:
+            compiler.errors.error(ast, f"Function '{func_name}' is missing a return statement.")
+            compiler.builder.unreachable()
+
+    compiler.emit_arena_epilogue(llvm_function)
+    compiler.emit_instrument_epilogue(llvm_function)
+
+    # The function's own slots end with it: no lifetime.end when its scope
+    # is exited, as the builder is the caller's by then (generic instances)
+    compiler.current_scope.lifetime_slots.clear()
+
+    compiler.function = prev_function
+    compiler.builder = prev_builder
+    compiler.bounds_unchecked = prev_unchecked
+    compiler.non_escaping_news, compiler.stack_objects = prev_escapes
+    compiler.current_arena = prev_arena
+
+# ---------------------------------------------------------------------------
 # ---------------------------------------------------------------------------
 # <Method name=compile_return args=[<Compiler>, <ReturnStatement>]>
 # <Description>
@@ -184,23 +226,26 @@ def compile_function_declaration(compiler: Compiler, ast: FunctionDeclaration, p
 # 2. Void returns.
 # 3. Struct Pointer -> Value conversion (if function returns Value).
 # 4. Type Coercion (Int->Float, etc.).
+# 5. Big struct results: copied into the caller's sret slot.
 # </Description>
 def compile_return(compiler: Compiler, ast: ReturnStatement):
     # 1. Dead Code Guard
     if compiler.builder.block.is_terminated:
         return
 
+    ret_slot = compiler.return_slot(compiler.function) # sret: result goes to the caller
+
     # 2. Void Return
     if ast.value is None:
         # Check if function expects void
-        if not isinstance(compiler.function.function_type.return_type, ir.VoidType):
+        if ret_slot is not None or not isinstance(compiler.function.function_type.return_type, ir.VoidType):
             compiler.errors.error(ast, "Function expects a return value, but got 'return;'.")
         compiler.builder.ret_void()
         return
 
     # 3. Compile Return Value
     ret_val = compiler.compile(ast.value)
-    func_ret_type = compiler.function.function_type.return_type
+    func_ret_type = ret_slot.type.pointee if ret_slot is not None else compiler.function.function_type.return_type
 
     # 4. Handle Struct Pointer -> Struct Value
     # If the function returns a Struct Value (e.g. %MyStruct), but we have a Pointer (%MyStruct*),
@@ -221,6 +266,10 @@ def compile_return(compiler: Compiler, ast: ReturnStatement):
         if ret_val.type != func_ret_type:
              compiler.errors.error(ast, f"Return type mismatch. Expected {func_ret_type}, got {ret_val.type}")
 
+    if ret_slot is not None:
+        compiler.store_value(ret_val, ret_slot) # memcpy when ret_val was just loaded
+        compiler.builder.ret_void()
+        return
     compiler.builder.ret(ret_val)
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,234 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+import ctypes
+
+# Per-function record: { calls, inclusive cycles, self cycles }
+_RECORD_TYPE = ir.LiteralStructType([ir.IntType(64), ir.IntType(64), ir.IntType(64)])
+
+# ---------------------------------------------------------------------------
+# <Method name=_get_profiler_globals args=[<Compiler>]>
+# <Description>
+# Creates (once) the shared runtime state of the profiler:
+# - __fin_prof_caller : id of the currently running function (-1 = root)
+# - __fin_prof_child  : cycles spent in callees of the current activation
+# - __fin_prof_nfuncs : number of instrumented functions (set by the JIT)
+# - __fin_prof_edges  : (nfuncs + 1) x nfuncs caller/callee call counts,
+#                       allocated by the JIT driver before 'main' runs.
+# </Description>
+def _get_profiler_globals(compiler: Compiler) -> Dict[str, ir.GlobalVariable]:
+    if compiler.instrument_globals:
+        return compiler.instrument_globals
+
+    i64 = ir.IntType(64)
+    def make(name, ty, init):
+        gv = ir.GlobalVariable(compiler.module, ty, name=name)
+        gv.initializer = ir.Constant(ty, init)
+        return gv
+
+    compiler.instrument_globals = {
+        "caller": make("__fin_prof_caller", i64, -1),
+        "child": make("__fin_prof_child", i64, 0),
+        "nfuncs": make("__fin_prof_nfuncs", i64, 0),
+        "edges": make("__fin_prof_edges", i64.as_pointer(), None),
+    }
+    return compiler.instrument_globals
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_instrument_prologue args=[<Compiler>, <ir.Function>]>
+# <Description>
+# Emitted at the top of the entry block when --instrument is on.
+# Counts the call, the caller -> callee edge, and starts the cycle timer
+# (llvm.readcyclecounter). The saved values stay in SSA registers; the
+# entry block dominates every 'ret', where the epilogue uses them.
+# </Description>
+def emit_instrument_prologue(compiler: Compiler, llvm_function: ir.Function):
+    if not compiler.instrument:
+        return
+
+    i64 = ir.IntType(64)
+    g = _get_profiler_globals(compiler)
+    builder = compiler.builder
+
+    func_id = len(compiler.instrumented_functions)
+    record = ir.GlobalVariable(compiler.module, _RECORD_TYPE, name=f"__fin_prof.{llvm_function.name}")
+    record.initializer = ir.Constant(_RECORD_TYPE, None)
+
+    # calls += 1
+    zero = ir.Constant(ir.IntType(32), 0)
+    calls_ptr = builder.gep(record, [zero, zero], inbounds=True)
+    builder.store(builder.add(builder.load(calls_ptr), ir.Constant(i64, 1)), calls_ptr)
+
+    # edges[(caller + 1) * nfuncs + id] += 1
+    caller = builder.load(g["caller"], name="prof_caller")
+    builder.store(ir.Constant(i64, func_id), g["caller"])
+    row = builder.mul(builder.add(caller, ir.Constant(i64, 1)), builder.load(g["nfuncs"]))
+    edge_ptr = builder.gep(builder.load(g["edges"]), [builder.add(row, ir.Constant(i64, func_id))])
+    builder.store(builder.add(builder.load(edge_ptr), ir.Constant(i64, 1)), edge_ptr)
+
+    # Child time accumulator for this activation
+    saved_child = builder.load(g["child"], name="prof_saved_child")
+    builder.store(ir.Constant(i64, 0), g["child"])
+
+    read_cycles = compiler.module.declare_intrinsic("llvm.readcyclecounter", fnty=ir.FunctionType(i64, []))
+    start = builder.call(read_cycles, [], name="prof_start")
+
+    compiler.instrumented_functions[llvm_function.name] = {
+        "id": func_id, "record": record, "caller": caller, "saved_child": saved_child, "start": start,
+    }
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_instrument_epilogue args=[<Compiler>, <ir.Function>]>
+# <Description>
+# Run once the body is complete: inserts the timer stop before every 'ret'.
+# inclusive += elapsed, self += elapsed - callee time; the elapsed time is
+# then credited to the parent's callee accumulator.
+# Paths ending in 'unreachable' (panics) are not timed.
+# </Description>
+def emit_instrument_epilogue(compiler: Compiler, llvm_function: ir.Function):
+    state = compiler.instrumented_functions.get(llvm_function.name) if compiler.instrument else None
+    if state is None:
+        return
+
+    i64 = ir.IntType(64)
+    zero = ir.Constant(ir.IntType(32), 0)
+    g = _get_profiler_globals(compiler)
+    read_cycles = compiler.module.declare_intrinsic("llvm.readcyclecounter", fnty=ir.FunctionType(i64, []))
+
+    for block in llvm_function.blocks:
+        if not isinstance(block.terminator, ir.Ret):
+            continue
+        builder = ir.IRBuilder(block)
+        builder.position_before(block.terminator)
+
+        elapsed = builder.sub(builder.call(read_cycles, []), state["start"], name="prof_elapsed")
+        children = builder.load(g["child"])
+
+        incl_ptr = builder.gep(state["record"], [zero, ir.Constant(ir.IntType(32), 1)], inbounds=True)
+        builder.store(builder.add(builder.load(incl_ptr), elapsed), incl_ptr)
+        self_ptr = builder.gep(state["record"], [zero, ir.Constant(ir.IntType(32), 2)], inbounds=True)
+        builder.store(builder.add(builder.load(self_ptr), builder.sub(elapsed, children)), self_ptr)
+
+        builder.store(builder.add(state["saved_child"], elapsed), g["child"])
+        builder.store(state["caller"], g["caller"])
+
+# ---------------------------------------------------------------------------
+# <Method name=attach_instrumentation args=[<Compiler>, <ExecutionEngine>]>
+# <Description>
+# Called by runwithjit before 'main': sizes and allocates the edge table.
+# </Description>
+def attach_instrumentation(compiler: Compiler, engine):
+    if not compiler.instrument or not compiler.instrumented_functions:
+        return
+    n = len(compiler.instrumented_functions)
+    compiler.instrument_edges = (ctypes.c_int64 * ((n + 1) * n))()
+    ctypes.c_int64.from_address(engine.get_global_value_address("__fin_prof_nfuncs")).value = n
+    ctypes.c_void_p.from_address(engine.get_global_value_address("__fin_prof_edges")).value = \
+        ctypes.addressof(compiler.instrument_edges)
+
+# ---------------------------------------------------------------------------
+# <Method name=collect_instrumentation args=[<Compiler>, <ExecutionEngine>]>
+# <Description>
+# Called by runwithjit after 'main' returns. Reads every record back into
+# 'compiler.runtime_profile':
+#   { name: { calls, inclusive, self, callers: { caller_name: count } } }
+# Names are demangled (see demangle_name); the root caller is '<root>'.
+# </Description>
+def collect_instrumentation(compiler: Compiler, engine):
+    if not compiler.instrument or not compiler.instrumented_functions:
+        return
+
+    n = len(compiler.instrumented_functions)
+    names = {state["id"]: compiler.demangle_name(name) for name, state in compiler.instrumented_functions.items()}
+    profile = {}
+    for name, state in compiler.instrumented_functions.items():
+        calls, inclusive, self_cycles = (ctypes.c_int64 * 3).from_address(
+            engine.get_global_value_address(state["record"].name)
+        )
+        callers = {}
+        for caller_id in range(-1, n):
+            count = compiler.instrument_edges[(caller_id + 1) * n + state["id"]]
+            if count:
+                callers[names.get(caller_id, "<root>")] = count
+        profile[names[state["id"]]] = {"calls": calls, "inclusive": inclusive, "self": self_cycles, "callers": callers}
+    compiler.runtime_profile = profile
+
+# ---------------------------------------------------------------------------
+# <Method name=format_runtime_profile args=[<Dict>]>
+# <Description>
+# Renders the flat profile (sorted by self time) and the call graph.
+# Inclusive time of recursive functions counts every activation.
+# </Description>
+def format_runtime_profile(profile: Dict[str, Dict[str, Any]]) -> str:
+    lines = []
+    called = [(name, row) for name, row in profile.items() if row["calls"]]
+    total_self = sum(row["self"] for _, row in called) or 1
+
+    lines.append("Flat profile (cycles):")
+    lines.append(f"{'%self':>7} {'self':>14} {'inclusive':>14} {'calls':>10} {'self/call':>12}  name")
+    for name, row in sorted(called, key=lambda item: item[1]["self"], reverse=True):
+        pct = 100.0 * row["self"] / total_self
+        per_call = row["self"] // row["calls"]
+        lines.append(f"{pct:7.2f} {row['self']:14d} {row['inclusive']:14d} {row['calls']:10d} {per_call:12d}  {name}")
+
+    lines.append("")
+    lines.append("Call graph (callee <- callers):")
+    for name, row in sorted(called, key=lambda item: item[1]["inclusive"], reverse=True):
+        lines.append(f"  {name}  [calls={row['calls']}, inclusive={row['inclusive']}]")
+        for caller, count in sorted(row["callers"].items(), key=lambda item: item[1], reverse=True):
+            lines.append(f"      <- {caller} ({count})")
+    return "\n".join(lines)
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_instrumentation args=[<Compiler>, <bool>]>
+# <Description>
+# Initializes the runtime profiler state on the compiler.
+# </Description>
+def setup_instrumentation(compiler: Compiler, instrument: bool):
+    compiler.instrument = instrument
+    compiler.instrument_globals = {}
+    compiler.instrumented_functions = {}
+    compiler.instrument_edges = None
+    compiler.runtime_profile = None
@@ -43,6 +43,7 @@
 # “Code fades. Love leaves a signature.”
 # =============================================================================
 from .essentials import *
+from .ssa import is_ssa_safe, is_ssa_scalar
 from copy import deepcopy
 
 # ---------------------------------------------------------------------------
@@ -102,6 +103,7 @@ def compile_macro_call(compiler: Compiler, ast: MacroCall) -> Optional[ir.Value]
         return None
 
     params, body_stmts = target_def
+    stats_mark = compiler.stats_mark()
     
     # 2. Hygiene: Enter Scope
     compiler.enter_scope()
@@ -141,10 +143,13 @@ def compile_macro_call(compiler: Compiler, ast: MacroCall) -> Optional[ir.Value]
                 temp_name = f"__macro_arg_{param.name}_{compiler.block_count}"
                 
                 # 3. Create the variable
-                # We use create_variable_mut directly
-                # We infer type from the value
+                # Scalars the body never assigns are bound straight to the SSA value,
+                # everything else gets a stack slot (create_variable_mut)
                 fin_type = compiler.infer_fin_type_from_llvm(val.type)
-                var_ptr = compiler.create_variable_mut(temp_name, val.type, val)
+                if is_ssa_scalar(val.type) and is_ssa_safe(param.name, body_stmts):
+                    compiler.define_ssa_value(temp_name, val, fin_type)
+                else:
+                    var_ptr = compiler.create_variable_mut(temp_name, val.type, val)
                 
                 # 4. Map the param name to a Variable Reference Node
                 # Whenever 'param.name' is used in the body, we replace it with 'temp_name'
@@ -181,7 +186,10 @@ def compile_macro_call(compiler: Compiler, ast: MacroCall) -> Optional[ir.Value]
             compiler.compile(expanded_stmt)
 
     # 5. Hygiene: Exit Scope
+    # No lifetime.end for the temporaries: the result may still point into one
+    compiler.current_scope.lifetime_slots.clear()
     compiler.exit_scope()
+    compiler.count_macro_expansion(ast.name, stats_mark)
 
     return result_val
 
@@ -156,7 +156,7 @@ def compile_new(compiler: Compiler, ast: NewExpressionNode) -> ir.Value:
 
     # 1. Calculate Size
     if compiler.data_layout_obj:
-        size_int = llvm_type_to_allocate.get_abi_size(compiler.data_layout_obj)
+        size_int = compiler.abi_size(llvm_type_to_allocate)
         size_arg = ir.Constant(ir.IntType(64), size_int)
     else:
         # Runtime calculation
@@ -183,33 +183,13 @@ def compile_new(compiler: Compiler, ast: NewExpressionNode) -> ir.Value:
         # Check if it's a Struct with Constructor
         if isinstance(llvm_type_to_allocate, ir.IdentifiedStructType):
             mangled_name = llvm_type_to_allocate.name
-            ctor_name = f"{mangled_name}__init"
-            try:
-                ctor = compiler.module.get_global(ctor_name)
-                # We need to call constructor on the allocated memory?
-                # WAIT: Your constructors currently ALLOCATE and return a pointer.
-                # They don't initialize existing memory (inplace new).
-                # This is a mismatch in the current architecture.
-                
-                # Current Constructor: returns MyStruct* (allocated inside)
-                # 'new' keyword: allocates memory.
-                
-                # FIX: If using 'new Struct(...)', we should just call the constructor directly?
-                # But the constructor allocates on STACK (alloca).
-                # If we want Heap, we need to change how constructors work or copy stack->heap.
-                
-                # For now: Call constructor (Stack), then memcpy to Heap.
-                # This is inefficient but safe for now.
-                
+            ctor = compiler.resolve_constructor(alloc_type_ast)
+            if ctor is not None:
+                # Constructors initialize caller storage: construct
+                # directly in the heap allocation (no stack copy)
                 args = [compiler.compile(a) for a in ast.init_args]
-                stack_instance = compiler.builder.call(ctor, args, name="temp_stack_ctor")
-                
-                # Load value from stack instance
-                val = compiler.builder.load(stack_instance)
-                # Store to heap
-                compiler.builder.store(val, typed_ptr)
-                
-            except KeyError:
+                compiler.emit_constructor_call(ctor, args, typed_ptr)
+            else:
                 compiler.errors.error(ast, f"Struct '{mangled_name}' has no constructor.")
         
         # Case: Primitive (new int(5))
@@ -231,9 +211,7 @@ def compile_new(compiler: Compiler, ast: NewExpressionNode) -> ir.Value:
         
         mangled_name = llvm_type_to_allocate.name
         
-        # Reuse _allocate_and_init_struct logic but use our heap pointer
-        # We need to extract the logic or call a helper that takes a pointer.
-        # Let's manually do it here to ensure we use the heap pointer.
+        # Same initialization as struct literals, into our heap pointer
         
         field_indices = compiler.struct_field_indices.get(mangled_name)
         defaults = compiler.struct_field_defaults.get(mangled_name, {})
@@ -251,34 +229,7 @@ def compile_new(compiler: Compiler, ast: NewExpressionNode) -> ir.Value:
              return typed_ptr
 
         provided = {fa.identifier: fa.value for fa in ast.init_fields}
-        
-        for field_name, idx in field_indices.items():
-            zero = ir.Constant(ir.IntType(32), 0)
-            idx_val = ir.Constant(ir.IntType(32), idx)
-            fld_ptr = compiler.builder.gep(typed_ptr, [zero, idx_val], inbounds=True)
-            
-            val_to_store = None
-            if field_name in provided:
-                val_to_store = compiler.compile(provided[field_name])
-            elif field_name in defaults:
-                val_to_store = compiler.compile(defaults[field_name])
-            else:
-                val_to_store = ir.Constant(llvm_type_to_allocate.elements[idx], None)
-            
-            # [TYPE ERASURE] Auto-Boxing
-            expected_type = llvm_type_to_allocate.elements[idx]
-            if expected_type == ir.IntType(8).as_pointer() and val_to_store.type != expected_type:
-                fin_type = compiler._infer_fin_type_from_llvm(val_to_store.type)
-                val_to_store = compiler.box_value(val_to_store, fin_type)
-            
-            # Coercion
-            if val_to_store.type != expected_type:
-                 if isinstance(expected_type, ir.FloatType) and isinstance(val_to_store.type, ir.IntType):
-                     val_to_store = compiler.builder.sitofp(val_to_store, expected_type)
-                 elif isinstance(expected_type, ir.PointerType) and isinstance(val_to_store.type, ir.PointerType):
-                     val_to_store = compiler.builder.bitcast(val_to_store, expected_type)
-
-            compiler.builder.store(val_to_store, fld_ptr)
+        compiler.init_struct_fields(typed_ptr, llvm_type_to_allocate, mangled_name, field_indices, defaults, provided, ast)
 
     # Case C: Zero Init
     else:
@@ -345,7 +296,7 @@ def compile_sizeof(compiler: Compiler, ast: SizeofNode) -> ir.Value:
     if compiler.data_layout_obj:
         # Preferred: Compile-time constant
         try:
-            size = llvm_type.get_abi_size(compiler.data_layout_obj)
+            size = compiler.abi_size(llvm_type)
             return ir.Constant(ir.IntType(64), size)
         except Exception as e:
             compiler.errors.error(ast, f"Could not calculate ABI size for type {llvm_type}: {e}")
@@ -384,16 +335,23 @@ def compile_as_ptr(compiler: Compiler, ast: AsPtrNode) -> ir.Value:
 # <Description>
 # Compiles 'new T' or 'new T(...)'.
 # 1. Calculates size.
-# 2. Calls allocator (compiler.memory.alloc).
+# 2. Calls allocator (compiler.memory.alloc), or uses a stack slot when
+#    escape analysis proved the object never leaves the function, or a
+#    slot of the type's pool for #[pooled] structs.
 # 3. Initializes memory (Constructor or Field Init).
 # </Description>
 def compile_new(compiler: Compiler, ast: NewExpressionNode) -> ir.Value:
     alloc_type_ast = ast.alloc_type_ast
     llvm_type_to_allocate = compiler.convert_type(alloc_type_ast)
+    ctor = None
+    if ast.init_args and isinstance(llvm_type_to_allocate, ir.IdentifiedStructType):
+        ctor = compiler.resolve_constructor(alloc_type_ast)
+    # A constructor receives the object as 'self' and may keep it: never on the stack
+    stack_slot = None if ctor is not None else compiler.stack_allocate_new(ast, llvm_type_to_allocate) # Non-escaping: no malloc
 
     # 1. Calculate Size (Robust GEP Method)
     if compiler.data_layout_obj:
-        size_int = llvm_type_to_allocate.get_abi_size(compiler.data_layout_obj)
+        size_int = compiler.abi_size(llvm_type_to_allocate)
         size_arg = ir.Constant(ir.IntType(64), size_int)
     else:
         # Runtime calculation
@@ -404,9 +362,15 @@ def compile_new(compiler: Compiler, ast: NewExpressionNode) -> ir.Value:
 
     # 2. Allocate Memory
     # We use a helper that calls the user-defined allocator (or malloc fallback)
-    raw_ptr = _call_allocator(compiler, size_arg)
-    
-    typed_ptr = compiler.builder.bitcast(raw_ptr, llvm_type_to_allocate.as_pointer(), name="new_typed_ptr")
+    pool = compiler.struct_pool(llvm_type_to_allocate)
+    if stack_slot is not None:
+        typed_ptr = stack_slot
+    elif pool is not None:
+        raw_ptr = compiler.pool_allocate(pool)
+        typed_ptr = compiler.builder.bitcast(raw_ptr, llvm_type_to_allocate.as_pointer(), name="new_typed_ptr")
+    else:
+        raw_ptr = _call_allocator(compiler, size_arg)
+        typed_ptr = compiler.builder.bitcast(raw_ptr, llvm_type_to_allocate.as_pointer(), name="new_typed_ptr")
 
     # 3. Initialization
     
@@ -414,27 +378,14 @@ def compile_new(compiler: Compiler, ast: NewExpressionNode) -> ir.Value:
     if ast.init_args:
         if isinstance(llvm_type_to_allocate, ir.IdentifiedStructType):
             mangled_name = llvm_type_to_allocate.name
-            ctor_name = f"{mangled_name}__init"
             
-            try:
-                ctor = compiler.module.get_global(ctor_name)
-                
+            if ctor is not None:
                 # [FIX] Call Constructor on Heap Memory
-                # Our constructors currently allocate their own stack memory and return it.
-                # This is incompatible with 'new'.
-                # We need to change constructors to accept an optional 'self' pointer?
-                # OR: We let the constructor allocate on stack, then memcpy to heap.
-                
-                # Current Strategy: Stack Alloc -> Memcpy
+                # Constructors initialize caller storage ('self' is their
+                # sret argument), so the object is built in the allocation.
                 args = [compiler.compile(a) for a in ast.init_args]
-                stack_instance_ptr = compiler.builder.call(ctor, args, name="temp_stack_ctor")
-                
-                # Load value from stack
-                val = compiler.builder.load(stack_instance_ptr)
-                # Store to heap
-                compiler.builder.store(val, typed_ptr)
-                
-            except KeyError:
+                compiler.emit_constructor_call(ctor, args, typed_ptr)
+            else:
                 compiler.errors.error(ast, f"Struct '{mangled_name}' has no constructor.")
         
         # Case: Primitive (new int(5))
@@ -456,7 +407,7 @@ def compile_new(compiler: Compiler, ast: NewExpressionNode) -> ir.Value:
         
         mangled_name = llvm_type_to_allocate.name
         
-        # Reuse _allocate_and_init_struct logic logic manually
+        # Same initialization as struct literals, into our heap pointer
         field_indices = compiler.struct_field_indices.get(mangled_name)
         defaults = compiler.struct_field_defaults.get(mangled_name, {})
         
@@ -472,34 +423,7 @@ def compile_new(compiler: Compiler, ast: NewExpressionNode) -> ir.Value:
              return typed_ptr
 
         provided = {fa.identifier: fa.value for fa in ast.init_fields}
-        
-        for field_name, idx in field_indices.items():
-            zero = ir.Constant(ir.IntType(32), 0)
-            idx_val = ir.Constant(ir.IntType(32), idx)
-            fld_ptr = compiler.builder.gep(typed_ptr, [zero, idx_val], inbounds=True)
-            
-            val_to_store = None
-            if field_name in provided:
-                val_to_store = compiler.compile(provided[field_name])
-            elif field_name in defaults:
-                val_to_store = compiler.compile(defaults[field_name])
-            else:
-                val_to_store = ir.Constant(llvm_type_to_allocate.elements[idx], None)
-            
-            # [TYPE ERASURE] Auto-Boxing
-            expected_type = llvm_type_to_allocate.elements[idx]
-            if expected_type == ir.IntType(8).as_pointer() and val_to_store.type != expected_type:
-                fin_type = compiler._infer_fin_type_from_llvm(val_to_store.type)
-                val_to_store = compiler.box_value(val_to_store, fin_type)
-            
-            # Coercion
-            if val_to_store.type != expected_type:
-                 if isinstance(expected_type, ir.FloatType) and isinstance(val_to_store.type, ir.IntType):
-                     val_to_store = compiler.builder.sitofp(val_to_store, expected_type)
-                 elif isinstance(expected_type, ir.PointerType) and isinstance(val_to_store.type, ir.PointerType):
-                     val_to_store = compiler.builder.bitcast(val_to_store, expected_type)
-
-            compiler.builder.store(val_to_store, fld_ptr)
+        compiler.init_struct_fields(typed_ptr, llvm_type_to_allocate, mangled_name, field_indices, defaults, provided, ast)
 
     # Case C: Zero Init
     else:
@@ -512,8 +436,13 @@ def compile_new(compiler: Compiler, ast: NewExpressionNode) -> ir.Value:
 # <Method name=compile_delete args=[<Compiler>, <DeleteStatementNode>]>
 # <Description>
 # Compiles 'delete ptr'. Calls deallocator.
+# Deleting an object that lives on the stack (see compile_new) is a no-op,
+# and so is deleting memory of an open #[arena] region (see arena.py).
+# #[pooled] structs go back to their pool.
 # </Description>
 def compile_delete(compiler: Compiler, ast: DeleteStatementNode):
+    if compiler.is_stack_delete(ast): # Freed with the frame
+        return
     ptr_val = compiler.compile(ast.pointer_expr_ast)
     
     if not isinstance(ptr_val.type, ir.PointerType):
@@ -524,6 +453,10 @@ def compile_delete(compiler: Compiler, ast: DeleteStatementNode):
     void_ptr = compiler.builder.bitcast(ptr_val, ir.IntType(8).as_pointer())
     
     # Call deallocator
+    pool = compiler.struct_pool(ptr_val.type.pointee)
+    if pool is not None:
+        compiler.pool_free(pool, void_ptr)
+        return
     _call_deallocator(compiler, void_ptr)
 
 
@@ -540,24 +473,9 @@ def compile_delete(compiler: Compiler, ast: DeleteStatementNode):
 def _call_allocator(compiler: Compiler, size_arg: ir.Value) -> ir.Value:
     """
     Calls the system allocator.
-    Prioritizes 'compiler.memory.alloc' if defined, else 'malloc'.
+    Inside an #[arena] region the bump allocator, else 'malloc'.
     """
-    # Try to find a user-defined allocator wrapper
-    # (We assume builtins.fin defines 'malloc' or a custom function)
-    try:
-        malloc_fn = compiler.module.get_global("malloc")
-    except KeyError:
-        # Fallback declaration
-        malloc_ty = ir.FunctionType(ir.IntType(8).as_pointer(), [ir.IntType(64)])
-        malloc_fn = ir.Function(compiler.module, malloc_ty, name="malloc")
-        
-    return compiler.builder.call(malloc_fn, [size_arg], name="alloc_call")
+    return compiler.emit_allocation(size_arg)
 
 def _call_deallocator(compiler: Compiler, ptr: ir.Value):
-    try:
-        free_fn = compiler.module.get_global("free")
-    except KeyError:
-        free_ty = ir.FunctionType(ir.VoidType(), [ir.IntType(8).as_pointer()])
-        free_fn = ir.Function(compiler.module, free_ty, name="free")
-        
-    compiler.builder.call(free_fn, [ptr])
\ No newline at end of file
+    compiler.emit_deallocation(ptr) # No-op for region memory
\ No newline at end of file
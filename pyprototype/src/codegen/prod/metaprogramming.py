@@ -43,6 +43,7 @@
 # “Code fades. Love leaves a signature.”
 # =============================================================================
 from .essentials import *
+import mmap, os
 
 
 # ---------------------------------------------------------------------------
@@ -162,6 +163,9 @@ def compile_special_call(compiler: Compiler, ast: SpecialCallNode) -> ir.Value:
         fin_type = compiler._get_arg_fin_type(ast.args[0], None)
         type_name = fin_type.get_signature().split("__")[-1]
         return compiler.create_global_string(type_name)
+
+    elif ast.name == "embed":
+        return compile_embed(compiler, ast)
     # 2. Check Special Functions
     if hasattr(compiler, 'special_functions') and ast.name in compiler.special_functions:
         func_def = compiler.special_functions[ast.name]
@@ -205,4 +209,77 @@ def compile_special_call(compiler: Compiler, ast: SpecialCallNode) -> ir.Value:
         return ir.Constant(ir.VoidType(), None)
 
     compiler.errors.error(ast, f"Unknown special function: @{ast.name}")
-    return ir.Constant(ir.IntType(32), 0)
\ No newline at end of file
+    return ir.Constant(ir.IntType(32), 0)
+
+# ---------------------------------------------------------------------------
+# <Method name=compile_embed args=[<Compiler>, <SpecialCallNode>]>
+# <Description>
+# @embed("path") / @embed("path", <T>): the file's bytes as a Collection<char>
+# (or Collection<T>, reinterpreted in native byte order), read at compile
+# time. The file is memory-mapped and emitted as one private constant byte
+# string, so the data never goes through the lexer or parser.
+# Relative paths are resolved against the current source file.
+# The collection borrows the constant (capacity 0): it is read-only until
+# it grows (push/reserve/extend copy it into the heap first).
+# </Description>
+def compile_embed(compiler: Compiler, ast: SpecialCallNode) -> ir.Value:
+    if len(ast.args) not in (1, 2) or not isinstance(ast.args[0], Literal) or not isinstance(ast.args[0].value, str):
+        compiler.errors.error(ast, "@embed expects a file path string literal and an optional element type.",
+                              hint='e.g. @embed("table.bin", <int>)')
+        return ir.Constant(ir.IntType(32), 0)
+
+    elem_type = compiler.convert_type(ast.args[1]) if len(ast.args) == 2 else ir.IntType(8)
+    elem_size = _embed_element_size(compiler, elem_type)
+    if elem_size is None:
+        compiler.errors.error(ast, f"@embed element type must be an integer or floating point type, got {elem_type}.")
+        return ir.Constant(ir.IntType(32), 0)
+
+    path = ast.args[0].value
+    if not os.path.isabs(path):
+        base_dir = os.path.dirname(compiler.current_file_path) if compiler.current_file_path else os.getcwd()
+        path = os.path.normpath(os.path.join(base_dir, path))
+    if not os.path.isfile(path):
+        compiler.errors.error(ast, f"@embed: file not found: '{path}'.")
+        return ir.Constant(ir.IntType(32), 0)
+
+    data = _embed_bytes(path)
+    if len(data) % elem_size:
+        compiler.errors.error(ast, f"@embed: size of '{path}' ({len(data)} bytes) is not a multiple of {elem_type} ({elem_size} bytes).")
+        return ir.Constant(ir.IntType(32), 0)
+
+    # One global per file (and alignment), shared by every @embed of it
+    key = (path, elem_size)
+    glob = compiler.embedded_files.get(key)
+    if glob is None:
+        array_type = ir.ArrayType(ir.IntType(8), len(data))
+        glob = ir.GlobalVariable(compiler.module, array_type, name=compiler.module.get_unique_name(".embed"))
+        glob.linkage = "private"
+        glob.global_constant = True
+        glob.unnamed_addr = True
+        glob.align = max(elem_size, 1)
+        glob.initializer = ir.Constant(array_type, bytearray(data))
+        compiler.embedded_files[key] = glob
+
+    data_ptr = glob.bitcast(elem_type.as_pointer())
+    coll_type = compiler.collection_type(elem_type)
+    return ir.Constant(coll_type, [data_ptr, ir.Constant(coll_type.elements[1], len(data) // elem_size),
+                                   ir.Constant(coll_type.elements[2], 0)])
+
+def _embed_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b"" # mmap rejects empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:]
+
+def _embed_element_size(compiler: Compiler, elem_type: ir.Type) -> Optional[int]:
+    if isinstance(elem_type, ir.IntType):
+        if elem_type.width % 8:
+            return None
+    elif not isinstance(elem_type, (ir.FloatType, ir.DoubleType)):
+        return None
+    if compiler.data_layout_obj:
+        return compiler.abi_size(elem_type)
+    if isinstance(elem_type, ir.IntType):
+        return elem_type.width // 8
+    return 4 if isinstance(elem_type, ir.FloatType) else 8
@@ -180,7 +180,7 @@ def compile_assignment(compiler: Compiler, ast: Assignment):
 
     # 4. Store
     if op == "=":
-        compiler.builder.store(val_to_store, target_ptr)
+        compiler.store_value(val_to_store, target_ptr) # memcpy for big structs
     else:
         # Compound Assignment
         current_val = compiler.builder.load(target_ptr, name="compound_load")
@@ -438,9 +438,7 @@ def compile_additive(compiler: Compiler, ast: AdditiveOperator) -> ir.Value:
         return compiler.emit_operator_call( struct_name, op, left, right)
     
     # Default Behavior
-    if left.type != right.type:
-        # Basic coercion?
-        pass # Rely on strict typing for now or add coercion here
+    left, right = _promote_int_operands(compiler, left, right)
         
     if isinstance(left.type, ir.FloatType):
         if op == "+": return compiler.builder.fadd(left, right, name="faddtmp")
@@ -471,6 +469,8 @@ def compile_multiplicative(compiler: Compiler, ast: MultiplicativeOperator) -> i
         return compiler.emit_operator_call( struct_name, op, left, right)
 
     # Default Behavior
+    left, right = _promote_int_operands(compiler, left, right)
+
     if isinstance(left.type, ir.FloatType):
         if op == "*": return compiler.builder.fmul(left, right, name="fmultmp")
         elif op == "/": return compiler.builder.fdiv(left, right, name="fdivtmp")
@@ -488,6 +488,21 @@ def compile_multiplicative(compiler: Compiler, ast: MultiplicativeOperator) -> i
             
     return ir.Constant(ir.IntType(32), 0)
 
+# ---------------------------------------------------------------------------
+# <Method name=_promote_int_operands args=[<Compiler>, <ir.Value>, <ir.Value>]>
+# <Description>
+# Integer Promotion for arithmetic: the narrower operand is sign-extended to
+# the wider one (e.g. 'long_val % 1000003', 'int_val + str[i]'), as
+# compile_comparison does.
+# </Description>
+def _promote_int_operands(compiler: Compiler, left: ir.Value, right: ir.Value):
+    if isinstance(left.type, ir.IntType) and isinstance(right.type, ir.IntType):
+        if left.type.width > right.type.width:
+            right = compiler.builder.sext(right, left.type, name="sext_r")
+        elif left.type.width < right.type.width:
+            left = compiler.builder.sext(left, right.type, name="sext_l")
+    return left, right
+
 # ---------------------------------------------------------------------------
 # <Method name=compile_postfix args=[<Compiler>, <PostfixOperator>]>
 # <Description>
@@ -0,0 +1,132 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+
+# Weights for a check branch (taken, not taken): same as __builtin_expect(x, 0)
+UNLIKELY_WEIGHTS = [1, 2000]
+
+# ---------------------------------------------------------------------------
+# <Method name=get_panic_function args=[<Compiler>]>
+# <Description>
+# Returns '__panic' (from builtins) marked noreturn + cold, so LLVM treats
+# every block calling it as cold and lays it out of the hot path. It exits
+# the process, so it is also nounwind (stays a call inside 'try').
+# Returns None if builtins are not loaded.
+# </Description>
+def get_panic_function(compiler: Compiler) -> Optional[ir.Function]:
+    try:
+        panic_fn = compiler.module.get_global("__panic")
+    except KeyError:
+        panic_fn = getattr(compiler, "panic_func", None) # Internal fallback if builtins are missing
+    if panic_fn is None:
+        return None
+    for attr in ("noreturn", "cold", "nounwind"):
+        panic_fn.attributes.add(attr)
+    return panic_fn
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_panic_check args=[<Compiler>, <ir.Value>, <str>, <Node>]>
+# <Description>
+# Runtime check: panics with 'message' if 'failed' (i1) is true, otherwise
+# continues in a fresh block (the builder is left there).
+# The failing branch is weighted unlikely and goes to one cold block per
+# function and message, which only calls a shared outlined stub
+# (see _panic_stub). A check therefore costs a compare and a branch in
+# the hot code, with no string or call setup inline.
+# </Description>
+def emit_panic_check(compiler: Compiler, failed: ir.Value, message: str, node: Node = None):
+    stub = _panic_stub(compiler, message)
+    if stub is None:
+        compiler.errors.error(node, "Runtime Error: '__panic' function not found.", hint="Ensure builtins are loaded.")
+        return
+
+    blocks = compiler.panic_blocks.setdefault(compiler.function, {})
+    cold_block = blocks.get(message)
+    if cold_block is None:
+        cold_block = compiler.function.append_basic_block("panic_cold")
+        cold_builder = ir.IRBuilder(cold_block)
+        cold_builder.call(stub, [])
+        cold_builder.unreachable()
+        blocks[message] = cold_block
+
+    ok_block = compiler.function.append_basic_block("check_ok")
+    branch = compiler.builder.cbranch(failed, cold_block, ok_block)
+    branch.set_weights(UNLIKELY_WEIGHTS)
+    compiler.builder.position_at_end(ok_block)
+
+# ---------------------------------------------------------------------------
+# <Method name=_panic_stub args=[<Compiler>, <str>]>
+# <Description>
+# One internal 'void __fin_panic_N()' per distinct message:
+# noinline + cold + noreturn + nounwind, calls __panic(message).
+# </Description>
+def _panic_stub(compiler: Compiler, message: str) -> Optional[ir.Function]:
+    stub = compiler.panic_stubs.get(message)
+    if stub is not None:
+        return stub
+    panic_fn = get_panic_function(compiler)
+    if panic_fn is None:
+        return None
+
+    stub = ir.Function(compiler.module, ir.FunctionType(ir.VoidType(), []),
+                       name=f"__fin_panic_{len(compiler.panic_stubs)}")
+    stub.linkage = "internal"
+    for attr in ("noinline", "cold", "noreturn", "nounwind"):
+        stub.attributes.add(attr)
+    builder = ir.IRBuilder(stub.append_basic_block("entry"))
+    builder.call(panic_fn, [compiler.create_global_string(message)])
+    builder.unreachable()
+
+    compiler.panic_stubs[message] = stub
+    return stub
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_panics args=[<Compiler>]>
+# <Description>
+# Initializes the panic stub caches on the compiler.
+# </Description>
+def setup_panics(compiler: Compiler):
+    compiler.panic_stubs = {} # message -> outlined stub
+    compiler.panic_blocks = {} # ir.Function -> { message: cold block }
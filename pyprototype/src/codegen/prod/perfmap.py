@@ -0,0 +1,171 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+from llvmlite import binding
+import os
+
+# Reverse of CONSTANTS.OPERATOR_SYMBOL_MAP ('add' -> '+')
+_OPERATOR_NAMES = {
+    'add': '+', 'sub': '-', 'mul': '*', 'div': '/', 'mod': '%',
+    'eq': '==', 'neq': '!=', 'lt': '<', 'gt': '>', 'lte': '<=', 'gte': '>=',
+    'and': '&&', 'or': '||', 'not': '!'
+}
+
+# ---------------------------------------------------------------------------
+# <Method name=demangle_name args=[<Compiler>, <str>]>
+# <Description>
+# Turns an LLVM symbol back into 'module.Struct.method' form.
+# Follows the get_mangled_name scheme ('<sanitized path>__<name>') and the
+# struct member patterns:
+#   '<Struct>_<method>', '<Struct>_static_<method>', '<Struct>__init',
+#   '<Struct>__del', '<Struct>__op_<op>'
+# Mangled prefixes are looked up in 'compiler.mangled_modules' and
+# 'compiler.struct_types' (longest match wins), since both paths and
+# names may contain underscores. Constructors and destructors carry the
+# unmangled struct name, which is mapped back to its registered struct. Suffixes such as multiversion variants
+# ('f.x86-64-v3') are kept in brackets.
+# </Description>
+def demangle_name(compiler: Compiler, llvm_name: str) -> str:
+    base, _, suffix = llvm_name.partition(".")
+    readable = _demangle_base(compiler, base)
+    return f"{readable} [{suffix}]" if suffix else readable
+
+def _demangle_base(compiler: Compiler, name: str) -> str:
+    # 1. Struct members
+    structs = {key: key for key in compiler.struct_types}
+    for key in compiler.struct_types:
+        module_prefix = longest_prefix(key, compiler.mangled_modules.keys(), "__")
+        if module_prefix:
+            structs.setdefault(key[len(module_prefix) + 2:], key)
+    struct_prefix = longest_prefix(name, structs.keys(), "_")
+    if struct_prefix:
+        member = name[len(struct_prefix) + 1:]
+        if member == "_init":
+            member = "init"
+        elif member == "_del":
+            member = "del"
+        elif member.startswith("_op_"):
+            member = f"operator{_OPERATOR_NAMES.get(member[4:], member[4:])}"
+        elif member.startswith("static_"):
+            member = member[len("static_"):]
+        return f"{_demangle_base(compiler, structs[struct_prefix])}.{member}"
+
+    # 2. Module-level symbols
+    module_prefix = longest_prefix(name, compiler.mangled_modules.keys(), "__")
+    if module_prefix:
+        return f"{compiler.mangled_modules[module_prefix]}.{name[len(module_prefix) + 2:]}"
+
+    return name
+
+# ---------------------------------------------------------------------------
+# <Method name=longest_prefix args=[<str>, <Iterable[str]>, <str>]>
+# <Description>
+# The longest candidate that 'name' starts with, followed by 'separator'
+# and at least one more character (None if there is none). Used to map
+# mangled symbols back to their module or struct.
+# </Description>
+def longest_prefix(name: str, candidates: Iterable[str], separator: str) -> Optional[str]:
+    best = None
+    for candidate in candidates:
+        if name.startswith(candidate + separator) and len(name) > len(candidate) + len(separator):
+            if best is None or len(candidate) > len(best):
+                best = candidate
+    return best
+
+# ---------------------------------------------------------------------------
+# <Method name=capture_jit_object args=[<Compiler>, <ExecutionEngine>]>
+# <Description>
+# Installs an object cache hook so the object MCJIT emits is kept. Its
+# text section size bounds the last function in the perf map. Must be
+# called before 'finalize_object'.
+# </Description>
+def capture_jit_object(compiler: Compiler, engine):
+    if not compiler.perf_map:
+        return
+    compiler.jit_objects = []
+    engine.set_object_cache(notify_func=lambda module, buffer: compiler.jit_objects.append(buffer))
+
+# ---------------------------------------------------------------------------
+# <Method name=write_perf_map args=[<Compiler>, <ExecutionEngine>]>
+# <Description>
+# Appends '<start> <size> <name>' lines (hex) to /tmp/perf-<pid>.map for
+# every function the engine materialized, so 'perf report' can symbolize
+# JIT frames. MCJIT does not report symbol sizes: a function extends to
+# the next function's start, and the last one to the end of the text
+# section.
+# Returns the map path.
+# </Description>
+def write_perf_map(compiler: Compiler, engine) -> Optional[str]:
+    if not compiler.perf_map:
+        return None
+
+    symbols = []
+    for fn in compiler.module.functions:
+        if fn.is_declaration:
+            continue
+        address = engine.get_function_address(fn.name)
+        if address:
+            symbols.append((address, fn.name))
+    if not symbols:
+        return None
+    symbols.sort()
+
+    text_size = 0
+    for buffer in getattr(compiler, "jit_objects", []):
+        obj = binding.ObjectFileRef.from_data(buffer)
+        for section in obj.sections():
+            if section.is_text():
+                text_size += section.size()
+    text_end = symbols[0][0] + text_size
+
+    path = f"/tmp/perf-{os.getpid()}.map"
+    with open(path, "a", encoding="utf-8") as f:
+        for i, (address, name) in enumerate(symbols):
+            if i + 1 < len(symbols):
+                size = symbols[i + 1][0] - address
+            else:
+                size = max(text_end - address, 1)
+            f.write(f"{address:x} {size:x} {demangle_name(compiler, name)}\n")
+    return path
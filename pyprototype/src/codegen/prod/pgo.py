@@ -0,0 +1,260 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+import os
+
+# A function is 'hot' if entered at least this fraction of the hottest one.
+PGO_HOT_FUNCTION_RATIO = 0.1
+# LLVM branch weights are 32-bit.
+PGO_MAX_WEIGHT = 0xFFFFFFFF
+
+# ---------------------------------------------------------------------------
+# <Method name=load_profile args=[<str>]>
+# <Description>
+# Reads a profile written by an instrumented build.
+# Format: one "<counter key> <count>" per line. Instrumented runs append to
+# the file, so repeated training runs are merged by summing their counts.
+# </Description>
+def load_profile(path: str) -> Dict[str, int]:
+    profile: Dict[str, int] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.rsplit(None, 1)
+            if len(parts) != 2 or not parts[1].isdigit():
+                continue
+            profile[parts[0]] = profile.get(parts[0], 0) + int(parts[1])
+    return profile
+
+# ---------------------------------------------------------------------------
+# <Method name=_next_site_key args=[<Compiler>, <str>]>
+# <Description>
+# Returns a stable key for the next instrumentation site of 'kind' in the
+# current function: "<llvm function>:<kind>:<ordinal>".
+# Both the instrumented and the optimizing compile walk the AST in the same
+# order, so the ordinals match between the two builds.
+# </Description>
+def _next_site_key(compiler: Compiler, kind: str) -> str:
+    fn_name = compiler.function.name
+    ordinals = compiler.pgo_site_ordinals.setdefault(fn_name, {})
+    ordinal = ordinals.get(kind, 0)
+    ordinals[kind] = ordinal + 1
+    return f"{fn_name}:{kind}:{ordinal}"
+
+# ---------------------------------------------------------------------------
+# <Method name=_get_profile_writer args=[<Compiler>]>
+# <Description>
+# Creates (once) '__fin_pgo_write', registered as a global destructor.
+# It opens the profile in append mode and prints every counter; the
+# fprintf calls are inserted before 'compiler.pgo_writer_anchor' (the
+# fclose) as counters are created.
+# </Description>
+def _get_profile_writer(compiler: Compiler) -> ir.Function:
+    if compiler.pgo_writer_anchor is not None:
+        return compiler.pgo_writer_anchor.function
+
+    i8_ptr = ir.IntType(8).as_pointer()
+    fopen_fn = compiler.get_or_declare_function("fopen", ir.FunctionType(i8_ptr, [i8_ptr, i8_ptr]))
+    fclose_fn = compiler.get_or_declare_function("fclose", ir.FunctionType(ir.IntType(32), [i8_ptr]))
+
+    writer = ir.Function(compiler.module, ir.FunctionType(ir.VoidType(), []), name="__fin_pgo_write")
+    writer.linkage = "internal"
+    entry = writer.append_basic_block("entry")
+    write_block = writer.append_basic_block("write")
+    done_block = writer.append_basic_block("done")
+
+    builder = ir.IRBuilder(entry)
+    path = compiler.create_global_string(os.path.abspath(compiler.pgo_generate))
+    fp = builder.call(fopen_fn, [path, compiler.create_global_string("a")], name="profile_fp")
+    is_null = builder.icmp_unsigned("==", fp, ir.Constant(i8_ptr, None))
+    builder.cbranch(is_null, done_block, write_block)
+
+    builder.position_at_end(write_block)
+    compiler.pgo_writer_anchor = builder.call(fclose_fn, [fp])
+    builder.branch(done_block)
+
+    builder.position_at_end(done_block)
+    builder.ret_void()
+
+    compiler.register_global_dtor(writer)
+    return writer
+
+# ---------------------------------------------------------------------------
+# <Method name=_emit_counter args=[<Compiler>, <ir.IRBuilder>, <str>]>
+# <Description>
+# Emits 'counter += 1' at the builder position and adds the counter to the
+# profile writer.
+# </Description>
+def _emit_counter(compiler: Compiler, builder: ir.IRBuilder, key: str):
+    i64 = ir.IntType(64)
+    counter = ir.GlobalVariable(compiler.module, i64, name=f"__fin_pgo.{len(compiler.pgo_counters)}")
+    counter.linkage = "internal"
+    counter.initializer = ir.Constant(i64, 0)
+    compiler.pgo_counters[key] = counter
+
+    current = builder.load(counter)
+    builder.store(builder.add(current, ir.Constant(i64, 1)), counter)
+
+    # Register with the writer: fprintf(fp, "%s %llu\n", key, counter)
+    _get_profile_writer(compiler)
+    i8_ptr = ir.IntType(8).as_pointer()
+    fprintf_fn = compiler.get_or_declare_function(
+        "fprintf", ir.FunctionType(ir.IntType(32), [i8_ptr, i8_ptr], var_arg=True)
+    )
+    anchor = compiler.pgo_writer_anchor
+    writer_builder = ir.IRBuilder(anchor.parent)
+    writer_builder.position_before(anchor)
+    writer_builder.call(fprintf_fn, [
+        anchor.args[0],
+        compiler.create_global_string("%s %llu\n"),
+        compiler.create_global_string(key),
+        writer_builder.load(counter),
+    ])
+
+# ---------------------------------------------------------------------------
+# <Method name=_scale_weights args=[<int>, <int>]>
+# <Description>
+# Scales a (taken, not_taken) pair down to fit LLVM's 32-bit weights.
+# </Description>
+def _scale_weights(taken: int, not_taken: int) -> List[int]:
+    largest = max(taken, not_taken)
+    if largest > PGO_MAX_WEIGHT:
+        scale = largest / PGO_MAX_WEIGHT
+        taken, not_taken = int(taken / scale), int(not_taken / scale)
+    # A zero weight is a hard "never"; keep a floor of 1 so LLVM only
+    # treats the edge as very unlikely.
+    return [max(taken, 1), max(not_taken, 1)]
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_profiled_cbranch args=[<Compiler>, <str>, <ir.Value>, <ir.Block>, <ir.Block>]>
+# <Description>
+# Drop-in replacement for 'builder.cbranch' used by if/while/for/foreach.
+# - Instrumented build (--profile-generate): counts how often the branch
+#   executes and how often the true edge is taken (at the start of
+#   'true_block', which must only be reachable from this branch).
+# - Optimizing build (--profile-use): attaches !prof branch_weights
+#   derived from those two counters.
+# - Otherwise: a plain cbranch.
+# </Description>
+def emit_profiled_cbranch(compiler: Compiler, kind: str, cond: ir.Value, true_block: ir.Block, false_block: ir.Block):
+    if compiler.pgo_generate is None and compiler.pgo_profile is None:
+        return compiler.builder.cbranch(cond, true_block, false_block)
+
+    key = _next_site_key(compiler, kind)
+
+    if compiler.pgo_generate is not None:
+        _emit_counter(compiler, compiler.builder, f"{key}:branch")
+        branch = compiler.builder.cbranch(cond, true_block, false_block)
+        taken_builder = ir.IRBuilder(true_block)
+        taken_builder.position_at_start(true_block)
+        _emit_counter(compiler, taken_builder, f"{key}:taken")
+        return branch
+
+    branch = compiler.builder.cbranch(cond, true_block, false_block)
+    executed = compiler.pgo_profile.get(f"{key}:branch")
+    taken = compiler.pgo_profile.get(f"{key}:taken")
+    if executed:
+        taken = min(taken or 0, executed)
+        branch.set_weights(_scale_weights(taken, executed - taken))
+    return branch
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_profiled_entry args=[<Compiler>, <ir.Function>]>
+# <Description>
+# Called right after a function's entry block is created.
+# - Instrumented build: counts function entries.
+# - Optimizing build: attaches 'function_entry_count' and marks functions
+#   never entered during training 'cold' and the hottest ones 'hot'.
+# </Description>
+def emit_profiled_entry(compiler: Compiler, llvm_function: ir.Function):
+    if compiler.pgo_generate is None and compiler.pgo_profile is None:
+        return
+
+    key = _next_site_key(compiler, "entry")
+
+    if compiler.pgo_generate is not None:
+        _emit_counter(compiler, compiler.builder, key)
+        return
+
+    count = compiler.pgo_profile.get(key)
+    if count is None:
+        # Function did not exist in the training build.
+        return
+
+    llvm_function.set_metadata("prof", compiler.module.add_metadata([
+        "function_entry_count", ir.Constant(ir.IntType(64), count)
+    ]))
+
+    if count == 0:
+        llvm_function.attributes.add("cold")
+    elif count >= compiler.pgo_hot_threshold:
+        # 'hot' is not in llvmlite's attribute whitelist.
+        set.add(llvm_function.attributes, "hot")
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_pgo args=[<Compiler>, <str>, <str>]>
+# <Description>
+# Initializes PGO state on the compiler. At most one of the two modes is
+# active per build.
+# </Description>
+def setup_pgo(compiler: Compiler, profile_generate: Optional[str], profile_use: Optional[str]):
+    compiler.pgo_generate = profile_generate
+    compiler.pgo_profile = None
+    compiler.pgo_hot_threshold = 0
+    compiler.pgo_site_ordinals = {}
+    compiler.pgo_counters = {}
+    compiler.pgo_writer_anchor = None
+
+    if profile_generate and profile_use:
+        compiler.errors.error(None, "--profile-generate and --profile-use cannot be used together.")
+
+    if profile_use:
+        try:
+            compiler.pgo_profile = load_profile(profile_use)
+        except OSError as e:
+            compiler.errors.error(None, f"Could not read profile '{profile_use}'.", hint=str(e))
+
+        entry_counts = [count for key, count in compiler.pgo_profile.items() if ":entry:" in key]
+        if entry_counts:
+            compiler.pgo_hot_threshold = max(1, int(max(entry_counts) * PGO_HOT_FUNCTION_RATIO))
@@ -0,0 +1,292 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+import ctypes
+
+# Pooled structs. '#[pooled]' on a struct gives it a slab allocator of its
+# own: 'new' pops a slot off the type's freelist (or carves the next one
+# from the current chunk) and 'delete' pushes it back, so node-like types
+# (lists, trees, messages) recycle memory without malloc/free. Chunks
+# hold 64 slots at first and double up to MAX_CHUNK_BYTES; they are kept
+# for the whole run. Delete pooled objects through a pointer to their own
+# type (a parent pointer would hand the slot to free()).
+#
+# Pool: { i8* free, i8* cursor, i8* limit, i64 chunk_slots,
+#         i64 reserved, i64 allocations, i64 recycled, i64 live }
+#   free         freelist head; a free slot starts with the next one
+#   cursor/limit unused part of the newest chunk
+#   chunk_slots  slots in the newest chunk
+#   reserved     bytes taken from malloc
+#   allocations, recycled, live: counted only under --stats
+
+I8_PTR = ir.IntType(8).as_pointer()
+I64 = ir.IntType(64)
+POOL_TYPE = ir.LiteralStructType([I8_PTR, I8_PTR, I8_PTR, I64, I64, I64, I64, I64])
+FREE_FIELD, CURSOR_FIELD, LIMIT_FIELD, CHUNK_SLOTS_FIELD = range(4)
+RESERVED_FIELD, ALLOCATIONS_FIELD, RECYCLED_FIELD, LIVE_FIELD = range(4, 8)
+STAT_FIELDS = ("reserved", "allocations", "recycled", "live")
+
+MIN_CHUNK_SLOTS = 64
+MAX_CHUNK_BYTES = 1 << 20
+
+# ---------------------------------------------------------------------------
+# <Method name=size_class args=[<int>]>
+# <Description>
+# Slot size for objects of 'size' bytes: multiples of 16 up to 128, then
+# four classes per power of two (160, 192, 224, 256, 320, ...). Slots
+# are at least 16 bytes (room for the freelist link, malloc alignment).
+# </Description>
+def size_class(size: int) -> int:
+    if size <= 128:
+        return max(16, (size + 15) // 16 * 16)
+    step = 1 << (size.bit_length() - 3)
+    return (size + step - 1) // step * step
+
+# ---------------------------------------------------------------------------
+# <Method name=struct_pool args=[<Compiler>, <ir.Type>]>
+# <Description>
+# The pool of 'llvm_type' if it is a #[pooled] struct (created on first
+# use: state global and alloc/free/refill helpers), else None. Needs the
+# data layout to size slots; without one pooled structs use malloc.
+# </Description>
+def struct_pool(compiler: Compiler, llvm_type: ir.Type) -> Optional[Dict[str, Any]]:
+    if not isinstance(llvm_type, ir.IdentifiedStructType) or llvm_type.name not in compiler.pooled_structs:
+        return None
+    pool = compiler.struct_pools.get(llvm_type.name)
+    if pool is not None or compiler.data_layout_obj is None:
+        return pool
+
+    slot = size_class(compiler.abi_size(llvm_type))
+    state = ir.GlobalVariable(compiler.module, POOL_TYPE, name=f"__fin_pool.{llvm_type.name}")
+    state.linkage = "internal"
+    state.initializer = ir.Constant(POOL_TYPE, None)
+    pool = {"type": llvm_type, "slot": slot, "state": state}
+    pool["refill"] = _refill_function(compiler, pool)
+    pool["alloc"] = _alloc_function(compiler, pool)
+    pool["free"] = _free_function(compiler, pool)
+    compiler.struct_pools[llvm_type.name] = pool
+    return pool
+
+# ---------------------------------------------------------------------------
+# <Method name=pool_allocate args=[<Compiler>, <Dict>]>
+# <Description>
+# One slot from 'pool' (see struct_pool). Returns i8*.
+# </Description>
+def pool_allocate(compiler: Compiler, pool: Dict[str, Any]) -> ir.Value:
+    return compiler.builder.call(pool["alloc"], [], name="pool_alloc")
+
+# ---------------------------------------------------------------------------
+# <Method name=pool_free args=[<Compiler>, <Dict>, <ir.Value>]>
+# <Description>
+# Gives the slot at 'ptr' (i8*, may be null) back to 'pool'.
+# </Description>
+def pool_free(compiler: Compiler, pool: Dict[str, Any], ptr: ir.Value):
+    compiler.builder.call(pool["free"], [ptr])
+
+# ---------------------------------------------------------------------------
+# <Method name=_alloc_function args=[<Compiler>, <Dict>]>
+# <Description>
+# 'i8* __fin_pool_alloc.<S>()': freelist pop, else bump within the chunk,
+# else a new chunk (out of line). Small enough to inline into 'new'.
+# </Description>
+def _alloc_function(compiler: Compiler, pool: Dict[str, Any]) -> ir.Function:
+    fn = _helper_function(compiler, "alloc", pool, I8_PTR, [])
+    entry = fn.append_basic_block("entry")
+    pop = fn.append_basic_block("pop")
+    bump = fn.append_basic_block("bump")
+    carve = fn.append_basic_block("carve")
+    refill = fn.append_basic_block("refill")
+    done = fn.append_basic_block("done")
+    state = pool["state"]
+
+    builder = ir.IRBuilder(entry)
+    head = builder.load(_field(builder, state, FREE_FIELD), name="head")
+    builder.cbranch(builder.icmp_unsigned("!=", head, ir.Constant(I8_PTR, None)), pop, bump)
+
+    builder.position_at_end(pop)
+    builder.store(builder.load(builder.bitcast(head, I8_PTR.as_pointer()), name="next"), _field(builder, state, FREE_FIELD))
+    _count(compiler, builder, state, RECYCLED_FIELD, 1)
+    builder.branch(done)
+
+    builder.position_at_end(bump)
+    cursor_ptr = _field(builder, state, CURSOR_FIELD)
+    cursor = builder.load(cursor_ptr, name="cursor")
+    fits = builder.icmp_unsigned("<", cursor, builder.load(_field(builder, state, LIMIT_FIELD)), name="fits")
+    builder.cbranch(fits, carve, refill)
+    builder.block.terminator.set_weights([1000, 1])
+
+    builder.position_at_end(carve)
+    builder.store(builder.gep(cursor, [_i64(pool["slot"])]), cursor_ptr)
+    builder.branch(done)
+
+    builder.position_at_end(refill)
+    fresh = builder.call(pool["refill"], [], name="fresh")
+    builder.branch(done)
+
+    builder.position_at_end(done)
+    slot = builder.phi(I8_PTR, name="slot")
+    slot.add_incoming(head, pop)
+    slot.add_incoming(cursor, carve)
+    slot.add_incoming(fresh, refill)
+    _count(compiler, builder, state, ALLOCATIONS_FIELD, 1)
+    _count(compiler, builder, state, LIVE_FIELD, 1)
+    builder.ret(slot)
+    return fn
+
+# ---------------------------------------------------------------------------
+# <Method name=_free_function args=[<Compiler>, <Dict>]>
+# <Description>
+# 'void __fin_pool_free.<S>(i8*)': pushes the slot on the freelist
+# (null is ignored, as with free()).
+# </Description>
+def _free_function(compiler: Compiler, pool: Dict[str, Any]) -> ir.Function:
+    fn = _helper_function(compiler, "free", pool, ir.VoidType(), [I8_PTR])
+    ptr, = fn.args
+    state = pool["state"]
+    builder = ir.IRBuilder(fn.append_basic_block("entry"))
+    with builder.if_then(builder.icmp_unsigned("!=", ptr, ir.Constant(I8_PTR, None))):
+        free_ptr = _field(builder, state, FREE_FIELD)
+        builder.store(builder.load(free_ptr, name="head"), builder.bitcast(ptr, I8_PTR.as_pointer()))
+        builder.store(ptr, free_ptr)
+        _count(compiler, builder, state, LIVE_FIELD, -1)
+    builder.ret_void()
+    return fn
+
+# ---------------------------------------------------------------------------
+# <Method name=_refill_function args=[<Compiler>, <Dict>]>
+# <Description>
+# 'i8* __fin_pool_refill.<S>()': mallocs the next chunk (twice the slots
+# of the last one, from MIN_CHUNK_SLOTS up to MAX_CHUNK_BYTES) and returns
+# its first slot; the rest becomes cursor..limit.
+# </Description>
+def _refill_function(compiler: Compiler, pool: Dict[str, Any]) -> ir.Function:
+    fn = _helper_function(compiler, "refill", pool, I8_PTR, [])
+    fn.attributes.add("noinline")
+    fn.attributes.add("cold")
+    slot = pool["slot"]
+    max_slots = max(MAX_CHUNK_BYTES // slot, MIN_CHUNK_SLOTS)
+    state = pool["state"]
+
+    builder = ir.IRBuilder(fn.append_basic_block("entry"))
+    slots_ptr = _field(builder, state, CHUNK_SLOTS_FIELD)
+    slots = builder.shl(builder.load(slots_ptr), _i64(1), name="doubled")
+    slots = builder.select(builder.icmp_unsigned("<", slots, _i64(MIN_CHUNK_SLOTS)), _i64(MIN_CHUNK_SLOTS), slots)
+    slots = builder.select(builder.icmp_unsigned(">", slots, _i64(max_slots)), _i64(max_slots), slots, name="slots")
+    builder.store(slots, slots_ptr)
+
+    size = builder.mul(slots, _i64(slot), name="bytes")
+    # i8*, whatever builtins.fin declares malloc to return: the geps below count bytes
+    chunk = compiler.call_runtime_function("malloc", ir.FunctionType(I8_PTR, [I64]), [size], builder, "chunk")
+    builder.store(builder.gep(chunk, [_i64(slot)]), _field(builder, state, CURSOR_FIELD))
+    builder.store(builder.gep(chunk, [size]), _field(builder, state, LIMIT_FIELD))
+    reserved_ptr = _field(builder, state, RESERVED_FIELD)
+    builder.store(builder.add(builder.load(reserved_ptr), size), reserved_ptr)
+    builder.ret(chunk)
+    return fn
+
+def _count(compiler: Compiler, builder: ir.IRBuilder, state: ir.GlobalVariable, field: int, amount: int):
+    if not compiler.stats_enabled:
+        return
+    counter = _field(builder, state, field)
+    builder.store(builder.add(builder.load(counter), _i64(amount)), counter)
+
+def _helper_function(compiler: Compiler, kind: str, pool: Dict[str, Any], ret_type: ir.Type, arg_types: List[ir.Type]) -> ir.Function:
+    fn = ir.Function(compiler.module, ir.FunctionType(ret_type, arg_types), name=f"__fin_pool_{kind}.{pool['type'].name}")
+    fn.linkage = "internal"
+    fn.attributes.add("nounwind")
+    return fn
+
+def _field(builder: ir.IRBuilder, struct_ptr: ir.Value, index: int) -> ir.Value:
+    return builder.gep(struct_ptr, [_i32(0), _i32(index)], inbounds=True)
+
+def _i32(value: int) -> ir.Constant:
+    return ir.Constant(ir.IntType(32), value)
+
+def _i64(value: int) -> ir.Constant:
+    return ir.Constant(I64, value)
+
+# ---------------------------------------------------------------------------
+# <Method name=collect_pool_stats args=[<Compiler>, <ExecutionEngine>]>
+# <Description>
+# Called by runwithjit after 'main' under --stats: reads every pool's
+# counters into 'compiler.pool_stats':
+#   { struct: {slot, reserved, allocations, recycled, live} }
+# </Description>
+def collect_pool_stats(compiler: Compiler, engine):
+    if not compiler.stats_enabled or not compiler.struct_pools:
+        return
+    stats = {}
+    for pool in compiler.struct_pools.values():
+        fields = (ctypes.c_int64 * len(POOL_TYPE.elements)).from_address(
+            engine.get_global_value_address(pool["state"].name)
+        )
+        row = {"slot": pool["slot"]}
+        for offset, kind in enumerate(STAT_FIELDS):
+            row[kind] = fields[RESERVED_FIELD + offset]
+        stats[compiler.demangle_name(pool["type"].name)] = row
+    compiler.pool_stats = stats
+
+# ---------------------------------------------------------------------------
+# <Method name=format_pool_stats args=[<Dict>]>
+# <Description>
+# Renders collect_pool_stats() as a table, busiest pool first.
+# </Description>
+def format_pool_stats(stats: Dict[str, Dict[str, int]]) -> str:
+    lines = [f"{'slot':>6} {'allocs':>10} {'recycled':>10} {'%':>6} {'live':>8} {'reserved':>10}  struct"]
+    for name, row in sorted(stats.items(), key=lambda item: item[1]["allocations"], reverse=True):
+        pct = 100.0 * row["recycled"] / (row["allocations"] or 1)
+        lines.append(f"{row['slot']:6d} {row['allocations']:10d} {row['recycled']:10d} {pct:6.2f} "
+                     f"{row['live']:8d} {row['reserved']:10d}  {name}")
+    return "\n".join(lines)
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_pools args=[<Compiler>]>
+# <Description>
+# Initializes the pooled struct state on the compiler.
+# </Description>
+def setup_pools(compiler: Compiler):
+    compiler.pooled_structs = set() # mangled names of #[pooled] structs
+    compiler.struct_pools = {} # mangled name -> pool (see struct_pool)
+    compiler.pool_stats = None # Filled by collect_pool_stats
@@ -0,0 +1,147 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+
+# ---------------------------------------------------------------------------
+# <Method name=create_block_params args=[<Compiler>, <ir.Block>, <List[ir.Type]>, <List[str]>]>
+# <Description>
+# Block-argument style SSA: gives 'block' one phi per type, placed at the
+# top of the block. Predecessors pass values with branch_with_args.
+# Must be called before anything else is emitted into 'block'.
+# </Description>
+def create_block_params(compiler: Compiler, block: ir.Block, types: List[ir.Type], names: List[str]) -> List[ir.PhiInstr]:
+    builder = ir.IRBuilder(block)
+    builder.position_at_start(block)
+    params = [builder.phi(ty, name=name) for ty, name in zip(types, names)]
+    compiler.ssa_block_params[block] = params
+    return params
+
+# ---------------------------------------------------------------------------
+# <Method name=branch_with_args args=[<Compiler>, <ir.Block>, <List[ir.Value]>]>
+# <Description>
+# Branches to 'target' passing 'args' to its block parameters (adds the
+# current block as an incoming edge of each phi).
+# </Description>
+def branch_with_args(compiler: Compiler, target: ir.Block, args: List[ir.Value]) -> ir.Instruction:
+    params = compiler.ssa_block_params[target]
+    if len(params) != len(args):
+        raise CompilerException(f"Block '{target.name}' takes {len(params)} arguments, got {len(args)}.")
+    for phi, value in zip(params, args):
+        phi.add_incoming(value, compiler.builder.block)
+    return compiler.builder.branch(target)
+
+# ---------------------------------------------------------------------------
+# <Method name=define_ssa_value args=[<Compiler>, <str>, <ir.Value>, <FinType>]>
+# <Description>
+# Binds 'name' directly to an SSA value in the current scope (no stack
+# slot). Identifiers resolve to the value itself (see get_variable), so
+# only use this for names that are never assigned or address-taken
+# (check with is_ssa_safe).
+# </Description>
+def define_ssa_value(compiler: Compiler, name: str, value: ir.Value, fin_type: FinType = None):
+    if fin_type is None:
+        fin_type = compiler.infer_fin_type_from_llvm(value.type)
+    compiler.current_scope.define(name, value, fin_type)
+
+# ---------------------------------------------------------------------------
+# <Method name=is_ssa_scalar args=[<ir.Type>]>
+# <Description>
+# Types that can live in SSA registers without changing how identifiers
+# of that type are compiled (aggregates and pointers keep their slot).
+# </Description>
+def is_ssa_scalar(llvm_type: ir.Type) -> bool:
+    return isinstance(llvm_type, (ir.IntType, ir.FloatType, ir.DoubleType))
+
+# ---------------------------------------------------------------------------
+# <Method name=is_ssa_safe args=[<str>, <Node>...]>
+# <Description>
+# True if no tree in 'trees' assigns 'name' ('=', '+=', ..., '++', '--'),
+# takes its address ('&name', as_ptr(name)), hands it to a macro (which
+# may assign it through an 'ast' parameter) or mentions it in a lambda.
+# Conservative: shadowing declarations are treated as writes.
+# </Description>
+def is_ssa_safe(name: str, *trees) -> bool:
+    return not any(_writes_or_escapes(tree, name) for tree in trees)
+
+def _mentions(node, name: str) -> bool:
+    if isinstance(node, str):
+        return node == name
+    if isinstance(node, (list, tuple)):
+        return any(_mentions(item, name) for item in node)
+    if isinstance(node, dict):
+        return any(_mentions(item, name) for item in node.values())
+    if isinstance(node, Node):
+        return any(_mentions(value, name) for value in vars(node).values())
+    return False
+
+def _writes_or_escapes(node, name: str) -> bool:
+    if isinstance(node, (list, tuple)):
+        return any(_writes_or_escapes(item, name) for item in node)
+    if isinstance(node, dict):
+        return any(_writes_or_escapes(item, name) for item in node.values())
+    if not isinstance(node, Node):
+        return False
+
+    if isinstance(node, Assignment) and node.identifier == name:
+        return True
+    if isinstance(node, PostfixOperator) and node.operand == name:
+        return True
+    if isinstance(node, AddressOfNode) and node.expression == name:
+        return True
+    if isinstance(node, AsPtrNode) and node.expression_ast == name:
+        return True
+    if isinstance(node, VariableDeclaration) and node.identifier == name:
+        return True
+    if isinstance(node, (MacroCall, LambdaNode)) and _mentions(node, name):
+        return True
+    return any(_writes_or_escapes(value, name) for value in vars(node).values())
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_ssa args=[<Compiler>]>
+# <Description>
+# Initializes the SSA builder state on the compiler.
+# </Description>
+def setup_ssa(compiler: Compiler):
+    compiler.ssa_block_params = {} # ir.Block -> [ir.PhiInstr]
@@ -0,0 +1,245 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+from .perfmap import longest_prefix
+
+# Per-function counters recorded during codegen (see count_stat)
+STAT_KINDS = ("bounds_checks", "bounds_checks_elided", "bounds_checks_hoisted",
+              "zero_checks", "boxes", "global_strings", "mono_instances")
+
+# ---------------------------------------------------------------------------
+# <Method name=count_stat args=[<Compiler>, <str>, <int>]>
+# <Description>
+# Records 'amount' occurrences of 'kind' (one of STAT_KINDS) against the
+# function currently being compiled ('<global>' outside functions).
+# No-op unless --stats is on.
+# </Description>
+def count_stat(compiler: Compiler, kind: str, amount: int = 1):
+    if not compiler.stats_enabled:
+        return
+    owner = compiler.function.name if compiler.function is not None else "<global>"
+    counters = compiler.compile_stats.setdefault(owner, {})
+    counters[kind] = counters.get(kind, 0) + amount
+
+# ---------------------------------------------------------------------------
+# <Method name=count_mono_instance args=[<Compiler>, <str>, <str>]>
+# <Description>
+# Records that generic 'generic_name' produced the instance 'inst_name'
+# (function or struct). Instructions of the instance (and, for structs,
+# of its methods) are attributed back to the generic in the report.
+# </Description>
+def count_mono_instance(compiler: Compiler, generic_name: str, inst_name: str):
+    if not compiler.stats_enabled:
+        return
+    count_stat(compiler, "mono_instances")
+    entry = compiler.stats_generics.setdefault(generic_name, {"instances": set(), "symbols": set()})
+    entry["instances"].add(inst_name)
+    entry["symbols"].update((inst_name, compiler.get_mangled_name(inst_name)))
+
+# ---------------------------------------------------------------------------
+# <Method name=stats_mark args=[<Compiler>]>
+# <Description>
+# Returns the current instruction count of the function being compiled,
+# to be passed to count_macro_expansion once the expansion is done.
+# </Description>
+def stats_mark(compiler: Compiler) -> Optional[int]:
+    if not compiler.stats_enabled or compiler.function is None:
+        return None
+    return _count_instructions(compiler.function)
+
+# ---------------------------------------------------------------------------
+# <Method name=count_macro_expansion args=[<Compiler>, <str>, <int>]>
+# <Description>
+# Records one expansion of macro 'name' and the instructions it emitted
+# since 'mark' (from stats_mark).
+# </Description>
+def count_macro_expansion(compiler: Compiler, name: str, mark: Optional[int]):
+    if not compiler.stats_enabled:
+        return
+    row = compiler.stats_macros.setdefault(name, {"expansions": 0, "instructions": 0})
+    row["expansions"] += 1
+    if mark is not None and compiler.function is not None:
+        row["instructions"] += _count_instructions(compiler.function) - mark
+
+def _count_instructions(llvm_function: ir.Function) -> int:
+    return sum(len(block.instructions) for block in llvm_function.blocks)
+
+def _module_of(compiler: Compiler, symbol: str) -> str:
+    prefix = longest_prefix(symbol, compiler.mangled_modules.keys(), "__")
+    return compiler.mangled_modules[prefix] if prefix else "<global>"
+
+# ---------------------------------------------------------------------------
+# <Method name=collect_compile_stats args=[<Compiler>]>
+# <Description>
+# Walks the finished module and combines it with the counters recorded
+# during codegen. Returns:
+#   functions: { llvm_name: {name, module, instructions, allocas, blocks, <STAT_KINDS>} }
+#   modules:   { module: summed function counters + vtables }
+#   generics:  { generic: {instances, instructions} }
+#   macros:    { macro: {expansions, instructions} }
+#   totals:    summed counters over the whole module
+# </Description>
+def collect_compile_stats(compiler: Compiler) -> Dict[str, Any]:
+    functions = {}
+    for fn in compiler.module.functions:
+        if fn.is_declaration:
+            continue
+        row = {
+            "name": compiler.demangle_name(fn.name),
+            "module": _module_of(compiler, fn.name),
+            "instructions": _count_instructions(fn),
+            "allocas": sum(1 for block in fn.blocks for inst in block.instructions
+                           if isinstance(inst, ir.AllocaInstr)),
+            "blocks": len(fn.blocks),
+        }
+        recorded = compiler.compile_stats.get(fn.name, {})
+        for kind in STAT_KINDS:
+            row[kind] = recorded.get(kind, 0)
+        functions[fn.name] = row
+
+    summed = ("instructions", "allocas", "blocks") + STAT_KINDS
+    modules = {}
+    for row in functions.values():
+        module = modules.setdefault(row["module"], dict({k: 0 for k in summed}, functions=0, vtables=0))
+        module["functions"] += 1
+        for key in summed:
+            module[key] += row[key]
+
+    # Globals recorded outside any function (e.g. strings in global initializers)
+    for kind, amount in compiler.compile_stats.get("<global>", {}).items():
+        module = modules.setdefault("<global>", dict({k: 0 for k in summed}, functions=0, vtables=0))
+        module[kind] += amount
+
+    for gv in compiler.module.global_values:
+        if isinstance(gv, ir.GlobalVariable) and gv.name.startswith("vtable_"):
+            struct_symbol = gv.name[len("vtable_"):].split("_for_", 1)[0]
+            module = modules.setdefault(_module_of(compiler, struct_symbol),
+                                        dict({k: 0 for k in summed}, functions=0, vtables=0))
+            module["vtables"] += 1
+
+    # Attribute every function to the generic instance it belongs to (longest symbol wins)
+    owners = {}
+    generics = {}
+    for generic, entry in compiler.stats_generics.items():
+        generics[generic] = {"instances": len(entry["instances"]), "instructions": 0}
+        for symbol in entry["symbols"]:
+            owners[symbol] = generic
+    for llvm_name, row in functions.items():
+        symbol = llvm_name if llvm_name in owners else longest_prefix(llvm_name, owners.keys(), "_")
+        if symbol:
+            generics[owners[symbol]]["instructions"] += row["instructions"]
+
+    totals = {k: sum(m[k] for m in modules.values()) for k in summed + ("functions", "vtables")}
+    return {
+        "functions": functions,
+        "modules": modules,
+        "generics": generics,
+        "macros": dict(compiler.stats_macros),
+        "totals": totals,
+    }
+
+# ---------------------------------------------------------------------------
+# <Method name=format_compile_stats args=[<Dict>, <int>]>
+# <Description>
+# Renders collect_compile_stats() as a bloat report, every table sorted
+# by emitted instructions (largest first).
+# </Description>
+def format_compile_stats(stats: Dict[str, Any], top: int = 25) -> str:
+    lines = []
+    t = stats["totals"]
+    lines.append(
+        f"Totals: {t['functions']} functions, {t['instructions']} instructions, {t['allocas']} allocas, "
+        f"{t['mono_instances']} mono instances, {t['boxes']} boxes, {t['bounds_checks']} bounds checks "
+        f"({t['bounds_checks_hoisted']} hoisted, {t['bounds_checks_elided']} elided), "
+        f"{t['zero_checks']} zero checks, {t['vtables']} vtables, {t['global_strings']} global strings"
+    )
+    total_insts = t["instructions"] or 1
+
+    header = f"{'insts':>8} {'%':>6} {'allocas':>8} {'bounds':>7} {'zero':>6} {'boxes':>6} {'strings':>8}"
+    def columns(row):
+        pct = 100.0 * row["instructions"] / total_insts
+        return (f"{row['instructions']:8d} {pct:6.2f} {row['allocas']:8d} {row['bounds_checks']:7d} "
+                f"{row['zero_checks']:6d} {row['boxes']:6d} {row['global_strings']:8d}")
+
+    lines.append("")
+    lines.append("Modules:")
+    lines.append(f"{header} {'funcs':>6} {'vtables':>8}  module")
+    for name, row in sorted(stats["modules"].items(), key=lambda item: item[1]["instructions"], reverse=True):
+        lines.append(f"{columns(row)} {row['functions']:6d} {row['vtables']:8d}  {name}")
+
+    lines.append("")
+    lines.append(f"Functions (top {top}):")
+    lines.append(f"{header} {'blocks':>7}  function")
+    ranked = sorted(stats["functions"].values(), key=lambda row: row["instructions"], reverse=True)
+    for row in ranked[:top]:
+        lines.append(f"{columns(row)} {row['blocks']:7d}  {row['name']}")
+
+    if stats["generics"]:
+        lines.append("")
+        lines.append("Generics (monomorphized):")
+        lines.append(f"{'insts':>8} {'%':>6} {'instances':>10}  generic")
+        for name, row in sorted(stats["generics"].items(), key=lambda item: item[1]["instructions"], reverse=True):
+            pct = 100.0 * row["instructions"] / total_insts
+            lines.append(f"{row['instructions']:8d} {pct:6.2f} {row['instances']:10d}  {name}")
+
+    if stats["macros"]:
+        lines.append("")
+        lines.append("Macros (expanded):")
+        lines.append(f"{'insts':>8} {'%':>6} {'expansions':>11}  macro")
+        for name, row in sorted(stats["macros"].items(), key=lambda item: item[1]["instructions"], reverse=True):
+            pct = 100.0 * row["instructions"] / total_insts
+            lines.append(f"{row['instructions']:8d} {pct:6.2f} {row['expansions']:11d}  {name}")
+    return "\n".join(lines)
+
+# ---------------------------------------------------------------------------
+# <Method name=setup_stats args=[<Compiler>, <bool>]>
+# <Description>
+# Initializes the compile statistics state on the compiler.
+# </Description>
+def setup_stats(compiler: Compiler, stats: bool):
+    compiler.stats_enabled = stats
+    compiler.compile_stats = {}
+    compiler.stats_generics = {}
+    compiler.stats_macros = {}
@@ -0,0 +1,312 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+from .essentials import *
+from llvmlite import binding
+
+# ---------------------------------------------------------------------------
+# Multiversioning Targets
+# ---------------------------------------------------------------------------
+# Each ISA level maps to:
+#   features : explicit "target-features" for the variant (overrides the
+#              module target machine so host features never leak in)
+#   cpuid    : (leaf, register, bit) requirements checked at load time.
+#              register: 0=eax, 1=ebx, 2=ecx, 3=edx
+#              leaf: 1, 7 or EXTENDED_LEAF (LZCNT is only reported there)
+#   xcr0     : OS-enabled register state mask (XGETBV) required, 0 = none
+EXTENDED_LEAF = 0x80000001
+MULTIVERSION_TARGETS = {
+    "x86-64-v2": {
+        "features": "+sse3,+ssse3,+sse4.1,+sse4.2,+popcnt,+cx16",
+        "cpuid": [(1, 2, 0), (1, 2, 9), (1, 2, 19), (1, 2, 20), (1, 2, 23), (1, 2, 13)],
+        "xcr0": 0,
+    },
+    "x86-64-v3": {
+        "features": "+sse3,+ssse3,+sse4.1,+sse4.2,+popcnt,+cx16,"
+                    "+avx,+avx2,+bmi,+bmi2,+fma,+f16c,+lzcnt,+movbe,+xsave",
+        "cpuid": [(1, 2, 20), (1, 2, 23), (1, 2, 28), (1, 2, 12), (1, 2, 29), (1, 2, 22),
+                  (7, 1, 3), (7, 1, 5), (7, 1, 8), (EXTENDED_LEAF, 2, 5)],
+        "xcr0": 0x6,
+    },
+    "x86-64-v4": {
+        "features": "+sse3,+ssse3,+sse4.1,+sse4.2,+popcnt,+cx16,"
+                    "+avx,+avx2,+bmi,+bmi2,+fma,+f16c,+lzcnt,+movbe,+xsave,"
+                    "+avx512f,+avx512dq,+avx512cd,+avx512bw,+avx512vl",
+        "cpuid": [(1, 2, 28), (1, 2, 12), (7, 1, 5), (7, 1, 8), (EXTENDED_LEAF, 2, 5),
+                  (7, 1, 16), (7, 1, 17), (7, 1, 28), (7, 1, 30), (7, 1, 31)],
+        "xcr0": 0xE6,
+    },
+}
+
+# Dispatch priority (lowest first, the last supported level wins)
+MULTIVERSION_ORDER = ["x86-64-v2", "x86-64-v3", "x86-64-v4"]
+
+# The '.default' variant runs wherever no level is supported, so it is
+# pinned to the x86-64 baseline instead of the module target machine
+# (which is the build host by default).
+MULTIVERSION_DEFAULT_CPU = "x86-64"
+MULTIVERSION_DEFAULT_FEATURES = "+cx8,+fxsr,+mmx,+sse,+sse2,+x87"
+
+# ---------------------------------------------------------------------------
+# <Method name=resolve_host_target args=[<str>, <str>]>
+# <Description>
+# Resolves the CPU name and feature string for the target machine.
+# - None / "host": Detected from the running machine.
+# - "generic": LLVM's baseline for the triple (portable AOT builds).
+# Host feature detection is not available on every platform, in which
+# case we fall back to the CPU's implied features.
+# </Description>
+def resolve_host_target(cpu: Optional[str] = None, features: Optional[str] = None) -> Tuple[str, str]:
+    if cpu is None or cpu == "host":
+        cpu = binding.get_host_cpu_name()
+        if features is None:
+            try:
+                features = binding.get_host_cpu_features().flatten()
+            except RuntimeError:
+                features = ""
+    return cpu, features or ""
+
+# ---------------------------------------------------------------------------
+# <Method name=set_target_attributes args=[<ir.Function>, <str>, <str>]>
+# <Description>
+# Attaches the "target-cpu" / "target-features" string attributes to a
+# function. llvmlite only knows enum attributes, so we bypass its
+# whitelist and store the raw string attribute.
+# </Description>
+def set_target_attributes(llvm_function: ir.Function, cpu: str, features: str = None):
+    set.add(llvm_function.attributes, f'"target-cpu"="{cpu}"')
+    if features:
+        set.add(llvm_function.attributes, f'"target-features"="{features}"')
+
+# ---------------------------------------------------------------------------
+# <Method name=supports_multiversion args=[<Compiler>]>
+# <Description>
+# Load-time dispatch relies on CPUID, so only x86-64 targets are supported.
+# </Description>
+def supports_multiversion(compiler: Compiler) -> bool:
+    return compiler.target_triple.startswith(("x86_64", "amd64"))
+
+# ---------------------------------------------------------------------------
+# <Method name=_parse_multiversion_targets args=[<Compiler>, <FunctionDeclaration>]>
+# <Description>
+# Reads the ISA levels requested by the attribute:
+#   #[multiversion]                           -> all known levels
+#   #[multiversion="x86-64-v3,x86-64-v4"]
+#   #[multiversion("x86-64-v3", "x86-64-v4")]
+# </Description>
+def _parse_multiversion_targets(compiler: Compiler, ast: FunctionDeclaration) -> List[str]:
+    value = ast.get_attr("multiversion")
+
+    if value is True:
+        requested = list(MULTIVERSION_ORDER)
+    elif isinstance(value, str):
+        requested = [v.strip() for v in value.split(",") if v.strip()]
+    elif isinstance(value, list):
+        requested = [getattr(v, "value", v) for v in value]
+    else:
+        requested = []
+
+    for level in requested:
+        if level not in MULTIVERSION_TARGETS:
+            compiler.errors.error(
+                ast, f"Unknown multiversion target '{level}'.",
+                hint=f"Supported targets: {', '.join(MULTIVERSION_ORDER)}"
+            )
+
+    if not requested:
+        compiler.errors.error(ast, "#[multiversion] requires at least one target.")
+
+    return [level for level in MULTIVERSION_ORDER if level in requested]
+
+# ---------------------------------------------------------------------------
+# <Method name=_get_cpu_supports_fn args=[<Compiler>, <str>]>
+# <Description>
+# Returns (creating once per module) 'i1 __fin_cpu_supports.<level>()'.
+# 1. CPUID leaf 0 gives the highest basic leaf (leaf 7 may not exist),
+#    leaf 0x80000000 the highest extended one.
+# 2. Every (leaf, reg, bit) requirement is AND-ed together.
+# 3. For AVX levels, XGETBV confirms the OS saves the wide registers.
+#    XGETBV faults without OSXSAVE, so it is executed behind a branch.
+# </Description>
+def _get_cpu_supports_fn(compiler: Compiler, level: str) -> ir.Function:
+    name = f"__fin_cpu_supports.{level}"
+    try:
+        return compiler.module.get_global(name)
+    except KeyError:
+        pass
+
+    i1, i32 = ir.IntType(1), ir.IntType(32)
+    spec = MULTIVERSION_TARGETS[level]
+
+    fn = ir.Function(compiler.module, ir.FunctionType(i1, []), name=name)
+    fn.linkage = "internal"
+    builder = ir.IRBuilder(fn.append_basic_block("entry"))
+
+    cpuid_ty = ir.FunctionType(ir.LiteralStructType([i32, i32, i32, i32]), [i32, i32])
+    def cpuid(leaf):
+        regs = builder.asm(cpuid_ty, "cpuid", "={ax},={bx},={cx},={dx},{ax},{cx}",
+                           [_u32(leaf), ir.Constant(i32, 0)], True, name=f"cpuid_{leaf:x}")
+        return [builder.extract_value(regs, r) for r in range(4)]
+
+    def guarded_cpuid(leaf, max_leaf): # Zeros when 'leaf' is beyond 'max_leaf'
+        has_leaf = builder.icmp_unsigned(">=", max_leaf, _u32(leaf))
+        return [builder.select(has_leaf, r, ir.Constant(i32, 0)) for r in cpuid(leaf)]
+
+    leaves = {1: cpuid(1), 7: guarded_cpuid(7, cpuid(0)[0])}
+    if any(leaf == EXTENDED_LEAF for leaf, _, _ in spec["cpuid"]):
+        leaves[EXTENDED_LEAF] = guarded_cpuid(EXTENDED_LEAF, cpuid(EXTENDED_LEAF - 1)[0])
+
+    ok = ir.Constant(i1, 1)
+    for leaf, reg, bit in spec["cpuid"]:
+        mask = ir.Constant(i32, 1 << bit)
+        has_bit = builder.icmp_unsigned("==", builder.and_(leaves[leaf][reg], mask), mask)
+        ok = builder.and_(ok, has_bit)
+
+    if spec["xcr0"]:
+        # OSXSAVE (leaf 1, ecx bit 27)
+        osxsave_mask = ir.Constant(i32, 1 << 27)
+        osxsave = builder.icmp_unsigned("==", builder.and_(leaves[1][2], osxsave_mask), osxsave_mask)
+
+        xgetbv_block = fn.append_basic_block("xgetbv")
+        done_block = fn.append_basic_block("done")
+        entry_block = builder.block
+        builder.cbranch(osxsave, xgetbv_block, done_block)
+
+        builder.position_at_end(xgetbv_block)
+        xgetbv_ty = ir.FunctionType(ir.LiteralStructType([i32, i32]), [i32])
+        xcr0 = builder.extract_value(
+            builder.asm(xgetbv_ty, "xgetbv", "={ax},={dx},{cx}", [ir.Constant(i32, 0)], True, name="xcr0"), 0
+        )
+        xcr0_mask = ir.Constant(i32, spec["xcr0"])
+        os_ok = builder.icmp_unsigned("==", builder.and_(xcr0, xcr0_mask), xcr0_mask)
+        builder.branch(done_block)
+
+        builder.position_at_end(done_block)
+        phi = builder.phi(i1, name="os_saves_state")
+        phi.add_incoming(ir.Constant(i1, 0), entry_block)
+        phi.add_incoming(os_ok, xgetbv_block)
+        ok = builder.and_(ok, phi)
+
+    builder.ret(ok)
+    return fn
+
+def _u32(value: int) -> ir.Constant:
+    # CPUID leaves above 0x7fffffff, as the i32 with the same bits
+    return ir.Constant(ir.IntType(32), value - (1 << 32) if value >= 1 << 31 else value)
+
+# ---------------------------------------------------------------------------
+# <Method name=compile_multiversion_function args=[<Compiler>, <FunctionDeclaration>, <ir.Function>, <Callable>]>
+# <Description>
+# Compiles a #[multiversion] function.
+# 1. The body is compiled once per ISA level into '<name>.<level>' (internal)
+#    plus a baseline '<name>.default' (see MULTIVERSION_DEFAULT_CPU).
+# 2. '<name>.dispatch' holds the selected implementation. It starts at the
+#    default variant so calls made before constructors run stay valid.
+# 3. '<name>.resolve' picks the best supported level and is registered as
+#    a global constructor (load-time dispatch, no per-call CPUID).
+# 4. The public symbol becomes a tail-calling trampoline through the slot,
+#    so callers and function pointers are unaffected.
+# 'compile_body(fn)' emits the function body into 'fn'.
+# </Description>
+def compile_multiversion_function(compiler: Compiler, ast: FunctionDeclaration, llvm_function: ir.Function, compile_body):
+    if not supports_multiversion(compiler):
+        # Other targets just get the regular single version.
+        compile_body(llvm_function)
+        return
+
+    if ast.is_vararg:
+        compiler.errors.error(ast, f"#[multiversion] cannot be applied to variadic function '{ast.name}'.")
+
+    levels = _parse_multiversion_targets(compiler, ast)
+    func_ty = llvm_function.function_type
+    base_name = llvm_function.name
+
+    # 1. Variants
+    def build_variant(suffix):
+        variant = ir.Function(compiler.module, func_ty, name=f"{base_name}.{suffix}")
+        variant.linkage = "internal"
+        for source, arg in zip(llvm_function.args, variant.args): # Same ABI (sret/byval, see abi.py)
+            for attr in source.attributes:
+                arg.add_attribute(attr)
+            arg.attributes.align = source.attributes.align
+            arg.attributes.dereferenceable = source.attributes.dereferenceable
+        compiler.enter_scope()
+        compile_body(variant)
+        compiler.exit_scope()
+        return variant
+
+    default_variant = build_variant("default")
+    set_target_attributes(default_variant, MULTIVERSION_DEFAULT_CPU, MULTIVERSION_DEFAULT_FEATURES)
+    variants = {}
+    for level in levels:
+        variants[level] = build_variant(level)
+        set_target_attributes(variants[level], level, MULTIVERSION_TARGETS[level]["features"])
+
+    # 2. Dispatch Slot
+    fn_ptr_ty = func_ty.as_pointer()
+    slot = ir.GlobalVariable(compiler.module, fn_ptr_ty, name=f"{base_name}.dispatch")
+    slot.linkage = "internal"
+    slot.initializer = default_variant
+
+    # 3. Resolver
+    resolver = ir.Function(compiler.module, ir.FunctionType(ir.VoidType(), []), name=f"{base_name}.resolve")
+    resolver.linkage = "internal"
+    builder = ir.IRBuilder(resolver.append_basic_block("entry"))
+    selected = default_variant
+    for level in levels:
+        supported = builder.call(_get_cpu_supports_fn(compiler, level), [], name=f"has_{level.replace('-', '_')}")
+        selected = builder.select(supported, variants[level], selected)
+    builder.store(selected, slot)
+    builder.ret_void()
+    compiler.register_global_ctor(resolver)
+
+    # 4. Trampoline
+    builder = ir.IRBuilder(llvm_function.append_basic_block("entry"))
+    target = builder.load(slot, name="impl")
+    result = builder.call(target, list(llvm_function.args), tail=True,
+                          arg_attrs=compiler.call_site_attributes(llvm_function))
+    if isinstance(func_ty.return_type, ir.VoidType):
+        builder.ret_void()
+    else:
+        builder.ret(result)
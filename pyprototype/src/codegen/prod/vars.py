@@ -76,6 +76,14 @@ def _compile_local_variable(compiler: Compiler, ast: VariableDeclaration):
     initial_val_llvm = None
     init_fin_type = None
     
+    # Constructor call into a variable of that struct type: construct in place
+    ctor = _constructor_for(compiler, declared_type, init_expr)
+    if ctor is not None:
+        args = [compiler.compile(a) for a in init_expr.params] # Before 'name' is in scope
+        var_ptr = compiler.create_variable_mut(name, declared_type)
+        compiler.emit_constructor_call(ctor, args, var_ptr)
+        return
+
     if init_expr:
         initial_val_llvm = compiler.compile(init_expr)
         # Resolve precise type from AST
@@ -98,6 +106,15 @@ def _compile_local_variable(compiler: Compiler, ast: VariableDeclaration):
     # including Boxing, Coercion, and Scope.
     compiler.create_variable_mut(name, type_arg, initial_val_llvm, init_fin_type)
 
+def _constructor_for(compiler: Compiler, declared_type, init_expr) -> Optional[ir.Function]:
+    # 'let x <S> = S(...)' -> constructor of S, else None
+    if declared_type == "auto" or not isinstance(init_expr, FunctionCall) or not isinstance(init_expr.call_name, str):
+        return None
+    ctor = compiler.resolve_constructor(init_expr.call_name)
+    if ctor is None or ctor.function_type.args[0].pointee != compiler.convert_type(declared_type):
+        return None
+    return ctor
+
 # ---------------------------------------------------------------------------
 # <Method name=_compile_global_variable args=[<Compiler>, <VariableDeclaration>]>
 # <Description>
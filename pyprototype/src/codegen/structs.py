@@ -45,6 +45,40 @@
 from .essentials import *
 
 
+_SCOUT_PRIMITIVES = {"int", "long", "float", "double", "bool", "string", "char"}
+
+# ---------------------------------------------------------------------------
+# <Method name=scout_struct_layout args=[<Compiler>, <AstNode<StructDeclaration>>]>
+# <Description>
+# Scouting pass: sets the body of the (opaque) type of a plain struct
+# (no generics, no parents) whose fields are primitives, pointers or
+# already laid out structs, so prototypes declared in the same pass see
+# its size and pass it by reference if big (see abi.py).
+# Anything else stays opaque until compile_struct lays it out.
+# </Description>
+def scout_struct_layout(compiler: Compiler, ast: StructDeclaration):
+    if ast.generic_params or ast.parents:
+        return
+    struct_ty = compiler.struct_types.get(compiler.get_mangled_name(ast.name))
+    if not isinstance(struct_ty, ir.IdentifiedStructType) or not struct_ty.is_opaque:
+        return
+    member_types = [_scout_field_type(compiler, member.var_type, by_value=True) for member in ast.members]
+    if member_types and None not in member_types:
+        struct_ty.set_body(*member_types)
+
+def _scout_field_type(compiler: Compiler, type_node: Any, by_value: bool) -> Optional[ir.Type]:
+    if isinstance(type_node, PointerTypeNode):
+        pointee = _scout_field_type(compiler, type_node.pointee_type, by_value=False)
+        return pointee.as_pointer() if pointee is not None else None
+    if not isinstance(type_node, str):
+        return None
+    if type_node in _SCOUT_PRIMITIVES:
+        return compiler.convert_type(type_node)
+    struct_ty = compiler.struct_types.get(compiler.get_mangled_name(type_node))
+    if not isinstance(struct_ty, ir.IdentifiedStructType) or (by_value and struct_ty.is_opaque):
+        return None
+    return struct_ty
+
 # --------------------------------------------------------------------------- M1778, https://github.com/M1778M/
 # <Method name=compile_struct args=[<Compiler>, <AstNode<StructDeclaration>>]>
 # <Description>
@@ -98,12 +132,12 @@ def compile_struct(compiler: Compiler, ast: StructDeclaration):
     # Check if already defined (or Opaque from Scouting Pass)
     if mangled_name in compiler.struct_types:
         struct_ty = compiler.struct_types[mangled_name]
-        if not struct_ty.is_opaque:
+        if mangled_name in compiler.struct_field_indices: # (a scouted layout is not a declaration)
              compiler.exit_scope()
              compiler.errors.error(ast, f"Struct '{name}' (internal: {mangled_name}) already declared.")
              return
     else:
-        struct_ty = ir.global_context.get_identified_type(mangled_name)
+        struct_ty = compiler.context.get_identified_type(mangled_name)
         compiler.struct_types[mangled_name] = struct_ty 
     
     # Save Context
@@ -184,16 +218,22 @@ def compile_struct(compiler: Compiler, ast: StructDeclaration):
         else:
             field_types_map[member.identifier] = "unknown"
 
-    struct_ty.set_body(*final_member_types)
+    if struct_ty.is_opaque: # Else laid out by scout_struct_layout, to the same body
+        struct_ty.set_body(*final_member_types)
 
     compiler.struct_field_indices[mangled_name] = final_field_indices
     compiler.struct_field_defaults[mangled_name] = final_field_defaults
     compiler.struct_field_visibility[mangled_name] = final_field_visibility
     compiler.struct_origins[mangled_name] = compiler.current_file_path
     compiler.struct_methods[name] = ast.methods
+    if ast.get_attr("pooled"): # #[pooled]: 'new' / 'delete' go through a slab of its own
+        compiler.pooled_structs.add(mangled_name)
     compiler.struct_field_types_registry[name] = field_types_map
 
     # --- PASS 2: Compile Behavior ---
+    # #[unchecked] on the struct covers its operators, constructor, destructor and methods
+    previous_unchecked = compiler.bounds_unchecked
+    compiler.bounds_unchecked = bool(ast.get_attr("unchecked"))
     compiler.struct_operators[mangled_name] = {}
     for op_decl in ast.operators:
         compiler.compile_operator(name, mangled_name, struct_ty, op_decl)
@@ -219,6 +259,7 @@ def compile_struct(compiler: Compiler, ast: StructDeclaration):
         compiler.compile_struct_method(mangled_name, struct_ty, method)
         
     # Restore Context
+    compiler.bounds_unchecked = previous_unchecked
     compiler.current_struct_name = previous_struct_name
     compiler.current_struct_type = previous_struct_type
     compiler.current_struct_ast_name = previous_struct_ast_name
@@ -284,13 +325,17 @@ def compile_struct_method(compiler: Compiler,
     method_llvm_func = ir.Function(compiler.module, llvm_fn_type, name=mangled_fn_name)
     
     # Save state
-    perv_function = compiler.current_function
+    perv_function = compiler.function
     perv_builder = compiler.builder
+    perv_unchecked = compiler.bounds_unchecked
     compiler.function = method_llvm_func
+    compiler.bounds_unchecked = perv_unchecked or bool(method_ast.get_attr("unchecked"))
     
     # Create entry block
     entry_block = method_llvm_func.append_basic_block(name='entry')
     compiler.builder = ir.IRBuilder(entry_block) # New builder for this function
+    compiler.emit_profiled_entry(method_llvm_func)
+    compiler.emit_instrument_prologue(method_llvm_func)
     
     # Bind arguments to names in scope
     arg_offset = 0
@@ -354,9 +399,15 @@ def compile_struct_method(compiler: Compiler,
             )
             compiler.builder.unreachable()
     
+    compiler.emit_instrument_epilogue(method_llvm_func)
+    
+    # The method's own slots end with it (no lifetime.end in the caller's builder)
+    compiler.current_scope.lifetime_slots.clear()
+    
     # Restore previous state ( just realized i named them pervs)
     compiler.function = perv_function
     compiler.builder = perv_builder
+    compiler.bounds_unchecked = perv_unchecked
     
     # Exit method scope
     compiler.exit_scope()
@@ -533,8 +584,7 @@ def compile_struct_instantiation(compiler: Compiler,node:StructInstantiation):
 # Logic Flow:
 # 1. Allocates stack memory for the struct instance.
 # 2. Processes field assignments from the AST node.
-# 3. Iterates over all fields, calculating pointers and determining values to store.
-# 4. Handles type erasure and boxing for generic fields.
+# 3. Initializes the fields (see init_struct_fields).
 # </Description>
 def allocate_and_init_struct(compiler: Compiler,
     struct_type: ir.IdentifiedStructType,
@@ -547,7 +597,7 @@ def allocate_and_init_struct(compiler: Compiler,
     struct_name = mangled_name # For clarity
     
     # 1. Allocate (Stack) Memory for Struct Instance
-    struct_ptr = compiler.builder.alloca(struct_type, name=f"{struct_name}_inst")
+    struct_ptr = compiler.create_entry_alloca(struct_type, name=f"{struct_name}_inst")
     if DEBUG: print(f"[DEBUG STRUCT INSTANTIATION] Allocated memory for struct '{struct_name}'") # Debug
     
     # 2. Process Field Assignments
@@ -556,69 +606,195 @@ def allocate_and_init_struct(compiler: Compiler,
         for assignment in node.field_assignments: # AstNode<FieldAssignment>
             provided_assignments[assignment.identifier] = assignment.value # Store AST node
     
-    # 3. Iterate ALL fields
+    # 3. Initialize ALL fields
+    compiler.init_struct_fields(struct_ptr, struct_type, mangled_name, field_indices, defaults_map, provided_assignments, node)
+    if DEBUG: print(f"[DEBUG STRUCT INSTANTIATION] Initialized fields for struct '{struct_name}'") # Debug  
+    return struct_ptr
+
+# --------------------------------------------------------------------------- M1778,
+# <Method name=init_struct_fields args=[<Compiler>, <ir.Value>, <ir.IdentifiedStructType>, <str>, <dict>, <dict>, <dict>, <AstNode>]>
+# <Description>
+# Initializes every field of the struct at 'struct_ptr'.
+# Logic Flow:
+# 1. Stores the struct's constant template (zero values and constant
+#    defaults, see struct_init_template) in one go: an aggregate store for
+#    small structs, a memcpy from a constant global for large ones.
+# 2. Stores the explicitly assigned fields.
+# 3. Stores the defaults that are not constants, compiled per instance.
+# </Description>
+def init_struct_fields(compiler: Compiler,
+    struct_ptr: ir.Value,
+    struct_type: ir.IdentifiedStructType,
+    mangled_name: str,
+    field_indices: dict,
+    defaults_map: dict,
+    provided_assignments: dict,
+    node: Node,
+    ):
+    """ Initializes the fields of the struct at 'struct_ptr' (template + overrides)."""
+    template, dynamic_defaults, source = compiler.struct_init_template(struct_type, mangled_name, field_indices, defaults_map)
+    
+    # 1. Constant Template
+    if len(provided_assignments) + len(dynamic_defaults) < len(field_indices) or \
+        len(field_indices) < len(struct_type.elements): # Some field comes from the template
+        if source is None: # Small: one aggregate store
+            compiler.builder.store(template, struct_ptr)
+        else: # Large: copy from the constant global
+            i8_ptr = ir.IntType(8).as_pointer()
+            memcpy = compiler.module.declare_intrinsic("llvm.memcpy", [i8_ptr, i8_ptr, ir.IntType(64)])
+            compiler.builder.call(memcpy, [
+                compiler.builder.bitcast(struct_ptr, i8_ptr),
+                compiler.builder.bitcast(source, i8_ptr),
+                _struct_size(compiler, struct_type),
+                ir.Constant(ir.IntType(1), 0),
+            ])
+    
+    # 2 & 3. Overridden and Non-Constant Fields
     for field_name, idx in field_indices.items(): # Iterate fields
+        # Case A: Explicitly Assigned
+        if field_name in provided_assignments:
+            value_to_store = compiler.compile(provided_assignments[field_name])
+        
+        # Case B: Default Value (not a constant)
+        elif field_name in dynamic_defaults:
+            value_to_store = compiler.compile(defaults_map[field_name])
+        
+        # Case C: Constant Default or Zero Init (already in the template)
+        else:
+            continue
+        
         # Calculate pointer to this field
         zero = ir.Constant(ir.IntType(32), 0) # for GEP
         idx_val = ir.Constant(ir.IntType(32), idx) # field index
         fld_ptr = compiler.builder.gep(struct_ptr, [zero, idx_val], inbounds=True) # Get field pointer
         
-        value_to_store = None
-        
-        # Case A: Explicitly Assigned
-        if field_name in provided_assignments:
-            value_to_store = compiler.compile(provided_assignments[field_name])
-            
-        # Case B: Default Value
-        elif field_name in defaults_map:
-            value_to_store = compiler.compile(defaults_map[field_name])
+        value_to_store = _coerce_field_value(compiler, value_to_store, struct_type.elements[idx], field_name, mangled_name, node)
+        compiler.store_value(value_to_store, fld_ptr)
 
-        # Case C: No Assignment or Default (Zero Init)
+# --------------------------------------------------------------------------- M1778,
+# <Method name=struct_init_template args=[<Compiler>, <ir.IdentifiedStructType>, <str>, <dict>, <dict>]>
+# <Description>
+# Computes, once per struct type, the constant initializer of an instance:
+# zero for fields without a default, the value of constant (literal)
+# defaults. Other defaults are left to init_struct_fields.
+# Returns (template, names of non-constant defaults, constant global holding
+# the template for large structs or None).
+# </Description>
+def struct_init_template(compiler: Compiler,
+    struct_type: ir.IdentifiedStructType,
+    mangled_name: str,
+    field_indices: dict,
+    defaults_map: dict,
+    ) -> Tuple[ir.Constant, Set[str], Optional[ir.GlobalVariable]]:
+    cached = compiler.struct_init_templates.get(mangled_name)
+    if cached is not None and cached[0].type is struct_type: # Already computed
+        return cached
+    
+    values = [ir.Constant(field_type, None) for field_type in struct_type.elements] # Zero init
+    dynamic_defaults = set() # Defaults compiled per instance
+    for field_name, idx in field_indices.items():
+        if field_name not in defaults_map: # Zero init
+            continue
+        value = _constant_default(compiler, defaults_map[field_name], struct_type.elements[idx])
+        if value is None: # Not a constant
+            dynamic_defaults.add(field_name)
         else:
-            field_type = struct_type.elements[idx]
-            value_to_store = ir.Constant(field_type, None) # Default zero/init value
-        
-        # ------ TYPE ERASURE & BOXING LOGIC ------- / super important
-        expected_type = struct_type.elements[idx]
-        # Check if the field is a Generic Slot (i8*) but the value is NOT i8*
-        # (e.g., assigning an int to a generic field like [int to T])
-        is_generic_slot = (expected_type == ir.IntType(8).as_pointer())
-        is_value_generic = (value_to_store.type == ir.IntType(8).as_pointer())
-        
-        if is_generic_slot and not is_value_generic:
-            # Box the value into i8*
-            # Infer the FinType so box_value knows it should malloc or bitcast
-            value_fin_type = compiler.infer_fin_type_from_llvm(value_to_store.type)
-            value_to_store = compiler.box_value(value_to_store, value_fin_type)
-        
-        # ----- Standard Coercion Logic -----
-        # Handle Int (i32) -> Bool (i1)
-        if isinstance(expected_type, ir.IntType) and expected_type.width == 1 and \
-            isinstance(value_to_store.type, ir.IntType) and value_to_store.type.width > 1:
-            value_to_store = compiler.builder.trunc(value_to_store, expected_type, name="bool_trunc")
-            
-        # Handle char (i8) vs string literal (i8*) mismatch
-        if isinstance(expected_type, ir.IntType) and expected_type.width == 8:
-            if isinstance(value_to_store.type, ir.PointerType) and value_to_store.type.pointee == ir.IntType(8):
-                    value_to_store = compiler.builder.load(value_to_store, name=f"{field_name}_char_load")
-
-        # Handle Int -> Float coercion
-        if value_to_store.type != expected_type:
-            if isinstance(expected_type, ir.FloatType) and isinstance(value_to_store.type, ir.IntType):
-                value_to_store = compiler.builder.sitofp(value_to_store, expected_type, name="default_conv")
-            elif isinstance(expected_type, ir.PointerType) and isinstance(value_to_store.type, ir.PointerType):
-                    value_to_store = compiler.builder.bitcast(value_to_store, expected_type)
+            values[idx] = value
+    template = ir.Constant(struct_type, values)
+    
+    source = None
+    if len(struct_type.elements) > INLINE_TEMPLATE_FIELDS: # Too big for one store: memcpy it
+        source = ir.GlobalVariable(compiler.module, struct_type, name=compiler.module.get_unique_name(f".init.{mangled_name}"))
+        source.linkage = "private"
+        source.global_constant = True
+        source.unnamed_addr = True
+        source.initializer = template
+    
+    compiler.struct_init_templates[mangled_name] = (template, dynamic_defaults, source)
+    return compiler.struct_init_templates[mangled_name]
+
+# Structs with more fields than this are initialized with a memcpy
+INLINE_TEMPLATE_FIELDS = 8
+
+def _constant_default(compiler: Compiler, default: Node, expected_type: ir.Type) -> Optional[ir.Constant]:
+    # Literals and negated numeric literals only: anything else may emit code
+    if isinstance(default, UnaryOperator) and default.operator == "-" and \
+        isinstance(default.operand, Literal) and type(default.operand.value) in (int, float):
+        value = compiler.compile(default.operand)
+        value = ir.Constant(value.type, -value.constant)
+    elif isinstance(default, Literal):
+        value = compiler.compile(default)
+    else:
+        return None
+    if not isinstance(value, ir.Constant):
+        return None
+    
+    # Same coercions as _coerce_field_value, folded
+    if value.type == expected_type:
+        return value
+    if expected_type == ir.IntType(8).as_pointer():
+        return None # Generic slot: boxed per instance
+    if isinstance(expected_type, ir.IntType) and expected_type.width == 1 and \
+        isinstance(value.type, ir.IntType): # Int -> Bool
+        return ir.Constant(expected_type, value.constant & 1)
+    if isinstance(expected_type, ir.FloatType) and isinstance(value.type, ir.IntType): # Int -> Float
+        return ir.Constant(expected_type, float(value.constant))
+    if isinstance(expected_type, ir.IntType) and isinstance(value.type, ir.IntType) and \
+        isinstance(value.constant, int): # Int width (e.g. literal -> <long>)
+        return ir.Constant(expected_type, value.constant)
+    if isinstance(expected_type, ir.PointerType) and isinstance(value.type, ir.PointerType):
+        return value.bitcast(expected_type)
+    return None # Mismatch: reported by _coerce_field_value
+
+def _coerce_field_value(compiler: Compiler, value_to_store: ir.Value, expected_type: ir.Type, field_name: str, struct_name: str, node: Node) -> ir.Value:
+    # ------ TYPE ERASURE & BOXING LOGIC ------- / super important
+    # Check if the field is a Generic Slot (i8*) but the value is NOT i8*
+    # (e.g., assigning an int to a generic field like [int to T])
+    is_generic_slot = (expected_type == ir.IntType(8).as_pointer())
+    is_value_generic = (value_to_store.type == ir.IntType(8).as_pointer())
+    
+    if is_generic_slot and not is_value_generic:
+        # Box the value into i8*
+        # Infer the FinType so box_value knows it should malloc or bitcast
+        value_fin_type = compiler.infer_fin_type_from_llvm(value_to_store.type)
+        value_to_store = compiler.box_value(value_to_store, value_fin_type)
+    
+    # ----- Standard Coercion Logic -----
+    # Handle Int (i32) -> Bool (i1)
+    if isinstance(expected_type, ir.IntType) and expected_type.width == 1 and \
+        isinstance(value_to_store.type, ir.IntType) and value_to_store.type.width > 1:
+        value_to_store = compiler.builder.trunc(value_to_store, expected_type, name="bool_trunc")
+        
+    # Handle char (i8) vs string literal (i8*) mismatch
+    if isinstance(expected_type, ir.IntType) and expected_type.width == 8:
+        if isinstance(value_to_store.type, ir.PointerType) and value_to_store.type.pointee == ir.IntType(8):
+                value_to_store = compiler.builder.load(value_to_store, name=f"{field_name}_char_load")
+
+    # Handle Int -> Float coercion
+    if value_to_store.type != expected_type:
+        if isinstance(expected_type, ir.FloatType) and isinstance(value_to_store.type, ir.IntType):
+            value_to_store = compiler.builder.sitofp(value_to_store, expected_type, name="default_conv")
+        elif isinstance(expected_type, ir.PointerType) and isinstance(value_to_store.type, ir.PointerType):
+                value_to_store = compiler.builder.bitcast(value_to_store, expected_type)
+        # Handle Int width mismatch (e.g. an <int> expression into a <long> field)
+        elif isinstance(expected_type, ir.IntType) and isinstance(value_to_store.type, ir.IntType):
+            if expected_type.width > value_to_store.type.width:
+                value_to_store = compiler.builder.sext(value_to_store, expected_type, name=f"{field_name}_sext")
             else:
-                compiler.errors.error(
-                    node,
-                    f"Type mismatch for field '{field_name}' in struct '{struct_name}'. "
-                    f"Expected {expected_type}, got {value_to_store.type}",
-                    hint="Ensure the assigned value matches the field's type."
-                )
-        
-        compiler.builder.store(value_to_store, fld_ptr)
-    if DEBUG: print(f"[DEBUG STRUCT INSTANTIATION] Initialized fields for struct '{struct_name}'") # Debug  
-    return struct_ptr
+                value_to_store = compiler.builder.trunc(value_to_store, expected_type, name=f"{field_name}_trunc")
+        else:
+            compiler.errors.error(
+                node,
+                f"Type mismatch for field '{field_name}' in struct '{struct_name}'. "
+                f"Expected {expected_type}, got {value_to_store.type}",
+                hint="Ensure the assigned value matches the field's type."
+            )
+    return value_to_store
+
+def _struct_size(compiler: Compiler, struct_type: ir.Type) -> ir.Constant:
+    if compiler.data_layout_obj:
+        return ir.Constant(ir.IntType(64), compiler.abi_size(struct_type))
+    return ir.Constant(struct_type.as_pointer(), None).gep([ir.Constant(ir.IntType(32), 1)]).ptrtoint(ir.IntType(64))
 
 # --------------------------------------------------------------------------- M1778,
 # <Method name=compile_member_access args=[<Compiler>, <AstNode<MemberAccess>>]>
@@ -686,11 +862,10 @@ def compile_member_access(compiler: Compiler, node: MemberAccess, want_pointer:
         
         # SpecialCase: __init access (super constructor)
         if node.member_name == "__init": # Accessing super constructor
-            ctor_name = f"{mangled_parent}__init" # Constructor mangled name
-            try:# Try to get constructor function
-                return compiler.module.get_global(ctor_name)# Return the constructor function
-            except KeyError:# Constructor not found
+            ctor = compiler.resolve_constructor(parent_name) # Parent's constructor function
+            if ctor is None: # Constructor not found
                 return ir.Constant(ir.IntType(8).as_pointer(), None)# Return null pointer for constructor
+            return ctor # Return the constructor function
         
         # Check Methods
         if parent_name in compiler.struct_methods:
@@ -787,31 +962,30 @@ def compile_member_access(compiler: Compiler, node: MemberAccess, want_pointer:
             
             # Fall through to standard struct access logic below
     
-    # 4. Handle Array Length (Collection Length)
-    # Check if lhs_val is a pointer to { T*, len }
+    # 4. Handle Array Length / Capacity (Collection)
+    # Check if lhs_val is a pointer to { T*, len, cap }
     check_type = lhs_val.type
     if isinstance(check_type, ir.PointerType): # If pointer type
         check_type = check_type.pointee # Dereference once
     
-    if isinstance(check_type, ir.LiteralStructType) and \
-        len(check_type.elements) == 2 and check_type.elements[1] == ir.IntType(32): # If struct with 2 elements
-            # It's probably a collection (we call arrays collections )
-            if node.member_name == "length": # Accessing .length
+    if compiler.is_collection_type(check_type): # Collection layout (we call arrays collections)
+            field_idx = {"length": 1, "capacity": 2}.get(node.member_name) # Accessing .length / .capacity
+            if field_idx is not None:
                 zero = ir.Constant(ir.IntType(32), 0)
-                one = ir.Constant(ir.IntType(32), 1)
+                field = ir.Constant(ir.IntType(32), field_idx)
                 
-                # If lhs_val is a pointer (alloca), GEP to length
+                # If lhs_val is a pointer (alloca), GEP to the field
                 if isinstance(lhs_val.type, ir.PointerType): # If pointer type
-                    len_ptr = compiler.builder.gep(lhs_val, [zero, one], inbounds=True) # Get length pointer
-                    return compiler.builder.load(len_ptr, name="array_len") # Load and return length
+                    len_ptr = compiler.builder.gep(lhs_val, [zero, field], inbounds=True) # Get field pointer
+                    return compiler.builder.load(len_ptr, name=f"array_{node.member_name}") # Load and return it
                 else:
                     # If lhs_val is a value (loaded struct), extract value
-                    return compiler.builder.extract_value(lhs_val, 1, name="array_len") # Extract length value
+                    return compiler.builder.extract_value(lhs_val, field_idx, name=f"array_{node.member_name}") # Extract field value
     # Static array
     elif isinstance(check_type, ir.ArrayType):
         if node.member_name == "length": # Accessing .length
             # Length is constant known at compile time
-            return ir.Constant(ir.IntType(32), check_type.count)
+            return ir.Constant(ir.IntType(64), check_type.count)
     
     # 5. Handle Standard Struct Field Access
     if isinstance(lhs_val.type, ir.PointerType):
@@ -862,12 +1036,17 @@ def compile_struct_method_call(compiler: Compiler, node: StructMethodCall):
                 hint="Ensure the current struct has a valid parent struct to access.")
             return ir.VoidType()
 
-        # 2. Resolve Parent Method
+        # 2. Resolve Parent Method (super.__init(...): the parent constructor)
         mangled_parent = compiler.get_mangled_name(parent_name) # Get mangled parent name
         method_full_name = f"{mangled_parent}_{node.method_name}" # Full mangled method name
         
         try:
-            func_to_call = compiler.module.get_global(method_full_name) # Get method function
+            if node.method_name == "__init":
+                func_to_call = compiler.resolve_constructor(parent_name) # Parent constructor
+                if func_to_call is None:
+                    raise KeyError(parent_name)
+            else:
+                func_to_call = compiler.module.get_global(method_full_name) # Get method function
         except KeyError: # Method not found
             compiler.errors.error(
                 node,
@@ -893,14 +1072,24 @@ def compile_struct_method_call(compiler: Compiler, node: StructMethodCall):
         
         # 4. Compile Args
         args = [compiler.compile(arg) for arg in node.params] # Compile arguments
+        if node.method_name == "__init": # Parent fields are initialized in place
+            return compiler.emit_constructor_call(func_to_call, args, self_as_parent)
         final_args = [self_as_parent] + args # Prepend 'self'
         
-        return compiler.builder.call(func_to_call, final_args) # Call method
+        return compiler.emit_call(func_to_call, final_args) # Call method
     
     # 1. Resolve the Object (Variable or Expression)
     obj_ptr = None
     fin_type= None
     
+    # Collection field (self.items.push(x)): methods need the field's address.
+    # Only for receivers rooted in a variable (not a module or namespace path)
+    if isinstance(node.struct_name, MemberAccess) and _receiver_root_in_scope(compiler, node.struct_name):
+        field_ptr = compiler.compile_member_access(node.struct_name, want_pointer=True)
+        if isinstance(field_ptr, ir.Value) and isinstance(field_ptr.type, ir.PointerType) and \
+            compiler.is_collection_type(field_ptr.type.pointee): # If pointer to collection
+                return compiler.compile_collection_method(node, field_ptr)
+    
     if isinstance(node.struct_name, str):
         # Case A: Variable Name
         obj_ptr = compiler.current_scope.resolve(node.struct_name) # Get variable pointer
@@ -913,7 +1102,7 @@ def compile_struct_method_call(compiler: Compiler, node: StructMethodCall):
             if node.method_name in namespace:# If method exists in module 
                 func = namespace[node.method_name] # Get the function
                 args = [compiler.compile(arg) for arg in node.params] # Compile arguments
-                return compiler.builder.call(func, args) # Call function
+                return compiler.emit_abi_call(func, args) # Call function
             compiler.errors.error(
                 node,
                 f"Method '{node.method_name}' not found in module '{node.struct_name}'.",
@@ -932,6 +1121,11 @@ def compile_struct_method_call(compiler: Compiler, node: StructMethodCall):
                 hint="Ensure the object is defined before calling its methods.")
             return ir.VoidType()
         
+        # Collections: built-in push/pop/reserve/extend/shrink_to_fit
+        coll_ptr = _collection_receiver(compiler, obj_ptr)
+        if coll_ptr is not None:
+            return compiler.compile_collection_method(node, coll_ptr)
+        
         # 2. Determine Dispatch Mode
         is_interface = False # Flag for interface dispatch
         
@@ -978,8 +1172,11 @@ def compile_struct_method_call(compiler: Compiler, node: StructMethodCall):
             if interface_name not in compiler.struct_methods:
                 # Try mangled lookup
                 mangled = compiler.get_mangled_name(interface_name) # Get mangled name
+                unmangled = interface_name.split("__")[-1] # FinType names are already mangled
                 if mangled in compiler.struct_methods:
                     interface_name = mangled
+                elif unmangled in compiler.struct_methods:
+                    interface_name = unmangled
                 else:
                     compiler.errors.error(
                         node,
@@ -1024,11 +1221,42 @@ def compile_struct_method_call(compiler: Compiler, node: StructMethodCall):
             # 7. Compile Arguments
             args = [compiler.compile(arg) for arg in node.params]
             final_args = [data_ptr] + args # Prepend data pointer as 'self'
-            return compiler.builder.call(func_ptr, final_args) # Call method
+            return compiler.emit_call(func_ptr, final_args) # Call method
         
         # ----- PATH B: Standard Struct (Static Dispatch) -----
         return compiler.compile_actual_method_call(node, obj_ptr) # Standard dispatch
 
+# ---------------------------------------------------------------------------
+# <Method name=_receiver_root_in_scope args=[<Compiler>, <MemberAccess>]>
+# <Description>
+# True if the leftmost identifier of 'a.b.c' is a variable in scope.
+# </Description>
+def _receiver_root_in_scope(compiler: Compiler, access: MemberAccess) -> bool:
+    root = access
+    while isinstance(root, MemberAccess):
+        root = root.struct_name
+    return isinstance(root, str) and compiler.current_scope.resolve(root) is not None
+
+# ---------------------------------------------------------------------------
+# <Method name=_collection_receiver args=[<Compiler>, <ir.Value>]>
+# <Description>
+# Address of the collection a method is called on, or None if 'obj' is not
+# a collection. Accepts Collection* (variable), Collection** (reference)
+# and Collection values (spilled to a stack slot, e.g. f().pop()).
+# </Description>
+def _collection_receiver(compiler: Compiler, obj: ir.Value) -> Optional[ir.Value]:
+    if compiler.is_collection_type(obj.type): # Value: spill
+        slot = compiler.create_entry_alloca(obj.type, name="coll_tmp")
+        compiler.builder.store(obj, slot)
+        return slot
+    if not isinstance(obj.type, ir.PointerType):
+        return None
+    if isinstance(obj.type.pointee, ir.PointerType) and compiler.is_collection_type(obj.type.pointee.pointee):
+        return compiler.builder.load(obj, name="coll_ref_load") # Collection** -> Collection*
+    if compiler.is_collection_type(obj.type.pointee):
+        return obj
+    return None
+
 # --------------------------------------------------------------------------- M1778,
 # <Method name=compile_struct_field_access args=[<Compiler>, <ir.PointerType>, <str>, <str>, <FinType|None>, <AstNode|None]>
 # <Description>
@@ -1111,33 +1339,38 @@ def compile_struct_field_access(compiler: Compiler, struct_ptr: ir.Value, struct
 # <Method name=compile_constructor args=[<Compiler>, <str>, <ir.Type>, <AstNode<ConstructorDeclaration>>]>
 # <Description>
 # Compiles a struct constructor declaration into an LLVM function.
-# The constructor initializes the struct instance with default values
-# and processes constructor parameters.
+# The constructor initializes, in place, storage provided by the caller
+# (a stack slot, the declared variable, a 'new' allocation or, for
+# super(...), the parent subobject of 'self'): no copies, no dangling 'self'.
 # Logic Flow:
 # 1. Mangles the constructor function name.
-# 2. Defines the function type and creates the LLVM function.
-# 3. Allocates space for 'self' and initializes fields with defaults.
+# 2. Defines 'void StructName__init(Struct* sret self, params...)'.
+# 3. Initializes the fields of 'self' with defaults.
 # 4. Processes constructor parameters, storing them in the scope.
 # 5. Compiles the constructor body statements.
-# 6. Returns the 'self' pointer at the end.
 # </Description>
 def compile_constructor(compiler: Compiler, struct_name: str, struct_llvm_type: ir.Type, node: ConstructorDeclaration):
     """
     Compiles a constructor into a function named 'StructName__init'.
-    Returns a pointer to the allocated struct.
+    It initializes the struct at its first (sret) argument.
     """
     # Mangle name: MyStruct__init
     mangled_fn_name = f"{struct_name}__init" # Constructor function name
     
-    # Return type: Pointer to the Struct
-    llvm_ret_type = struct_llvm_type.as_pointer() # Return type
-    
-    # Parameter Types
-    param_types = [compiler.convert_type(p.var_type) for p in node.params] # Convert param types
+    # Parameter Types: hidden 'self' (caller storage) first
+    param_types = [struct_llvm_type.as_pointer()] # self
+    param_types += [compiler.convert_type(p.var_type) for p in node.params] # Convert param types
     
-    fn_ty = ir.FunctionType(llvm_ret_type, param_types) # Function type
+    fn_ty = ir.FunctionType(ir.VoidType(), param_types) # Function type
     fn = ir.Function(compiler.module, fn_ty, name=mangled_fn_name) # Create function
     
+    self_ptr = fn.args[0] # Storage to construct into
+    self_ptr.name = "self"
+    for attr in ("noalias", "nonnull", "sret"): # Fresh, unaliased, never null
+        self_ptr.add_attribute(attr)
+    if compiler.data_layout_obj:
+        self_ptr.attributes.dereferenceable = compiler.abi_size(struct_llvm_type)
+    
     # Save current state
     prev_fn = compiler.function # Save previous function
     prev_builder = compiler.builder # Save previous builder
@@ -1148,8 +1381,7 @@ def compile_constructor(compiler: Compiler, struct_name: str, struct_llvm_type:
     bb = fn.append_basic_block("entry") # Entry block
     compiler.builder = ir.IRBuilder(bb) # New builder
     
-    # 1. Allocate 'self' (The struct instance being created)
-    self_ptr = compiler.builder.alloca(struct_llvm_type, name="self") # Allocate struct
+    # 1. Bind 'self' (The struct instance being created)
     compiler.current_scope.define("self", self_ptr) # Define 'self' in scope
     
     # 2. Initialize 'self' with Default Values
@@ -1157,34 +1389,15 @@ def compile_constructor(compiler: Compiler, struct_name: str, struct_llvm_type:
     mangled_struct_name = struct_llvm_type.name # Get mangled struct name
     field_indices = compiler.struct_field_indices[mangled_struct_name] # Field indices
     defaults_map = compiler.struct_field_defaults.get(mangled_struct_name, {})  # Default values
-    
-    for field_name, idx in field_indices.items(): # For each field
-        # Calculate pointer to field
-        zero = ir.Constant(ir.IntType(32), 0) # for GEP
-        idx_val = ir.Constant(ir.IntType(32), idx) # field index
-        fld_ptr = compiler.builder.gep(self_ptr, [zero, idx_val], inbounds=True) # Field pointer
-        
-        # Apply default if exists
-        if field_name in defaults_map: # If default value exists
-            val = compiler.compile(defaults_map[field_name]) # Compile default value
-            # Add coercion logic here if needed (int->float etc) 
-            if val.type != struct_llvm_type.elements[idx]:# Type mismatch
-                    if isinstance(struct_llvm_type.elements[idx], ir.FloatType) and \
-                        isinstance(val.type, ir.IntType): # Int to Float
-                        val = compiler.builder.sitofp(val, struct_llvm_type.elements[idx]) # Convert
-            compiler.builder.store(val, fld_ptr) # Store default value
-        else:
-            # Zero init
-            zero_val = ir.Constant(struct_llvm_type.elements[idx], None) # Zero value
-            compiler.builder.store(zero_val, fld_ptr) # Store zero value
+    compiler.init_struct_fields(self_ptr, struct_llvm_type, mangled_struct_name, field_indices, defaults_map, {}, node) # Template + non-constant defaults
 
     # 3. Process Constructor Arguments
     for i, param in enumerate(node.params): # For each parameter
-        arg_val = fn.args[i] # Get argument value
+        arg_val = fn.args[i + 1] # Get argument value (after 'self')
         arg_val.name = param.identifier # Name the argument
         
         # Store argument in stack for mutability
-        arg_ptr = compiler.builder.alloca(arg_val.type, name=param.identifier) # Allocate space
+        arg_ptr = compiler.create_entry_alloca(arg_val.type, name=param.identifier) # Allocate space
         compiler.builder.store(arg_val, arg_ptr) # Store argument value
         
         # Define in scope
@@ -1194,11 +1407,11 @@ def compile_constructor(compiler: Compiler, struct_name: str, struct_llvm_type:
     for stmt in node.body: # For each statement
         compiler.compile(stmt) # Compile statement
         
-    # 5. Return 'self'
-    # Note: If there is a 'return ...' in the body, compile(ReturnStatement) 
-    # handles it. But constructors implicitly return self at the end.
+    # 5. Implicit Return
+    # Note: If there is a 'return;' in the body, compile(ReturnStatement) 
+    # handles it. The object lives in the caller's storage.
     if not compiler.builder.block.is_terminated: # If not already returned
-        compiler.builder.ret(self_ptr) # Return self pointer
+        compiler.builder.ret_void() # Return
     
     compiler.exit_scope() # Exit constructor scope
     
@@ -1206,6 +1419,45 @@ def compile_constructor(compiler: Compiler, struct_name: str, struct_llvm_type:
     compiler.function = prev_fn # Restore previous function
     compiler.builder = prev_builder # Restore previous builder
 
+# ---------------------------------------------------------------------------
+# <Method name=resolve_constructor args=[<Compiler>, <str|GenericTypeNode>]>
+# <Description>
+# Returns the constructor ('__init') of struct 'name' (a type node like
+# Box<int> names its instance), or None if 'name' is not a struct or the
+# struct has no constructor. Constructors are emitted under the struct's
+# source name, so every constructor lookup goes through here.
+# </Description>
+def resolve_constructor(compiler: Compiler, name: Union[str, GenericTypeNode]) -> Optional[ir.Function]:
+    if isinstance(name, GenericTypeNode): # Box<int>: constructor of the instance
+        name = compiler.get_mono_mangled_name(name.base_name, name.type_args)
+    if not isinstance(name, str):
+        return None
+    mangled_struct_name = compiler.get_mangled_name(name) # Get mangled struct name
+    if mangled_struct_name not in compiler.struct_types and name not in compiler.struct_types: # Not a struct
+        return None
+    for ctor_name in (f"{mangled_struct_name}__init", f"{name}__init"): # Mangled first, then raw
+        try:
+            return compiler.module.get_global(ctor_name) # Get constructor function
+        except KeyError:
+            continue
+    return None
+
+# ---------------------------------------------------------------------------
+# <Method name=emit_constructor_call args=[<Compiler>, <ir.Function>, <List[ir.Value]>, <ir.Value|None>]>
+# <Description>
+# Constructs an object in place: calls 'ctor' on 'dest' (Struct*), or on a
+# fresh entry-block stack slot if no destination is given.
+# Returns the pointer to the constructed object.
+# </Description>
+def emit_constructor_call(compiler: Compiler, ctor: ir.Function, args: List[ir.Value], dest: ir.Value = None) -> ir.Value:
+    struct_ptr_type = ctor.function_type.args[0] # Struct*
+    if dest is None: # Temporary object
+        dest = compiler.create_entry_alloca(struct_ptr_type.pointee, name="ctor_tmp") # Caller-owned storage
+    elif dest.type != struct_ptr_type: # e.g. i8* from an allocator or Child* for super(...)
+        dest = compiler.builder.bitcast(dest, struct_ptr_type, name="ctor_dest") # Cast to Struct*
+    compiler.emit_call(ctor, [dest] + list(args)) # Construct in place
+    return dest
+
 # --------------------------------------------------------------------------- M1778,
 # <Method name=compile_operator args=[<Compiler>, <str>, <str>, <ir.Type>, <AstNode<OperatorDeclaration>>]>
 # <Description>
@@ -1246,8 +1498,10 @@ def compile_operator(compiler: Compiler, struct_name: str, mangled_struct_name:
     for p in op_ast.params:
         llvm_param_types.append(compiler.convert_type(p.var_type))
         
-    fn_ty = ir.FunctionType(llvm_ret_type, llvm_param_types)
+    fn_ty = compiler.lower_function_type(llvm_ret_type, llvm_param_types) # Big structs by reference
     fn = ir.Function(compiler.module, fn_ty, name=mangled_fn_name)
+    compiler.apply_abi_attributes(fn, llvm_ret_type, llvm_param_types)
+    fn_args = compiler.source_arguments(fn) # Without the sret slot
     
     prev_fn = compiler.function
     prev_builder = compiler.builder
@@ -1257,7 +1511,7 @@ def compile_operator(compiler: Compiler, struct_name: str, mangled_struct_name:
     compiler.builder = ir.IRBuilder(bb)
     
     # Bind Self
-    self_arg = fn.args[0]
+    self_arg = fn_args[0]
     self_arg.name = "self"
     self_ptr = compiler.builder.alloca(self_arg.type, name="self_ptr")
     compiler.builder.store(self_arg, self_ptr)
@@ -1268,10 +1522,14 @@ def compile_operator(compiler: Compiler, struct_name: str, mangled_struct_name:
     
     # Bind Args
     for i, param in enumerate(op_ast.params):
-        arg_val = fn.args[i+1]
+        arg_val = fn_args[i+1]
         arg_val.name = param.identifier
-        p_ptr = compiler.builder.alloca(arg_val.type, name=param.identifier)
-        compiler.builder.store(arg_val, p_ptr)
+        if "byval" in arg_val.attributes: # Big struct: copy out of the caller's byval copy
+            p_ptr = compiler.create_entry_alloca(arg_val.type.pointee, name=param.identifier)
+            compiler.copy_aggregate(p_ptr, arg_val)
+        else:
+            p_ptr = compiler.create_entry_alloca(arg_val.type, name=param.identifier)
+            compiler.builder.store(arg_val, p_ptr)
 
         param_fin_type = compiler.ast_to_fin_type(param.var_type)
         compiler.current_scope.define(param.identifier, p_ptr, param_fin_type)
@@ -1283,6 +1541,7 @@ def compile_operator(compiler: Compiler, struct_name: str, mangled_struct_name:
             if isinstance(llvm_ret_type, ir.VoidType):
                 compiler.builder.ret_void()
     
+    compiler.current_scope.lifetime_slots.clear() # Ended by the return
     compiler.function = prev_fn
     compiler.builder = prev_builder
 
@@ -1293,6 +1552,7 @@ def compile_operator(compiler: Compiler, struct_name: str, mangled_struct_name:
 # <Description>
 # Emits a call to a struct operator overload function.
 # Handles spilling 'self' to stack if needed and boxing 'other' for generics.
+# Big struct operands/results follow the function ABI (see abi.py).
 # Logic Flow:
 # 1. Retrieves the mangled operator function name and function from the module.
 # 2. Prepares 'self' argument:
@@ -1315,22 +1575,23 @@ def emit_operator_call(compiler: Compiler, struct_name: str, op: str, left_val:
     self_arg = left_val # Default
     if not isinstance(left_val.type, ir.PointerType):
         # It's a value (loaded from stack). We must spill it back to a temp alloca.
-        temp_ptr = compiler.builder.alloca(left_val.type, name="op_self_spill") # Allocate temp
-        compiler.builder.store(left_val, temp_ptr) # Store value
+        temp_ptr = compiler.create_entry_alloca(left_val.type, name="op_self_spill") # Allocate temp
+        compiler.store_value(left_val, temp_ptr) # Store value (memcpy for big structs)
         self_arg = temp_ptr # Use pointer as arg
     
     args = [self_arg] # Initialize args with self
+    _, param_types = compiler.source_signature(fn) # Fin-level types (before byval/sret lowering)
 
     # 2. Prepare 'other' (Arg 1) - Binary Operators only
-    if right_val is not None and len(fn.args) > 1: # If binary operator
-        expected_type = fn.args[1].type # Expected type of other arg
+    if right_val is not None and len(param_types) > 1: # If binary operator
+        expected_type = param_types[1] # Expected type of other arg
         other_arg = right_val # Default
         
         # Boxing for Generics
         # If operator expects i8* (T) but we have a concrete type, BOX IT.
         if expected_type == ir.IntType(8).as_pointer() and \
             other_arg.type != expected_type: # if T (i8*) expected
-            fin_type = compiler._infer_fin_type_from_llvm(other_arg.type) # Infer FinType
+            fin_type = compiler.infer_fin_type_from_llvm(other_arg.type) # Infer FinType
             other_arg = compiler.box_value(other_arg, fin_type) # Box to i8*
         
         # Pointer Casting (e.g. Child* -> Parent*)
@@ -1341,7 +1602,7 @@ def emit_operator_call(compiler: Compiler, struct_name: str, op: str, left_val:
         
         args.append(other_arg)
 
-    return compiler.builder.call(fn, args, name="op_call")
+    return compiler.emit_abi_call(fn, args, name="op_call")
 
 # --------------------------------------------------------------------------- M1778,
 # <Method name=assign_struct_field arg=[<Compiler>, ir.PointerType>, <str>, <str>, <ir.Value>, <AstNode|None]>>
@@ -1419,7 +1680,7 @@ def assign_struct_field(compiler: Compiler, struct_ptr: ir.Value, struct_name: s
     # If field is i8* (Generic) but value is Concrete
     if expected_type == ir.IntType(8).as_pointer() and val_to_store.type != expected_type:
         # Infer type and box
-        fin_type = compiler._infer_fin_type_from_llvm(val_to_store.type)
+        fin_type = compiler.infer_fin_type_from_llvm(val_to_store.type)
         val_to_store = compiler.box_value(val_to_store, fin_type)
 
     # [FIX] Standard Coercion
@@ -1506,7 +1767,7 @@ def compile_actual_method_call(compiler: Compiler, ast: StructMethodCall, struct
             # [FIX] Auto-Boxing for Type Erasure
             # Method expects T (i8*) but we have Concrete Type
             if expected_type == ir.IntType(8).as_pointer() and val.type != expected_type:
-                fin_type = compiler._infer_fin_type_from_llvm(val.type)
+                fin_type = compiler.infer_fin_type_from_llvm(val.type)
                 val = compiler.box_value(val, fin_type)
 
             # [FIX] Interface Packing
@@ -1547,7 +1808,7 @@ def compile_actual_method_call(compiler: Compiler, ast: StructMethodCall, struct
 
         final_args.append(val)
 
-    return compiler.builder.call(
+    return compiler.emit_call(
         method_func, final_args, name=f"{ast.struct_name}_{ast.method_name}_call"
     )
 
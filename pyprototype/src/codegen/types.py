@@ -175,6 +175,10 @@ def convert_type(compiler: Compiler, type_node: Union[str, Node]) -> ir.Type:
     # =========================================================================
     elif isinstance(type_node, GenericTypeNode):
         base_name = type_node.base_name
+
+        # Collection<T> is the built-in growable array, same layout as [T]
+        if base_name == "Collection" and len(type_node.type_args) == 1:
+            return compiler.collection_type(convert_type(compiler, type_node.type_args[0]))
         
         # Resolve Alias for Base Name (e.g. Vector -> lib__Vector)
         alias_target = compiler.current_scope.resolve_type_alias(base_name)
@@ -243,6 +247,7 @@ def convert_type(compiler: Compiler, type_node: Union[str, Node]) -> ir.Type:
             mangled_inst = compiler.get_mangled_name(inst_name)
             struct_ty = compiler.struct_types[mangled_inst]
             compiler.mono_struct_cache[inst_name] = struct_ty
+            compiler.count_mono_instance(base_name, inst_name)
             return struct_ty
 
         # --- PATH B: Type Erasure ---
@@ -252,7 +257,7 @@ def convert_type(compiler: Compiler, type_node: Union[str, Node]) -> ir.Type:
             return compiler.struct_types[mangled]
 
     # =========================================================================
-    # CASE 3: Arrays (Static ONLY)
+    # CASE 3: Arrays ([T, N] static, [T] growable Collection)
     # =========================================================================
     elif isinstance(type_node, ArrayTypeNode):
         llvm_element_type = convert_type(compiler, type_node.element_type)
@@ -264,10 +269,10 @@ def convert_type(compiler: Compiler, type_node: Union[str, Node]) -> ir.Type:
             size = type_node.size_expr.value
             return ir.ArrayType(llvm_element_type, size)
         else:
-            # [T] -> Error (Must be explicit or inferred at variable decl)
-            # We return None or raise Error? 
-            # Raising error is safer. VariableDeclaration handles inference BEFORE calling convert_type.
-            raise compiler.errors.error(type_node, "Static array requires explicit size (e.g. <[T, 10]>).")
+            # [T] -> Collection<T> { T*, len, cap }
+            # (let x <[T]> = [..] keeps the literal's fixed size; VariableDeclaration
+            # infers that BEFORE calling convert_type.)
+            return compiler.collection_type(llvm_element_type)
 
     # =========================================================================
     # CASE 4: Pointers (&T)
@@ -676,9 +681,9 @@ def legacy_convert_type(compiler:Compiler, type_name_or_node: Union[str, Node])
             size = ast_node.size_expr.value
             return ir.ArrayType(llvm_element_type, size)
         else:
-            # Case 2: Slice / Dynamic View [int] -> { T*, i32 }
+            # Case 2: Slice / Dynamic View [int] -> { T*, len, cap }
             # We create an anonymous struct type for the slice
-            # Structure: { pointer, length }
+            # Structure: { pointer, length, capacity }
             
             # We use i8* for generic slices (Type Erasure compatibility)
             if llvm_element_type == ir.IntType(8).as_pointer():
@@ -686,11 +691,7 @@ def legacy_convert_type(compiler:Compiler, type_name_or_node: Union[str, Node])
                     # Wait, if T is i8*, then T* is i8**.
                     pass
 
-            slice_struct = ir.LiteralStructType([
-                llvm_element_type.as_pointer(), # Data Pointer
-                ir.IntType(32)                  # Length
-            ])
-            return slice_struct
+            return compiler.collection_type(llvm_element_type)
     if isinstance(type_name_or_node, PointerTypeNode):
         ast_node = type_name_or_node
         llvm_pointee_type = compiler.convert_type(ast_node.pointee_type)
@@ -833,10 +834,8 @@ def infer_fin_type_from_llvm(compiler: Compiler, llvm_type: ir.Type) -> FinType:
             # Return a generic Interface marker or Unknown.
             return StructType("Interface") # Placeholder
         
-        # Check for Slice: {T*, i32}
-        if len(llvm_type.elements) == 2 and \
-           isinstance(llvm_type.elements[0], ir.PointerType) and \
-           llvm_type.elements[1] == ir.IntType(32):
+        # Check for Slice: {T*, len, cap}
+        if compiler.is_collection_type(llvm_type):
             
             # Infer element type from pointer
             ptr_type = llvm_type.elements[0]
@@ -1159,7 +1158,7 @@ def fin_type_to_llvm(compiler: Compiler, fin_type: FinType) -> ir.Type:
         
         # [CASE A] Collection (Dynamic Array Slice)
         if name == "Collection":
-            # It's a slice! { T*, i32 }
+            # It's a growable slice! { T*, len, cap }
             if not fin_type.generic_args:
                 # Default to void* if no generic arg provided (shouldn't happen in valid AST)
                 elem_llvm_type = ir.IntType(8).as_pointer()
@@ -1172,10 +1171,7 @@ def fin_type_to_llvm(compiler: Compiler, fin_type: FinType) -> ir.Type:
                 else:
                     elem_llvm_type = fin_type_to_llvm(compiler, elem_fin_type)
 
-            return ir.LiteralStructType([
-                elem_llvm_type.as_pointer(), # Data Pointer
-                ir.IntType(32)               # Length
-            ])
+            return compiler.collection_type(elem_llvm_type)
 
         # [CASE B] Standard Structs & Interfaces
         # We need to find the LLVM type definition.
@@ -1261,23 +1257,15 @@ def compile_type_conv(compiler: Compiler, ast: TypeConv) -> ir.Value:
             if compiler._is_parent_of(parent_name, child_name):
                 return compiler.builder.bitcast(val, tgt_ty, name="upcast")
 
-    # --- 4. SLICE HANDLING (i8* or T* -> Slice {T*, i32}) ---
-    if isinstance(tgt_ty, ir.LiteralStructType) and len(tgt_ty.elements) == 2:
+    # --- 4. SLICE HANDLING (i8* or T* -> Slice {T*, len, cap}) ---
+    if compiler.is_collection_type(tgt_ty):
         # Casting a pointer to a slice creates a slice with length 0 (Unsafe/Raw)
         if isinstance(src_ty, ir.PointerType):
-            # Create a new slice struct (Undefined base)
-            slice_val = ir.Constant(tgt_ty, ir.Undefined)
-            
             # Cast pointer to element type
             ptr_part = compiler.builder.bitcast(val, tgt_ty.elements[0])
             
-            # Insert pointer
-            slice_val = compiler.builder.insert_value(slice_val, ptr_part, 0)
-            
-            # Insert length 0
-            slice_val = compiler.builder.insert_value(slice_val, ir.Constant(ir.IntType(32), 0), 1)
-            
-            return slice_val
+            # Length and capacity 0: the buffer is not owned, push copies it out
+            return compiler.build_collection(tgt_ty, ptr_part, 0)
 
     # --- 5. PRIMITIVE NUMERIC CONVERSIONS ---
     
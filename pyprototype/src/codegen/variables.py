@@ -78,21 +78,19 @@ def create_variable_mut(
 
     if isinstance(var_type_ast_or_llvm, ir.Type):
         llvm_type = var_type_ast_or_llvm
-        fin_type = compiler._infer_fin_type_from_llvm(llvm_type)
+        fin_type = compiler.infer_fin_type_from_llvm(llvm_type)
     else:
         ast_node = var_type_ast_or_llvm
         
         # Handle Array Size Inference: let x <[int]> = [1, 2]
-        if isinstance(ast_node, ArrayTypeNode) and ast_node.size_expr is None:
-            if initial_value_llvm and isinstance(initial_value_llvm.type, ir.ArrayType):
-                # Infer size from initializer
-                inferred_size = initial_value_llvm.type.count
-                elem_type = compiler.convert_type(ast_node.element_type)
-                llvm_type = ir.ArrayType(elem_type, inferred_size)
-                fin_type = compiler.ast_to_fin_type(ast_node) # Note: FinType might need update to store size
-            else:
-                compiler.errors.error(ast_node, f"Cannot infer size for array '{name}'. Initializer missing or not an array.")
-                return None
+        # (any other unsized [T] is a growable Collection, see convert_type)
+        if isinstance(ast_node, ArrayTypeNode) and ast_node.size_expr is None and \
+                initial_value_llvm is not None and isinstance(initial_value_llvm.type, ir.ArrayType):
+            # Infer size from initializer
+            inferred_size = initial_value_llvm.type.count
+            elem_type = compiler.convert_type(ast_node.element_type)
+            llvm_type = ir.ArrayType(elem_type, inferred_size)
+            fin_type = compiler.ast_to_fin_type(ast_node) # Note: FinType might need update to store size
         else:
             llvm_type = compiler.convert_type(var_type_ast_or_llvm)
             fin_type = compiler.ast_to_fin_type(var_type_ast_or_llvm)
@@ -100,8 +98,8 @@ def create_variable_mut(
     if llvm_type is None:
         raise compiler.errors.error(ast_node, f"Could not determine type for '{name}'")
 
-    # 2. Allocate Stack Memory
-    var_ptr = compiler.builder.alloca(llvm_type, name=f"{name}_ptr")
+    # 2. Allocate Stack Memory (entry block, scoped lifetime)
+    var_ptr = compiler.create_entry_alloca(llvm_type, name=f"{name}_ptr", scoped=True)
 
     # 3. Define in Scope (With High-Level Type Info)
     try:
@@ -167,21 +165,33 @@ def create_variable_mut(
                     val_to_store.type.pointee == llvm_type:
                 val_to_store = compiler.builder.load(val_to_store, name=f"{name}_init_struct_load")
 
-            # G. Array Literal ([N x T]) -> Collection ({T*, len})
-            elif isinstance(llvm_type, ir.LiteralStructType) and \
-                    len(llvm_type.elements) == 2 and \
+            # G. Array Literal ([N x T]) -> Collection ({T*, len, cap})
+            elif compiler.is_collection_type(llvm_type) and \
                     isinstance(val_to_store.type, ir.ArrayType):
                     
                     target_elem_type = llvm_type.elements[0].pointee
                     val_to_store = compiler.create_collection_from_array_literal(val_to_store, target_elem_type)
 
+            # H. Struct (Value or Pointer) -> Interface Fat Pointer {i8*, i8*}
+            elif isinstance(llvm_type, ir.LiteralStructType) and len(llvm_type.elements) == 2 and \
+                    all(isinstance(e, ir.PointerType) for e in llvm_type.elements) and \
+                    isinstance(getattr(val_to_store.type, 'pointee', val_to_store.type), ir.IdentifiedStructType):
+                val_to_store = compiler.pack_interface(val_to_store, val_to_store.type, llvm_type)
+
             # Final Check
             if val_to_store.type != llvm_type:
                 msg = f"Type mismatch for variable '{name}'. Expected {llvm_type}, got {val_to_store.type}."
                 if ast_node: compiler.errors.error(ast_node, msg)
                 else: raise CompilerException(msg)
 
-        compiler.builder.store(val_to_store, var_ptr)
+        if isinstance(val_to_store.type, ir.ArrayType):
+            compiler.store_array_value(val_to_store, var_ptr) # Literals: memcpy of the constant part
+        else:
+            compiler.store_value(val_to_store, var_ptr) # Big structs: memcpy from their source
+
+    elif compiler.is_collection_type(llvm_type):
+        # No initializer: start as the empty collection {null, 0, 0}
+        compiler.builder.store(ir.Constant(llvm_type, None), var_ptr)
 
     return var_ptr
 
@@ -364,6 +374,7 @@ def create_global_string(self, val: str) -> ir.Value:
     gvar.linkage = "internal"
     gvar.global_constant = True
     gvar.initializer = ir.Constant(str_ty, bytes_)
+    self.count_stat("global_strings")
 
     zero = ir.Constant(ir.IntType(32), 0)
     
@@ -447,8 +458,7 @@ def set_variable(compiler: Compiler, name: str, value_llvm: ir.Value, node: Node
             val_to_store = compiler.builder.bitcast(val_to_store, expected_type, name=f"{name}_set_bitcast")
 
         # Array Literal -> Collection
-        elif isinstance(expected_type, ir.LiteralStructType) and \
-             len(expected_type.elements) == 2 and \
+        elif compiler.is_collection_type(expected_type) and \
              isinstance(val_to_store.type, ir.ArrayType):
              
              target_elem_type = expected_type.elements[0].pointee
@@ -461,7 +471,10 @@ def set_variable(compiler: Compiler, name: str, value_llvm: ir.Value, node: Node
             else: raise Exception(msg)
 
     # 4. Store
-    compiler.builder.store(val_to_store, var_ptr)
+    if isinstance(val_to_store.type, ir.ArrayType):
+        compiler.store_array_value(val_to_store, var_ptr) # Literals: memcpy of the constant part
+    else:
+        compiler.store_value(val_to_store, var_ptr) # Big structs: memcpy from their source
     return var_ptr
 # ---------------------------------------------------------------------------
 # <Method name=get_variable args=[<Compiler>, <Union[str, Node]>]>
@@ -494,7 +507,8 @@ def get_variable(compiler: Compiler, name_or_node_ast: Union[str, Node]) -> ir.V
                 raise Exception("get_variable trying to load from memory outside function context.")
             return compiler.builder.load(resolved_symbol, name=identifier_name + "_val")
         
-        elif isinstance(resolved_symbol, (ir.Function, ir.Constant, ir.Argument)):
+        elif isinstance(resolved_symbol, (ir.Function, ir.Constant, ir.Argument, ir.Instruction)):
+            # Instructions are SSA-bound names (see define_ssa_value)
             return resolved_symbol
         
         elif resolved_symbol is None:
@@ -158,6 +158,10 @@ def t_DIVEQUAL(t):
     r'/='
     return t
 
+def t_AT_RETURN(t):
+    r'@return\b'
+    return t
+
     
 def t_BLOCK_COMMENT(t):
     r'/\*[\s\S]*?\*/'
@@ -261,7 +261,7 @@ def p_constructor_declaration(p):
     """constructor_declaration : STRUCT LPAREN params RPAREN LBRACE statements RBRACE
                                | STRUCT LBRACE statements RBRACE"""
     if len(p) == 8:
-        p[0] = attach_loc(ConstructorDeclaration(params=p[3], body=p[6], visibility="public"), p, 1)
+        p[0] = attach_loc(ConstructorDeclaration(params=p[3][0], body=p[6], visibility="public"), p, 1) # params is (list, is_vararg)
     else:
         p[0] = attach_loc(ConstructorDeclaration(params=[], body=p[3], visibility="public"), p, 1)
 
@@ -277,7 +277,7 @@ def p_operator_declaration(p):
     """operator_declaration : visibility_opt OPERATOR generic_param_list_decl_opt operator_symbol LPAREN params RPAREN return_type LBRACE statements RBRACE"""
     p[0] = attach_loc(OperatorDeclaration(
         operator=p[4],
-        params=p[6],
+        params=p[6][0], # (list, is_vararg)
         return_type=p[8],
         body=p[10],
         visibility=p[1],
@@ -894,6 +894,7 @@ def p_primary(p):
     | SUPER
     | SUPER LBRACE field_assignments RBRACE
     | AT IDENTIFIER LPAREN arguments RPAREN
+    | AT IDENTIFIER LPAREN expression_list COMMA LT type GT RPAREN
     | SELF_TYPE LBRACE field_assignments RBRACE
     | lambda_expression"""
     
@@ -952,10 +953,14 @@ def p_primary(p):
     elif len(p) == 6 and p.slice[1].type == 'AT':
         p[0] = attach_loc(SpecialCallNode(name=p[2], args=p[4]), p, 1)
 
+    # Case: Special Call with a trailing type (@embed("f.bin", <int>))
+    elif len(p) == 10 and p.slice[1].type == 'AT':
+        p[0] = attach_loc(SpecialCallNode(name=p[2], args=p[4] + [p[7]]), p, 1)
+
 def p_new_heap_allocation_expression(p):
-    """new_heap_allocation_expression : NEW type
-                                      | NEW type LPAREN arguments RPAREN
-                                      | NEW type LBRACE field_assignments RBRACE"""
+    """new_heap_allocation_expression : NEW alloc_type
+                                      | NEW alloc_type LPAREN arguments RPAREN
+                                      | NEW alloc_type LBRACE field_assignments RBRACE"""
     if len(p) == 3:
         p[0] = attach_loc(NewExpressionNode(alloc_type_ast=p[2]), p, 1)
     elif p.slice[3].type == 'LPAREN':
@@ -963,6 +968,15 @@ def p_new_heap_allocation_expression(p):
     elif p.slice[3].type == 'LBRACE':
         p[0] = attach_loc(NewExpressionNode(alloc_type_ast=p[2], init_fields=p[4]), p, 1)
 
+def p_alloc_type(p):
+    """alloc_type : dotted_path
+                  | dotted_generic_type_usage
+                  | primitive_type
+                  | pointer_type
+                  | array_type"""
+    # A type without 'Name(bits)' annotations: 'new S(5)' is a constructor call
+    p[0] = p[1]
+
 def p_field_assignments_single(p):
     """field_assignments : field_assignment
     | empty"""
@@ -70,6 +70,9 @@ class Scope:
         self.loop_cond_block = loop_cond_block
         self.loop_end_block = loop_end_block
 
+        # (alloca, size) pairs whose llvm.lifetime.end is emitted on exit
+        self.lifetime_slots = []
+
     # --- Type Parameters (Generics) ---
     def define_type_parameter(self, name: str, constraint=None):
         if name in self.type_parameters:
@@ -0,0 +1,159 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+"""
+Thin client for the Fin compile server (src/utils/compile_server.py).
+
+Only uses the standard library, so it starts in milliseconds:
+
+    python -m src.utils.compile_client main.fin --ir
+    python -m src.utils.compile_client main.fin --obj -o main.o
+    python -m src.utils.compile_client main.fin --stats
+    python -m src.utils.compile_client --server-stats | --shutdown
+"""
+import argparse
+import base64
+import json
+import os
+import socket
+import sys
+
+
+def default_socket_path():
+    return os.path.join("/tmp", f"fin-compiler-{os.getuid()}.sock")
+
+
+def send_request(request, socket_path=None):
+    """Sends one request and returns the decoded response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path or default_socket_path())
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    return json.loads(data)
+
+
+def main(argv=None):
+    prs = argparse.ArgumentParser(description="Fin compile client")
+    prs.add_argument("input", type=str, nargs="?", help="Input Fin file")
+    prs.add_argument("-o", "--output", type=str, help="Output file for --obj/--ir")
+    prs.add_argument("--obj", action="store_true", help="Emit an object file")
+    prs.add_argument("--ir", "-i", action="store_true", help="Emit LLVM IR")
+    prs.add_argument("-O", "--optimization-level", type=int, help="LLVM Optimization level")
+    prs.add_argument("-C", "--codemodel", type=str, help="LLVM CodeModel (default, small,...)")
+    prs.add_argument("--cpu", type=str, default="host", help="Target CPU")
+    prs.add_argument("--features", type=str, default=None, help="Target features")
+    prs.add_argument("--release", action="store_true", help="Build with the release profile")
+    prs.add_argument("--profile-generate", type=str, metavar="PROFILE",
+                     help="Instrumented build: append branch/entry counts to PROFILE at exit")
+    prs.add_argument("--profile-use", type=str, metavar="PROFILE", help="Optimize using counts from PROFILE")
+    prs.add_argument("--instrument", action="store_true",
+                     help="Emit the runtime profiler (IR only: the profile is read back by the JIT driver)")
+    prs.add_argument("--stats", action="store_true", help="Print the code-bloat report of the compiled program")
+    prs.add_argument("--socket", type=str, default=default_socket_path(), help="Server socket path")
+    prs.add_argument("--server-stats", action="store_true", help="Print server statistics")
+    prs.add_argument("--shutdown", action="store_true", help="Stop the server")
+    args = prs.parse_args(argv)
+
+    try:
+        if args.server_stats or args.shutdown:
+            response = send_request({"cmd": "stats" if args.server_stats else "shutdown"}, args.socket)
+            print(json.dumps(response, indent=2))
+            return 0
+
+        if not args.input:
+            prs.error("an input file is required")
+        if args.instrument and args.obj:
+            prs.error("--instrument cannot be used with --obj (its edge table is set up by the JIT driver)")
+
+        emit = "obj" if args.obj else ("ir" if args.ir else "check")
+        response = send_request({
+            "cmd": "compile",
+            "file": os.path.abspath(args.input),
+            "options": {
+                "opt": args.optimization_level,
+                "codemodel": args.codemodel,
+                "cpu": args.cpu,
+                "features": args.features,
+                "profile": "release" if args.release else "debug",
+                "profile_generate": args.profile_generate and os.path.abspath(args.profile_generate),
+                "profile_use": args.profile_use and os.path.abspath(args.profile_use),
+                "instrument": args.instrument,
+                "stats": args.stats,
+                "emit": emit,
+            },
+        }, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"Error: no compile server at '{args.socket}'. Start one with 'python -m src.utils.compile_server'.")
+        return 2
+
+    if response.get("diagnostics"):
+        sys.stdout.write(response["diagnostics"])
+    if not response.get("ok"):
+        return 1
+
+    if response.get("stats"):
+        print("--- Compile Stats ---")
+        print(response["stats"])
+        print("---------------------")
+
+    if emit == "ir":
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(response["ir"])
+        else:
+            print(response["ir"])
+    elif emit == "obj":
+        output = args.output or os.path.splitext(os.path.basename(args.input))[0] + ".o"
+        with open(output, "wb") as f:
+            f.write(base64.b64decode(response["object"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
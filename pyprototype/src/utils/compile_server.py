@@ -0,0 +1,243 @@
+# =============================================================================
+# Fin Programming Language Compiler
+#
+# Made with ❤️
+#
+# This project is genuinely built on love, dedication, and care.
+# Fin exists not only as a compiler, but as a labor of passion —
+# created for a lover, inspired by curiosity, perseverance, and belief
+# in building something meaningful from the ground up.
+#
+# “What is made with love is never made in vain.”
+# “Love is the reason this code exists; logic is how it survives.”
+#
+# -----------------------------------------------------------------------------
+# Author: M1778
+# Repository: https://github.com/M1778M/Fin
+# Profile: https://github.com/M1778M/
+#
+# Socials:
+#   Telegram: https://t.me/your_username_here
+#   Instagram: https://instagram.com/your_username_here
+#   X (Twitter): https://x.com/your_username_here
+#
+# -----------------------------------------------------------------------------
+# Copyright (C) 2025 M1778
+#
+# This file is part of the Fin Programming Language Compiler.
+#
+# Fin is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fin is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fin.  If not, see <https://www.gnu.org/licenses/>.
+#
+# -----------------------------------------------------------------------------
+# “Code fades. Love leaves a signature.”
+# =============================================================================
+"""
+Fin compile server.
+
+Keeps a warm compiler process around so repeated builds (editors, test
+matrices) skip the Python import of src.codegen, the PLY grammar tables,
+LLVM target initialization and re-parsing of builtins/unchanged modules.
+
+    python -m src.utils.compile_server [--socket PATH]
+
+Protocol: one JSON request per line over a Unix socket, one JSON response
+per line back (see src/utils/compile_client.py).
+
+    {"cmd": "compile", "file": "/abs/main.fin",
+     "options": {"opt": 2, "codemodel": null, "cpu": "host", "features": null,
+                 "profile": "debug" | "release", "profile_generate": null,
+                 "profile_use": null, "instrument": false, "stats": false,
+                 "emit": "ir" | "obj" | "check"}}
+    {"cmd": "ping"} / {"cmd": "stats"} / {"cmd": "shutdown"}
+
+    -> {"ok": true, "diagnostics": "...", "ir": "...", "object": "<base64>",
+        "stats": "<code-bloat report, with options.stats>"}
+"""
+import argparse
+import base64
+import contextlib
+import io
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from copy import deepcopy
+from pathlib import Path
+
+from llvmlite import binding
+
+from src.codegen.fin import FinCompiler
+from src.codegen.compiletime.errors import CompileError
+from src.codegen.prod.stats import collect_compile_stats, format_compile_stats
+from src.utils.helpers import parse_code, parse_file, enable_parse_cache
+from src.utils.module_loader import ModuleLoader
+
+BUILTINS_PATH = Path(__file__).resolve().parent.parent.parent.joinpath("stdlib", "builtins.fin")
+
+def default_socket_path():
+    return os.path.join("/tmp", f"fin-compiler-{os.getuid()}.sock")
+
+
+class CompileService:
+    """
+    The warm state shared by every request: parsed builtins, the parsed
+    module cache and an initialized LLVM. Every request gets its own
+    FinCompiler (and type context); requests are still compiled one at a
+    time because diagnostics are captured by redirecting stdout.
+    """
+    def __init__(self):
+        binding.initialize_native_target()
+        binding.initialize_native_asmprinter()
+        binding.initialize_native_asmparser()
+
+        self.lock = threading.Lock()
+        self.parse_cache = enable_parse_cache()
+        with open(BUILTINS_PATH, "r", encoding="utf-8") as f:
+            self.builtins_ast = parse_code(f.read(), BUILTINS_PATH.name)
+
+        self.started = time.time()
+        self.requests = 0
+
+    def compile(self, path, options):
+        """
+        Compiles 'path' and returns the response dict. Everything the
+        compiler prints (diagnostics) is captured into 'diagnostics'.
+        """
+        path = os.path.abspath(path)
+        emit = options.get("emit", "ir")
+        response = {"ok": False}
+        out = io.StringIO()
+
+        with self.lock, contextlib.redirect_stdout(out):
+            self.requests += 1
+            start = time.perf_counter()
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    source = f.read()
+                ast = parse_file(path)
+
+                compiler = FinCompiler(
+                    source,
+                    path,
+                    opt=options.get("opt"),
+                    codemodel=options.get("codemodel"),
+                    module_loader=ModuleLoader(entrypoint_file=path),
+                    initial_file_path=path,
+                    cpu=options.get("cpu"),
+                    features=options.get("features"),
+                    build_profile=options.get("profile", "debug"),
+                    profile_generate=options.get("profile_generate"),
+                    profile_use=options.get("profile_use"),
+                    instrument=options.get("instrument", False),
+                    stats=options.get("stats", False),
+                )
+                compiler.compile(deepcopy(self.builtins_ast.statements))
+                compiler.compile(ast)
+
+                if options.get("stats"):
+                    response["stats"] = format_compile_stats(collect_compile_stats(compiler))
+
+                if emit in ("ir", "obj"):
+                    llvm_ir = str(compiler.module)
+                    if emit == "ir":
+                        response["ir"] = llvm_ir
+                    else:
+                        llvm_module = binding.parse_assembly(llvm_ir)
+                        llvm_module.verify()
+                        obj = compiler.target_machine.emit_object(llvm_module)
+                        response["object"] = base64.b64encode(obj).decode("ascii")
+                response["ok"] = True
+            except CompileError:
+                # Already reported by ErrorHandler
+                pass
+            except Exception:
+                traceback.print_exc(file=sys.stdout)
+            response["time"] = time.perf_counter() - start
+
+        response["diagnostics"] = out.getvalue()
+        return response
+
+    def stats(self):
+        return {
+            "ok": True,
+            "uptime": time.time() - self.started,
+            "requests": self.requests,
+            "cached_modules": len(self.parse_cache),
+        }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                self._send({"ok": False, "diagnostics": f"Malformed request: {e}"})
+                continue
+
+            cmd = request.get("cmd", "compile")
+            if cmd == "compile":
+                self._send(self.server.service.compile(request["file"], request.get("options", {})))
+            elif cmd == "ping":
+                self._send({"ok": True})
+            elif cmd == "stats":
+                self._send(self.server.service.stats())
+            elif cmd == "shutdown":
+                self._send({"ok": True})
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+            else:
+                self._send({"ok": False, "diagnostics": f"Unknown command '{cmd}'"})
+
+    def _send(self, response):
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class CompileServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, service):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        self.service = service
+        super().__init__(socket_path, _RequestHandler)
+        os.chmod(socket_path, 0o600)
+
+
+def main(argv=None):
+    prs = argparse.ArgumentParser(description="Fin compile server")
+    prs.add_argument("--socket", type=str, default=default_socket_path(), help="Unix socket path")
+    args = prs.parse_args(argv)
+
+    service = CompileService()
+    server = CompileServer(args.socket, service)
+    print(f"Fin compile server listening on {args.socket}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -44,20 +44,48 @@
 # =============================================================================
 import os
 import platform
+import threading
+from copy import deepcopy
 from ctypes.util import find_library
 from ..lexer import lexer
 from ..parser import parser
 from ..preprocessor.macros import preprocess_macros
+# The PLY lexer/parser are module-level singletons
+_parse_lock = threading.Lock()
+
 def parse_code(code, filename="<stdin>"):
-    # Set the filename on the lexer so DiagnosticEngine can read it
-    lexer.filename = filename 
-    
-    code = preprocess_macros(code)
-    lexer.input(code)
-    ast = parser.parse(code)
+    with _parse_lock:
+        # Set the filename on the lexer so DiagnosticEngine can read it
+        lexer.filename = filename 
+        
+        code = preprocess_macros(code)
+        lexer.input(code)
+        ast = parser.parse(code)
     return ast
 
+# Parsed module cache (enabled by long-lived processes, e.g. the compile server)
+# Maps abs path -> ((mtime_ns, size), AST)
+_parse_cache = None
+
+def enable_parse_cache():
+    global _parse_cache
+    if _parse_cache is None:
+        _parse_cache = {}
+    return _parse_cache
+
 def parse_file(path):
+    if _parse_cache is not None:
+        abs_path = os.path.abspath(path)
+        st = os.stat(abs_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _parse_cache.get(abs_path)
+        if cached is None or cached[0] != stamp:
+            with open(abs_path, "r") as f:
+                cached = (stamp, parse_code(f.read(), filename=path))
+            _parse_cache[abs_path] = cached
+        # Codegen annotates/mutates AST nodes, hand out a private copy
+        return deepcopy(cached[1])
+
     with open(path, "r") as f:
         code = f.read()
     # Pass the path to parse_code
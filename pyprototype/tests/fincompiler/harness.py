@@ -0,0 +1,271 @@
+"""
+In-process parallel runner for tests/fintests.
+
+Every worker process imports the compiler once and keeps it warm (LLVM
+initialized, builtins parsed, parsed-module cache). For each test it
+compiles in-process, then runs the JIT in a forked child so the program's
+stdout, exit code, exit()/panic and crashes are isolated from the worker.
+
+Golden files next to a test 'foo.fin' (all optional):
+    foo.out   expected stdout (exact match)
+    foo.code  expected exit code (default 0)
+
+Results are cached in tests/fintests/.cache/results.json. A test whose
+inputs (test file, goldens, sibling .fin files) and compiler hash (src/
+and stdlib/) are unchanged since its last pass is skipped.
+
+    python -m tests.fincompiler.harness [-j N] [--no-cache] [paths...]
+"""
+import argparse
+import contextlib
+import ctypes
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import tempfile
+import time
+import traceback
+from copy import deepcopy
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+FINTESTS_DIR = ROOT / "tests" / "fintests"
+CACHE_FILE = FINTESTS_DIR / ".cache" / "results.json"
+BUILTINS_PATH = ROOT / "stdlib" / "builtins.fin"
+DEFAULT_TIMEOUT = 30
+
+
+def discover(paths=None):
+    """Returns every .fin test under 'paths' (default: tests/fintests)."""
+    found = []
+    for base in (paths or [FINTESTS_DIR]):
+        base = Path(base)
+        if base.is_file() and base.suffix == ".fin":
+            found.append(base.resolve())
+        elif base.is_dir():
+            found.extend(p.resolve() for p in base.rglob("*.fin") if ".cache" not in p.parts)
+    return sorted(found)
+
+
+def compiler_hash():
+    """Hash of everything that affects compilation: src/ and stdlib/."""
+    digest = hashlib.sha256()
+    for folder, pattern in ((ROOT / "src", "*.py"), (ROOT / "stdlib", "*.fin")):
+        for path in sorted(folder.rglob(pattern)):
+            digest.update(str(path.relative_to(ROOT)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def test_key(test, compiler_digest):
+    """Cache key: compiler hash + test, goldens and sibling modules it may import."""
+    digest = hashlib.sha256(compiler_digest.encode())
+    inputs = {test, test.with_suffix(".out"), test.with_suffix(".code")}
+    inputs.update(test.parent.glob("*.fin"))
+    for path in sorted(inputs):
+        if path.exists():
+            digest.update(str(path).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+_worker = {}
+
+def _init_worker():
+    # Imported here so the parent process (pytest collection) stays light
+    from llvmlite import binding
+    from src.codegen.fin import FinCompiler
+    from src.codegen.compiletime.errors import CompileError
+    from src.utils.helpers import parse_code, parse_file, enable_parse_cache
+    from src.utils.module_loader import ModuleLoader
+
+    binding.initialize_native_target()
+    binding.initialize_native_asmprinter()
+    binding.initialize_native_asmparser()
+    enable_parse_cache()
+
+    _worker.update(
+        FinCompiler=FinCompiler, CompileError=CompileError, parse_file=parse_file,
+        ModuleLoader=ModuleLoader,
+        builtins=parse_code(BUILTINS_PATH.read_text(encoding="utf-8"), BUILTINS_PATH.name),
+    )
+
+
+def _compile(test, **options):
+    """
+    Compiles 'test' in-process. 'options' are extra FinCompiler keyword
+    arguments (the tests/run_jit.py flags, e.g. stats=True).
+    Returns (compiler or None, diagnostics).
+    """
+    out = io.StringIO()
+    compiler = None
+    with contextlib.redirect_stdout(out):
+        try:
+            path = str(test)
+            compiler = _worker["FinCompiler"](
+                test.read_text(encoding="utf-8"), path,
+                is_jit=True,
+                module_loader=_worker["ModuleLoader"](entrypoint_file=path),
+                initial_file_path=path,
+                **options,
+            )
+            compiler.compile(deepcopy(_worker["builtins"].statements))
+            compiler.compile(_worker["parse_file"](path))
+        except _worker["CompileError"]:
+            compiler = None
+        except Exception:
+            traceback.print_exc(file=out)
+            compiler = None
+    return compiler, out.getvalue()
+
+
+def _run(compiler, timeout, after=None):
+    """
+    Runs the JIT in a forked child. 'after(compiler)' is called in the child
+    once main returns; whatever it prints is captured too (e.g. the reports
+    that only exist in the child, like the runtime profile).
+    Returns (exit_code, stdout).
+    """
+    with tempfile.TemporaryFile() as capture:
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                os.dup2(capture.fileno(), 1)
+                os.dup2(capture.fileno(), 2)
+                # pytest swaps sys.stdout/stderr for its own capture objects
+                sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+                signal.alarm(timeout)
+                code = compiler.runwithjit("main")
+                if after is not None:
+                    ctypes.CDLL(None).fflush(None)
+                    after(compiler)
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                sys.stdout.flush()
+                ctypes.CDLL(None).fflush(None)
+                os._exit(code & 0xFF)
+
+        _, status = os.waitpid(pid, 0)
+        capture.seek(0)
+        stdout = capture.read().decode("utf-8", errors="replace")
+
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status), stdout
+    return os.WEXITSTATUS(status), stdout
+
+
+def run_test(task):
+    test, key, timeout = task
+    test = Path(test)
+    start = time.perf_counter()
+    result = {"path": str(test), "key": key, "status": "fail", "message": "", "stdout": "", "exit_code": None}
+
+    compiler, diagnostics = _compile(test)
+    if compiler is None:
+        result["message"] = "compilation failed\n" + diagnostics
+    else:
+        exit_code, stdout = _run(compiler, timeout)
+        result.update(exit_code=exit_code, stdout=stdout)
+
+        expected_code = 0
+        code_file = test.with_suffix(".code")
+        if code_file.exists():
+            expected_code = int(code_file.read_text().strip())
+        out_file = test.with_suffix(".out")
+
+        if exit_code == -signal.SIGALRM:
+            result["message"] = f"timed out after {timeout}s"
+        elif exit_code != expected_code:
+            result["message"] = f"exit code {exit_code}, expected {expected_code}"
+        elif out_file.exists() and stdout != out_file.read_text(encoding="utf-8"):
+            result["message"] = "stdout does not match " + out_file.name
+        else:
+            result["status"] = "pass"
+
+    result["duration"] = time.perf_counter() - start
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+def _load_cache():
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_FILE.write_text(json.dumps(cache, indent=1, sort_keys=True))
+
+
+def run_all(tests, jobs=None, use_cache=True, timeout=DEFAULT_TIMEOUT):
+    """
+    Runs 'tests' and returns { path: result }. Cached passes are returned
+    with status 'cached'.
+    """
+    digest = compiler_hash()
+    cache = _load_cache() if use_cache else {}
+    results, pending = {}, []
+
+    for test in tests:
+        key = test_key(test, digest)
+        cached = cache.get(str(test))
+        if use_cache and cached and cached.get("key") == key and cached.get("status") == "pass":
+            results[str(test)] = dict(cached, status="cached")
+        else:
+            pending.append((str(test), key, timeout))
+
+    if pending:
+        ctx = multiprocessing.get_context("fork")
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+        with ctx.Pool(jobs, initializer=_init_worker) as pool:
+            for result in pool.imap_unordered(run_test, pending):
+                results[result["path"]] = result
+                if result["status"] == "pass":
+                    cache[result["path"]] = {"key": result["key"], "status": "pass"}
+                else:
+                    cache.pop(result["path"], None)
+
+    if use_cache:
+        _save_cache(cache)
+    return results
+
+
+def main(argv=None):
+    prs = argparse.ArgumentParser(description="Run Fin compiler tests")
+    prs.add_argument("paths", nargs="*", help="Test files or directories (default: tests/fintests)")
+    prs.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    prs.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache")
+    prs.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help="Per-test run timeout (seconds)")
+    args = prs.parse_args(argv)
+
+    tests = discover(args.paths or None)
+    if not tests:
+        print("No .fin tests found under " + ", ".join(args.paths or [os.path.relpath(FINTESTS_DIR, ROOT)]))
+        return 1
+    start = time.perf_counter()
+    results = run_all(tests, args.jobs, not args.no_cache, args.timeout)
+
+    failed = [r for r in results.values() if r["status"] == "fail"]
+    cached = sum(1 for r in results.values() if r["status"] == "cached")
+    for result in sorted(failed, key=lambda r: r["path"]):
+        print(f"FAIL {os.path.relpath(result['path'], ROOT)}: {result['message']}")
+    print(f"{len(results) - len(failed)} passed ({cached} cached), {len(failed)} failed "
+          f"in {time.perf_counter() - start:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
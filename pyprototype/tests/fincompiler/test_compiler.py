@@ -1,13 +1,20 @@
 from pathlib import Path
-import os
-
-def smart_search(dir:str = "tests/fintests/"):
-    for test_file in os.listdir(dir):
-        if not Path(dir).joinpath(test_file).is_file():
-            smart_search(Path(dir).joinpath(test_file))
-        else:
-            file = str(Path(dir).joinpath(test_file).absolute())
-            os.system(f"uv run python tests/run_jit.py {file} -r")
-
-def test_compiler():
-    smart_search()
\ No newline at end of file
+import pytest
+
+from tests.fincompiler.harness import discover, run_all, ROOT
+
+TESTS = discover()
+
+@pytest.fixture(scope="session")
+def fintest_results():
+    # All fintests are compiled and run once, in parallel, with caching
+    return run_all(TESTS)
+
+def test_fintests_discovered():
+    # An empty or missing tests/fintests must not pass vacuously
+    assert TESTS, "no .fin tests found under tests/fintests"
+
+@pytest.mark.parametrize("test_file", TESTS, ids=lambda p: str(p.relative_to(ROOT)))
+def test_compiler(test_file: Path, fintest_results):
+    result = fintest_results[str(test_file)]
+    assert result["status"] != "fail", result["message"] + "\n" + result["stdout"]
@@ -0,0 +1,146 @@
+"""
+Golden tests for the tests/run_jit.py compiler flags.
+
+The programs live in tests/fintests/flags/, so the plain harness also checks
+their .out goldens without any flag. Here each one is compiled again with
+its flag: the program output must not change, and the flag's own output
+is checked against the test's extra golden or the facts it must report.
+"""
+import os
+from pathlib import Path
+import pytest
+
+from tests.fincompiler import harness
+from tests.fincompiler.harness import FINTESTS_DIR
+
+FLAGS_DIR = FINTESTS_DIR / "flags"
+
+@pytest.fixture(scope="module", autouse=True)
+def worker():
+    # Same warm compiler state the harness workers use
+    harness._init_worker()
+
+def compile_with(test: Path, **options):
+    compiler, diagnostics = harness._compile(test, **options)
+    assert compiler is not None, diagnostics
+    return compiler
+
+def run_golden(test: Path, compiler, after=None):
+    """
+    Runs 'compiler' and checks its stdout against 'test's .out golden.
+    Returns what 'after' printed behind the program's own output.
+    """
+    exit_code, stdout = harness._run(compiler, harness.DEFAULT_TIMEOUT, after)
+    assert exit_code == 0, stdout
+    golden = test.with_suffix(".out").read_text(encoding="utf-8")
+    assert stdout[:len(golden)] == golden, stdout
+    assert after is not None or stdout == golden, stdout
+    return stdout[len(golden):]
+
+def test_pgo_round_trip(tmp_path):
+    test = FLAGS_DIR / "pgo_branches.fin"
+    profile = tmp_path / "pgo.profile"
+
+    # --profile-generate: one training run writes the golden counts
+    run_golden(test, compile_with(test, profile_generate=str(profile)))
+    expected = test.with_suffix(".profile").read_text(encoding="utf-8")
+    assert profile.read_text(encoding="utf-8") == expected
+
+    # A second training run appends; --profile-use sums both runs
+    run_golden(test, compile_with(test, profile_generate=str(profile)))
+    compiler = compile_with(test, profile_use=str(profile))
+    llvm_ir = str(compiler.module)
+    assert '!{ !"branch_weights", i32 200, i32 1800 }' in llvm_ir  # classify's if
+    assert '!{ !"branch_weights", i32 2000, i32 2 }' in llvm_ir    # main's while
+    assert '!{ !"function_entry_count", i64 2000 }' in llvm_ir
+
+    classify = compiler.module.get_global("pgo_branches__classify")
+    never_called = compiler.module.get_global("pgo_branches__never_called")
+    assert "hot" in classify.attributes
+    assert "cold" in never_called.attributes
+
+    # The optimized build still prints the golden output
+    run_golden(test, compiler)
+
+def test_stats_report():
+    from src.codegen.prod.stats import STAT_KINDS, collect_compile_stats, format_compile_stats
+
+    test = FLAGS_DIR / "stats_report.fin"
+    compiler = compile_with(test, stats=True)
+    stats = collect_compile_stats(compiler)
+
+    # Codegen counters are exact; instruction counts are left free
+    counted = {
+        row["name"]: {kind: row[kind] for kind in STAT_KINDS if row[kind]}
+        for row in stats["functions"].values()
+    }
+    assert counted["stats_report.nth"] == {"bounds_checks": 1, "global_strings": 1}
+    assert counted["stats_report.ratio"] == {"zero_checks": 1, "global_strings": 1}
+    assert counted["stats_report.larger_int"] == {}
+    assert counted["stats_report.larger_float"] == {}
+    assert counted["main"] == {"mono_instances": 2, "global_strings": 2}
+
+    larger = stats["generics"]["larger"]
+    assert larger["instances"] == 2
+    assert larger["instructions"] == sum(
+        row["instructions"] for row in stats["functions"].values()
+        if row["name"] in ("stats_report.larger_int", "stats_report.larger_float")
+    )
+    assert stats["macros"]["square"]["expansions"] == 2
+    assert stats["modules"]["stats_report"]["vtables"] == 1
+    assert stats["totals"]["functions"] == len(stats["functions"])
+
+    report = format_compile_stats(stats)
+    assert report.startswith("Totals: 9 functions, ")
+    assert "2 mono instances, 0 boxes, 1 bounds checks (0 hoisted, 0 elided), 1 zero checks, 1 vtables" in report
+    for section in ("Modules:", "Functions (top 25):", "Generics (monomorphized):", "Macros (expanded):"):
+        assert "\n" + section + "\n" in report
+
+    # --stats only observes: the program prints the same
+    run_golden(test, compiler)
+
+def print_call_graph(compiler):
+    # Runs in the JIT child: call counts are exact, cycles only add up
+    profile = compiler.runtime_profile
+    for name, row in sorted(profile.items()):
+        callers = ", ".join(f"{caller} ({count})" for caller, count in sorted(row["callers"].items()))
+        print(f"{name} calls={row['calls']} <- {callers}")
+    self_total = sum(row["self"] for row in profile.values())
+    print("self cycles add up:", self_total == profile["main"]["inclusive"] > 0)
+
+def test_instrument_call_graph():
+    test = FLAGS_DIR / "instrument_calls.fin"
+    report = run_golden(test, compile_with(test, instrument=True), after=print_call_graph)
+    assert report == (
+        "instrument_calls.Counter.hit calls=3 <- main (3)\n"
+        "instrument_calls.fib calls=177 <- instrument_calls.fib (176), main (1)\n"
+        "instrument_calls.leaf calls=6 <- instrument_calls.twice (6)\n"
+        "instrument_calls.twice calls=3 <- main (3)\n"
+        "main calls=1 <- <root> (1)\n"
+        "self cycles add up: True\n"
+    )
+
+def print_perf_map(compiler):
+    # Runs in the JIT child, which owns /tmp/perf-<pid>.map
+    path = f"/tmp/perf-{os.getpid()}.map"
+    with open(path, encoding="utf-8") as f:
+        rows = [line.split(None, 2) for line in f.read().splitlines()]
+    os.remove(path)
+    ranges = [(int(start, 16), int(size, 16)) for start, size, _ in rows]
+    print("\n".join(sorted(name for _, _, name in rows)))
+    print("contiguous:", all(start + size == ranges[i + 1][0] for i, (start, size) in enumerate(ranges[:-1])))
+    print("sized:", all(size > 0 for _, size in ranges))
+
+def test_perf_map_symbols():
+    test = FLAGS_DIR / "perf_map.fin"
+    report = run_golden(test, compile_with(test, perf_map=True), after=print_perf_map)
+    assert report == (
+        "__panic\n"
+        "main\n"
+        "perf_map.Vec2.dot\n"
+        "perf_map.Vec2.init\n"
+        "perf_map.Vec2.operator+\n"
+        "perf_map.scale\n"
+        "contiguous: True\n"
+        "sized: True\n"
+    )
@@ -0,0 +1,9 @@
+pgo_branches__classify:entry:0 1000
+pgo_branches__classify:if:0:branch 1000
+pgo_branches__classify:if:0:taken 100
+pgo_branches__never_called:entry:0 0
+main:entry:0 1
+main:while:0:branch 1001
+main:while:0:taken 1000
+main:if:0:branch 1
+main:if:0:taken 0
@@ -7,11 +7,17 @@ try:
     from src.codegen.fin import FinCompiler
     from src.utils.helpers import parse_code
     from src.utils.module_loader import ModuleLoader
+    from src.codegen.prod.instrument import format_runtime_profile
+    from src.codegen.prod.stats import collect_compile_stats, format_compile_stats
+    from src.codegen.prod.pools import format_pool_stats
 except:
     sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
     from src.codegen.fin import FinCompiler
     from src.utils.helpers import parse_code
     from src.utils.module_loader import ModuleLoader
+    from src.codegen.prod.instrument import format_runtime_profile
+    from src.codegen.prod.stats import collect_compile_stats, format_compile_stats
+    from src.codegen.prod.pools import format_pool_stats
     from src.ast2.nodes import *
 
     
@@ -31,6 +37,38 @@ if __name__ == "__main__":
     prs.add_argument(
         "-C", "--codemodel", help="LLVM CodeModel (default, small,...)", type=str
     )
+    prs.add_argument(
+        "--cpu", type=str, default="host",
+        help="Target CPU (default: host, use 'generic' for portable builds)"
+    )
+    prs.add_argument(
+        "--features", type=str, default=None,
+        help="Target features, e.g. '+avx2,+fma' (default: host features when --cpu=host)"
+    )
+    prs.add_argument(
+        "--profile-generate", type=str, metavar="PROFILE",
+        help="Instrumented build: append branch/entry counts to PROFILE at exit"
+    )
+    prs.add_argument(
+        "--profile-use", type=str, metavar="PROFILE",
+        help="Optimize using counts from a --profile-generate run"
+    )
+    prs.add_argument(
+        "--instrument", action="store_true",
+        help="Profile every Fin function (calls, cycles, call graph); requires -r"
+    )
+    prs.add_argument(
+        "--perf-map", action="store_true",
+        help="Write /tmp/perf-<pid>.map so 'perf' can symbolize JIT frames (with -r)"
+    )
+    prs.add_argument(
+        "--stats", action="store_true",
+        help="Print a code-bloat report (instructions, allocas, generics, macros, checks) and, with --run, #[pooled] struct usage"
+    )
+    prs.add_argument(
+        "--release", action="store_true",
+        help="Build with the release profile ([profile.release] in finn.toml, e.g. per-module bounds checks)"
+    )
     prs.add_argument(
         "--keep-obj",
         action="store_true",
@@ -51,6 +89,10 @@ if __name__ == "__main__":
 
     args = prs.parse_args()
 
+    if args.instrument and not args.run:
+        print("Error: --instrument requires -r/--run (the profile is read back from the JIT).")
+        exit(1)
+
     input_file_path = os.path.abspath(args.input)
     if not os.path.exists(input_file_path):
         print(f"Error: File '{args.input}' not found.")
@@ -80,12 +122,25 @@ if __name__ == "__main__":
         codemodel=args.codemodel, 
         is_jit=args.run, 
         module_loader=module_loader,
-        initial_file_path=input_file_path
+        initial_file_path=input_file_path,
+        cpu=args.cpu,
+        features=args.features,
+        profile_generate=args.profile_generate,
+        profile_use=args.profile_use,
+        instrument=args.instrument,
+        perf_map=args.perf_map,
+        stats=args.stats,
+        build_profile="release" if args.release else "debug",
     )
     compiler.load_library(str(Path(__file__).parent.parent.joinpath("stdlib/").joinpath("builtins.fin")))
     compiler.compile(ast)
         
 
+    if args.stats:
+        print("--- Compile Stats ---")
+        print(format_compile_stats(collect_compile_stats(compiler)))
+        print("---------------------")
+
     if args.ir:
         print("--- Generated LLVM IR ---")
         print(str(compiler.module))
@@ -95,6 +150,14 @@ if __name__ == "__main__":
         try:
             print("Running with JIT...")
             compiler.runwithjit("main")
+            if compiler.runtime_profile is not None:
+                print("--- Runtime Profile ---")
+                print(format_runtime_profile(compiler.runtime_profile))
+                print("-----------------------")
+            if compiler.pool_stats is not None:
+                print("--- Pool Stats ---")
+                print(format_pool_stats(compiler.pool_stats))
+                print("------------------")
         except Exception as e:
             print(f"Error during JIT execution: {e}")
 